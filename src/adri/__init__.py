@@ -41,21 +41,56 @@ Semantic Kernel, and any Python function.
 Learn more: https://github.com/adri-standard/adri
 """
 
-from .analysis import ContractGenerator, DataProfiler, TypeInference
-from .config.loader import ConfigurationLoader
-from .contracts.artifact import ArtifactDeclaration
-
-# Core public API imports
-from .decorator import adri_protected
-from .guard.modes import DataProtectionEngine
-from .logging.local import LocalLogger
-
-# Core component imports
-from .validator.engine import DataQualityAssessor, ValidationEngine
+import importlib
+from typing import TYPE_CHECKING, Any
 
 # Version information - updated import for src/ layout
 from .version import __version__, get_version_info
 
+# Public API is resolved lazily (PEP 562) so that `import adri`, `adri --version`
+# and cold starts that only need `adri_protected` do not pay for pandas or the
+# contract generator until they are actually used.
+_LAZY_IMPORTS: dict[str, str] = {
+    # Core public API
+    "adri_protected": ".decorator",
+    "DataProtectionEngine": ".guard.modes",
+    "LocalLogger": ".logging.local",
+    "ConfigurationLoader": ".config.loader",
+    "ArtifactDeclaration": ".contracts.artifact",
+    # Core components
+    "DataQualityAssessor": ".validator.engine",
+    "ValidationEngine": ".validator.engine",
+    # Analysis components
+    "ContractGenerator": ".analysis",
+    "DataProfiler": ".analysis",
+    "TypeInference": ".analysis",
+}
+
+if TYPE_CHECKING:
+    from .analysis import ContractGenerator, DataProfiler, TypeInference
+    from .config.loader import ConfigurationLoader
+    from .contracts.artifact import ArtifactDeclaration
+    from .decorator import adri_protected
+    from .guard.modes import DataProtectionEngine
+    from .logging.local import LocalLogger
+    from .validator.engine import DataQualityAssessor, ValidationEngine
+
+
+def __getattr__(name: str) -> Any:
+    """Import public API attributes on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily loaded public API names in dir(adri)."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 # Public API exports
 __all__ = [
     "__version__",
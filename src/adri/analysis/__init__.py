@@ -6,15 +6,19 @@ Provides data profiling and automatic contract generation capabilities.
 
 Components:
 - DataProfiler: Analyzes data patterns and structure
+- StreamingProfiler: Single-pass, bounded-memory profiling with mergeable sketches
 - ContractGenerator: Creates YAML contracts from data analysis
 - TypeInference: Infers data types and validation rules
+- SyntheticDataGenerator: Generates conforming or violating data from a contract
 
 This module provides the "Data Scientist" functionality for the ADRI framework.
 """
 
 # Import analysis components
 from .data_profiler import DataProfiler, profile_dataframe
+from .streaming_profiler import StreamingProfiler
 from .contract_generator import generate_contract_from_data, ContractGenerator
+from .synthetic import SyntheticDataGenerator, generate_synthetic_data
 
 # Import all analysis components
 from .type_inference import (
@@ -26,10 +30,13 @@ from .type_inference import (
 # Export all components
 __all__ = [
     "DataProfiler",
+    "StreamingProfiler",
     "ContractGenerator",
     "TypeInference",
+    "SyntheticDataGenerator",
     "profile_dataframe",
     "generate_contract_from_data",
+    "generate_synthetic_data",
     "infer_types_from_dataframe",
     "infer_validation_rules_from_data",
 ]
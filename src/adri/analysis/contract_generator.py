@@ -12,13 +12,6 @@ from typing import Any
 
 import pandas as pd
 
-from ..validator.rules import (
-    check_date_bounds,
-    check_field_pattern,
-    check_field_range,
-    check_field_type,
-    check_length_bounds,
-)
 from .data_profiler import DataProfiler
 from .generation import (
     ContractBuilder,
@@ -26,6 +19,7 @@ from .generation import (
     ExplanationGenerator,
     FieldInferenceEngine,
 )
+from .generation.field_inference import map_columns
 from .rule_inference import (
     infer_allowed_values,
     infer_allowed_values_tolerant,
@@ -35,7 +29,9 @@ from .rule_inference import (
     infer_numeric_range_robust,
     infer_regex_pattern,
     InferenceConfig,
+    pattern_coverage,
 )
+from .sampling import sample_rows, SamplingConfig
 
 
 class GenerationConfig:
@@ -270,202 +266,6 @@ class ContractGenerator:
             out["after_date"], out["before_date"] = db[0], db[1]
         return out
 
-    def _prepare_observed_stats(self, data: pd.DataFrame) -> dict[str, dict[str, Any]]:
-        """Precompute observed per-field stats for training-pass relaxation.
-
-        Provides min/max length and numeric min/max for widening rules.
-        """
-        observed_stats: dict[str, dict[str, Any]] = {}
-        for col in data.columns:
-            s = data[col].dropna()
-            if s.empty:
-                observed_stats[col] = {}
-                continue
-            try:
-                lengths = s.astype(str).str.len()
-            except Exception:
-                lengths = pd.Series(dtype=int)
-            observed_stats[col] = {
-                "min_len": int(lengths.min()) if not lengths.empty else None,
-                "max_len": int(lengths.max()) if not lengths.empty else None,
-                "min_val": (
-                    float(pd.to_numeric(s, errors="coerce").min())
-                    if pd.to_numeric(s, errors="coerce").notna().any()
-                    else None
-                ),
-                "max_val": (
-                    float(pd.to_numeric(s, errors="coerce").max())
-                    if pd.to_numeric(s, errors="coerce").notna().any()
-                    else None
-                ),
-            }
-        return observed_stats
-
-    def _validate_value_against_rules(
-        self, val: Any, field_req: dict[str, Any]
-    ) -> str | None:
-        """Validate a single value against field requirements in strict order.
-
-        Returns the first failing rule key or None if all pass.
-        """
-        if not check_field_type(val, field_req):
-            return "type"
-        if "allowed_values" in field_req and val not in field_req["allowed_values"]:
-            return "allowed_values"
-        if (
-            ("min_length" in field_req) or ("max_length" in field_req)
-        ) and not check_length_bounds(val, field_req):
-            return "length_bounds"
-        if "pattern" in field_req and not check_field_pattern(val, field_req):
-            return "pattern"
-        if (
-            ("min_value" in field_req) or ("max_value" in field_req)
-        ) and not check_field_range(val, field_req):
-            return "numeric_range"
-        if any(
-            k in field_req
-            for k in ["after_date", "before_date", "after_datetime", "before_datetime"]
-        ) and not check_date_bounds(val, field_req):
-            return "date_bounds"
-        return None
-
-    def _relax_constraint_for_failure(
-        self,
-        col: str,
-        failing_rule: str,
-        field_req: dict[str, Any],
-        observed: dict[str, Any],
-        exp_root: dict[str, Any],
-    ) -> None:
-        """Relax only the failing rule and log adjustments for training-pass guarantee.
-
-        Mutates field_req in-place.
-        """
-        if failing_rule == "type":
-            if field_req.get("type") != "string":
-                field_req["type"] = "string"
-                for k in [
-                    "min_value",
-                    "max_value",
-                    "after_date",
-                    "before_date",
-                    "after_datetime",
-                    "before_datetime",
-                ]:
-                    field_req.pop(k, None)
-                exp_root.setdefault(col, {}).setdefault("adjustments", []).append(
-                    {
-                        "rule": "type",
-                        "action": "coerced_to_string",
-                        "reason": "training-pass failure",
-                    }
-                )
-        elif failing_rule == "allowed_values":
-            if "allowed_values" in field_req:
-                field_req.pop("allowed_values", None)
-                exp_root.setdefault(col, {}).setdefault("adjustments", []).append(
-                    {
-                        "rule": "allowed_values",
-                        "action": "removed",
-                        "reason": "training-pass failure",
-                    }
-                )
-        elif failing_rule == "length_bounds":
-            stats = observed or {}
-            if stats:
-                min_len = stats.get("min_len")
-                max_len = stats.get("max_len")
-                before_min = field_req.get("min_length")
-                before_max = field_req.get("max_length")
-                if min_len is not None:
-                    field_req["min_length"] = min(
-                        int(field_req.get("min_length", min_len)), int(min_len)
-                    )
-                if max_len is not None:
-                    field_req["max_length"] = max(
-                        int(field_req.get("max_length", max_len)), int(max_len)
-                    )
-                exp_root.setdefault(col, {}).setdefault("adjustments", []).append(
-                    {
-                        "rule": "length_bounds",
-                        "action": "widened",
-                        "reason": "training-pass failure",
-                        "before": {"min": before_min, "max": before_max},
-                        "after": {
-                            "min": field_req.get("min_length"),
-                            "max": field_req.get("max_length"),
-                        },
-                    }
-                )
-            else:
-                before_min = field_req.get("min_length")
-                before_max = field_req.get("max_length")
-                field_req.pop("min_length", None)
-                field_req.pop("max_length", None)
-                exp_root.setdefault(col, {}).setdefault("adjustments", []).append(
-                    {
-                        "rule": "length_bounds",
-                        "action": "removed",
-                        "reason": "insufficient stats",
-                        "before": {"min": before_min, "max": before_max},
-                    }
-                )
-        elif failing_rule == "pattern":
-            if "pattern" in field_req:
-                before = field_req.get("pattern")
-                field_req.pop("pattern", None)
-                exp_root.setdefault(col, {}).setdefault("adjustments", []).append(
-                    {
-                        "rule": "pattern",
-                        "action": "removed",
-                        "reason": "training-pass failure",
-                        "before": before,
-                    }
-                )
-        elif failing_rule == "numeric_range":
-            stats = observed or {}
-            min_val = stats.get("min_val")
-            max_val = stats.get("max_val")
-            before_min = field_req.get("min_value")
-            before_max = field_req.get("max_value")
-            if min_val is not None:
-                field_req["min_value"] = min(
-                    float(field_req.get("min_value", min_val)), float(min_val)
-                )
-            if max_val is not None:
-                field_req["max_value"] = max(
-                    float(field_req.get("max_value", max_val)), float(max_val)
-                )
-            exp_root.setdefault(col, {}).setdefault("adjustments", []).append(
-                {
-                    "rule": "numeric_range",
-                    "action": "widened",
-                    "reason": "training-pass failure",
-                    "before": {"min": before_min, "max": before_max},
-                    "after": {
-                        "min": field_req.get("min_value"),
-                        "max": field_req.get("max_value"),
-                    },
-                }
-            )
-        elif failing_rule == "date_bounds":
-            before_after = field_req.get("after_date") or field_req.get(
-                "after_datetime"
-            )
-            before_before = field_req.get("before_date") or field_req.get(
-                "before_datetime"
-            )
-            for k in ["after_date", "before_date", "after_datetime", "before_datetime"]:
-                field_req.pop(k, None)
-            exp_root.setdefault(col, {}).setdefault("adjustments", []).append(
-                {
-                    "rule": "date_bounds",
-                    "action": "removed",
-                    "reason": "training-pass failure",
-                    "before": {"after": before_after, "before": before_before},
-                }
-            )
-
     # --- Explanation helpers (kept 1:1 with existing explain payload semantics) ---
     def _explain_type(self, req: dict[str, Any]) -> Any:
         return str(req.get("type")) if "type" in req else None
@@ -644,15 +444,7 @@ class ContractGenerator:
         if "pattern" not in req:
             return None
         try:
-            non_null = series.dropna().astype(str)
-            import re as _re
-
-            patt = _re.compile(req["pattern"])
-            coverage = (
-                float(non_null.apply(lambda v: bool(patt.match(v))).mean())
-                if len(non_null)
-                else 1.0
-            )
+            coverage = pattern_coverage(series, req["pattern"])
         except Exception:
             coverage = None
         return {
@@ -727,72 +519,26 @@ class ContractGenerator:
         inf_cfg: InferenceConfig,
         pk_fields: list | None = None,
     ) -> dict[str, Any]:
-        field_reqs: dict[str, Any] = {}
         prof_fields = data_profile.get("fields", {}) or {}
+        arguments = []
         for col in data.columns:
             fp = prof_fields.get(col, {"dtype": str(data[col].dtype)})
             # Ensure name for downstream logic
             fp.setdefault("name", col)
-            field_reqs[col] = self._build_field_requirement(
-                fp, data[col], inf_cfg, pk_fields=pk_fields
-            )
-        return field_reqs
+            arguments.append((fp, data[col], inf_cfg, pk_fields))
+        requirements = map_columns(self._build_field_requirement, arguments, inf_cfg)
+        return dict(zip(data.columns, requirements))
 
     def _enforce_training_pass(
         self, data: pd.DataFrame, standard: dict[str, Any]
     ) -> dict[str, Any]:
         """Enforce training-pass guarantee for the standard.
 
-        Process:
-        - Validate each field value against its rules in strict order
-        - On failures, relax only the failing rule(s) and re-validate
-        - Returns adjusted standard that the training data passes.
+        Delegates to ContractBuilder.enforce_training_pass_guarantee, which
+        relaxes only the failing rules from column aggregates and returns an
+        adjusted standard that the training data passes.
         """
-        reqs = standard.get("requirements", {}).get("field_requirements", {})
-        if not isinstance(reqs, dict):
-            return standard
-
-        # Prepare explanations sink for adjustments
-        meta = standard.setdefault("metadata", {})
-        exp_root = meta.setdefault("explanations", {})
-
-        # Precompute observed per-field stats for relaxation
-        observed_stats = self._prepare_observed_stats(data)
-
-        # Iterate until stable or 2 passes for safety
-        for _ in range(2):
-            any_changes = False
-            for col in data.columns:
-                if col not in reqs:
-                    continue
-                field_req = reqs[col]
-                # Ensure nullable aligns with data if required
-                if not field_req.get("nullable", True) and data[col].isnull().any():
-                    field_req["nullable"] = True
-                    any_changes = True
-
-                # Validate non-null values and capture first failing rule type
-                for val in data[col].dropna():
-                    failing_rule = self._validate_value_against_rules(val, field_req)
-                    if failing_rule:
-                        self._relax_constraint_for_failure(
-                            col,
-                            failing_rule,
-                            field_req,
-                            observed_stats.get(col, {}),
-                            exp_root,
-                        )
-                        any_changes = True
-                        # After relaxation, continue to next value
-                        continue
-
-                # write back
-                reqs[col] = field_req
-
-            if not any_changes:
-                break
-
-        return standard
+        return self.standard_builder.enforce_training_pass_guarantee(data, standard)
 
     def _generate_dimension_requirements(
         self, thresholds: dict[str, Any]
@@ -967,7 +713,11 @@ class ContractGenerator:
         Args:
             data: DataFrame to analyze
             data_name: Name for the generated standard
-            generation_config: Optional configuration for generation thresholds
+            generation_config: Optional configuration for generation thresholds;
+                a "sampling" entry (SamplingConfig fields) runs inference on a
+                sample and then verifies the contract against all rows, and
+                "plausibility_baselines": True records outlier quartiles and
+                category shares for plausibility scoring
 
         Returns:
             Complete ADRI standard dictionary in normalized format:
@@ -978,6 +728,20 @@ class ContractGenerator:
         """
         # Sanitize data to handle complex object types
         data = self.standard_builder.sanitize_dataframe(data)
+        config = generation_config or {}
+
+        # Sample once; every inference step below runs on the sample
+        sampling = config.get("sampling") or self.config.get("sampling")
+        full_data = None
+        if sampling:
+            sampling_config = (
+                sampling
+                if isinstance(sampling, SamplingConfig)
+                else SamplingConfig(**sampling)
+            )
+            sampled = sample_rows(data, sampling_config)
+            if len(sampled) < len(data):
+                full_data, data = data, sampled
 
         # Profile the data
         data_profile = self.profiler.profile_data(data)
@@ -998,14 +762,15 @@ class ContractGenerator:
             delattr(self, "_current_authority_override")
 
         # Enforce training-pass guarantee
-        standard = self.standard_builder.enforce_training_pass_guarantee(data, standard)
+        inference_config = InferenceConfig(**(config.get("inference", {}) or {}))
+        standard = self.standard_builder.enforce_training_pass_guarantee(
+            data, standard, inference_config
+        )
 
         # Configure freshness detection
         standard = self.standard_builder.detect_and_configure_freshness(data, standard)
 
         # Add explanations
-        config = generation_config or {}
-        inference_config = InferenceConfig(**(config.get("inference", {}) or {}))
         standard = self.explanation_generator.add_explanations_to_standard(
             standard, data, data_profile, inference_config
         )
@@ -1013,6 +778,27 @@ class ContractGenerator:
         # Add plausibility templates
         standard = self.standard_builder.add_plausibility_templates(standard)
 
+        # Persist plausibility baselines from the (sampled) training data
+        if config.get("plausibility_baselines") or self.config.get(
+            "plausibility_baselines"
+        ):
+            standard = self.standard_builder.add_plausibility_baselines(data, standard)
+
+        # Re-establish the training-pass guarantee on the full data
+        if full_data is not None:
+            if sampling_config.verify:
+                standard = self.standard_builder.verify_training_pass(
+                    full_data, standard, inference_config
+                )
+            standard.setdefault("metadata", {})["sampling"] = {
+                "strategy": sampling_config.strategy,
+                "column": sampling_config.column,
+                "seed": sampling_config.seed,
+                "sample_rows": len(data),
+                "total_rows": len(full_data),
+                "verified": sampling_config.verify,
+            }
+
         # Clean numpy types for YAML compatibility
         standard = self._clean_numpy_types(standard)
 
@@ -11,6 +11,13 @@ from typing import Any
 
 import pandas as pd
 
+# (name, regex) pairs reported in common_patterns when >80% of values match
+COMMON_PATTERNS = (
+    ("email", r"^[^@]+@[^@]+\.[^@]+$"),
+    ("phone", r"^[\+]?[0-9\s\-\(\)]+$"),
+    ("date", r"^\d{4}-\d{2}-\d{2}"),
+)
+
 
 class ProfileResult:
     """Result of data profiling operation with clean, explicit interface.
@@ -180,6 +187,8 @@ class DataProfiler:
             "enable_pattern_detection", True
         )
         self.null_threshold = self.config.get("null_threshold", 0.05)
+        # Opt-in: profile the full data with approximate, bounded-memory sketches
+        self.streaming = self.config.get("streaming", False)
 
     def profile_data(
         self, data: pd.DataFrame, max_rows: int | None = None
@@ -187,6 +196,11 @@ class DataProfiler:
         """
         Profile a DataFrame to understand its structure and patterns.
 
+        Datasets larger than ``sample_size`` are truncated to it. With
+        ``streaming`` configured as True, the full dataset is profiled by
+        StreamingProfiler instead; its medians and outlier counts are
+        approximate.
+
         Args:
             data: DataFrame to profile
             max_rows: Maximum rows to analyze (for performance)
@@ -207,6 +221,11 @@ class DataProfiler:
                 data_quality_score=0.0,
             )
 
+        if self.streaming:
+            from .streaming_profiler import StreamingProfiler
+
+            return StreamingProfiler(self.config).profile_data(data, max_rows)
+
         # Apply sampling if configured
         sample_size = max_rows or self.sample_size
         if len(data) > sample_size:
@@ -290,15 +309,15 @@ class DataProfiler:
 
     def _profile_single_field(self, series: pd.Series) -> dict[str, Any]:
         """Profile a single field/column."""
+        null_count = int(series.isnull().sum())
+        unique_count = int(series.astype(str).nunique())
         profile = {
             "name": series.name,
             "dtype": str(series.dtype),
-            "null_count": int(series.isnull().sum()),
-            "null_percentage": float((series.isnull().sum() / len(series)) * 100),
-            "unique_count": int(series.astype(str).nunique()),
-            "unique_percentage": float(
-                (series.astype(str).nunique() / len(series)) * 100
-            ),
+            "null_count": null_count,
+            "null_percentage": float((null_count / len(series)) * 100),
+            "unique_count": unique_count,
+            "unique_percentage": float((unique_count / len(series)) * 100),
         }
 
         # Add type-specific analysis
@@ -308,19 +327,20 @@ class DataProfiler:
             non_null_series = series.dropna()
             if len(non_null_series) > 0:
                 try:
+                    q1, median, q3 = (
+                        float(q) for q in non_null_series.quantile([0.25, 0.5, 0.75])
+                    )
                     profile.update(
                         {
                             "min_value": float(non_null_series.min()),
                             "max_value": float(non_null_series.max()),
                             "mean_value": float(non_null_series.mean()),
-                            "median_value": float(non_null_series.median()),
+                            "median_value": median,
                             "std_dev": float(non_null_series.std()),
-                            "outlier_count": int(self._count_outliers(non_null_series)),
-                            "quartiles": [
-                                float(non_null_series.quantile(0.25)),
-                                float(non_null_series.quantile(0.5)),
-                                float(non_null_series.quantile(0.75)),
-                            ],
+                            "outlier_count": int(
+                                self._count_outliers(non_null_series, q1, q3)
+                            ),
+                            "quartiles": [q1, median, q3],
                         }
                     )
                 except (TypeError, ValueError):
@@ -361,24 +381,27 @@ class DataProfiler:
                 sample_values = head_vals + [v for v in tail_vals if v not in head_vals]
                 # Clamp to at most 10 items
                 sample_values = sample_values[:10]
+                lengths = non_null_str.str.len()
 
                 profile.update(
                     {
-                        "avg_length": float(non_null_str.str.len().mean()),
-                        "max_length": int(non_null_str.str.len().max()),
-                        "min_length": int(non_null_str.str.len().min()),
-                        "common_patterns": self._identify_patterns(non_null_series),
+                        "avg_length": float(lengths.mean()),
+                        "max_length": int(lengths.max()),
+                        "min_length": int(lengths.min()),
+                        "common_patterns": self._identify_patterns(non_null_str),
                         "sample_values": sample_values,
                     }
                 )
 
         return profile
 
-    def _count_outliers(self, series: pd.Series) -> int:
-        """Count outliers using IQR method."""
+    def _count_outliers(
+        self, series: pd.Series, q1: float | None = None, q3: float | None = None
+    ) -> int:
+        """Count outliers using IQR method (quartiles computed if not given)."""
         try:
-            Q1 = series.quantile(0.25)
-            Q3 = series.quantile(0.75)
+            Q1 = series.quantile(0.25) if q1 is None else q1
+            Q3 = series.quantile(0.75) if q3 is None else q3
             IQR = Q3 - Q1
             lower_bound = Q1 - 1.5 * IQR
             upper_bound = Q3 + 1.5 * IQR
@@ -388,30 +411,13 @@ class DataProfiler:
 
     def _identify_patterns(self, series: pd.Series) -> list[str]:
         """Identify common patterns in string data."""
-        patterns = []
-
-        # Check for email patterns
-        email_pattern = series.astype(str).str.contains(
-            r"^[^@]+@[^@]+\.[^@]+$", regex=True, na=False
-        )
-        if email_pattern.sum() > len(series) * 0.8:
-            patterns.append("email")
-
-        # Check for phone patterns
-        phone_pattern = series.astype(str).str.contains(
-            r"^[\+]?[0-9\s\-\(\)]+$", regex=True, na=False
-        )
-        if phone_pattern.sum() > len(series) * 0.8:
-            patterns.append("phone")
-
-        # Check for date patterns
-        date_pattern = series.astype(str).str.contains(
-            r"^\d{4}-\d{2}-\d{2}", regex=True, na=False
-        )
-        if date_pattern.sum() > len(series) * 0.8:
-            patterns.append("date")
-
-        return patterns
+        values = series.astype(str)
+        return [
+            name
+            for name, regex in COMMON_PATTERNS
+            if values.str.contains(regex, regex=True, na=False).sum()
+            > len(series) * 0.8
+        ]
 
     def _assess_quality_patterns(self, data: pd.DataFrame) -> dict[str, Any]:
         """Assess overall quality patterns in the data."""
@@ -113,7 +113,7 @@ class ContractBuilder:
         try:
             # Detect fields that appear to be derived from other fields
             derived_fields = self.field_engine.detect_derived_fields(
-                data, field_requirements
+                data, field_requirements, max_workers=config.max_workers
             )
 
             # Enhance each derived field with derivation rules
@@ -427,13 +427,23 @@ class ContractBuilder:
         self.dimension_builder.normalize_rule_weights(dimension_reqs, "plausibility")
 
     def enforce_training_pass_guarantee(
-        self, data: pd.DataFrame, standard: dict[str, Any]
+        self,
+        data: pd.DataFrame,
+        standard: dict[str, Any],
+        config: InferenceConfig | None = None,
     ) -> dict[str, Any]:
         """Ensure the generated standard passes on its training data.
 
+        Each column is checked with one vectorized pass per rule
+        (FieldInferenceEngine.find_failing_rules) and failing rules are relaxed
+        from column aggregates: numeric and length bounds widen to the observed
+        extremes, and missing categories are added to allowed_values while the
+        column stays within the enum size limit.
+
         Args:
             data: Training data that must pass validation
             standard: Standard to validate and potentially adjust
+            config: Inference configuration (enum size limit)
 
         Returns:
             Modified standard that passes on training data
@@ -442,53 +452,113 @@ class ContractBuilder:
         if not isinstance(field_reqs, dict):
             return standard
 
-        # Prepare adjustment logging
         metadata = standard.setdefault("metadata", {})
         adjustments_log = metadata.setdefault("explanations", {})
+        config = config or InferenceConfig()
 
-        # Get observed statistics for relaxation
-        observed_stats = self.field_engine.prepare_observed_stats(data)
+        for col in data.columns:
+            field_req = field_reqs.get(col)
+            if isinstance(field_req, dict):
+                self._relax_to_data(
+                    col, data[col], field_req, adjustments_log, config.enum_max_unique
+                )
 
-        # Iterate until stable (max 2 passes for safety)
-        for iteration in range(2):
-            any_changes = False
+        return standard
 
-            for col in data.columns:
-                if col not in field_reqs:
-                    continue
+    def verify_training_pass(
+        self,
+        data: pd.DataFrame,
+        standard: dict[str, Any],
+        config: InferenceConfig | None = None,
+    ) -> dict[str, Any]:
+        """Relax a standard generated from a sample until the full data passes.
 
-                field_req = field_reqs[col]
+        Applies the same relaxation as enforce_training_pass_guarantee to the
+        full data, re-detects the primary key if it repeats outside the sample
+        and moves the freshness as_of forward to the newest full-data date.
 
-                # Ensure nullable aligns with actual data
-                if not field_req.get("nullable", True) and data[col].isnull().any():
-                    field_req["nullable"] = True
-                    any_changes = True
+        Args:
+            data: Full data that must pass validation
+            standard: Standard generated from a sample of ``data``
+            config: Inference configuration
 
-                # Validate each non-null value and relax failing constraints
-                for val in data[col].dropna():
-                    failing_rule = self.field_engine.validate_field_against_rules(
-                        val, field_req
-                    )
-                    if failing_rule:
-                        self.field_engine.relax_constraint_for_failure(
-                            col,
-                            failing_rule,
-                            field_req,
-                            observed_stats.get(col, {}),
-                            adjustments_log,
-                        )
-                        any_changes = True
-                        # Continue to next value after relaxation
-                        continue
+        Returns:
+            Modified standard that passes on the full data
+        """
+        config = config or InferenceConfig()
+
+        # A key unique within the sample can still repeat in the full data
+        record_id = standard.get("record_identification") or {}
+        pk_fields = [
+            f for f in record_id.get("primary_key_fields") or [] if f in data.columns
+        ]
+        if pk_fields and data.duplicated(subset=pk_fields).any():
+            record_id["primary_key_fields"] = self._detect_primary_key_fields(
+                data, config
+            )
 
-                # Update field requirements
-                field_reqs[col] = field_req
+        standard = self.enforce_training_pass_guarantee(data, standard, config)
+
+        # Freshness as_of was taken from the sample's newest date
+        metadata = standard.setdefault("metadata", {})
+        freshness = metadata.get("freshness")
+        if isinstance(freshness, dict) and freshness.get("date_field") in data.columns:
+            try:
+                from datetime import timedelta
 
-            if not any_changes:
-                break  # Converged
+                parsed = pd.to_datetime(
+                    data[freshness["date_field"]], errors="coerce", format="ISO8601"
+                )
+                max_date = parsed.max()
+                current = pd.Timestamp(str(freshness.get("as_of", "")).rstrip("Z"))
+                if pd.notna(max_date):
+                    as_of = max_date.to_pydatetime() + timedelta(days=1)
+                    if pd.isna(current) or pd.Timestamp(as_of) > current:
+                        freshness["as_of"] = as_of.isoformat() + "Z"
+            except Exception:
+                pass
 
         return standard
 
+    def _relax_to_data(
+        self,
+        col: str,
+        series: pd.Series,
+        field_req: dict[str, Any],
+        adjustments_log: dict[str, Any],
+        max_distinct: int,
+        max_passes: int = 6,
+    ) -> None:
+        """Relax one field requirement until every value of ``series`` passes.
+
+        Observed statistics are computed only for columns that fail, and only
+        once. Each pass relaxes the first failing rule whose relaxation changes
+        the requirement, so a rule that cannot be relaxed (e.g. a string type
+        over non-string values) does not block the rules after it.
+        """
+        if not field_req.get("nullable", True) and series.isnull().any():
+            field_req["nullable"] = True
+
+        observed_stats = None
+        for _ in range(max_passes):
+            failing = self.field_engine.find_failing_rules(series, field_req)
+            if not failing:
+                return
+            if observed_stats is None:
+                observed_stats = self.field_engine.prepare_observed_stats(
+                    series.to_frame(col), max_distinct=max_distinct
+                ).get(col, {})
+
+            for rule in failing:
+                before = dict(field_req)
+                self.field_engine.relax_constraint_for_failure(
+                    col, rule, field_req, observed_stats, adjustments_log
+                )
+                if field_req != before:
+                    break
+            else:
+                return
+
     def detect_and_configure_freshness(
         self, data: pd.DataFrame, standard: dict[str, Any]
     ) -> dict[str, Any]:
@@ -677,6 +747,55 @@ class ContractBuilder:
 
         return standard
 
+    def add_plausibility_baselines(
+        self, data: pd.DataFrame, standard: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Persist plausibility baselines (quartiles, category shares) in the standard.
+
+        Assessments then score outliers and rare categories against these
+        training-time references instead of each batch's own statistics.
+        Primary key fields are left out of the baselines. When no
+        plausibility rule weights are active, the statistical_outliers and
+        categorical_frequency rules are enabled for the recorded baselines.
+
+        Args:
+            data: Training data
+            standard: Standard to enhance
+
+        Returns:
+            Standard with dimension_requirements.plausibility.baselines set
+        """
+        from ...validator.dimensions.plausibility import build_plausibility_baselines
+
+        dimension_reqs = standard.get("requirements", {}).get(
+            "dimension_requirements", {}
+        )
+        if "plausibility" not in dimension_reqs:
+            return standard
+
+        record_id = standard.get("record_identification", {})
+        pk_fields = (
+            record_id.get("primary_key_fields", [])
+            if isinstance(record_id, dict)
+            else []
+        )
+        baselines = build_plausibility_baselines(data, exclude_columns=pk_fields)
+        plausibility = dimension_reqs["plausibility"]
+        plausibility["baselines"] = baselines
+
+        rule_weights = plausibility.setdefault("scoring", {}).setdefault(
+            "rule_weights", {}
+        )
+        if not any(float(v or 0) > 0 for v in rule_weights.values()):
+            if baselines["numeric"]:
+                rule_weights["statistical_outliers"] = 0.4
+            if baselines["categorical"]:
+                rule_weights["categorical_frequency"] = 0.3
+            self.dimension_builder.normalize_rule_weights(
+                dimension_reqs, "plausibility"
+            )
+        return standard
+
     def sanitize_dataframe(self, data: pd.DataFrame) -> pd.DataFrame:
         """Sanitize DataFrame to handle unhashable object types.
 
@@ -9,7 +9,7 @@ from typing import Any
 
 import pandas as pd
 
-from ..rule_inference import InferenceConfig
+from ..rule_inference import InferenceConfig, pattern_coverage
 
 
 class ExplanationGenerator:
@@ -381,13 +381,7 @@ class ExplanationGenerator:
             return None
 
         try:
-            non_null = series.dropna().astype(str)
-            import re
-
-            pattern = field_req["pattern"]
-            compiled_pattern = re.compile(pattern)
-            matches = non_null.apply(lambda v: bool(compiled_pattern.match(v)))
-            coverage = float(matches.mean()) if len(non_null) > 0 else 1.0
+            coverage = pattern_coverage(series, field_req["pattern"])
         except Exception:
             coverage = None
 
@@ -5,8 +5,11 @@ inference including type detection, constraint generation, and rule creation
 for individual data fields.
 """
 
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from ..rule_inference import (
@@ -21,6 +24,105 @@ from ..rule_inference import (
 )
 
 
+def map_columns(
+    function: Callable[..., Any],
+    arguments: list[tuple[Any, ...]],
+    config: InferenceConfig,
+) -> list[Any]:
+    """Apply ``function`` to per-column argument tuples, in input order.
+
+    Runs sequentially unless ``config.parallel_backend`` is 'thread' or
+    'process'; pools are sized by ``config.max_workers``. Results always come
+    back in the order of ``arguments``, so generated contracts do not depend
+    on the backend.
+
+    Args:
+        function: Callable taking one argument tuple's items (must be
+            picklable for the process backend)
+        arguments: One argument tuple per column
+        config: Inference configuration
+
+    Returns:
+        Results in the order of ``arguments``
+    """
+    backend = config.parallel_backend
+    if backend not in (None, "thread", "process"):
+        raise ValueError(
+            f"Unknown parallel_backend '{backend}'. Use 'thread' or 'process'"
+        )
+    if backend is None or config.max_workers == 1 or len(arguments) < 2:
+        return [function(*args) for args in arguments]
+
+    columns = list(zip(*arguments))
+    if backend == "thread":
+        with ThreadPoolExecutor(max_workers=config.max_workers) as pool:
+            return list(pool.map(function, *columns))
+
+    with ProcessPoolExecutor(max_workers=config.max_workers) as pool:
+        workers = getattr(pool, "_max_workers", 1)
+        chunksize = max(1, len(arguments) // (workers * 4))
+        return list(pool.map(function, *columns, chunksize=chunksize))
+
+
+def _correlation_ratio_codes(codes: np.ndarray, values: np.ndarray) -> float:
+    """Correlation ratio (eta) of float ``values`` grouped by category codes.
+
+    NaN values count towards their group's size but not its mean, matching
+    pandas' skipna semantics.
+    """
+    valid = ~np.isnan(values)
+    if not valid.any():
+        return float("nan")
+    overall_mean = values[valid].mean()
+
+    counts = np.bincount(codes)
+    size = len(counts)
+    sums = np.bincount(codes[valid], weights=values[valid], minlength=size)
+    valid_counts = np.bincount(codes[valid], minlength=size)
+    present = counts > 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums[present] / valid_counts[present]
+    ss_between = float((counts[present] * (means - overall_mean) ** 2).sum())
+    ss_total = float(((values[valid] - overall_mean) ** 2).sum())
+
+    if ss_total == 0:
+        return 0.0
+    return (ss_between / ss_total) ** 0.5
+
+
+def _cramers_v_codes(
+    x_codes: np.ndarray, y_codes: np.ndarray, x_size: int, y_size: int
+) -> float:
+    """Cramér's V from two aligned arrays of non-negative category codes.
+
+    Uses chi-square = sum(observed^2 / expected) - n over the observed cells,
+    so sparse tables never have to be materialized.
+    """
+    n = len(x_codes)
+    if n == 0:
+        return 0.0
+
+    keys = x_codes.astype(np.int64) * y_size + y_codes
+    if x_size * y_size <= 4 * n:
+        observed = np.bincount(keys, minlength=x_size * y_size)
+        cells = np.flatnonzero(observed)
+        observed = observed[cells]
+    else:
+        cells, observed = np.unique(keys, return_counts=True)
+
+    row_sums = np.bincount(x_codes, minlength=x_size)
+    col_sums = np.bincount(y_codes, minlength=y_size)
+    expected = row_sums[cells // y_size] * col_sums[cells % y_size] / n
+    chi_square = float((observed.astype(float) ** 2 / expected).sum()) - n
+
+    min_dim = min(np.count_nonzero(row_sums) - 1, np.count_nonzero(col_sums) - 1)
+    if min_dim <= 0:
+        return 0.0
+
+    cramers_v = max(chi_square, 0.0) / (n * min_dim)
+    return min(cramers_v**0.5, 1.0)  # Cap at 1.0
+
+
 class FieldInferenceEngine:
     """Handles inference of field-level requirements and constraints.
 
@@ -42,6 +144,10 @@ class FieldInferenceEngine:
     ) -> dict[str, Any]:
         """Infer comprehensive requirements for all fields in the data.
 
+        Columns can be inferred in a thread or process pool via
+        ``config.parallel_backend``; the output order always follows
+        ``data.columns``.
+
         Args:
             data: DataFrame containing the data to analyze
             field_profile: Profile data for all fields from DataProfiler
@@ -51,18 +157,17 @@ class FieldInferenceEngine:
         Returns:
             Dictionary mapping field names to their requirements
         """
-        field_requirements = {}
         prof_fields = field_profile.get("fields", {}) or {}
 
+        arguments = []
         for col in data.columns:
             field_prof = prof_fields.get(col, {"dtype": str(data[col].dtype)})
             field_prof.setdefault("name", col)
+            arguments.append((field_prof, data[col], config, pk_fields))
 
-            field_requirements[col] = self.build_field_requirement(
-                field_prof, data[col], config, pk_fields=pk_fields
-            )
-
-        return field_requirements
+        # Columns are independent; see InferenceConfig.parallel_backend
+        requirements = map_columns(self.build_field_requirement, arguments, config)
+        return dict(zip(data.columns, requirements))
 
     def build_field_requirement(
         self,
@@ -127,90 +232,137 @@ class FieldInferenceEngine:
         return req
 
     def detect_derived_fields(
-        self, data: pd.DataFrame, field_requirements: dict[str, Any]
+        self,
+        data: pd.DataFrame,
+        field_requirements: dict[str, Any],
+        max_workers: int | None = None,
     ) -> dict[str, dict[str, Any]]:
         """Detect fields that appear to be derived from other fields.
 
         Analyzes categorical fields to identify those that may be computed
         from other fields based on statistical correlations and patterns.
+        Every column is factorized once; pairs involving a constant column
+        are skipped (their association is 0) and targets are evaluated in a
+        thread pool.
 
         Args:
             data: DataFrame containing the data to analyze
             field_requirements: Existing field requirements
+            max_workers: Worker threads for the target fields (None: executor
+                default, 1: sequential)
 
         Returns:
             Dictionary mapping field names to their derivation metadata
         """
-        derived_fields = {}
-
         # Only analyze categorical fields with allowed_values
         categorical_fields = {
             name: req
             for name, req in field_requirements.items()
             if "allowed_values" in req and isinstance(req["allowed_values"], list)
         }
+        targets = [name for name in categorical_fields if name in data.columns]
+        if not targets:
+            return {}
+
+        encoded = {col: self._encode_column(data[col]) for col in data.columns}
+
+        # Skip predictors that are categorical with many values
+        predictors = [
+            col
+            for col in data.columns
+            if encoded[col] is not None
+            and encoded[col]["cardinality"] > 1
+            and len(field_requirements.get(col, {}).get("allowed_values") or ()) <= 10
+        ]
+
+        def correlations(target: str) -> dict[str, float]:
+            found: dict[str, float] = {}
+            coded = encoded[target]
+            if coded is None or coded["cardinality"] < 2:
+                return found
+            for other in predictors:
+                if other == target:
+                    continue
+                try:
+                    correlation = self._coded_correlation(coded, encoded[other])
+                except Exception:
+                    # Skip fields that can't be analyzed
+                    continue
+                if correlation >= self._correlation_threshold:
+                    found[other] = correlation
+            return found
 
-        for field_name, field_req in categorical_fields.items():
-            if field_name not in data.columns:
-                continue
-
-            # Analyze correlations with other fields
-            correlated_fields = self._find_correlated_fields(
-                field_name, data, field_requirements
-            )
+        if max_workers == 1 or len(targets) == 1:
+            results = [correlations(target) for target in targets]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(correlations, targets))
 
-            if correlated_fields:
+        derived_fields = {}
+        for field_name, correlated in zip(targets, results):
+            if correlated:
                 derived_fields[field_name] = {
                     "is_derived": True,
-                    "input_fields": correlated_fields,
-                    "allowed_values": field_req["allowed_values"],
-                    "confidence": self._calculate_derivation_confidence(
-                        field_name, correlated_fields, data
-                    ),
+                    "input_fields": list(correlated),
+                    "allowed_values": categorical_fields[field_name]["allowed_values"],
+                    "confidence": sum(correlated.values()) / len(correlated),
                 }
 
         return derived_fields
 
-    def _find_correlated_fields(
-        self, target_field: str, data: pd.DataFrame, field_requirements: dict[str, Any]
-    ) -> list[str]:
-        """Find fields that correlate with the target categorical field.
-
-        Args:
-            target_field: Name of the categorical field to analyze
-            data: DataFrame containing the data
-            field_requirements: Field requirements for type information
+    def _encode_column(self, series: pd.Series) -> dict[str, Any] | None:
+        """Factorize a column for correlation analysis.
 
-        Returns:
-            List of field names that correlate with the target
+        Returns integer codes (-1 for nulls), the number of distinct values
+        and, when the column can be read as numbers, a float array with NaN
+        for nulls and unparseable values. Numeric coercion of non-numeric
+        dtypes runs on the distinct values only.
         """
-        correlated = []
-        target_series = data[target_field]
+        try:
+            codes, uniques = pd.factorize(series)
+        except TypeError:
+            return None
 
-        for other_field in data.columns:
-            if other_field == target_field:
-                continue
+        numeric = None
+        if pd.api.types.is_numeric_dtype(series) and not isinstance(
+            series.dtype, pd.CategoricalDtype
+        ):
+            numeric = series.to_numpy(dtype=float, na_value=np.nan)
+        else:
+            try:
+                parsed = pd.to_numeric(pd.Series(uniques), errors="coerce")
+                lookup = parsed.to_numpy(dtype=float, na_value=np.nan)
+                numeric = np.append(lookup, np.nan)[codes]
+            except Exception:
+                numeric = None
 
-            # Skip if other field is also categorical with many values
-            if other_field in field_requirements:
-                other_req = field_requirements[other_field]
-                if "allowed_values" in other_req:
-                    if len(other_req["allowed_values"]) > 10:
-                        continue
+        return {"codes": codes, "cardinality": len(uniques), "numeric": numeric}
 
-            # Calculate correlation based on field type
-            try:
-                correlation = self._calculate_categorical_correlation(
-                    target_series, data[other_field]
-                )
+    def _coded_correlation(
+        self, target: dict[str, Any], predictor: dict[str, Any]
+    ) -> float:
+        """Correlation between an encoded categorical target and predictor.
 
-                if correlation >= self._correlation_threshold:
-                    correlated.append(other_field)
-            except Exception:
-                # Skip fields that can't be analyzed
-                continue
+        Uses the correlation ratio when more than 80% of the jointly non-null
+        predictor values are numeric and Cramér's V otherwise.
+        """
+        mask = (target["codes"] >= 0) & (predictor["codes"] >= 0)
+        total = int(mask.sum())
+        if total < 10:  # Need at least 10 samples
+            return 0.0
 
-        return correlated
+        target_codes = target["codes"][mask]
+        if predictor["numeric"] is not None:
+            values = predictor["numeric"][mask]
+            if np.count_nonzero(~np.isnan(values)) / total > 0.8:
+                return _correlation_ratio_codes(target_codes, values)
+
+        return _cramers_v_codes(
+            target_codes,
+            predictor["codes"][mask],
+            target["cardinality"],
+            predictor["cardinality"],
+        )
 
     def _calculate_categorical_correlation(
         self, target: pd.Series, predictor: pd.Series
@@ -226,25 +378,11 @@ class FieldInferenceEngine:
         Returns:
             Correlation coefficient between 0 and 1
         """
-        # Remove missing values
-        mask = target.notna() & predictor.notna()
-        if mask.sum() < 10:  # Need at least 10 samples
-            return 0.0
-
-        target_clean = target[mask]
-        predictor_clean = predictor[mask]
-
-        # Check if predictor is numeric
-        try:
-            predictor_numeric = pd.to_numeric(predictor_clean, errors="coerce")
-            if predictor_numeric.notna().sum() / len(predictor_numeric) > 0.8:
-                # Use correlation ratio (eta) for numeric predictor
-                return self._correlation_ratio(target_clean, predictor_numeric)
-        except Exception:
-            pass
-
-        # Use Cramér's V for categorical predictor
-        return self._cramers_v(target_clean, predictor_clean)
+        encoded_target = self._encode_column(target)
+        encoded_predictor = self._encode_column(predictor)
+        if encoded_target is None or encoded_predictor is None:
+            raise TypeError("Unhashable values cannot be correlated")
+        return self._coded_correlation(encoded_target, encoded_predictor)
 
     def _correlation_ratio(self, categories: pd.Series, values: pd.Series) -> float:
         """Calculate correlation ratio (eta) between categorical and numeric variables.
@@ -256,26 +394,10 @@ class FieldInferenceEngine:
         Returns:
             Correlation ratio between 0 and 1
         """
-        # Calculate overall mean
-        overall_mean = values.mean()
-
-        # Calculate sum of squares between groups
-        ss_between = 0.0
-        for category in categories.unique():
-            category_values = values[categories == category]
-            if len(category_values) > 0:
-                category_mean = category_values.mean()
-                ss_between += len(category_values) * (category_mean - overall_mean) ** 2
-
-        # Calculate total sum of squares
-        ss_total = ((values - overall_mean) ** 2).sum()
-
-        if ss_total == 0:
-            return 0.0
-
-        # Correlation ratio is sqrt(SS_between / SS_total)
-        eta_squared = ss_between / ss_total
-        return eta_squared**0.5
+        codes, _ = pd.factorize(categories)
+        return _correlation_ratio_codes(
+            codes, pd.to_numeric(values).to_numpy(dtype=float, na_value=np.nan)
+        )
 
     def _cramers_v(self, x: pd.Series, y: pd.Series) -> float:
         """Calculate Cramér's V statistic for categorical association.
@@ -287,67 +409,12 @@ class FieldInferenceEngine:
         Returns:
             Cramér's V between 0 and 1
         """
-        # Create contingency table
-        contingency_table = pd.crosstab(x, y)
-
-        # Calculate chi-square statistic
-        n = contingency_table.sum().sum()
-        if n == 0:
-            return 0.0
-
-        # Calculate expected frequencies and chi-square
-        row_sums = contingency_table.sum(axis=1)
-        col_sums = contingency_table.sum(axis=0)
-
-        chi_square = 0.0
-        for i in range(len(row_sums)):
-            for j in range(len(col_sums)):
-                expected = (row_sums.iloc[i] * col_sums.iloc[j]) / n
-                if expected > 0:
-                    observed = contingency_table.iloc[i, j]
-                    chi_square += ((observed - expected) ** 2) / expected
-
-        # Calculate Cramér's V
-        min_dim = min(len(row_sums) - 1, len(col_sums) - 1)
-        if min_dim == 0:
-            return 0.0
-
-        cramers_v = (chi_square / (n * min_dim)) ** 0.5
-        return min(cramers_v, 1.0)  # Cap at 1.0
-
-    def _calculate_derivation_confidence(
-        self, target_field: str, input_fields: list[str], data: pd.DataFrame
-    ) -> float:
-        """Calculate confidence score for derived field detection.
-
-        Args:
-            target_field: Name of the target field
-            input_fields: List of correlated input fields
-            data: DataFrame containing the data
-
-        Returns:
-            Confidence score between 0 and 1
-        """
-        if not input_fields:
-            return 0.0
-
-        # Average correlation strength across all input fields
-        correlations = []
-        target_series = data[target_field]
-
-        for input_field in input_fields:
-            try:
-                corr = self._calculate_categorical_correlation(
-                    target_series, data[input_field]
-                )
-                correlations.append(corr)
-            except Exception:
-                continue
-
-        if not correlations:
-            return 0.0
-
-        return sum(correlations) / len(correlations)
+        x_codes, x_uniques = pd.factorize(x)
+        y_codes, y_uniques = pd.factorize(y)
+        mask = (x_codes >= 0) & (y_codes >= 0)
+        return _cramers_v_codes(
+            x_codes[mask], y_codes[mask], len(x_uniques), len(y_uniques)
+        )
 
     def generate_derivation_rules(
         self, field_name: str, derivation_metadata: dict[str, Any], data: pd.DataFrame
@@ -772,11 +839,185 @@ class FieldInferenceEngine:
 
         return None
 
-    def prepare_observed_stats(self, data: pd.DataFrame) -> dict[str, dict[str, Any]]:
+    def find_failing_rules(
+        self, series: pd.Series, field_req: dict[str, Any]
+    ) -> list[str]:
+        """Find the rules that at least one non-null value of a column fails.
+
+        Vectorized counterpart of validate_field_against_rules. Each rule builds
+        a candidate mask with pandas string/numeric operations that flags every
+        value the scalar check could reject; only the distinct candidates are
+        confirmed with the scalar check, stopping at the first confirmed
+        failure.
+
+        Args:
+            series: Column data
+            field_req: Field requirements dictionary
+
+        Returns:
+            Failing rule names in validate_field_against_rules order
+        """
+        from ...validator.rules import (
+            check_allowed_values,
+            check_date_bounds,
+            check_field_pattern,
+            check_field_range,
+            check_field_type,
+            check_length_bounds,
+        )
+
+        values = series.dropna()
+        if values.empty:
+            return []
+
+        # String form is only built for rules that need it
+        cache: dict[str, pd.Series] = {}
+
+        def text() -> pd.Series:
+            if "text" not in cache:
+                cache["text"] = values.astype(str)
+            return cache["text"]
+
+        date_keys = ("after_date", "before_date", "after_datetime", "before_datetime")
+        checks = (
+            ("type", check_field_type, True),
+            ("allowed_values", check_allowed_values, "allowed_values" in field_req),
+            (
+                "length_bounds",
+                check_length_bounds,
+                "min_length" in field_req or "max_length" in field_req,
+            ),
+            ("pattern", check_field_pattern, "pattern" in field_req),
+            (
+                "numeric_range",
+                check_field_range,
+                "min_value" in field_req or "max_value" in field_req,
+            ),
+            ("date_bounds", check_date_bounds, any(k in field_req for k in date_keys)),
+        )
+
+        failing = []
+        for rule, check, active in checks:
+            if not active:
+                continue
+            try:
+                mask = self._candidate_failures(rule, values, text, field_req)
+            except Exception:
+                mask = None
+            if mask is not None:
+                candidates = values[np.asarray(mask, dtype=bool)]
+            else:
+                candidates = values
+            if candidates.empty:
+                continue
+            try:
+                distinct = pd.unique(candidates)
+            except TypeError:
+                distinct = candidates.tolist()
+            if any(not check(value, field_req) for value in distinct):
+                failing.append(rule)
+        return failing
+
+    def _candidate_failures(
+        self,
+        rule: str,
+        values: pd.Series,
+        text: Callable[[], pd.Series],
+        field_req: dict[str, Any],
+    ) -> pd.Series | np.ndarray | None:
+        """Return a mask covering every value that may fail ``rule`` (None: all)."""
+        if rule == "type":
+            required = field_req.get("type", "string")
+            numeric = pd.api.types.is_numeric_dtype(values)
+            if required == "integer":
+                if pd.api.types.is_float_dtype(values):
+                    return ~np.isfinite(values.to_numpy(dtype=float))
+                if numeric:
+                    return np.zeros(len(values), dtype=bool)
+                return ~text().str.fullmatch(r"\s*[+-]?\d+\s*")
+            if required in ("number", "float"):
+                if numeric:
+                    return np.zeros(len(values), dtype=bool)
+                return pd.to_numeric(values, errors="coerce").isna()
+            if required == "string":
+                if values.dtype != object and pd.api.types.is_string_dtype(values):
+                    return np.zeros(len(values), dtype=bool)
+                if pd.api.types.infer_dtype(values, skipna=True) == "string":
+                    return np.zeros(len(values), dtype=bool)
+                return None
+            if required == "boolean":
+                if pd.api.types.is_bool_dtype(values):
+                    return np.zeros(len(values), dtype=bool)
+                return ~text().str.lower().isin(["true", "false", "1", "0"])
+            if required == "date":
+                return ~text().str.match(r"^\d{4}-\d{2}-\d{2}$|^\d{2}/\d{2}/\d{4}$")
+            return np.zeros(len(values), dtype=bool)
+
+        if rule == "allowed_values":
+            allowed = field_req.get("allowed_values")
+            if not allowed:
+                return np.zeros(len(values), dtype=bool)
+            return ~values.isin(list(allowed))
+
+        if rule == "length_bounds":
+            lengths = text().str.len()
+            mask = np.zeros(len(values), dtype=bool)
+            if field_req.get("min_length") is not None:
+                mask |= (lengths < int(field_req["min_length"])).to_numpy()
+            if field_req.get("max_length") is not None:
+                mask |= (lengths > int(field_req["max_length"])).to_numpy()
+            return mask
+
+        if rule == "pattern":
+            if not field_req.get("pattern"):
+                return np.zeros(len(values), dtype=bool)
+            return ~text().str.match(field_req["pattern"])
+
+        if rule == "numeric_range":
+            numbers = pd.to_numeric(values, errors="coerce")
+            mask = numbers.isna()
+            if field_req.get("min_value") is not None:
+                mask |= numbers < float(field_req["min_value"])
+            if field_req.get("max_value") is not None:
+                mask |= numbers > float(field_req["max_value"])
+            return mask
+
+        if rule == "date_bounds":
+            from ...validator.rules import _parse_date_like
+
+            # Plain YYYY-MM-DD strings parse identically in pandas and the
+            # scalar check; everything else is confirmed value by value
+            iso = text().str.fullmatch(r"\d{4}-\d{2}-\d{2}")
+            parsed = pd.to_datetime(
+                text().where(iso), format="%Y-%m-%d", errors="coerce"
+            )
+            mask = parsed.isna()
+            bounds = (
+                ("after_date", pd.Timestamp.fromisoformat, False),
+                ("before_date", pd.Timestamp.fromisoformat, True),
+                ("after_datetime", _parse_date_like, False),
+                ("before_datetime", _parse_date_like, True),
+            )
+            for key, parse, upper in bounds:
+                if not field_req.get(key):
+                    continue
+                bound = parse(str(field_req[key]))
+                if bound is None or getattr(bound, "tzinfo", None) is not None:
+                    return None
+                mask |= parsed > bound if upper else parsed < bound
+            return mask
+
+        return None
+
+    def prepare_observed_stats(
+        self, data: pd.DataFrame, max_distinct: int | None = None
+    ) -> dict[str, dict[str, Any]]:
         """Precompute observed statistics for training-pass relaxation.
 
         Args:
             data: DataFrame to analyze
+            max_distinct: When set, also collect the distinct non-null values
+                of columns with at most this many of them ("distinct_values")
 
         Returns:
             Dictionary mapping field names to their observed statistics
@@ -789,9 +1030,20 @@ class FieldInferenceEngine:
                 observed_stats[col] = {}
                 continue
 
+            # Extremes over distinct values equal those over all rows; float
+            # columns keep every row since 0.0 and -0.0 are equal but print
+            # with different lengths
+            distinct = None
+            if not pd.api.types.is_float_dtype(series):
+                try:
+                    distinct = pd.Series(series.unique())
+                except TypeError:
+                    distinct = None
+            values = series if distinct is None else distinct
+
             # Calculate length statistics
             try:
-                lengths = series.astype(str).str.len()
+                lengths = values.astype(str).str.len()
                 min_len = int(lengths.min()) if not lengths.empty else None
                 max_len = int(lengths.max()) if not lengths.empty else None
             except Exception:
@@ -799,7 +1051,7 @@ class FieldInferenceEngine:
 
             # Calculate numeric statistics
             try:
-                numeric_series = pd.to_numeric(series, errors="coerce")
+                numeric_series = pd.to_numeric(values, errors="coerce")
                 if numeric_series.notna().any():
                     min_val = float(numeric_series.min())
                     max_val = float(numeric_series.max())
@@ -815,6 +1067,15 @@ class FieldInferenceEngine:
                 "max_val": max_val,
             }
 
+            if max_distinct is not None:
+                if distinct is None and pd.api.types.is_float_dtype(series):
+                    distinct = pd.Series(series.unique())
+                observed_stats[col]["distinct_values"] = (
+                    distinct.tolist()
+                    if distinct is not None and len(distinct) <= max_distinct
+                    else None
+                )
+
         return observed_stats
 
     def relax_constraint_for_failure(
@@ -867,8 +1128,29 @@ class FieldInferenceEngine:
                 )
 
         elif failing_rule == "allowed_values":
-            # Remove allowed values constraint
-            if "allowed_values" in field_req:
+            from ...validator.rules import check_allowed_values
+
+            # Add missing observed categories while the enum stays small
+            allowed = field_req.get("allowed_values")
+            distinct = (observed_stats or {}).get("distinct_values")
+            if isinstance(allowed, list) and distinct is not None:
+                missing = sorted(
+                    (v for v in distinct if not check_allowed_values(v, field_req)),
+                    key=str,
+                )
+                field_req["allowed_values"] = allowed + missing
+                adjustments_log.setdefault(col, {}).setdefault(
+                    "adjustments", []
+                ).append(
+                    {
+                        "rule": "allowed_values",
+                        "action": "widened",
+                        "reason": "training-pass failure",
+                        "added": missing,
+                    }
+                )
+            # Otherwise remove allowed values constraint
+            elif "allowed_values" in field_req:
                 old_values = field_req.pop("allowed_values", None)
                 adjustments_log.setdefault(col, {}).setdefault(
                     "adjustments", []
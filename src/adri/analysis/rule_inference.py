@@ -20,6 +20,7 @@ from datetime import datetime, timedelta
 from itertools import combinations
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -52,6 +53,10 @@ class InferenceConfig:
     # Enum strategy (default keeps existing behavior)
     enum_strategy: str = "coverage"  # 'coverage' | 'tolerant'
     enum_top_k: int = 10
+    # Worker threads for parallel analysis (None: executor default, 1: sequential)
+    max_workers: int | None = None
+    # Per-column inference pool: None (sequential) | 'thread' | 'process'
+    parallel_backend: str | None = None
 
 
 # -----------------------------
@@ -252,23 +257,63 @@ _CANDIDATE_PATTERNS: list[tuple[str, re.Pattern]] = [
 ]
 
 
-def infer_regex_pattern(series: pd.Series) -> str | None:
+# Values inspected with Python regex/strptime before a vectorized confirmation
+INFERENCE_SAMPLE_SIZE = 256
+
+
+def _distinct_text(series: pd.Series) -> pd.Series:
+    """Distinct non-null values of ``series`` as strings.
+
+    Values are stringified before de-duplication: ``1``, ``1.0`` and ``True``
+    compare equal but render differently, and every rendering must match.
+    """
+    return pd.Series(series.dropna().astype(str).unique())
+
+
+def _sample(values: pd.Series, size: int) -> pd.Series:
+    """Deterministic random sample of at most ``size`` values."""
+    if len(values) <= size:
+        return values
+    return values.sample(n=size, random_state=0)
+
+
+def infer_regex_pattern(
+    series: pd.Series, sample_size: int = INFERENCE_SAMPLE_SIZE
+) -> str | None:
     """
     Infer a regex pattern only if 100% of non-null values match the same candidate pattern.
     Uses a small, safe set of known patterns to avoid overfitting.
+
+    Candidates are screened on a random sample of the distinct values; the first
+    one matching the whole sample is confirmed with one vectorized match over
+    all distinct values.
     """
-    non_null = series.dropna().astype(str)
-    if non_null.empty:
+    distinct = _distinct_text(series)
+    if distinct.empty:
         return None
 
-    candidates = list(_CANDIDATE_PATTERNS)
-    for name, pat in candidates:
-        if non_null.apply(lambda s: bool(pat.match(s))).all():
+    sample = _sample(distinct, sample_size).tolist()
+    for name, pat in _CANDIDATE_PATTERNS:
+        if not all(pat.match(s) for s in sample):
+            continue
+        if len(sample) == len(distinct) or distinct.str.match(pat.pattern).all():
             return pat.pattern
 
     return None
 
 
+def pattern_coverage(series: pd.Series, pattern: str) -> float:
+    """Fraction of non-null values of ``series`` matching ``pattern``.
+
+    Matches each distinct value once and weights it by its count.
+    """
+    counts = series.dropna().astype(str).value_counts()
+    if counts.empty:
+        return 1.0
+    matches = counts.index.to_series().str.match(pattern).to_numpy(dtype=bool)
+    return float(counts[matches].sum() / counts.sum())
+
+
 # -----------------------------
 # Date Bounds
 # -----------------------------
@@ -310,17 +355,73 @@ def _try_parse_date(val: Any) -> datetime | None:
     return None
 
 
-def infer_date_bounds(series: pd.Series, margin_days: int) -> tuple[str, str] | None:
+# Shapes parsed in one vectorized pass, in _try_parse_date precedence order.
+# Each regex only admits strings that the earlier formats cannot parse, so the
+# vectorized result equals the scalar one; anything else uses _try_parse_date.
+_DATE_FORMATS: list[tuple[str, re.Pattern]] = [
+    (
+        "ISO8601",
+        re.compile(r"^\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?)?$"),
+    ),
+    ("%m/%d/%Y", re.compile(r"^\d{2}/\d{2}/\d{4}$")),
+    ("%Y/%m/%d", re.compile(r"^\d{4}/\d{2}/\d{2}$")),
+    ("%d-%m-%Y", re.compile(r"^\d{2}-\d{2}-\d{4}$")),
+    ("%Y/%m/%d %H:%M:%S", re.compile(r"^\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}$")),
+]
+
+
+def infer_date_bounds(
+    series: pd.Series, margin_days: int, sample_size: int = INFERENCE_SAMPLE_SIZE
+) -> tuple[str, str] | None:
     """
     Infer min/max date bounds (inclusive) widened by +/- margin_days.
     Returns (after_date_iso, before_date_iso) as ISO date strings (YYYY-MM-DD).
+
+    Formats seen in a random sample of the distinct values are parsed with one
+    pd.to_datetime(format=...) call each; values of any other shape fall back
+    to _try_parse_date.
     """
-    parsed = series.dropna().map(_try_parse_date).dropna()
-    if parsed.empty:
-        return None
+    if pd.api.types.is_datetime64_any_dtype(series):
+        parsed_values = series.dropna()
+        if parsed_values.empty:
+            return None
+        extremes = [parsed_values.min(), parsed_values.max()]
+    else:
+        text = _distinct_text(series).str.strip()
+        sample = _sample(text, sample_size).tolist()
+
+        extremes = []
+        remaining = text
+        for fmt, shape in _DATE_FORMATS:
+            if remaining.empty:
+                break
+            if not any(shape.match(s) for s in sample):
+                continue
+            matching = remaining.str.match(shape.pattern).to_numpy(dtype=bool)
+            parsed = pd.to_datetime(remaining[matching], format=fmt, errors="coerce")
+            valid = parsed.notna().to_numpy()
+            if valid.any():
+                extremes += [parsed[valid].min(), parsed[valid].max()]
+            # Shape matches that failed to parse (e.g. month 13) stay scalar
+            keep = ~matching
+            keep[np.flatnonzero(matching)[~valid]] = True
+            remaining = remaining[keep]
+
+        # No supported format starts with a letter, and the only all-digit
+        # form fromisoformat accepts is YYYYMMDD
+        if not remaining.empty:
+            hopeless = remaining.str.match(r"^[A-Za-z]") | (
+                remaining.str.match(r"^\d+$") & (remaining.str.len() != 8)
+            )
+            remaining = remaining[~hopeless.to_numpy(dtype=bool)]
+        extremes += [
+            dt for dt in (_try_parse_date(v) for v in remaining) if dt is not None
+        ]
+        if not extremes:
+            return None
 
-    min_dt = parsed.min()
-    max_dt = parsed.max()
+    min_dt = min(extremes)
+    max_dt = max(extremes)
     min_dt = (min_dt - timedelta(days=margin_days)).date()
     max_dt = (max_dt + timedelta(days=margin_days)).date()
 
@@ -367,27 +468,20 @@ def detect_primary_key(df: pd.DataFrame, max_combo: int = 2) -> list[str]:  # no
         ]
         return any(tok in lname for tok in tokens)
 
-    def _is_series_hashable(s: pd.Series) -> bool:
+    # Per-column facts computed once: distinct count (None when unhashable)
+    # and whether the column has nulls
+    cardinality: dict[str, int | None] = {}
+    has_nulls: dict[str, bool] = {}
+    for col in df.columns:
+        s = df[col]
+        has_nulls[col] = bool(s.isna().any())
         try:
-            for v in s.dropna():
-                hash(v)
-            return True
+            cardinality[col] = int(s.nunique(dropna=True))
         except TypeError:
-            return False
+            cardinality[col] = None
 
     # Single-column unique candidates
-    unique_cols: list[str] = []
-    for col in df.columns:
-        s = df[col]
-        if not _is_series_hashable(s):
-            continue
-        ok_unique = False
-        try:
-            ok_unique = s.notna().all() and s.nunique(dropna=True) == n
-        except Exception:
-            ok_unique = False
-        if ok_unique:
-            unique_cols.append(col)
+    unique_cols = [c for c in df.columns if not has_nulls[c] and cardinality[c] == n]
 
     # Rank single unique columns: id-like first, then non-measure strings, then others
     id_like_uniques = [c for c in unique_cols if _is_id_like(c)]
@@ -395,57 +489,81 @@ def detect_primary_key(df: pd.DataFrame, max_combo: int = 2) -> list[str]:  # no
         c for c in unique_cols if not _is_id_like(c) and not _is_measure_like(c)
     ]
 
+    avg_lengths: dict[str, float] = {}
+
     def avg_len(col_name: str) -> float:
-        try:
-            return df[col_name].astype(str).str.len().mean()
-        except Exception:
-            return float("inf")
+        if col_name not in avg_lengths:
+            try:
+                avg_lengths[col_name] = df[col_name].astype(str).str.len().mean()
+            except Exception:
+                avg_lengths[col_name] = float("inf")
+        return avg_lengths[col_name]
 
     if id_like_uniques:
         id_like_uniques.sort(key=lambda c: (avg_len(c), c))
         return [id_like_uniques[0]]
 
-    # Try combinations up to max_combo, prefer those including id-like columns
-    cols = list(df.columns)
-    best_combo: list[str] | None = None
-    best_score = -1  # number of id-like columns in combo
+    row_hashes: dict[str, np.ndarray] = {}
 
-    for k in range(2, max(2, max_combo) + 1):
-        for combo in combinations(cols, k):
-            subset = list(combo)
-            # Skip combos with nulls
-            if df[subset].isnull().any(axis=1).any():
-                continue
-            # All columns in subset must be hashable
-            if any(not _is_series_hashable(df[c]) for c in subset):
-                continue
-            # Must be unique across rows
-            dupe_check_failed = False
-            is_dup = False
+    def column_hash(col_name: str) -> np.ndarray:
+        if col_name not in row_hashes:
+            row_hashes[col_name] = pd.util.hash_pandas_object(
+                df[col_name], index=False
+            ).to_numpy()
+        return row_hashes[col_name]
+
+    def is_unique(subset: list[str]) -> bool:
+        if any(cardinality[c] == n for c in subset):
+            return True
+        try:
+            return _hashes_unique(subset)
+        except Exception:
             try:
-                is_dup = df.duplicated(subset=subset, keep=False).any()
+                return not df.duplicated(subset=subset).any()
             except Exception:
-                dupe_check_failed = True
-            if dupe_check_failed:
-                continue
-            if is_dup:
-                continue
+                return False
+
+    def _hashes_unique(subset: list[str]) -> bool:
+        combined = column_hash(subset[0]).copy()
+        for c in subset[1:]:
+            combined ^= (
+                column_hash(c)
+                + np.uint64(0x9E3779B97F4A7C15)
+                + (combined << np.uint64(6))
+                + (combined >> np.uint64(2))
+            )
+        collided = pd.Series(combined).duplicated(keep=False).to_numpy()
+        if not collided.any():
+            return True
+        # Equal hashes are confirmed on the colliding rows only
+        return not df.loc[collided, subset].duplicated().any()
 
-            score = sum(1 for c in subset if _is_id_like(c))
-            # Prefer combos with more id-like columns; break ties using shorter
-            # combined average length
-            if score > best_score:
-                best_combo = subset
-                best_score = score
-            elif score == best_score and best_combo is not None:
-                # tie-breaker: prefer shorter average length
-                if sum(avg_len(c) for c in subset) < sum(
-                    avg_len(c) for c in best_combo
-                ):
-                    best_combo = subset
-
-        if best_combo:
-            return best_combo
+    # Try combinations up to max_combo, prefer those including id-like columns.
+    # A combo can only be unique if the product of its column cardinalities
+    # reaches n; combos with nulls or unhashable columns are never keys.
+    cols = [c for c in df.columns if not has_nulls[c] and cardinality[c] is not None]
+
+    for k in range(2, max(2, max_combo) + 1):
+        by_score: dict[int, list[tuple[int, list[str]]]] = {}
+        for position, combo in enumerate(combinations(cols, k)):
+            product = 1
+            for c in combo:
+                product *= cardinality[c]
+            if product < n:
+                continue
+            score = sum(1 for c in combo if _is_id_like(c))
+            by_score.setdefault(score, []).append((position, list(combo)))
+
+        # Highest id-like score wins; ties go to the shortest combined average
+        # length, then to the first combo in column order
+        for score in sorted(by_score, reverse=True):
+            unique_combos = [
+                (sum(avg_len(c) for c in subset), position, subset)
+                for position, subset in by_score[score]
+                if is_unique(subset)
+            ]
+            if unique_combos:
+                return min(unique_combos, key=lambda item: item[:2])[2]
 
     # If no good combo, consider non-measure single unique columns next
     if non_measure_uniques:
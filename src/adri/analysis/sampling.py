@@ -0,0 +1,150 @@
+"""
+ADRI Sampling for Contract Generation.
+
+Row sampling applied once at the start of contract generation so profiling,
+rule inference and derived-field detection run on a bounded, unbiased subset.
+The training-pass guarantee is then restored on the full data by a vectorized
+verification pass (see ``ContractBuilder.verify_training_pass``).
+
+Strategies:
+- reservoir: uniform random sample without replacement
+- stratified: proportional per value of ``column``, at least one row per value
+- time: equal share per equal-width time bucket of ``column``, so old and new
+  rows of a time-ordered file are both represented
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+SAMPLING_STRATEGIES = ("reservoir", "stratified", "time")
+
+
+@dataclass
+class SamplingConfig:
+    """Configuration options controlling row sampling."""
+
+    size: int | None = None  # rows to sample; None disables sampling
+    strategy: str = "reservoir"  # 'reservoir' | 'stratified' | 'time'
+    column: str | None = None  # stratum or timestamp column
+    seed: int = 0
+    buckets: int = 20  # time buckets for strategy='time'
+    verify: bool = True  # re-verify the contract against the full data
+
+    def __post_init__(self):
+        """Validate the strategy and its column."""
+        if self.strategy not in SAMPLING_STRATEGIES:
+            raise ValueError(
+                f"Unknown sampling strategy '{self.strategy}'. "
+                f"Use one of: {', '.join(SAMPLING_STRATEGIES)}"
+            )
+        if self.strategy in ("stratified", "time") and not self.column:
+            raise ValueError(f"Sampling strategy '{self.strategy}' requires a column")
+
+
+def sample_rows(data: pd.DataFrame, config: SamplingConfig) -> pd.DataFrame:
+    """Return a sample of ``data`` according to ``config``.
+
+    Rows keep their original relative order and the index is reset. Data with
+    no more than ``config.size`` rows is returned unchanged.
+
+    Args:
+        data: DataFrame to sample
+        config: Sampling configuration
+
+    Returns:
+        Sampled DataFrame
+    """
+    size = config.size
+    if not size or len(data) <= size:
+        return data
+    if config.column and config.column not in data.columns:
+        raise ValueError(f"Sampling column '{config.column}' not found in data")
+
+    rng = np.random.default_rng(config.seed)
+    if config.strategy == "stratified":
+        codes, _ = pd.factorize(data[config.column], use_na_sentinel=False)
+        positions = _stratified_positions(codes, size, rng, proportional=True)
+    elif config.strategy == "time":
+        codes = _time_bucket_codes(data[config.column], config.buckets)
+        positions = _stratified_positions(codes, size, rng, proportional=False)
+    else:
+        positions = rng.choice(len(data), size=size, replace=False)
+
+    return data.iloc[np.sort(positions)].reset_index(drop=True)
+
+
+def _stratified_positions(
+    codes: np.ndarray, size: int, rng: np.random.Generator, proportional: bool
+) -> np.ndarray:
+    """Pick row positions per stratum code without a Python loop over strata.
+
+    Proportional allocation gives each stratum ``size * share`` rows (at least
+    one); equal allocation gives every stratum the same quota. Quotas are capped
+    at the stratum size, and an excess over ``size`` is taken from the largest
+    quotas. Only with more strata than ``size`` is the result trimmed at random.
+    """
+    counts = np.bincount(codes)
+    present = counts > 0
+    if proportional:
+        quota = np.maximum(np.round(counts * (size / len(codes))), 1)
+    else:
+        quota = np.full(len(counts), int(np.ceil(size / max(present.sum(), 1))))
+    quota = _trim_quotas(np.minimum(quota, counts).astype(np.int64), size)
+
+    # Rank rows within their stratum by a random key and keep the first quota
+    order = np.lexsort((rng.random(len(codes)), codes))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    rank = np.arange(len(codes)) - starts[codes[order]]
+    positions = order[rank < quota[codes[order]]]
+
+    if len(positions) > size:
+        positions = rng.choice(positions, size=size, replace=False)
+    return positions
+
+
+def _trim_quotas(quota: np.ndarray, size: int) -> np.ndarray:
+    """Lower the largest quotas to a common level so they sum to ``size``.
+
+    Every stratum keeps at least one row as long as that fits in ``size``.
+    """
+    if quota.sum() <= size:
+        return quota
+
+    # Highest level whose capped quotas still fit, found by bisection
+    low, high = 1, int(quota.max())
+    if np.minimum(quota, low).sum() > size:
+        return quota
+    while low < high:
+        level = (low + high + 1) // 2
+        if np.minimum(quota, level).sum() <= size:
+            low = level
+        else:
+            high = level - 1
+
+    # Hand the remainder to the largest quotas above the level, one row each
+    trimmed = np.minimum(quota, low)
+    remainder = size - int(trimmed.sum())
+    largest = np.argsort(-quota, kind="stable")[:remainder]
+    trimmed[largest] += 1
+    return trimmed
+
+
+def _time_bucket_codes(series: pd.Series, buckets: int) -> np.ndarray:
+    """Assign each row to an equal-width time bucket; unparseable rows share one."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        parsed = series
+    else:
+        parsed = pd.to_datetime(series, errors="coerce", format="mixed", utc=True)
+    if getattr(parsed.dt, "tz", None) is not None:
+        parsed = parsed.dt.tz_convert(None)
+    values = parsed.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+    valid = parsed.notna().to_numpy()
+    codes = np.full(len(series), buckets, dtype=np.int64)
+    if valid.any():
+        low, high = values[valid].min(), values[valid].max()
+        width = max((high - low) / buckets, 1)
+        offsets = ((values[valid] - low) / width).astype(np.int64)
+        codes[valid] = np.minimum(offsets, buckets - 1)
+    return codes
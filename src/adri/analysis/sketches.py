@@ -0,0 +1,352 @@
+"""
+Mergeable streaming sketches for data profiling.
+
+Every sketch is updated with whole NumPy/pandas chunks and can be merged with
+another sketch of the same configuration, so a column can be profiled chunk by
+chunk (or in parallel) in bounded memory:
+
+- Moments: count, sum, mean/variance (Chan's parallel update), min and max
+- HyperLogLog: distinct count estimate, exact until ``exact_limit`` values
+- QuantileSketch: relative-error quantiles over log-spaced buckets
+  (DDSketch); used instead of t-digest/KLL because bucket updates vectorize
+  to a single ``np.unique`` per chunk
+- MisraGries: heavy hitters with a guaranteed error bound
+- LengthHistogram: exact string length counts
+"""
+
+import math
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+def hash_values(values) -> np.ndarray:
+    """Hash values to uint64 so equal values hash equally across chunks.
+
+    Numeric values are hashed as float64 (so ``5`` and ``5.0`` coincide when a
+    CSV chunk is read as float because of missing values); everything else is
+    hashed by its string form, matching ``astype(str).nunique()``.
+    """
+    series = pd.Series(values)
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        series = series.astype("float64")
+    elif not pd.api.types.is_string_dtype(series) or series.dtype == object:
+        series = series.astype(str)
+    return pd.util.hash_pandas_object(series, index=False).to_numpy(dtype=np.uint64)
+
+
+class Moments:
+    """Count, mean, variance, min and max of a numeric stream."""
+
+    def __init__(self):
+        """Initialize empty moments."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a chunk of non-null float values."""
+        n = len(values)
+        if n == 0:
+            return
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+        self._combine(n, chunk_mean, chunk_m2, float(values.min()), float(values.max()))
+
+    def merge(self, other: "Moments") -> None:
+        """Merge another Moments into this one."""
+        if other.count:
+            self._combine(other.count, other.mean, other.m2, other.min, other.max)
+
+    def _combine(self, n: int, mean: float, m2: float, lo: float, hi: float) -> None:
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = lo if self.min is None else min(self.min, lo)
+        self.max = hi if self.max is None else max(self.max, hi)
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1, as pandas)."""
+        if self.count < 2:
+            return float("nan")
+        return math.sqrt(self.m2 / (self.count - 1))
+
+
+class HyperLogLog:
+    """HyperLogLog distinct counter over uint64 hashes.
+
+    Distinct hashes are kept exactly until there are more than ``exact_limit``
+    of them, so small and medium cardinalities are reported exactly.
+    """
+
+    def __init__(self, precision: int = 14, exact_limit: int = 65536):
+        """Initialize the counter.
+
+        Args:
+            precision: Register index bits (2**precision registers)
+            exact_limit: Maximum number of distinct hashes kept exactly
+        """
+        self.precision = precision
+        self.exact_limit = exact_limit
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+        self._exact: np.ndarray | None = np.empty(0, dtype=np.uint64)
+
+    @property
+    def is_exact(self) -> bool:
+        """True while the count is exact."""
+        return self._exact is not None
+
+    def update(self, hashes: np.ndarray) -> None:
+        """Add a chunk of uint64 hashes."""
+        if len(hashes) == 0:
+            return
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        rest = hashes & np.uint64((1 << (64 - self.precision)) - 1)
+        # rho = 1 + trailing zeros of the remaining bits; x & -x isolates the
+        # lowest set bit, whose log2 is exact in float64
+        lowest = rest & (~rest + np.uint64(1))
+        lowest[rest == 0] = 1
+        rho = np.log2(lowest.astype(np.float64)).astype(np.uint8) + 1
+        rho[rest == 0] = 64 - self.precision + 1
+        np.maximum.at(self.registers, index, rho)
+
+        if self._exact is not None:
+            self._exact = np.union1d(self._exact, hashes)
+            if len(self._exact) > self.exact_limit:
+                self._exact = None
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Merge another HyperLogLog with the same precision."""
+        np.maximum(self.registers, other.registers, out=self.registers)
+        if self._exact is not None and other._exact is not None:
+            self._exact = np.union1d(self._exact, other._exact)
+            if len(self._exact) > self.exact_limit:
+                self._exact = None
+        else:
+            self._exact = None
+
+    def count(self) -> int:
+        """Return the (estimated) number of distinct values."""
+        if self._exact is not None:
+            return int(len(self._exact))
+        m = float(len(self.registers))
+        alpha = 0.7213 / (1.0 + 1.079 / m)
+        estimate = alpha * m * m / float(np.sum(np.exp2(-self.registers.astype(float))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class QuantileSketch:
+    """Relative-error quantile sketch (DDSketch) over log-spaced buckets.
+
+    Every value ``x`` with ``|x| > min_value`` falls into bucket
+    ``ceil(log_gamma |x|)``; quantiles are within ``relative_accuracy`` of an
+    exact value. The number of buckets grows with the logarithm of the value
+    range only (about 2,400 buckets for 1e-9..1e12 at 1%).
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-9):
+        """Initialize the sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles
+            min_value: Magnitudes at or below this are counted as zero
+        """
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.min_value = min_value
+        self.positive: dict[int, int] = {}
+        self.negative: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a chunk of non-null float values."""
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        lo, hi = float(values.min()), float(values.max())
+        self.min = lo if self.min is None else min(self.min, lo)
+        self.max = hi if self.max is None else max(self.max, hi)
+
+        magnitude = np.abs(values)
+        small = magnitude <= self.min_value
+        self.zero_count += int(small.sum())
+        for store, mask in (
+            (self.positive, (values > 0) & ~small),
+            (self.negative, (values < 0) & ~small),
+        ):
+            if mask.any():
+                keys = np.ceil(np.log(magnitude[mask]) / self._log_gamma).astype(
+                    np.int64
+                )
+                unique, counts = np.unique(keys, return_counts=True)
+                for key, n in zip(unique.tolist(), counts.tolist()):
+                    store[key] = store.get(key, 0) + n
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Merge another sketch with the same relative accuracy."""
+        for store, other_store in (
+            (self.positive, other.positive),
+            (self.negative, other.negative),
+        ):
+            for key, n in other_store.items():
+                store[key] = store.get(key, 0) + n
+        self.zero_count += other.zero_count
+        self.count += other.count
+        for attr, pick in (("min", min), ("max", max)):
+            theirs = getattr(other, attr)
+            if theirs is not None:
+                mine = getattr(self, attr)
+                setattr(self, attr, theirs if mine is None else pick(mine, theirs))
+
+    def _bucket_value(self, key: int) -> float:
+        return 2.0 * self.gamma**key / (self.gamma + 1.0)
+
+    def _ordered_buckets(self):
+        """Yield (representative value, count) from the smallest value up."""
+        for key in sorted(self.negative, reverse=True):
+            yield -self._bucket_value(key), self.negative[key]
+        if self.zero_count:
+            yield 0.0, self.zero_count
+        for key in sorted(self.positive):
+            yield self._bucket_value(key), self.positive[key]
+
+    def quantiles(self, qs) -> list[float | None]:
+        """Return estimates for several quantiles (each in [0, 1])."""
+        if not self.count:
+            return [None for _ in qs]
+        targets = sorted((q * (self.count - 1), i) for i, q in enumerate(qs))
+        results: list[float | None] = [None] * len(targets)
+        seen = 0
+        position = 0
+        for value, n in self._ordered_buckets():
+            seen += n
+            while position < len(targets) and targets[position][0] < seen:
+                clamped = min(max(value, self.min), self.max)
+                results[targets[position][1]] = clamped
+                position += 1
+            if position == len(targets):
+                break
+        for rank, i in targets[position:]:
+            results[i] = self.max
+        return results
+
+    def count_outside(self, lower: float, upper: float) -> int:
+        """Estimate how many values fall below ``lower`` or above ``upper``."""
+        return sum(
+            n for value, n in self._ordered_buckets() if value < lower or value > upper
+        )
+
+
+class MisraGries:
+    """Misra-Gries heavy-hitter summary with at most ``capacity`` counters.
+
+    Each reported count underestimates the true count by at most
+    ``error_bound``; while ``error_bound`` is zero the counts are exact.
+    """
+
+    def __init__(self, capacity: int = 64):
+        """Initialize the summary.
+
+        Args:
+            capacity: Maximum number of tracked values
+        """
+        self.capacity = capacity
+        self.counts = pd.Series(dtype="int64")
+        self.error_bound = 0
+
+    def update(self, value_counts: pd.Series) -> None:
+        """Add a chunk summarized as ``value -> count`` (e.g. value_counts())."""
+        if value_counts.empty:
+            return
+        incoming = value_counts.astype("int64")
+        if len(incoming) > self.capacity:
+            # Summarize the chunk to capacity counters first (MG summaries are
+            # mergeable) so merging never aligns more than 2 * capacity keys
+            threshold = int(incoming.nlargest(self.capacity + 1).iloc[-1])
+            incoming = incoming[incoming > threshold] - threshold
+            self.error_bound += threshold
+        if self.counts.empty:
+            combined = incoming
+        else:
+            combined = self.counts.add(incoming, fill_value=0).astype("int64")
+        self._set(combined)
+
+    def merge(self, other: "MisraGries") -> None:
+        """Merge another summary."""
+        self.error_bound += other.error_bound
+        self.update(other.counts)
+
+    def _set(self, combined: pd.Series) -> None:
+        if len(combined) > self.capacity:
+            ordered = combined.sort_values(ascending=False, kind="stable")
+            threshold = int(ordered.iloc[self.capacity])
+            ordered = ordered.iloc[: self.capacity] - threshold
+            combined = ordered[ordered > 0]
+            self.error_bound += threshold
+        self.counts = combined
+
+    def top(self, k: int | None = None) -> list[tuple[Any, int]]:
+        """Return the ``k`` most frequent values with their counts."""
+        ordered = self.counts.sort_values(ascending=False, kind="stable")
+        if k is not None:
+            ordered = ordered.iloc[:k]
+        return [(value, int(n)) for value, n in ordered.items()]
+
+
+class LengthHistogram:
+    """Exact histogram of string lengths."""
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def update(self, lengths: np.ndarray, weights: np.ndarray | None = None) -> None:
+        """Add a chunk of lengths, optionally weighted by occurrence counts."""
+        if len(lengths) == 0:
+            return
+        chunk = np.bincount(np.asarray(lengths, dtype=np.int64), weights=weights)
+        self._add(chunk.astype(np.int64))
+
+    def merge(self, other: "LengthHistogram") -> None:
+        """Merge another histogram."""
+        self._add(other.counts)
+
+    def _add(self, chunk: np.ndarray) -> None:
+        if len(chunk) > len(self.counts):
+            chunk = chunk.copy()
+            chunk[: len(self.counts)] += self.counts
+            self.counts = chunk
+        else:
+            self.counts[: len(chunk)] += chunk
+
+    @property
+    def total(self) -> int:
+        """Number of values counted."""
+        return int(self.counts.sum())
+
+    def stats(self) -> dict[str, float] | None:
+        """Return min, max and mean length (None when empty)."""
+        total = self.total
+        if not total:
+            return None
+        present = np.flatnonzero(self.counts)
+        lengths = np.arange(len(self.counts))
+        return {
+            "min_length": int(present[0]),
+            "max_length": int(present[-1]),
+            "avg_length": float((lengths * self.counts).sum() / total),
+        }
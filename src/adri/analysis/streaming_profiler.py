@@ -0,0 +1,440 @@
+"""
+ADRI Streaming Data Profiler.
+
+Single-pass, bounded-memory profiling for training sets that are too large
+to profile (or even load) in one piece. Each chunk updates mergeable sketches
+per column (see :mod:`adri.analysis.sketches`), and the final profile has the
+same shape as :class:`~adri.analysis.data_profiler.DataProfiler` output, so it
+feeds ``FieldInferenceEngine`` and the contract builder unchanged.
+
+Per chunk and column the work is one ``isna``, one ``value_counts`` and, for
+numeric columns, one float conversion. Distinct counts, heavy hitters, string
+lengths and pattern matches are all computed on the chunk's distinct values
+weighted by their counts.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .data_profiler import COMMON_PATTERNS, DataProfiler, FieldProfile, ProfileResult
+from .sketches import (
+    HyperLogLog,
+    LengthHistogram,
+    MisraGries,
+    Moments,
+    QuantileSketch,
+    hash_values,
+)
+
+DEFAULT_CHUNK_ROWS = 100_000
+
+# infer_dtype results that mean an object column mixes value types
+_MIXED_DTYPES = ("mixed", "mixed-integer", "mixed-integer-float")
+
+
+def _merge_dtype(current: str | None, incoming: str) -> str:
+    """Combine dtypes seen in different chunks of the same column."""
+    if current is None or current == incoming:
+        return incoming
+    numeric = ("int", "float", "uint")
+    if any(t in current for t in numeric) and any(t in incoming for t in numeric):
+        return "float64"
+    return "object"
+
+
+class ColumnSketch:
+    """Streaming summary of a single column."""
+
+    def __init__(self, name: Any, config: dict[str, Any]):
+        """Initialize an empty column summary.
+
+        Args:
+            name: Column name
+            config: Profiler configuration (top_k, hll_precision,
+                exact_distinct_limit, relative_accuracy)
+        """
+        self.name = name
+        self.config = config
+        self.dtype: str | None = None
+        self.rows = 0
+        self.null_count = 0
+        self.true_count = 0
+        self.mixed_types = False
+        self.distinct = HyperLogLog(
+            precision=config.get("hll_precision", 14),
+            exact_limit=config.get("exact_distinct_limit", 65536),
+        )
+        self.top = MisraGries(capacity=config.get("top_k", 64))
+        self.moments = Moments()
+        self.quantiles = QuantileSketch(config.get("relative_accuracy", 0.01))
+        self.lengths = LengthHistogram()
+        self.pattern_counts = {name: 0 for name, _ in COMMON_PATTERNS}
+        self.head_values: list[str] = []
+        self.tail_values: list[str] = []
+
+    @property
+    def kind(self) -> str:
+        """Return numeric, boolean, datetime or string for the merged dtype."""
+        dtype = self.dtype or "object"
+        if dtype == "bool":
+            return "boolean"
+        if "datetime" in dtype:
+            return "datetime"
+        if any(t in dtype for t in ("int", "float")):
+            return "numeric"
+        return "string"
+
+    def update(self, series: pd.Series) -> None:
+        """Add one chunk of the column."""
+        self.rows += len(series)
+        self.dtype = _merge_dtype(self.dtype, str(series.dtype))
+        missing = series.isna()
+        nulls = int(missing.sum())
+        self.null_count += nulls
+        non_null = series[~missing] if nulls else series
+        if non_null.empty:
+            return
+
+        # Distinct values in order of first appearance, with their counts
+        counts = non_null.value_counts(sort=False, dropna=True)
+        self.distinct.update(hash_values(counts.index))
+        self.top.update(counts)
+
+        if pd.api.types.is_bool_dtype(non_null):
+            self.true_count += int(non_null.sum())
+        elif pd.api.types.is_numeric_dtype(non_null):
+            values = non_null.to_numpy(dtype=np.float64)
+            self.moments.update(values)
+            self.quantiles.update(values)
+        elif pd.api.types.is_string_dtype(non_null) or non_null.dtype == "object":
+            self._update_strings(counts, non_null.dtype == "object")
+
+    def _update_strings(self, counts: pd.Series, is_object: bool) -> None:
+        distinct = pd.Series(counts.index, dtype=object).astype(str)
+        weights = counts.to_numpy(dtype=np.int64)
+        self.lengths.update(distinct.str.len().to_numpy(), weights)
+        for name, regex in COMMON_PATTERNS:
+            matched = distinct.str.contains(regex, regex=True, na=False).to_numpy()
+            self.pattern_counts[name] += int(weights[matched].sum())
+
+        if len(self.head_values) < 5:
+            for value in distinct.iloc[:5]:
+                if value not in self.head_values and len(self.head_values) < 5:
+                    self.head_values.append(value)
+        self.tail_values = distinct.iloc[-5:].tolist()
+
+        if is_object and not self.mixed_types:
+            inferred = pd.api.types.infer_dtype(counts.index, skipna=True)
+            self.mixed_types = inferred in _MIXED_DTYPES
+
+    def merge(self, other: "ColumnSketch") -> None:
+        """Merge the summary of another slice of the same column."""
+        if other.dtype is not None:
+            self.dtype = _merge_dtype(self.dtype, other.dtype)
+        self.rows += other.rows
+        self.null_count += other.null_count
+        self.true_count += other.true_count
+        self.mixed_types = self.mixed_types or other.mixed_types
+        self.distinct.merge(other.distinct)
+        self.top.merge(other.top)
+        self.moments.merge(other.moments)
+        self.quantiles.merge(other.quantiles)
+        self.lengths.merge(other.lengths)
+        for name, n in other.pattern_counts.items():
+            self.pattern_counts[name] += n
+        for value in other.head_values:
+            if value not in self.head_values and len(self.head_values) < 5:
+                self.head_values.append(value)
+        if other.tail_values:
+            self.tail_values = other.tail_values
+
+    @property
+    def field_type(self) -> str:
+        """Field type as reported by DataProfiler."""
+        dtype = self.dtype or "object"
+        if "int" in dtype:
+            return "integer"
+        if "float" in dtype or dtype == "bool":
+            return "numeric"
+        if "datetime" in dtype:
+            return "date"
+        return "string"
+
+    def to_profile(self) -> dict[str, Any]:
+        """Render the summary with DataProfiler's per-field keys."""
+        rows = max(self.rows, 1)
+        non_null = self.rows - self.null_count
+        # An estimate can overshoot; there are never more distinct than values
+        unique = min(self.distinct.count(), non_null)
+        profile: dict[str, Any] = {
+            "name": self.name,
+            "dtype": self.dtype or "object",
+            "null_count": self.null_count,
+            "null_percentage": float(self.null_count / rows * 100),
+            "unique_count": unique,
+            "unique_percentage": float(unique / rows * 100),
+            "distinct_exact": self.distinct.is_exact,
+            "top_values": [[v, n] for v, n in self.top.top(10)],
+        }
+        kind = self.kind
+
+        if kind == "numeric" and self.moments.count:
+            q1, median, q3 = self.quantiles.quantiles((0.25, 0.5, 0.75))
+            iqr = q3 - q1
+            profile.update(
+                {
+                    "min_value": float(self.moments.min),
+                    "max_value": float(self.moments.max),
+                    "mean_value": float(self.moments.mean),
+                    "median_value": float(median),
+                    "std_dev": float(self.moments.std),
+                    "outlier_count": self.quantiles.count_outside(
+                        q1 - 1.5 * iqr, q3 + 1.5 * iqr
+                    ),
+                    "quartiles": [float(q1), float(median), float(q3)],
+                }
+            )
+        elif kind == "boolean" and non_null:
+            profile.update(
+                {
+                    "true_count": self.true_count,
+                    "false_count": non_null - self.true_count,
+                    "true_percentage": float(self.true_count / non_null * 100),
+                }
+            )
+        elif kind == "string" and self.lengths.total:
+            samples = list(self.head_values)
+            samples += [v for v in self.tail_values if v not in samples]
+            profile.update(self.lengths.stats())
+            profile.update(
+                {
+                    "common_patterns": [
+                        name
+                        for name, _ in COMMON_PATTERNS
+                        if self.pattern_counts[name] > non_null * 0.8
+                    ],
+                    "sample_values": samples[:10],
+                    "length_histogram": {
+                        int(length): int(n)
+                        for length, n in enumerate(self.lengths.counts)
+                        if n
+                    },
+                }
+            )
+        return profile
+
+
+class StreamingProfiler(DataProfiler):
+    """Single-pass profiler built from mergeable per-column sketches.
+
+    Use :meth:`profile_data` for an in-memory DataFrame, :meth:`profile_file`
+    for CSV or Parquet files of any size, or feed chunks yourself with
+    :meth:`update` / :meth:`merge` and call :meth:`result`.
+
+    Configuration keys (in addition to DataProfiler's):
+        chunk_rows: Rows per chunk (default 100,000)
+        top_k: Heavy hitters tracked per column (default 64)
+        hll_precision: HyperLogLog register bits (default 14)
+        exact_distinct_limit: Distinct values counted exactly before switching
+            to the HyperLogLog estimate (default 65,536)
+        relative_accuracy: Quantile sketch accuracy (default 0.01)
+    """
+
+    def __init__(self, config: dict[str, Any] | None = None):
+        """Initialize the streaming profiler."""
+        super().__init__(config)
+        self.chunk_rows = int(self.config.get("chunk_rows", DEFAULT_CHUNK_ROWS))
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all accumulated state."""
+        self.columns: dict[Any, ColumnSketch] = {}
+        self.rows = 0
+        self.memory_bytes = 0
+        self.row_hashes = HyperLogLog(
+            precision=self.config.get("hll_precision", 14),
+            exact_limit=self.config.get("exact_distinct_limit", 65536),
+        )
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Add one chunk of rows."""
+        if chunk.empty:
+            return
+        self.rows += len(chunk)
+        self.memory_bytes += int(chunk.memory_usage(deep=True).sum())
+        self.row_hashes.update(
+            pd.util.hash_pandas_object(chunk, index=False).to_numpy(dtype=np.uint64)
+        )
+        for column in chunk.columns:
+            sketch = self.columns.get(column)
+            if sketch is None:
+                sketch = self.columns[column] = ColumnSketch(column, self.config)
+            sketch.update(chunk[column])
+
+    def merge(self, other: "StreamingProfiler") -> "StreamingProfiler":
+        """Merge the state of a profiler that saw other rows of the same data."""
+        self.rows += other.rows
+        self.memory_bytes += other.memory_bytes
+        self.row_hashes.merge(other.row_hashes)
+        for column, sketch in other.columns.items():
+            if column in self.columns:
+                self.columns[column].merge(sketch)
+            else:
+                self.columns[column] = sketch
+        return self
+
+    def profile_data(
+        self, data: pd.DataFrame, max_rows: int | None = None
+    ) -> ProfileResult:
+        """Profile all rows of a DataFrame chunk by chunk.
+
+        Args:
+            data: DataFrame to profile
+            max_rows: Optional limit on the number of rows profiled
+
+        Returns:
+            ProfileResult in DataProfiler's format
+        """
+        if data is None:
+            from ..core.exceptions import DataValidationError
+
+            raise DataValidationError("Data cannot be None")
+        if max_rows:
+            data = data.head(max_rows)
+        self.reset()
+        for start in range(0, len(data), self.chunk_rows):
+            self.update(data.iloc[start : start + self.chunk_rows])
+        return self.result()
+
+    def profile_file(self, file_path: str | Path) -> ProfileResult:
+        """Profile a CSV or Parquet file without loading it whole.
+
+        Args:
+            file_path: Path to a .csv or .parquet file
+
+        Returns:
+            ProfileResult in DataProfiler's format
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file format is unsupported
+        """
+        self.reset()
+        for chunk in iter_file_chunks(file_path, self.chunk_rows):
+            self.update(chunk)
+        return self.result()
+
+    def result(self) -> ProfileResult:
+        """Build the ProfileResult from the accumulated sketches."""
+        if not self.rows:
+            return ProfileResult(
+                field_profiles={},
+                summary_statistics={"total_rows": 0, "total_columns": 0},
+                data_quality_score=0.0,
+            )
+
+        field_profiles = {}
+        for column, sketch in self.columns.items():
+            profile = sketch.to_profile()
+            field_profiles[column] = FieldProfile(
+                field_type=sketch.field_type,
+                null_count=profile.pop("null_count"),
+                unique_count=profile.pop("unique_count"),
+                **profile,
+            )
+
+        cells = self.rows * len(self.columns)
+        nulls = sum(s.null_count for s in self.columns.values())
+        completeness = (cells - nulls) / cells if cells else 0.0
+        dtypes: dict[str, int] = {}
+        for sketch in self.columns.values():
+            dtypes[sketch.dtype] = dtypes.get(sketch.dtype, 0) + 1
+        duplicate_rows = max(self.rows - self.row_hashes.count(), 0)
+
+        summary_stats = {
+            "total_rows": self.rows,
+            "total_columns": len(self.columns),
+            "data_types": dtypes,
+            "memory_usage_mb": float(self.memory_bytes / 1024 / 1024),
+            "completeness_ratio": float(completeness),
+        }
+
+        issues = []
+        high_null = [s for s in self.columns.values() if s.null_count / self.rows > 0.5]
+        if high_null:
+            issues.append(f"High null rate in {len(high_null)} fields")
+        if duplicate_rows > 0:
+            issues.append(f"{duplicate_rows} duplicate rows found")
+        for column, sketch in self.columns.items():
+            if sketch.mixed_types:
+                issues.append(f"Mixed data types in field: {column}")
+
+        quality_assessment = {
+            "overall_completeness": float(completeness * 100),
+            "fields_with_nulls": sum(1 for s in self.columns.values() if s.null_count),
+            "completely_null_fields": sum(
+                1 for s in self.columns.values() if s.null_count == s.rows
+            ),
+            "duplicate_rows": duplicate_rows,
+            "potential_issues": issues,
+        }
+
+        recommendations = []
+        if completeness * 100 < 90:
+            recommendations.append(
+                "Consider addressing missing values to improve completeness"
+            )
+        if any(s.dtype == "object" for s in self.columns.values()):
+            recommendations.append("Review string fields for consistent formatting")
+
+        result = ProfileResult(
+            field_profiles=field_profiles,
+            summary_statistics=summary_stats,
+            data_quality_score=self._calculate_data_quality_score(
+                quality_assessment, field_profiles
+            ),
+            metadata={
+                "recommendations": recommendations,
+                "config": self.config,
+                "streaming": True,
+                "duplicate_rows_exact": self.row_hashes.is_exact,
+            },
+        )
+        result.quality_assessment = quality_assessment
+        result.fields = field_profiles
+        return result
+
+
+def iter_file_chunks(
+    file_path: str | Path, chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> Iterator[pd.DataFrame]:
+    """Yield a CSV or Parquet file as DataFrames of at most ``chunk_rows`` rows.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file format is unsupported
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Data file not found: {file_path}")
+
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with pd.read_csv(path, chunksize=chunk_rows) as reader:
+            yield from reader
+    elif suffix == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "pyarrow package required for Parquet file support. "
+                "Install with: pip install pyarrow"
+            )
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Unsupported file format: {path.suffix}")
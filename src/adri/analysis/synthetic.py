@@ -0,0 +1,541 @@
+"""
+ADRI Synthetic Data Generator.
+
+Contract-driven synthetic data for load testing, benchmarking and fuzzing
+the validator. Values are generated column-at-a-time with NumPy from
+``requirements.field_requirements`` (type, nullable, allowed_values,
+min/max_value, min/max_length, pattern and date bounds), and a configurable
+share of rows per rule is overwritten with values that violate that rule.
+"""
+
+import re
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+_ALNUM = np.frombuffer(
+    b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789", dtype=np.uint8
+)
+_LOWER = np.frombuffer(b"abcdefghijklmnopqrstuvwxyz", dtype=np.uint8)
+_DIGITS = np.frombuffer(b"0123456789", dtype=np.uint8)
+
+_DEFAULT_NUMERIC_SPAN = 1000.0
+_DEFAULT_MIN_LENGTH = 4
+_DEFAULT_MAX_LENGTH = 12
+_EMAIL_DOMAIN = "@example.com"
+# Prefixes tried, in order, for string primary keys built from a counter
+_PK_PREFIXES = ("", "ID-", "ID_", "ID", "id-", "id_", "id")
+
+# Rule types that can be violated, in the order they are assigned row bands
+VIOLATION_RULES = (
+    "not_null",
+    "type",
+    "allowed_values",
+    "numeric_bounds",
+    "length_bounds",
+    "pattern",
+    "date_bounds",
+)
+
+
+def _random_strings(
+    rng: np.random.Generator,
+    lengths: np.ndarray,
+    alphabet: np.ndarray = _ALNUM,
+    prefix: str = "",
+    suffix: str = "",
+) -> np.ndarray:
+    """Build random strings with per-row lengths from a byte alphabet."""
+    rows = len(lengths)
+    width = int(lengths.max()) if rows else 0
+    if width == 0:
+        core = np.full(rows, "", dtype=object)
+    else:
+        codes = alphabet[rng.integers(0, len(alphabet), size=(rows, width))]
+        # Trailing NUL bytes are dropped when viewing as fixed-width bytes
+        codes[np.arange(width) >= lengths[:, None]] = 0
+        core = codes.view(f"S{width}").ravel().astype(str).astype(object)
+    if prefix or suffix:
+        core = prefix + pd.Series(core, dtype=object) + suffix
+        return core.to_numpy(dtype=object)
+    return core
+
+
+def _allowed_values(field_req: dict[str, Any]) -> list[Any] | None:
+    allowed = field_req.get("allowed_values")
+    if isinstance(allowed, dict):
+        allowed = list(allowed.keys())
+    return list(allowed) if allowed else None
+
+
+def _length_bounds(field_req: dict[str, Any]) -> tuple[int, int]:
+    min_len = field_req.get("min_length")
+    max_len = field_req.get("max_length")
+    low = int(min_len) if min_len is not None else None
+    high = int(max_len) if max_len is not None else None
+    if low is None and high is None:
+        return _DEFAULT_MIN_LENGTH, _DEFAULT_MAX_LENGTH
+    if low is None:
+        low = min(_DEFAULT_MIN_LENGTH, high)
+    if high is None:
+        high = max(low, _DEFAULT_MAX_LENGTH)
+    return max(low, 0), max(high, low, 0)
+
+
+def _unique_strings(values: np.ndarray, suffix: str, row_offset: int) -> np.ndarray:
+    """Make random key strings unique by ending them with the row counter.
+
+    The counter replaces the trailing characters before ``suffix``, so
+    lengths are kept unless a value is shorter than the counter; uniqueness
+    wins over length bounds, as for numeric keys.
+    """
+    series = pd.Series(values, dtype=object)
+    if series.is_unique:
+        return values
+    counter = pd.Series(np.arange(row_offset, row_offset + len(values))).astype(str)
+    counter = counter.str.zfill(len(str(row_offset + len(values))))
+    stems = series.str[: -len(suffix)] if suffix else series
+    keep = (stems.str.len() - counter.str.len()).clip(lower=0)
+    heads = pd.Series(
+        [stem[:n] for stem, n in zip(stems.tolist(), keep.tolist())], dtype=object
+    )
+    return (heads + counter + suffix).to_numpy(dtype=object)
+
+
+def _matches_all(pattern: str | None, values: np.ndarray) -> bool:
+    if not pattern:
+        return True
+    try:
+        return bool(pd.Series(values, dtype=object).str.match(pattern).all())
+    except re.error:
+        return False
+
+
+class SyntheticDataGenerator:
+    """Generate data that conforms to, or deliberately violates, a contract.
+
+    Example:
+        >>> generator = SyntheticDataGenerator(contract, seed=1)
+        >>> df = generator.generate(1_000_000, violation_rate=0.01)
+        >>> generator.last_violations["email"]["pattern"]
+    """
+
+    def __init__(self, contract: dict[str, Any], seed: int = 0):
+        """Initialize the generator.
+
+        Args:
+            contract: Contract dictionary (as loaded from YAML)
+            seed: Random seed; output is deterministic for a given seed
+        """
+        requirements = contract.get("requirements", {}) or {}
+        self.field_requirements: dict[str, dict[str, Any]] = (
+            requirements.get("field_requirements", {}) or {}
+        )
+        record_id = contract.get("record_identification", {}) or {}
+        self.primary_key_fields: list[str] = [
+            f
+            for f in (record_id.get("primary_key_fields") or [])
+            if f in self.field_requirements
+        ]
+        self.seed = seed
+        self.last_violations: dict[str, dict[str, int]] = {}
+
+    @classmethod
+    def from_file(cls, contract_path: str | Path, seed: int = 0):
+        """Create a generator from a contract YAML file."""
+        import yaml
+
+        with open(contract_path, encoding="utf-8") as f:
+            return cls(yaml.safe_load(f), seed=seed)
+
+    def generate(
+        self,
+        rows: int,
+        violation_rate: float | dict[str, float] = 0.0,
+        duplicate_pk_rate: float = 0.0,
+        null_rate: float = 0.0,
+        chunk_index: int = 0,
+        row_offset: int = 0,
+    ) -> pd.DataFrame:
+        """Generate a DataFrame.
+
+        Args:
+            rows: Number of rows
+            violation_rate: Share of rows per field that violate each applicable
+                rule type, or a mapping of rule type (see VIOLATION_RULES) to
+                rate. Bands are disjoint per field, so each violating cell
+                targets a single rule.
+            duplicate_pk_rate: Share of rows whose primary key repeats the key
+                of another row
+            null_rate: Share of nulls in nullable fields
+            chunk_index: Chunk number, mixed into the seed for chunked output
+            row_offset: Index of the first row (keeps primary keys unique
+                across chunks)
+
+        Returns:
+            DataFrame with one column per field requirement
+        """
+        rng = np.random.default_rng([self.seed, chunk_index])
+        rates = self._rule_rates(violation_rate)
+        columns: dict[str, Any] = {}
+        self.last_violations = {}
+
+        for field_name, field_req in self.field_requirements.items():
+            is_pk = field_name in self.primary_key_fields
+            values = self._generate_valid(rng, field_req, rows, is_pk, row_offset)
+            if null_rate > 0 and field_req.get("nullable", True) and not is_pk:
+                values = values.astype(object)
+                values[rng.random(rows) < null_rate] = None
+            if rates:
+                values, counts = self._inject_violations(rng, field_req, values, rates)
+                if counts:
+                    self.last_violations[field_name] = counts
+            columns[field_name] = values
+
+        df = pd.DataFrame(columns)
+        if duplicate_pk_rate > 0 and self.primary_key_fields and rows > 1:
+            mask = rng.random(rows - 1) < duplicate_pk_rate
+            targets = np.flatnonzero(mask) + 1
+            sources = (rng.random(len(targets)) * targets).astype(np.int64)
+            for pk in self.primary_key_fields:
+                column = df[pk].to_numpy(copy=True)
+                column[targets] = column[sources]
+                df[pk] = column
+            self.last_violations.setdefault("_primary_key", {})["duplicate"] = int(
+                len(targets)
+            )
+        return df
+
+    def to_parquet(
+        self,
+        path: str | Path,
+        rows: int,
+        chunk_rows: int = 1_000_000,
+        **generate_kwargs: Any,
+    ) -> Path:
+        """Write ``rows`` rows to a Parquet file, generating in chunks.
+
+        Memory stays bounded by ``chunk_rows``; duplicate primary keys are
+        drawn within each chunk. Fields that receive type violations are
+        written as strings, since Parquet columns cannot mix types.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "pyarrow package required for Parquet output. "
+                "Install with: pip install pyarrow"
+            )
+
+        path = Path(path)
+        rates = self._rule_rates(generate_kwargs.get("violation_rate", 0.0))
+        string_fields = [
+            name
+            for name, field_req in self.field_requirements.items()
+            if "type" in rates and "type" in self._applicable_rules(field_req)
+        ]
+        writer = None
+        try:
+            for chunk_index, start in enumerate(range(0, max(rows, 1), chunk_rows)):
+                size = min(chunk_rows, rows - start)
+                df = self.generate(
+                    size, chunk_index=chunk_index, row_offset=start, **generate_kwargs
+                )
+                for name in string_fields:
+                    present = df[name].notna()
+                    df[name] = df[name].astype(object)
+                    df.loc[present, name] = df.loc[present, name].astype(str)
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(str(path), table.schema)
+                else:
+                    table = table.cast(writer.schema, safe=False)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        return path
+
+    # ------------------------------------------------------------------
+    # Valid values
+    # ------------------------------------------------------------------
+
+    def _generate_valid(
+        self,
+        rng: np.random.Generator,
+        field_req: dict[str, Any],
+        rows: int,
+        is_pk: bool,
+        row_offset: int,
+    ) -> np.ndarray:
+        field_type = field_req.get("type", "string")
+        allowed = _allowed_values(field_req)
+
+        if allowed and not is_pk:
+            choices = np.empty(len(allowed), dtype=object)
+            choices[:] = allowed
+            return choices[rng.integers(0, len(allowed), size=rows)]
+        if field_type in ("integer", "float", "number"):
+            return self._numbers(rng, field_req, rows, is_pk, row_offset)
+        if field_type == "date":
+            return self._dates(rng, field_req, rows, "D")
+        if field_type == "datetime":
+            return self._dates(rng, field_req, rows, "s")
+        if field_type == "boolean":
+            return rng.random(rows) < 0.5
+        return self._strings(rng, field_req, rows, is_pk, row_offset)
+
+    def _numbers(self, rng, field_req, rows, is_pk, row_offset) -> np.ndarray:
+        low = field_req.get("min_value")
+        high = field_req.get("max_value")
+        low = float(low) if low is not None else None
+        high = float(high) if high is not None else None
+        if low is None:
+            low = high - _DEFAULT_NUMERIC_SPAN if high is not None else 0.0
+        if high is None:
+            high = low + _DEFAULT_NUMERIC_SPAN
+        integer = field_req.get("type") == "integer"
+
+        if is_pk:
+            # Uniqueness wins over bounds when the range is too narrow
+            start = int(np.ceil(low)) if integer else low
+            values = start + row_offset + np.arange(rows, dtype=np.int64)
+            return values if integer else values.astype(float)
+        if integer:
+            low_i, high_i = int(np.ceil(low)), int(np.floor(high))
+            return rng.integers(low_i, max(high_i, low_i) + 1, size=rows)
+        return np.round(rng.uniform(low, high, size=rows), 2).clip(low, high)
+
+    def _dates(self, rng, field_req, rows, unit: str) -> np.ndarray:
+        if unit == "D":
+            low = field_req.get("after_date") or field_req.get("after_datetime")
+            high = field_req.get("before_date") or field_req.get("before_datetime")
+        else:
+            low = field_req.get("after_datetime") or field_req.get("after_date")
+            high = field_req.get("before_datetime") or field_req.get("before_date")
+        low_ts = pd.Timestamp(low) if low else pd.Timestamp("2020-01-01")
+        high_ts = pd.Timestamp(high) if high else low_ts + pd.Timedelta(days=365)
+        if low_ts.tzinfo is not None:
+            low_ts = low_ts.tz_convert(None)
+        if high_ts.tzinfo is not None:
+            high_ts = high_ts.tz_convert(None)
+        low_dt = np.datetime64(low_ts.to_datetime64(), unit)
+        high_dt = np.datetime64(high_ts.to_datetime64(), unit)
+        # Stay inside the bounds even when they carry a time component
+        if low_dt < low_ts.to_datetime64():
+            low_dt += np.timedelta64(1, unit)
+        span = max(int((high_dt - low_dt).astype(np.int64)), 0)
+        offsets = rng.integers(0, span + 1, size=rows)
+        if span < rows:
+            # Format each distinct value once and index into the table
+            table = np.datetime_as_string(
+                low_dt + np.arange(span + 1).astype(f"timedelta64[{unit}]"), unit=unit
+            ).astype(object)
+            return table[offsets]
+        return np.datetime_as_string(
+            low_dt + offsets.astype(f"timedelta64[{unit}]"), unit=unit
+        ).astype(object)
+
+    def _strings(self, rng, field_req, rows, is_pk, row_offset) -> np.ndarray:
+        pattern = field_req.get("pattern")
+        low, high = _length_bounds(field_req)
+
+        if is_pk:
+            ids = pd.Series(np.arange(row_offset, row_offset + rows)).astype(str)
+            digits = len(str(row_offset + rows))
+            for prefix in _PK_PREFIXES:
+                # Prefix plus zero-padded counter, e.g. "0042" or "ID-0042"
+                width = max(low - len(prefix), digits)
+                if len(prefix) + width > max(high, digits):
+                    continue
+                values = (prefix + ids.str.zfill(width)).to_numpy(dtype=object)
+                if _matches_all(pattern, values[:100]):
+                    return values
+
+        lengths = rng.integers(low, high + 1, size=rows)
+        shapes = self._string_shapes(high)
+        shape = shapes[0]
+        for candidate in shapes:
+            # Probe each shape on a small sample before building the column
+            probe = self._shaped_strings(rng, lengths[:200], *candidate)
+            if _matches_all(pattern, probe):
+                shape = candidate
+                break
+        # If the pattern is not reproducible from the built-in shapes, values
+        # still satisfy type and length so only the pattern rule is affected.
+        values = self._shaped_strings(rng, lengths, *shape)
+        if is_pk:
+            values = _unique_strings(values, shape[1], row_offset)
+        return values
+
+    @staticmethod
+    def _string_shapes(max_length: int) -> list[tuple[np.ndarray, str]]:
+        """Return (alphabet, suffix) shapes tried in order for string fields."""
+        domain = _EMAIL_DOMAIN if max_length - len(_EMAIL_DOMAIN) >= 1 else "@x.io"
+        return [(_ALNUM, ""), (_LOWER, ""), (_DIGITS, ""), (_LOWER, domain)]
+
+    @staticmethod
+    def _shaped_strings(rng, lengths, alphabet, suffix) -> np.ndarray:
+        if suffix:
+            lengths = np.maximum(lengths - len(suffix), 1)
+        return _random_strings(rng, lengths, alphabet, suffix=suffix)
+
+    # ------------------------------------------------------------------
+    # Violations
+    # ------------------------------------------------------------------
+
+    def _rule_rates(self, violation_rate: float | dict[str, float]) -> dict[str, float]:
+        if isinstance(violation_rate, dict):
+            unknown = set(violation_rate) - set(VIOLATION_RULES)
+            if unknown:
+                raise ValueError(
+                    f"Unknown rule types {sorted(unknown)}; "
+                    f"expected {', '.join(VIOLATION_RULES)}"
+                )
+            return {k: float(v) for k, v in violation_rate.items() if v > 0}
+        if violation_rate <= 0:
+            return {}
+        return {rule: float(violation_rate) for rule in VIOLATION_RULES}
+
+    def _applicable_rules(self, field_req: dict[str, Any]) -> list[str]:
+        field_type = field_req.get("type", "string")
+        rules = []
+        if field_req.get("nullable", True) is False:
+            rules.append("not_null")
+        rules.append("type")
+        if _allowed_values(field_req):
+            rules.append("allowed_values")
+        if field_type in ("integer", "float", "number") and (
+            field_req.get("min_value") is not None
+            or field_req.get("max_value") is not None
+        ):
+            rules.append("numeric_bounds")
+        if (
+            field_req.get("min_length") is not None
+            or field_req.get("max_length") is not None
+        ):
+            rules.append("length_bounds")
+        if field_req.get("pattern"):
+            rules.append("pattern")
+        if any(
+            field_req.get(k)
+            for k in ("after_date", "before_date", "after_datetime", "before_datetime")
+        ):
+            rules.append("date_bounds")
+        return rules
+
+    def _inject_violations(self, rng, field_req, values, rates):
+        rules = [r for r in self._applicable_rules(field_req) if r in rates]
+        if not rules:
+            return values, {}
+        rows = len(values)
+        draw = rng.random(rows)
+        values = values.astype(object)
+        counts: dict[str, int] = {}
+        band_start = 0.0
+        for rule in rules:
+            band_end = min(band_start + rates[rule], 1.0)
+            mask = (draw >= band_start) & (draw < band_end)
+            band_start = band_end
+            count = int(mask.sum())
+            if count == 0:
+                continue
+            bad = self._violating_value(rule, field_req)
+            if bad is _NO_VIOLATION:
+                continue
+            values[mask] = bad
+            counts[rule] = count
+        return values, counts
+
+    def _violating_value(self, rule: str, field_req: dict[str, Any]) -> Any:
+        field_type = field_req.get("type", "string")
+        if rule == "not_null":
+            return None
+        if rule == "type":
+            if field_type in ("integer", "float", "number", "date", "datetime"):
+                return "not_a_" + field_type
+            if field_type == "boolean":
+                return "maybe"
+            return 12345
+        if rule == "allowed_values":
+            allowed = {str(v) for v in _allowed_values(field_req) or []}
+            candidate = "zz"
+            while candidate in allowed:
+                candidate += "z"
+            return self._fit_length(candidate, field_req)
+        if rule == "numeric_bounds":
+            high = field_req.get("max_value")
+            if high is not None:
+                value = float(high) + max(1.0, abs(float(high)))
+            else:
+                low = float(field_req["min_value"])
+                value = low - max(1.0, abs(low))
+            return int(np.ceil(value)) if field_type == "integer" else value
+        if rule == "length_bounds":
+            max_len = field_req.get("max_length")
+            if max_len is not None:
+                return "x" * (int(max_len) + 1)
+            min_len = int(field_req.get("min_length") or 0)
+            return "x" * (min_len - 1) if min_len > 0 else _NO_VIOLATION
+        if rule == "pattern":
+            pattern = field_req["pattern"]
+            for candidate in ("!@# $%", "@@", " ", "-", "0", "a"):
+                candidate = self._fit_length(candidate, field_req)
+                if not _matches_all(pattern, np.array([candidate], dtype=object)):
+                    return candidate
+            return _NO_VIOLATION
+        if rule == "date_bounds":
+            low = field_req.get("after_date") or field_req.get("after_datetime")
+            if low:
+                value = pd.Timestamp(low) - pd.Timedelta(days=365)
+            else:
+                high = field_req.get("before_date") or field_req.get("before_datetime")
+                value = pd.Timestamp(high) + pd.Timedelta(days=365)
+            if field_type == "datetime":
+                return value.strftime("%Y-%m-%dT%H:%M:%S")
+            return value.strftime("%Y-%m-%d")
+        return _NO_VIOLATION
+
+    @staticmethod
+    def _fit_length(value: str, field_req: dict[str, Any]) -> str:
+        """Pad or trim ``value`` so that it satisfies the length bounds."""
+        min_len = field_req.get("min_length")
+        max_len = field_req.get("max_length")
+        if min_len is not None and len(value) < int(min_len):
+            value = value + value[-1] * (int(min_len) - len(value))
+        if max_len is not None and len(value) > int(max_len):
+            value = value[: int(max_len)]
+        return value
+
+
+_NO_VIOLATION = object()
+
+
+def generate_synthetic_data(
+    contract: dict[str, Any],
+    rows: int,
+    violation_rate: float | dict[str, float] = 0.0,
+    duplicate_pk_rate: float = 0.0,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """Generate a DataFrame from a contract using a default generator.
+
+    Args:
+        contract: Contract dictionary
+        rows: Number of rows
+        violation_rate: Per-rule violation rate (see SyntheticDataGenerator.generate)
+        duplicate_pk_rate: Share of rows repeating another row's primary key
+        seed: Random seed
+
+    Returns:
+        Generated DataFrame
+    """
+    return SyntheticDataGenerator(contract, seed=seed).generate(
+        rows, violation_rate=violation_rate, duplicate_pk_rate=duplicate_pk_rate
+    )
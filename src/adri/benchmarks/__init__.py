@@ -0,0 +1,23 @@
+"""
+ADRI Benchmarks Module.
+
+Reproducible performance benchmarks for the assessment engine.
+
+Components:
+- make_dataset: Vectorized synthetic dataset with controlled failure rates
+- run_benchmarks: Time assessors, contract generation, loaders and audit logging
+- compare_results: Compare a run against a saved baseline
+
+Run from the command line with ``adri bench``.
+"""
+
+from .datasets import make_contract, make_dataset
+from .runner import CASES, compare_results, run_benchmarks
+
+__all__ = [
+    "CASES",
+    "make_dataset",
+    "make_contract",
+    "run_benchmarks",
+    "compare_results",
+]
@@ -0,0 +1,92 @@
+"""Synthetic benchmark datasets.
+
+The benchmark contract is generated from a clean sample built by
+:func:`make_dataset` (vectorized NumPy, fully determined by
+``(rows, failure_rate, seed)``). Benchmark runs then draw data of any size
+from that contract with :class:`adri.analysis.synthetic.SyntheticDataGenerator`.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+STATUSES = np.array(["active", "inactive", "pending", "closed"], dtype=object)
+COUNTRIES = np.array(["AU", "DE", "FR", "GB", "JP", "NZ", "US"], dtype=object)
+
+# Rows in the clean sample used to generate the benchmark contract
+CONTRACT_SAMPLE_ROWS = 1000
+
+
+def make_dataset(rows: int, failure_rate: float = 0.0, seed: int = 0) -> pd.DataFrame:
+    """Build the benchmark dataset.
+
+    Args:
+        rows: Number of rows
+        failure_rate: Fraction of rows per column that receive an injected
+            violation (bad pattern, out-of-range value, unknown category,
+            missing value or duplicate key)
+        seed: Random seed
+
+    Returns:
+        DataFrame with customer_id, email, age, amount, status, country and
+        signup_date columns
+    """
+    rng = np.random.default_rng(seed)
+    ids = np.arange(1, rows + 1, dtype=np.int64)
+
+    data = {
+        "customer_id": ids,
+        "email": "user" + pd.Series(ids).astype(str) + "@example.com",
+        "age": rng.integers(18, 91, size=rows),
+        "amount": np.round(rng.uniform(1.0, 10_000.0, size=rows), 2),
+        "status": STATUSES[rng.integers(0, len(STATUSES), size=rows)],
+        "country": COUNTRIES[rng.integers(0, len(COUNTRIES), size=rows)],
+        "signup_date": np.datetime_as_string(
+            np.datetime64("2020-01-01")
+            + rng.integers(0, 365 * 5, size=rows).astype("timedelta64[D]"),
+            unit="D",
+        ).astype(object),
+    }
+    df = pd.DataFrame(data)
+
+    if failure_rate > 0 and rows > 1:
+        _inject_failures(df, rng, failure_rate)
+    return df
+
+
+def _inject_failures(df: pd.DataFrame, rng: np.random.Generator, rate: float) -> None:
+    """Inject one kind of violation per column into ``rate`` of the rows."""
+    rows = len(df)
+
+    def mask() -> np.ndarray:
+        return rng.random(rows) < rate
+
+    df.loc[mask(), "email"] = "not-an-email"
+    df.loc[mask(), "age"] = 150
+    df.loc[mask(), "amount"] = -1.0
+    df.loc[mask(), "status"] = "unknown"
+    df.loc[mask(), "country"] = None
+    df.loc[mask(), "signup_date"] = "1900-01-01"
+
+    duplicates = np.flatnonzero(mask()[1:]) + 1
+    df.loc[duplicates, "customer_id"] = df["customer_id"].to_numpy()[duplicates - 1]
+
+
+def make_contract(seed: int = 0, name: str = "benchmark") -> dict[str, Any]:
+    """Generate the benchmark contract from a clean sample of the schema."""
+    from ..analysis.contract_generator import ContractGenerator
+
+    sample = make_dataset(CONTRACT_SAMPLE_ROWS, failure_rate=0.0, seed=seed)
+    return ContractGenerator().generate(data=sample, data_name=name)
+
+
+def write_contract(contract: dict[str, Any], path: str | Path) -> Path:
+    """Write a contract dictionary as YAML and return its path."""
+    import yaml
+
+    path = Path(path)
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(contract, f, sort_keys=False)
+    return path
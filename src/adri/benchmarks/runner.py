@@ -0,0 +1,284 @@
+"""Benchmark runner and baseline comparison.
+
+Each case is timed ``repeat`` times without tracing overhead, then run once
+more under tracemalloc to record peak Python memory. Results are plain
+dictionaries so they can be saved as JSON and compared against a baseline.
+"""
+
+import gc
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from ..version import __version__
+from .datasets import make_contract, write_contract
+
+DIMENSIONS = ("validity", "completeness", "consistency", "freshness", "plausibility")
+
+# Cases in execution order. "dimension.*" cases are derived from the
+# per-dimension timing spans recorded while running "assess".
+CASES = (
+    "assess",
+    *(f"dimension.{name}" for name in DIMENSIONS),
+    "generate_contract",
+    "load_csv",
+    "load_parquet",
+    "load_contract",
+    "audit_log",
+)
+
+DEFAULT_ROWS = (1_000, 10_000, 100_000)
+DEFAULT_TOLERANCE = 0.15
+
+
+def _time_runs(func: Callable[[], Any], repeat: int) -> tuple[list[float], Any]:
+    """Run ``func`` ``repeat`` times; return durations (ms) and the last result."""
+    durations = []
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        result = func()
+        durations.append((time.perf_counter() - started) * 1000.0)
+    return durations, result
+
+
+def _peak_memory_mb(func: Callable[[], Any]) -> float:
+    """Run ``func`` once under tracemalloc and return its peak in MiB."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / (1024 * 1024), 3)
+
+
+def _summarize(case: str, rows: int, runs_ms: list[float]) -> dict[str, Any]:
+    median = statistics.median(runs_ms)
+    return {
+        "case": case,
+        "rows": rows,
+        "median_ms": round(median, 3),
+        "min_ms": round(min(runs_ms), 3),
+        "runs_ms": [round(r, 3) for r in runs_ms],
+        "rows_per_second": round(rows / (median / 1000.0), 1) if median > 0 else None,
+    }
+
+
+def run_benchmarks(
+    rows: tuple[int, ...] | list[int] = DEFAULT_ROWS,
+    cases: tuple[str, ...] | list[str] | None = None,
+    repeat: int = 3,
+    failure_rate: float = 0.01,
+    seed: int = 0,
+    measure_memory: bool = True,
+    progress: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    """Run the benchmark suite.
+
+    Args:
+        rows: Dataset sizes to benchmark
+        cases: Case names (see CASES) or prefixes such as ``dimension``;
+            defaults to all cases
+        repeat: Timed runs per case; the median is reported
+        failure_rate: Per-rule violation rate and duplicate primary key rate
+            passed to the synthetic data generator
+        seed: Random seed for dataset generation
+        measure_memory: Record tracemalloc peak memory per case
+        progress: Optional callback receiving one line per finished case
+
+    Returns:
+        Dictionary with environment metadata and one result per case and size
+    """
+    from ..analysis.contract_generator import ContractGenerator
+    from ..analysis.synthetic import SyntheticDataGenerator
+    from ..logging.local import LocalLogger
+    from ..validator.engine import DataQualityAssessor
+    from ..validator.loaders import load_contract, load_data
+
+    selected = _select_cases(cases)
+    results: list[dict[str, Any]] = []
+
+    with tempfile.TemporaryDirectory(prefix="adri-bench-") as work_dir:
+        work = Path(work_dir)
+        contract = make_contract(seed)
+        contract_path = str(write_contract(contract, work / "benchmark.yaml"))
+        generator = SyntheticDataGenerator(contract, seed=seed)
+        assessor = DataQualityAssessor({"audit": {"enabled": False}, "timings": True})
+        audit_logger = LocalLogger({"enabled": True, "log_dir": str(work / "audit")})
+
+        for size in rows:
+            data = generator.generate(
+                size, violation_rate=failure_rate, duplicate_pk_rate=failure_rate
+            )
+
+            def record(case: str, runs_ms: list[float], func: Callable[[], Any] | None):
+                entry = _summarize(case, size, runs_ms)
+                if measure_memory and func is not None:
+                    entry["peak_memory_mb"] = _peak_memory_mb(func)
+                results.append(entry)
+                if progress:
+                    progress(
+                        f"{case:<24} {size:>10,} rows  {entry['median_ms']:>10.1f}ms"
+                    )
+
+            assessment = None
+            if "assess" in selected or any(
+                c.startswith("dimension.") for c in selected
+            ):
+                dimension_runs: dict[str, list[float]] = {
+                    name: [] for name in DIMENSIONS
+                }
+
+                def assess():
+                    result = assessor.assess(data, contract_path)
+                    timings = result.metadata.get("timings", {}).get("dimensions", {})
+                    for name, ms in timings.items():
+                        dimension_runs.setdefault(name, []).append(ms)
+                    return result
+
+                runs_ms, assessment = _time_runs(assess, repeat)
+                if "assess" in selected:
+                    record("assess", runs_ms, assess)
+                # Per-dimension figures come from the timing spans of the timed runs
+                for name in DIMENSIONS:
+                    case = f"dimension.{name}"
+                    if case in selected and dimension_runs[name]:
+                        record(case, dimension_runs[name][:repeat], None)
+
+            if "generate_contract" in selected:
+
+                def generate():
+                    return ContractGenerator().generate(data=data, data_name="bench")
+
+                record("generate_contract", _time_runs(generate, repeat)[0], generate)
+
+            if "load_csv" in selected:
+                csv_path = work / f"data_{size}.csv"
+                data.to_csv(csv_path, index=False)
+
+                def load_csv():
+                    return load_data(str(csv_path))
+
+                record("load_csv", _time_runs(load_csv, repeat)[0], load_csv)
+
+            if "load_parquet" in selected:
+                parquet_path = work / f"data_{size}.parquet"
+                try:
+                    data.to_parquet(parquet_path, index=False)
+                except ImportError:
+                    parquet_path = None
+                if parquet_path is not None:
+
+                    def load_parquet():
+                        return load_data(str(parquet_path))
+
+                    record(
+                        "load_parquet",
+                        _time_runs(load_parquet, repeat)[0],
+                        load_parquet,
+                    )
+
+            if "load_contract" in selected:
+
+                def load():
+                    return load_contract(contract_path, validate=False)
+
+                record("load_contract", _time_runs(load, repeat)[0], load)
+
+            if "audit_log" in selected:
+                if assessment is None:
+                    assessment = assessor.assess(data, contract_path)
+                data_info = {
+                    "row_count": len(data),
+                    "column_count": len(data.columns),
+                    "columns": list(data.columns),
+                }
+
+                def audit():
+                    return audit_logger.log_assessment(
+                        assessment_result=assessment,
+                        execution_context={"function_name": "bench"},
+                        data_info=data_info,
+                    )
+
+                record("audit_log", _time_runs(audit, repeat)[0], audit)
+
+    return {
+        "adri_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+        "timestamp": datetime.now().isoformat(),
+        "config": {
+            "rows": list(rows),
+            "cases": list(selected),
+            "repeat": repeat,
+            "failure_rate": failure_rate,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def _select_cases(cases: tuple[str, ...] | list[str] | None) -> tuple[str, ...]:
+    """Expand case names and prefixes (e.g. ``dimension``) into CASES entries."""
+    if not cases:
+        return CASES
+    selected = []
+    for name in cases:
+        matches = [c for c in CASES if c == name or c.startswith(f"{name}.")]
+        if not matches:
+            raise ValueError(
+                f"Unknown benchmark case '{name}'. Known: {', '.join(CASES)}"
+            )
+        selected.extend(m for m in matches if m not in selected)
+    return tuple(c for c in CASES if c in selected)
+
+
+def compare_results(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[dict[str, Any]]:
+    """Compare median timings with a baseline run.
+
+    Args:
+        current: Result of :func:`run_benchmarks`
+        baseline: Previously saved result
+        tolerance: Allowed slowdown ratio before a case counts as a regression
+
+    Returns:
+        One entry per case and size present in both runs, with ``ratio``
+        (current / baseline median) and a ``regression`` flag
+    """
+    baseline_index = {
+        (entry["case"], entry["rows"]): entry for entry in baseline.get("results", [])
+    }
+    comparison = []
+    for entry in current.get("results", []):
+        previous = baseline_index.get((entry["case"], entry["rows"]))
+        if previous is None or not previous.get("median_ms"):
+            continue
+        ratio = entry["median_ms"] / previous["median_ms"]
+        comparison.append(
+            {
+                "case": entry["case"],
+                "rows": entry["rows"],
+                "baseline_ms": previous["median_ms"],
+                "current_ms": entry["median_ms"],
+                "ratio": round(ratio, 3),
+                "regression": ratio > 1.0 + tolerance,
+            }
+        )
+    return comparison
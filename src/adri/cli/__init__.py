@@ -16,20 +16,8 @@ import yaml
 
 from ..version import __version__
 
-# Import command classes for clean modular access
-from .commands.assess import AssessCommand
-from .commands.config import (
-    ConfigGetCommand,
-    ConfigSetCommand,
-    ExplainThresholdsCommand,
-    ListContractsCommand,
-    ShowConfigCommand,
-    WhatIfCommand,
-)
-from .commands.generate_contract import GenerateContractCommand
-from .commands.list_assessments import ListAssessmentsCommand
-from .commands.setup import SetupCommand
-from .commands.view_logs import ViewLogsCommand
+# Command classes are loaded on demand through the registry so that
+# `adri --version` and `adri --help` do not import pandas or the analysis package.
 from .registry import get_command
 
 # Import needed components
@@ -39,25 +27,9 @@ except ImportError:
     ConfigurationLoader = None
 
 try:
-    from ..validator.assessor import DataQualityAssessor
-except ImportError:
-    DataQualityAssessor = None
-
-try:
-    from ..validator.loaders import load_contract
+    from ..contracts.loader import load_standard
 except ImportError:
-    try:
-        from ..contracts.loader import load_standard
-    except ImportError:
-        load_standard = None
-
-try:
-    from ..utils.data_loader import load_data
-except ImportError:
-    try:
-        from ..utils import load_data
-    except ImportError:
-        load_data = None
+    load_standard = None
 
 # Ensure UTF-8 console output on Windows (avoid 'charmap' codec errors)
 try:
@@ -239,6 +211,8 @@ def show_config_command(
 ) -> int:
     """Show current ADRI configuration (standalone function for tests)."""
     try:
+        from .commands.config import ShowConfigCommand
+
         cmd = ShowConfigCommand()
         args = {"paths_only": paths_only, "environment": environment}
         return cmd.execute(args)
@@ -277,6 +251,8 @@ def setup_command(
 ) -> int:
     """Initialize ADRI in a project (standalone function for tests)."""
     try:
+        from .commands.setup import SetupCommand
+
         cmd = SetupCommand()
         args = {
             "force": force,
@@ -297,6 +273,8 @@ def assess_command(
 ) -> int:
     """Run data quality assessment (standalone function for tests)."""
     try:
+        from .commands.assess import AssessCommand
+
         cmd = AssessCommand()
         args = {
             "data_path": data_path,
@@ -315,6 +293,8 @@ def generate_standard_command(
 ) -> int:
     """Generate ADRI standard from data (standalone function for tests)."""
     try:
+        from .commands.generate_contract import GenerateContractCommand
+
         cmd = GenerateContractCommand()
         args = {
             "data_path": data_path,
@@ -344,6 +324,8 @@ def validate_standard_command(standard_path: str) -> int:
 def list_standards_command(include_catalog: bool = False) -> int:
     """List available YAML standards (standalone function for tests)."""
     try:
+        from .commands.config import ListContractsCommand
+
         cmd = ListContractsCommand()
         args = {"include_catalog": include_catalog}
         return cmd.execute(args)
@@ -355,6 +337,8 @@ def list_standards_command(include_catalog: bool = False) -> int:
 def list_assessments_command(recent: int = 10, verbose: bool = False) -> int:
     """List previous assessment reports (standalone function for tests)."""
     try:
+        from .commands.list_assessments import ListAssessmentsCommand
+
         cmd = ListAssessmentsCommand()
         args = {"recent": recent, "verbose": verbose}
         return cmd.execute(args)
@@ -368,6 +352,8 @@ def view_logs_command(
 ) -> int:
     """View audit logs (standalone function for tests)."""
     try:
+        from .commands.view_logs import ViewLogsCommand
+
         cmd = ViewLogsCommand()
         args = {"recent": recent, "today": today, "verbose": verbose}
         return cmd.execute(args)
@@ -1108,7 +1094,12 @@ def setup(force, project_name, guide):
 @click.option(
     "--guide", is_flag=True, help="Show detailed assessment explanation and next steps"
 )
-def assess(data_path, standard_path, output_path, guide):
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Profile the assessment and write hot-spot reports to ADRI/profiles",
+)
+def assess(data_path, standard_path, output_path, guide, profile):
     """Run data quality assessment."""
     command = get_command("assess")
     args = {
@@ -1116,12 +1107,13 @@ def assess(data_path, standard_path, output_path, guide):
         "standard_path": standard_path,
         "output_path": output_path,
         "guide": guide,
+        "profile": profile,
     }
     sys.exit(command.execute(args))
 
 
 @cli.command("generate-contract")
-@click.argument("data_path")
+@click.argument("data_path", nargs=-1, required=True)
 @click.option("--force", is_flag=True, help="Overwrite existing contract file")
 @click.option(
     "-o",
@@ -1131,10 +1123,77 @@ def assess(data_path, standard_path, output_path, guide):
 @click.option(
     "--guide", is_flag=True, help="Show detailed generation explanation and next steps"
 )
-def generate_contract(data_path, force, output, guide):
-    """Generate ADRI contract from data file analysis."""
+@click.option(
+    "--sample",
+    type=int,
+    help="Infer rules from N sampled rows, then verify against all rows",
+)
+@click.option(
+    "--sample-strategy",
+    type=click.Choice(["reservoir", "stratified", "time"]),
+    default="reservoir",
+    show_default=True,
+    help="How rows are sampled",
+)
+@click.option(
+    "--sample-column", help="Stratum column (stratified) or timestamp column (time)"
+)
+@click.option("--sample-seed", type=int, default=0, help="Random seed for sampling")
+@click.option(
+    "-j",
+    "--jobs",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Worker processes when DATA_PATH is a directory, glob or several files",
+)
+@click.option(
+    "--compress-snapshot", is_flag=True, help="Store training snapshots gzip-compressed"
+)
+@click.option(
+    "--plausibility-baselines",
+    is_flag=True,
+    help="Record outlier quartiles and category shares for plausibility scoring",
+)
+def generate_contract(
+    data_path,
+    force,
+    output,
+    guide,
+    sample,
+    sample_strategy,
+    sample_column,
+    sample_seed,
+    jobs,
+    compress_snapshot,
+    plausibility_baselines,
+):
+    """Generate ADRI contract(s) from data file, directory or glob analysis."""
     command = get_command("generate-contract")
-    args = {"data_path": data_path, "force": force, "output": output, "guide": guide}
+    args = {
+        "data_path": data_path[0] if len(data_path) == 1 else list(data_path),
+        "force": force,
+        "output": output,
+        "guide": guide,
+        "sample": sample,
+        "sample_strategy": sample_strategy,
+        "sample_column": sample_column,
+        "sample_seed": sample_seed,
+        "jobs": jobs,
+        "compress_snapshot": compress_snapshot,
+        "plausibility_baselines": plausibility_baselines,
+    }
+    sys.exit(command.execute(args))
+
+
+@cli.command("gc-snapshots")
+@click.option(
+    "--dry-run", is_flag=True, help="List unreferenced snapshots without removing them"
+)
+def gc_snapshots(dry_run):
+    """Remove training snapshots no longer referenced by any contract."""
+    command = get_command("gc-snapshots")
+    args = {"dry_run": dry_run}
     sys.exit(command.execute(args))
 
 
@@ -1210,6 +1269,114 @@ def view_logs(recent, today, verbose):
     sys.exit(command.execute(args))
 
 
+@cli.command("metrics")
+@click.option(
+    "--file",
+    "file_path",
+    help="Prometheus text snapshot (default: $ADRI_METRICS_FILE or ADRI/metrics.prom)",
+)
+@click.option("--url", help="Metrics endpoint to scrape, e.g. http://127.0.0.1:9464")
+@click.option("--raw", is_flag=True, help="Print the Prometheus exposition unchanged")
+@click.option("--json", "json_output", is_flag=True, help="Output summary as JSON")
+def metrics(file_path, url, raw, json_output):
+    """Show assessment rate, latency quantiles, cache and audit metrics."""
+    command = get_command("metrics")
+    args = {"file": file_path, "url": url, "raw": raw, "json_output": json_output}
+    sys.exit(command.execute(args))
+
+
+@cli.command("bench")
+@click.option(
+    "--rows",
+    default="1000,10000,100000",
+    show_default=True,
+    help="Comma-separated dataset sizes (e.g. 1000,1e6,1e7)",
+)
+@click.option(
+    "--cases", help="Comma-separated cases or prefixes (default: all), e.g. assess,load"
+)
+@click.option("--repeat", default=3, show_default=True, help="Timed runs per case")
+@click.option(
+    "--failure-rate",
+    default=0.01,
+    show_default=True,
+    help="Per-rule violation rate and duplicate primary key rate",
+)
+@click.option("--seed", default=0, show_default=True, help="Random seed")
+@click.option("--no-memory", is_flag=True, help="Skip tracemalloc peak memory runs")
+@click.option("--output", help="Write JSON results to this file")
+@click.option("--baseline", help="Baseline JSON results to compare against")
+@click.option(
+    "--tolerance",
+    default=0.15,
+    show_default=True,
+    help="Allowed slowdown vs baseline before flagging a regression",
+)
+@click.option("--json", "json_output", is_flag=True, help="Print results as JSON")
+def bench(
+    rows,
+    cases,
+    repeat,
+    failure_rate,
+    seed,
+    no_memory,
+    output,
+    baseline,
+    tolerance,
+    json_output,
+):
+    """Benchmark assessors, contract generation, loaders and audit logging."""
+    command = get_command("bench")
+    args = {
+        "rows": [int(float(r)) for r in rows.split(",") if r.strip()],
+        "cases": [c.strip() for c in cases.split(",")] if cases else None,
+        "repeat": repeat,
+        "failure_rate": failure_rate,
+        "seed": seed,
+        "memory": not no_memory,
+        "output": output,
+        "baseline": baseline,
+        "tolerance": tolerance,
+        "json_output": json_output,
+    }
+    sys.exit(command.execute(args))
+
+
+@cli.command("profile")
+@click.argument("data_path")
+@click.option(
+    "--standard", "standard_path", required=True, help="Path to YAML contract file"
+)
+@click.option(
+    "--output-dir", help="Directory for reports (default: ADRI/profiles/<timestamp>)"
+)
+@click.option(
+    "--top",
+    default=25,
+    show_default=True,
+    help="Functions and allocation sites to report",
+)
+@click.option("--no-memory", is_flag=True, help="Skip the tracemalloc allocation pass")
+@click.option(
+    "--interval",
+    default=0.001,
+    show_default=True,
+    help="Seconds between stack samples for the collapsed-stack file",
+)
+def profile(data_path, standard_path, output_dir, top, no_memory, interval):
+    """Profile an assessment: hot functions, rules, flamegraph stacks and memory."""
+    command = get_command("profile")
+    args = {
+        "data_path": data_path,
+        "standard_path": standard_path,
+        "output_dir": output_dir,
+        "top": top,
+        "memory": not no_memory,
+        "interval": interval,
+    }
+    sys.exit(command.execute(args))
+
+
 @cli.command("scoring-explain")
 @click.argument("data_path")
 @click.option(
@@ -1218,13 +1385,19 @@ def view_logs(recent, today, verbose):
 @click.option(
     "--json", "json_output", is_flag=True, help="Output machine-readable breakdown JSON"
 )
-def scoring_explain(data_path, standard_path, json_output):
+@click.option(
+    "--timings",
+    is_flag=True,
+    help="Record and show per-phase, per-dimension and per-rule timings",
+)
+def scoring_explain(data_path, standard_path, json_output, timings):
     """Explain scoring breakdown for a dataset against a standard."""
     command = get_command("scoring-explain")
     args = {
         "data_path": data_path,
         "standard_path": standard_path,
         "json_output": json_output,
+        "timings": timings,
     }
     sys.exit(command.execute(args))
 
@@ -1314,10 +1487,10 @@ def config(action, setting, standard_path):
       adri config get min_score --standard dev/standards/invoice.yaml
     """
     if action == "set":
-        command = ConfigSetCommand()
+        command = get_command("config-set")
         args = {"setting": setting, "standard_path": standard_path}
     else:  # get
-        command = ConfigGetCommand()
+        command = get_command("config-get")
         args = {"setting": setting, "standard_path": standard_path}
     sys.exit(command.execute(args))
 
@@ -1328,7 +1501,7 @@ def config(action, setting, standard_path):
 )
 def explain_thresholds(standard_path):
     """Explain threshold configurations and their implications."""
-    command = ExplainThresholdsCommand()
+    command = get_command("explain-thresholds")
     args = {"standard_path": standard_path}
     sys.exit(command.execute(args))
 
@@ -1346,7 +1519,7 @@ def what_if(changes, standard_path, data_path):
       adri what-if min_score=85 --standard dev/standards/invoice.yaml --data test.csv
       adri what-if min_score=85 readiness.row_threshold=0.9 --standard dev/standards/invoice.yaml --data test.csv
     """
-    command = WhatIfCommand()
+    command = get_command("what-if")
     args = {
         "changes": list(changes),
         "standard_path": standard_path,
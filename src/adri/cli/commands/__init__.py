@@ -5,19 +5,39 @@ monolithic cli.py structure. Each command is implemented as a focused class
 following the Command pattern.
 """
 
-from .assess import AssessCommand
-from .config import (
-    ListContractsCommand,
-    ShowConfigCommand,
-    ShowContractCommand,
-    ValidateContractCommand,
-)
-from .generate_contract import GenerateContractCommand
-from .guide import GuideCommand
-from .list_assessments import ListAssessmentsCommand
-from .scoring import ScoringExplainCommand, ScoringPresetApplyCommand
-from .setup import SetupCommand
-from .view_logs import ViewLogsCommand
+import importlib
+from typing import Any
+
+# Command classes are imported on first access (PEP 562) so that importing a
+# single command does not load the dependencies of every other command.
+_LAZY_IMPORTS: dict[str, str] = {
+    "AssessCommand": ".assess",
+    "BenchCommand": ".bench",
+    "ListContractsCommand": ".config",
+    "ShowConfigCommand": ".config",
+    "ShowContractCommand": ".config",
+    "ValidateContractCommand": ".config",
+    "GenerateContractCommand": ".generate_contract",
+    "GuideCommand": ".guide",
+    "ListAssessmentsCommand": ".list_assessments",
+    "MetricsCommand": ".metrics",
+    "ProfileCommand": ".profile",
+    "ScoringExplainCommand": ".scoring",
+    "ScoringPresetApplyCommand": ".scoring",
+    "SetupCommand": ".setup",
+    "ViewLogsCommand": ".view_logs",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import command classes on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "SetupCommand",
@@ -26,6 +46,9 @@ __all__ = [
     "GuideCommand",
     "ListAssessmentsCommand",
     "ViewLogsCommand",
+    "MetricsCommand",
+    "BenchCommand",
+    "ProfileCommand",
     "ShowConfigCommand",
     "ValidateContractCommand",
     "ListContractsCommand",
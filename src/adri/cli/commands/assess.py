@@ -57,6 +57,7 @@ class AssessCommand(Command):
                 - standard_path: str - Path to YAML standard file
                 - output_path: Optional[str] - Output path for assessment report
                 - guide: bool - Show detailed assessment explanation and next steps
+                - profile: bool - Profile the assessment and write hot-spot reports
 
         Returns:
             Exit code (0 for success, non-zero for error)
@@ -65,8 +66,11 @@ class AssessCommand(Command):
         standard_path = args["standard_path"]
         output_path = args.get("output_path")
         guide = args.get("guide", False)
+        profile = args.get("profile", False)
 
-        return self._run_assessment(data_path, standard_path, output_path, guide)
+        return self._run_assessment(
+            data_path, standard_path, output_path, guide, profile
+        )
 
     def _run_assessment(
         self,
@@ -74,6 +78,7 @@ class AssessCommand(Command):
         standard_path: str,
         output_path: str | None = None,
         guide: bool = False,
+        profile: bool = False,
     ) -> int:
         """Run data quality assessment."""
         try:
@@ -103,8 +108,19 @@ class AssessCommand(Command):
             data = pd.DataFrame(data_list)
 
             # Run assessment
-            assessor = DataQualityAssessor(self._load_assessor_config())
-            result = assessor.assess(data, str(resolved_standard_path))
+            profile_report = None
+            if profile:
+                from ...core.profiling import profile_assessment
+
+                profile_report = profile_assessment(
+                    data,
+                    str(resolved_standard_path),
+                    config=self._load_assessor_config(),
+                )
+                result = profile_report.result
+            else:
+                assessor = DataQualityAssessor(self._load_assessor_config())
+                result = assessor.assess(data, str(resolved_standard_path))
 
             # Process results
             self._save_assessment_report(guide, data_path, result)
@@ -118,6 +134,11 @@ class AssessCommand(Command):
                     json.dump(report_data, f, indent=2)
                 click.echo(f"📄 Report saved: {output_path}")
 
+            if profile_report is not None:
+                from .profile import save_profile_report
+
+                save_profile_report(profile_report, None, top_n=10)
+
             return 0
 
         except FileNotFoundError as e:
@@ -0,0 +1,112 @@
+"""Bench command implementation for ADRI CLI.
+
+This module contains the BenchCommand class that runs the benchmark suite
+and compares the results against a saved baseline.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import click
+
+from ...core.protocols import Command
+
+
+class BenchCommand(Command):
+    """Command for running ADRI performance benchmarks.
+
+    Runs the suite from adri.benchmarks, optionally saves the JSON results and
+    flags cases slower than a baseline by more than the tolerance.
+    """
+
+    def get_description(self) -> str:
+        """Get command description."""
+        return "Run performance benchmarks and compare against a baseline"
+
+    def execute(self, args: dict[str, Any]) -> int:
+        """Execute the bench command.
+
+        Args:
+            args: Command arguments containing:
+                - rows: list[int] - Dataset sizes
+                - cases: list[str] - Case names or prefixes (default: all)
+                - repeat: int - Timed runs per case
+                - failure_rate: float - Injected violation rate
+                - seed: int - Random seed
+                - memory: bool - Record tracemalloc peak memory
+                - output: str - Path to write JSON results
+                - baseline: str - Baseline JSON to compare against
+                - tolerance: float - Allowed slowdown ratio
+                - json_output: bool - Print results as JSON
+
+        Returns:
+            Exit code (0 for success, 1 on error, 2 on regression)
+        """
+        from ...benchmarks import compare_results, run_benchmarks
+
+        json_output = args.get("json_output", False)
+        baseline_path = args.get("baseline")
+        try:
+            baseline = None
+            if baseline_path:
+                with open(baseline_path, encoding="utf-8") as f:
+                    baseline = json.load(f)
+
+            results = run_benchmarks(
+                rows=args.get("rows") or (1_000, 10_000, 100_000),
+                cases=args.get("cases"),
+                repeat=args.get("repeat", 3),
+                failure_rate=args.get("failure_rate", 0.01),
+                seed=args.get("seed", 0),
+                measure_memory=args.get("memory", True),
+                progress=None if json_output else click.echo,
+            )
+        except Exception as e:
+            click.echo(f"❌ Benchmark failed: {e}")
+            return 1
+
+        comparison = []
+        if baseline is not None:
+            comparison = compare_results(
+                results, baseline, tolerance=args.get("tolerance", 0.15)
+            )
+            results["comparison"] = comparison
+
+        output = args.get("output")
+        if output:
+            Path(output).parent.mkdir(parents=True, exist_ok=True)
+            with open(output, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+
+        if json_output:
+            click.echo(json.dumps(results, indent=2))
+        else:
+            if output:
+                click.echo(f"💾 Results saved to {output}")
+            if baseline is not None:
+                self._display_comparison(comparison, baseline_path)
+
+        return 2 if any(entry["regression"] for entry in comparison) else 0
+
+    def _display_comparison(
+        self, comparison: list[dict[str, Any]], baseline_path: str
+    ) -> None:
+        """Print the baseline comparison table."""
+        click.echo("")
+        click.echo(f"📊 Comparison with {baseline_path}")
+        click.echo(
+            f"{'Case':<24} {'Rows':>10} {'Baseline':>11} {'Current':>11} {'Ratio':>7}"
+        )
+        for entry in comparison:
+            marker = "  ⚠️ regression" if entry["regression"] else ""
+            click.echo(
+                f"{entry['case']:<24} {entry['rows']:>10,} "
+                f"{entry['baseline_ms']:>9.1f}ms {entry['current_ms']:>9.1f}ms "
+                f"{entry['ratio']:>6.2f}x{marker}"
+            )
+        regressions = sum(1 for entry in comparison if entry["regression"])
+        if regressions:
+            click.echo(f"❌ {regressions} case(s) slower than baseline")
+        else:
+            click.echo("✅ No regressions against baseline")
@@ -6,6 +6,7 @@ This module contains the GenerateContractCommand class that handles automatic
 ADRI contract generation from data analysis.
 """
 
+import glob
 import sys
 import time
 from pathlib import Path
@@ -21,8 +22,54 @@ from ...utils.path_utils import (
     rel_to_project_root,
     resolve_project_path,
 )
+from ...utils.serialization import write_yaml_atomic
 from ...validator.loaders import load_data
 
+# File types discovered when generating contracts for a directory or glob
+BATCH_EXTENSIONS = (".csv", ".json", ".parquet")
+
+
+def is_batch_target(data_path: str) -> bool:
+    """Return True when ``data_path`` names a directory or a glob pattern."""
+    return glob.has_magic(data_path) or Path(data_path).is_dir()
+
+
+def discover_data_files(targets: list[str]) -> list[Path]:
+    """Expand directories and glob patterns into supported data files.
+
+    Args:
+        targets: Files, directories (searched recursively) or glob patterns
+
+    Returns:
+        Sorted, de-duplicated list of data files
+    """
+    found: set[Path] = set()
+    for target in targets:
+        if glob.has_magic(target):
+            candidates = [Path(p) for p in glob.glob(target, recursive=True)]
+        elif Path(target).is_dir():
+            candidates = [p for p in Path(target).rglob("*")]
+        else:
+            candidates = [Path(target)]
+        found.update(
+            p.resolve()
+            for p in candidates
+            if p.is_file() and p.suffix.lower() in BATCH_EXTENSIONS
+        )
+    return sorted(found)
+
+
+def _generate_contract_task(task: dict[str, Any]) -> dict[str, Any]:
+    """Generate one contract in a batch; runs in a worker process."""
+    start = time.perf_counter()
+    try:
+        result = GenerateContractCommand()._generate_file(**task)
+    except Exception as e:
+        result = {"status": "failed", "error": str(e)}
+    result["data_path"] = task["data_path"]
+    result["seconds"] = time.perf_counter() - start
+    return result
+
 
 def _progressive_echo(text: str, delay: float = 0.0) -> None:
     """Print text with optional delay for progressive output in guide mode.
@@ -52,10 +99,19 @@ class GenerateContractCommand(Command):
 
         Args:
             args: Command arguments containing:
-                - data_path: str - Path to data file to analyze
+                - data_path: str | list[str] - Data file, directory or glob
+                  pattern (several for batch generation)
                 - force: bool - Overwrite existing standard file
                 - output: Optional[str] - Output path (ignored; uses config paths)
                 - guide: bool - Show detailed generation explanation and next steps
+                - sample: Optional[int] - Infer rules from this many sampled rows
+                - sample_strategy: str - reservoir, stratified or time
+                - sample_column: Optional[str] - Stratum or timestamp column
+                - sample_seed: int - Random seed for sampling
+                - jobs: int - Worker processes for batch generation
+                - compress_snapshot: bool - Store training snapshots gzip-compressed
+                - plausibility_baselines: bool - Record plausibility baselines
+                  in the contract
 
         Returns:
             Exit code (0 for success, non-zero for error)
@@ -63,11 +119,189 @@ class GenerateContractCommand(Command):
         data_path = args["data_path"]
         force = args.get("force", False)
         guide = args.get("guide", False)
+        compress = args.get("compress_snapshot", False)
+        baselines = args.get("plausibility_baselines", False)
+
+        sampling = None
+        if args.get("sample"):
+            sampling = {
+                "size": args["sample"],
+                "strategy": args.get("sample_strategy") or "reservoir",
+                "column": args.get("sample_column"),
+                "seed": args.get("sample_seed") or 0,
+            }
+
+        targets = [data_path] if isinstance(data_path, str) else list(data_path)
+        if len(targets) > 1 or is_batch_target(targets[0]):
+            return self._generate_batch(
+                targets, force, args.get("jobs") or 1, sampling, compress, baselines
+            )
+        return self._generate_standard(
+            targets[0], force, guide, sampling, compress, baselines
+        )
+
+    def _generate_batch(
+        self,
+        targets: list[str],
+        force: bool = False,
+        jobs: int = 1,
+        sampling: dict[str, Any] | None = None,
+        compress: bool = False,
+        baselines: bool = False,
+    ) -> int:
+        """Generate contracts for every data file under ``targets``.
+
+        Output and training-data directories are resolved once and passed to
+        the workers. Files whose hash matches the lineage of their existing
+        contract are skipped.
+        """
+        files = discover_data_files(
+            [t if glob.has_magic(t) else str(resolve_project_path(t)) for t in targets]
+        )
+        if not files:
+            click.echo(f"❌ No data files found in: {', '.join(targets)}")
+            return 1
+
+        contracts_dir = self._determine_output_path("contract.yaml").parent
+        training_dir = self._get_training_data_directory()
+
+        tasks = []
+        results: dict[str, dict[str, Any]] = {}
+        seen: dict[str, Path] = {}
+        for path in files:
+            if path.stem in seen:
+                results[str(path)] = {
+                    "data_path": str(path),
+                    "status": "failed",
+                    "error": f"Contract name clashes with {seen[path.stem]}",
+                    "seconds": 0.0,
+                }
+                continue
+            seen[path.stem] = path
+            tasks.append(
+                {
+                    "data_path": str(path),
+                    "contracts_dir": str(contracts_dir),
+                    "training_dir": str(training_dir),
+                    "force": force,
+                    "sampling": sampling,
+                    "compress": compress,
+                    "baselines": baselines,
+                }
+            )
+
+        click.echo(
+            f"📂 Generating contracts for {len(files)} files with {jobs} job(s)..."
+        )
+        start = time.perf_counter()
+
+        if jobs > 1 and len(tasks) > 1:
+            from concurrent.futures import as_completed, ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = [pool.submit(_generate_contract_task, t) for t in tasks]
+                for future in as_completed(futures):
+                    result = future.result()
+                    results[result["data_path"]] = result
+                    self._display_batch_result(result)
+        else:
+            for task in tasks:
+                result = _generate_contract_task(task)
+                results[result["data_path"]] = result
+                self._display_batch_result(result)
+
+        counts = {"generated": 0, "skipped": 0, "failed": 0}
+        for result in results.values():
+            counts[result["status"]] += 1
+
+        failed = [r for r in results.values() if r["status"] == "failed"]
+        for result in sorted(failed, key=lambda r: r["data_path"]):
+            click.echo(f"❌ {result['data_path']}: {result['error']}")
+
+        click.echo(
+            f"📊 {counts['generated']} generated, {counts['skipped']} unchanged, "
+            f"{counts['failed']} failed in {time.perf_counter() - start:.2f}s"
+        )
+        return 1 if failed else 0
+
+    def _display_batch_result(self, result: dict[str, Any]) -> None:
+        """Print one line per file as batch results arrive."""
+        name = Path(result["data_path"]).name
+        if result["status"] == "generated":
+            click.echo(
+                f"   ✅ {name:<40} {result['seconds']:>8.2f}s  "
+                f"({result.get('rows', 0):,} rows)"
+            )
+        elif result["status"] == "skipped":
+            click.echo(f"   ⏭️  {name:<40} unchanged")
+        else:
+            click.echo(f"   ❌ {name:<40} {result['seconds']:>8.2f}s  failed")
+
+    def _generate_file(
+        self,
+        data_path: str,
+        contracts_dir: str,
+        training_dir: str,
+        force: bool = False,
+        sampling: dict[str, Any] | None = None,
+        compress: bool = False,
+        baselines: bool = False,
+    ) -> dict[str, Any]:
+        """Generate and write the contract for one file of a batch.
+
+        Returns:
+            Result dictionary with status 'generated', 'skipped' or 'failed'
+        """
+        source = Path(data_path)
+        data_name = source.stem
+        output_path = Path(contracts_dir) / f"{data_name}_ADRI_standard.yaml"
+
+        if output_path.exists() and not force:
+            # Contracts written before full-length hashes recorded 8 characters
+            existing_hash = self._existing_file_hash(output_path)
+            if existing_hash and self._generate_file_hash(source).startswith(
+                existing_hash
+            ):
+                return {"status": "skipped", "output": str(output_path)}
+            return {
+                "status": "failed",
+                "error": f"Standard exists: {output_path}. Use --force to overwrite.",
+            }
+
+        data_list = load_data(str(source))
+        if not data_list:
+            return {"status": "failed", "error": "No data loaded"}
+        data = pd.DataFrame(data_list)
+
+        snapshot_path = self._create_training_snapshot(
+            str(source), Path(training_dir), compress
+        )
+        std_dict = self._generate_standard_dict(data, data_name, sampling, baselines)
+        std_dict["training_data_lineage"] = self._create_lineage_metadata(
+            str(source), snapshot_path
+        )
+        self._add_generation_metadata(std_dict, data_name)
+        write_yaml_atomic(output_path, std_dict)
 
-        return self._generate_standard(data_path, force, guide)
+        return {"status": "generated", "output": str(output_path), "rows": len(data)}
+
+    def _existing_file_hash(self, contract_path: Path) -> str | None:
+        """Return the source file hash recorded in an existing contract."""
+        try:
+            with open(contract_path, encoding="utf-8") as f:
+                contract = yaml.safe_load(f) or {}
+            return (contract.get("training_data_lineage") or {}).get("file_hash")
+        except Exception:
+            return None
 
     def _generate_standard(
-        self, data_path: str, force: bool = False, guide: bool = False
+        self,
+        data_path: str,
+        force: bool = False,
+        guide: bool = False,
+        sampling: dict[str, Any] | None = None,
+        compress: bool = False,
+        baselines: bool = False,
     ) -> int:
         """Generate ADRI standard from data analysis."""
         try:
@@ -103,12 +337,16 @@ class GenerateContractCommand(Command):
             data = pd.DataFrame(data_list)
 
             # Create training snapshot
-            snapshot_path = self._create_training_snapshot(str(resolved_data_path))
+            snapshot_path = self._create_training_snapshot(
+                str(resolved_data_path), compress=compress
+            )
             if guide:
                 self._display_snapshot_status(snapshot_path)
 
             # Generate standard
-            std_dict = self._generate_standard_dict(data, data_name)
+            std_dict = self._generate_standard_dict(
+                data, data_name, sampling, baselines
+            )
 
             # Add lineage metadata
             lineage_metadata = self._create_lineage_metadata(
@@ -120,8 +358,7 @@ class GenerateContractCommand(Command):
             self._add_generation_metadata(std_dict, data_name)
 
             # Save standard
-            with open(output_path, "w", encoding="utf-8") as f:
-                yaml.dump(std_dict, f, default_flow_style=False, sort_keys=False)
+            write_yaml_atomic(output_path, std_dict)
 
             # Display results
             if guide:
@@ -167,26 +404,29 @@ class GenerateContractCommand(Command):
         click.echo("📋 Creating data quality rules based on your good data...")
         click.echo("🔍 Creating training data snapshot for lineage tracking...")
 
-    def _create_training_snapshot(self, data_path: str) -> str | None:
-        """Create a training data snapshot for lineage tracking."""
+    def _create_training_snapshot(
+        self,
+        data_path: str,
+        training_data_dir: Path | None = None,
+        compress: bool = False,
+    ) -> str | None:
+        """Store a content-addressed training data snapshot for lineage tracking.
+
+        Identical content is stored once and shared between contracts.
+        """
+        from ...utils.snapshot_store import SnapshotStore
+
         try:
             source_file = Path(data_path)
             if not source_file.exists():
                 return None
 
-            file_hash = self._generate_file_hash(source_file)
-
             # Determine training data directory
-            training_data_dir = self._get_training_data_directory()
-            training_data_dir.mkdir(parents=True, exist_ok=True)
+            if training_data_dir is None:
+                training_data_dir = self._get_training_data_directory()
 
-            snapshot_filename = f"{source_file.stem}_{file_hash}.csv"
-            snapshot_path = training_data_dir / snapshot_filename
-
-            import shutil
-
-            shutil.copy2(source_file, snapshot_path)
-            return str(snapshot_path)
+            store = SnapshotStore(training_data_dir, compress=compress)
+            return str(store.put(source_file).path)
 
         except Exception:
             return None
@@ -207,14 +447,10 @@ class GenerateContractCommand(Command):
         return Path("ADRI/training-data")
 
     def _generate_file_hash(self, file_path: Path) -> str:
-        """Generate SHA256 hash for a file."""
-        import hashlib
+        """Generate the full SHA256 hash for a file."""
+        from ...utils.snapshot_store import hash_file
 
-        hash_sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
-        return hash_sha256.hexdigest()[:8]
+        return hash_file(file_path)
 
     def _display_snapshot_status(self, snapshot_path: str | None) -> None:
         """Display training snapshot creation status."""
@@ -225,13 +461,24 @@ class GenerateContractCommand(Command):
         click.echo("")
 
     def _generate_standard_dict(
-        self, data: pd.DataFrame, data_name: str
+        self,
+        data: pd.DataFrame,
+        data_name: str,
+        sampling: dict[str, Any] | None = None,
+        baselines: bool = False,
     ) -> dict[str, Any]:
         """Generate the standard dictionary using StandardGenerator."""
         from ...analysis.contract_generator import ContractGenerator
 
+        generation_config: dict[str, Any] = {}
+        if sampling:
+            generation_config["sampling"] = sampling
+        if baselines:
+            generation_config["plausibility_baselines"] = True
         generator = ContractGenerator()
-        return generator.generate(data, data_name, generation_config=None)
+        return generator.generate(
+            data, data_name, generation_config=generation_config or None
+        )
 
     def _create_lineage_metadata(
         self, data_path: str, snapshot_path: str | None = None
@@ -239,6 +486,8 @@ class GenerateContractCommand(Command):
         """Create lineage metadata for the generated standard."""
         from datetime import datetime
 
+        from ...utils.snapshot_store import object_digest
+
         source_file = Path(data_path)
         metadata: dict[str, Any] = {
             "source_path": str(source_file.resolve()),
@@ -253,7 +502,8 @@ class GenerateContractCommand(Command):
             metadata.update(
                 {
                     "snapshot_path": str(snapshot_file.resolve()),
-                    "snapshot_hash": self._generate_file_hash(snapshot_file),
+                    "snapshot_hash": object_digest(snapshot_file)
+                    or self._generate_file_hash(snapshot_file),
                     "snapshot_filename": snapshot_file.name,
                 }
             )
@@ -490,4 +740,53 @@ class GenerateContractCommand(Command):
         return "generate-contract"
 
 
+class SnapshotGCCommand(Command):
+    """Command for removing unreferenced training data snapshots.
+
+    Snapshots in the content-addressed store are kept while any contract's
+    training_data_lineage still references them.
+    """
+
+    def get_description(self) -> str:
+        """Get command description."""
+        return "Remove training snapshots no longer referenced by any contract"
+
+    def execute(self, args: dict[str, Any]) -> int:
+        """Execute the gc-snapshots command.
+
+        Args:
+            args: Command arguments containing:
+                - dry_run: bool - Only list snapshots that would be removed
+
+        Returns:
+            Exit code (0 for success, non-zero for error)
+        """
+        from ...utils.snapshot_store import referenced_digests, SnapshotStore
+
+        dry_run = args.get("dry_run", False)
+        generator = GenerateContractCommand()
+        try:
+            contracts_dir = generator._determine_output_path("contract.yaml").parent
+            store = SnapshotStore(generator._get_training_data_directory())
+            removed = store.collect_garbage(
+                referenced_digests(contracts_dir), dry_run=dry_run
+            )
+        except Exception as e:
+            click.echo(f"❌ Snapshot cleanup failed: {e}")
+            return 1
+
+        freed = sum(p.stat().st_size for p in removed if p.exists())
+        verb = "Would remove" if dry_run else "Removed"
+        for path in removed:
+            click.echo(f"   🗑️  {path.name}")
+        click.echo(f"✅ {verb} {len(removed)} unreferenced snapshot(s)")
+        if dry_run and removed:
+            click.echo(f"📦 {freed / 1_048_576:.1f} MB would be freed")
+        return 0
+
+    def get_name(self) -> str:
+        """Get the command name."""
+        return "gc-snapshots"
+
+
 # @ADRI_FEATURE_END[cli_generate_contract]
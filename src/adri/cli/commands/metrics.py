@@ -0,0 +1,142 @@
+"""Metrics command implementation for ADRI CLI.
+
+This module contains the MetricsCommand class that reads a Prometheus text
+snapshot written by the in-process metrics registry (ADRI_METRICS_FILE) or
+scraped from a local metrics endpoint (ADRI_METRICS_PORT) and summarises it.
+"""
+
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any
+
+import click
+
+from ...core.protocols import Command
+
+DEFAULT_METRICS_FILE = "ADRI/metrics.prom"
+
+
+def _ms(seconds: float | None) -> str:
+    """Format a duration in seconds as milliseconds."""
+    if seconds is None or (isinstance(seconds, float) and math.isnan(seconds)):
+        return "-"
+    return f"{seconds * 1000.0:.1f}ms"
+
+
+class MetricsCommand(Command):
+    """Command for summarising ADRI process metrics.
+
+    Shows assessments per second, per-contract latency quantiles and rows per
+    second, cache hit ratios and audit write latency and queue depth.
+    """
+
+    def get_description(self) -> str:
+        """Get command description."""
+        return "Summarise ADRI metrics from a Prometheus snapshot or endpoint"
+
+    def execute(self, args: dict[str, Any]) -> int:
+        """Execute the metrics command.
+
+        Args:
+            args: Command arguments containing:
+                - file: str - Prometheus text file (default: ADRI_METRICS_FILE
+                  or ADRI/metrics.prom)
+                - url: str - Metrics endpoint to scrape instead of a file
+                - raw: bool - Print the exposition text unchanged
+                - json_output: bool - Print the summary as JSON
+
+        Returns:
+            Exit code (0 for success, non-zero for error)
+        """
+        from ...core.metrics import parse_prometheus_text, summarize_samples
+
+        try:
+            text = self._read_exposition(args.get("file"), args.get("url"))
+        except Exception as e:
+            click.echo(f"❌ Failed to read metrics: {e}")
+            return 1
+
+        if text is None:
+            click.echo("📊 No metrics snapshot found")
+            click.echo(
+                "💡 Set ADRI_METRICS_FILE=ADRI/metrics.prom (or ADRI_METRICS_PORT) "
+                "in the process running assessments"
+            )
+            return 0
+
+        if args.get("raw"):
+            click.echo(text, nl=False)
+            return 0
+
+        summary = summarize_samples(parse_prometheus_text(text))
+        if args.get("json_output"):
+            click.echo(json.dumps(summary, indent=2, default=str))
+        else:
+            self._display_summary(summary)
+        return 0
+
+    def _read_exposition(self, file_path: str | None, url: str | None) -> str | None:
+        """Return exposition text from ``url`` or a metrics file, if available."""
+        if url:
+            from urllib.request import urlopen
+
+            with urlopen(url, timeout=5) as response:  # nosec B310
+                return response.read().decode("utf-8")
+
+        path = Path(
+            file_path or os.environ.get("ADRI_METRICS_FILE") or DEFAULT_METRICS_FILE
+        )
+        if not path.exists():
+            return None
+        return path.read_text(encoding="utf-8")
+
+    def _display_summary(self, summary: dict[str, Any]) -> None:
+        """Print a human-readable metrics summary."""
+        rate = summary["assessments_per_second"]
+        click.echo("📈 ADRI Metrics")
+        click.echo("=" * 60)
+        click.echo(f"Assessments: {summary['assessments']:.0f}")
+        if rate is not None:
+            click.echo(
+                f"Rate: {rate:.2f}/s over {summary['uptime_seconds']:.0f}s uptime"
+            )
+
+        contracts = summary["contracts"]
+        if contracts:
+            click.echo("")
+            click.echo(
+                f"{'Contract':<28} {'Count':>7} {'Failed':>7} "
+                f"{'p50':>9} {'p95':>9} {'p99':>9} {'Rows/s':>11}"
+            )
+            for name, entry in sorted(contracts.items()):
+                rows_per_second = entry.get("rows_per_second")
+                click.echo(
+                    f"{name[:28]:<28} {entry['assessments']:>7.0f} "
+                    f"{entry['failed']:>7.0f} {_ms(entry['p50']):>9} "
+                    f"{_ms(entry['p95']):>9} {_ms(entry['p99']):>9} "
+                    f"{rows_per_second or 0:>11,.0f}"
+                )
+
+        for name, entry in sorted(summary["caches"].items()):
+            ratio = entry["hit_ratio"]
+            ratio_text = f"{ratio:.1%}" if ratio is not None else "-"
+            click.echo("")
+            click.echo(
+                f"Cache {name}: {ratio_text} hit ratio "
+                f"({entry['hit']:.0f} hits, {entry['miss']:.0f} misses)"
+            )
+
+        audit = summary["audit"]
+        if audit["writes"]:
+            click.echo("")
+            click.echo(
+                f"Audit writes: {audit['writes']:.0f} "
+                f"(p50 {_ms(audit['p50'])}, p95 {_ms(audit['p95'])}, "
+                f"p99 {_ms(audit['p99'])})"
+            )
+            click.echo(
+                f"Audit queue depth: {audit['queue_depth']:.0f} "
+                f"(max {audit['max_queue_depth']:.0f})"
+            )
@@ -0,0 +1,115 @@
+"""Profile command implementation for ADRI CLI.
+
+This module contains the ProfileCommand class that runs an assessment under
+the profilers in adri.core.profiling and writes hot-spot reports.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import click
+import pandas as pd
+
+from ...core.protocols import Command
+from ...utils.path_utils import resolve_project_path
+
+
+def save_profile_report(report, output_dir: str | None, top_n: int) -> dict[str, Path]:
+    """Write profile artifacts and print a short hot-spot summary.
+
+    Args:
+        report: ProfileReport from profile_assessment
+        output_dir: Directory for the artifacts (default: timestamped
+            directory under ADRI/profiles)
+        top_n: Number of entries to print per section
+
+    Returns:
+        Mapping of artifact name to written path
+    """
+    from ...core.profiling import default_profile_dir
+
+    target = (
+        Path(output_dir)
+        if output_dir
+        else default_profile_dir(resolve_project_path("ADRI/profiles"))
+    )
+    paths = report.write(target)
+
+    click.echo("🔥 Hot spots")
+    dimensions = report.timings.get("dimensions") or {}
+    for name, ms in sorted(dimensions.items(), key=lambda item: -item[1]):
+        click.echo(f"   {name:<28} {ms:>10.2f}ms")
+    for name, ms in list(report.rule_type_totals().items())[:top_n]:
+        click.echo(f"   rules.{name:<22} {ms:>10.2f}ms")
+    for entry in report.functions[: min(top_n, 10)]:
+        click.echo(f"   {entry['cumulative_ms']:>10.2f}ms  {entry['function']}")
+    if report.memory:
+        click.echo(f"   peak memory {report.memory['peak_mb']:.2f} MiB")
+
+    click.echo("📈 Profile written:")
+    for name, path in paths.items():
+        click.echo(f"   {name:<10} {path}")
+    return paths
+
+
+class ProfileCommand(Command):
+    """Command for profiling a data quality assessment.
+
+    Produces a top-N report of functions, dimensions, fields and rule types, a
+    collapsed-stack file for flamegraph tools and a tracemalloc allocation
+    summary.
+    """
+
+    def get_description(self) -> str:
+        """Get command description."""
+        return "Profile an assessment and write hot-spot reports"
+
+    def execute(self, args: dict[str, Any]) -> int:
+        """Execute the profile command.
+
+        Args:
+            args: Command arguments containing:
+                - data_path: str - Path to data file to assess
+                - standard_path: str - Path to YAML contract file
+                - output_dir: str - Directory for the profile artifacts
+                - top: int - Number of functions and allocation sites to report
+                - memory: bool - Run the tracemalloc pass
+                - interval: float - Seconds between stack samples
+
+        Returns:
+            Exit code (0 for success, non-zero for error)
+        """
+        from ...core.profiling import DEFAULT_SAMPLE_INTERVAL, profile_assessment
+        from ...validator.loaders import load_data
+
+        top_n = args.get("top", 25)
+        try:
+            data_path = resolve_project_path(args["data_path"])
+            standard_path = resolve_project_path(args["standard_path"])
+            for label, path in (("Data file", data_path), ("Contract", standard_path)):
+                if not path.exists():
+                    click.echo(f"❌ {label} not found: {path}")
+                    return 1
+
+            data_list = load_data(str(data_path))
+            if not data_list:
+                click.echo("❌ No data loaded")
+                return 1
+            data = pd.DataFrame(data_list)
+
+            click.echo(f"📊 Profiling assessment of {len(data):,} rows...")
+            report = profile_assessment(
+                data,
+                str(standard_path),
+                top_n=top_n,
+                memory=args.get("memory", True),
+                sample_interval=args.get("interval") or DEFAULT_SAMPLE_INTERVAL,
+                config={"audit": {"enabled": False}},
+            )
+        except Exception as e:
+            click.echo(f"❌ Profiling failed: {e}")
+            return 1
+
+        click.echo(f"✅ Score: {report.result.overall_score:.1f}/100")
+        save_profile_report(report, args.get("output_dir"), top_n)
+        return 0
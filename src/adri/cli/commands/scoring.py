@@ -39,6 +39,7 @@ class ScoringExplainCommand(Command):
                 - data_path: str - Path to data file
                 - standard_path: str - Path to YAML standard file
                 - json_output: bool - Output machine-readable breakdown JSON
+                - timings: bool - Record and show per-phase/dimension/rule timings
 
         Returns:
             Exit code (0 for success, non-zero for error)
@@ -46,11 +47,16 @@ class ScoringExplainCommand(Command):
         data_path = args["data_path"]
         standard_path = args["standard_path"]
         json_output = args.get("json_output", False)
+        timings = args.get("timings", False)
 
-        return self._scoring_explain(data_path, standard_path, json_output)
+        return self._scoring_explain(data_path, standard_path, json_output, timings)
 
     def _scoring_explain(
-        self, data_path: str, standard_path: str, json_output: bool = False
+        self,
+        data_path: str,
+        standard_path: str,
+        json_output: bool = False,
+        timings: bool = False,
     ) -> int:
         """Produce a scoring breakdown using the standard's configured weights."""
         try:
@@ -81,7 +87,10 @@ class ScoringExplainCommand(Command):
             data = pd.DataFrame(data_list)
 
             # Run assessment
-            assessor = DataQualityAssessor(self._load_assessor_config())
+            assessor_config = self._load_assessor_config()
+            if timings:
+                assessor_config["timings"] = True
+            assessor = DataQualityAssessor(assessor_config)
             result = assessor.assess(data, str(resolved_standard_path))
 
             # Get threshold and metadata
@@ -171,6 +180,7 @@ class ScoringExplainCommand(Command):
             "contributions": contributions,
             "warnings": warnings,
             "explain": explain,
+            "timings": metadata.get("timings", {}) or {},
         }
 
     def _compute_dimension_contributions(
@@ -241,6 +251,9 @@ class ScoringExplainCommand(Command):
                     dimension, dim_explain
                 )
 
+        if scoring_info["timings"]:
+            payload["timings"] = scoring_info["timings"]
+
         click.echo(json.dumps(payload, indent=2))
 
     def _display_text_output(
@@ -278,6 +291,10 @@ class ScoringExplainCommand(Command):
         # Display dimension-specific explanations
         self._display_dimension_explanations(scoring_info["explain"])
 
+        # Display timings if recorded
+        if scoring_info["timings"]:
+            self._display_timings(scoring_info["timings"])
+
         # Display warnings if any
         if scoring_info["warnings"]:
             click.echo("")
@@ -446,6 +463,31 @@ class ScoringExplainCommand(Command):
             f" - recency_window: {passed_c}/{total} passed, pass_rate={pr:.1f}%, weight={float(rw):.2f}"
         )
 
+    def _display_timings(self, timings: dict[str, Any], top_n: int = 10) -> None:
+        """Display recorded timing spans, slowest rules first."""
+        click.echo("")
+        click.echo(f"⏱️  Timings (total {float(timings.get('total_ms', 0.0)):.1f} ms):")
+
+        phases = timings.get("phases", {}) or {}
+        for phase, ms in phases.items():
+            click.echo(f" - {phase}: {float(ms):.1f} ms")
+
+        dimensions = timings.get("dimensions", {}) or {}
+        for dim, ms in dimensions.items():
+            click.echo(f" - dimension {dim}: {float(ms):.1f} ms")
+
+        rule_spans = []
+        for dim, fields in (timings.get("rules", {}) or {}).items():
+            for field_name, rules in (fields or {}).items():
+                for rule_type, ms in (rules or {}).items():
+                    rule_spans.append((float(ms), dim, field_name, rule_type))
+
+        if rule_spans:
+            rule_spans.sort(reverse=True)
+            click.echo(f"  Slowest rules (top {min(top_n, len(rule_spans))}):")
+            for ms, dim, field_name, rule_type in rule_spans[:top_n]:
+                click.echo(f"     • {dim}.{field_name}.{rule_type}: {ms:.2f} ms")
+
     def get_name(self) -> str:
         """Get the command name."""
         return "scoring-explain"
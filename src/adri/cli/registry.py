@@ -4,53 +4,70 @@ This module provides command registration and discovery functionality
 for the new modular CLI architecture.
 """
 
+import importlib
+
 from ..core.protocols import Command
 from ..core.registry import get_global_registry
-from .commands import (
-    AssessCommand,
-    GenerateContractCommand,
-    GuideCommand,
-    ListAssessmentsCommand,
-    ListContractsCommand,
-    ScoringExplainCommand,
-    ScoringPresetApplyCommand,
-    SetupCommand,
-    ShowConfigCommand,
-    ShowContractCommand,
-    ValidateContractCommand,
-    ViewLogsCommand,
-)
 
+# Command name -> (module, class name). Modules are imported only when the
+# command is requested so CLI startup does not pay for every command's
+# dependencies (pandas, the contract generator, ...).
+COMMAND_SPECS: dict[str, tuple[str, str]] = {
+    # Core commands
+    "setup": (".commands.setup", "SetupCommand"),
+    "assess": (".commands.assess", "AssessCommand"),
+    "generate-contract": (".commands.generate_contract", "GenerateContractCommand"),
+    "guide": (".commands.guide", "GuideCommand"),
+    "gc-snapshots": (".commands.generate_contract", "SnapshotGCCommand"),
+    # Information commands
+    "list-assessments": (".commands.list_assessments", "ListAssessmentsCommand"),
+    "list-contracts": (".commands.config", "ListContractsCommand"),
+    "view-logs": (".commands.view_logs", "ViewLogsCommand"),
+    "metrics": (".commands.metrics", "MetricsCommand"),
+    "bench": (".commands.bench", "BenchCommand"),
+    "profile": (".commands.profile", "ProfileCommand"),
+    # Configuration commands
+    "show-config": (".commands.config", "ShowConfigCommand"),
+    "validate-contract": (".commands.config", "ValidateContractCommand"),
+    "show-contract": (".commands.config", "ShowContractCommand"),
+    "config-set": (".commands.config", "ConfigSetCommand"),
+    "config-get": (".commands.config", "ConfigGetCommand"),
+    "explain-thresholds": (".commands.config", "ExplainThresholdsCommand"),
+    "what-if": (".commands.config", "WhatIfCommand"),
+    # Scoring commands
+    "scoring-explain": (".commands.scoring", "ScoringExplainCommand"),
+    "scoring-preset-apply": (".commands.scoring", "ScoringPresetApplyCommand"),
+}
+
+
+def _load_command_class(command_name: str) -> type[Command]:
+    """Import and return the command class registered under ``command_name``."""
+    module_name, class_name = COMMAND_SPECS[command_name]
+    module = importlib.import_module(module_name, __package__)
+    return getattr(module, class_name)
+
+
+def register_command(command_name: str) -> None:
+    """Register a single CLI command with the global registry, importing it lazily.
+
+    Unknown names are ignored so that the registry raises its usual
+    ComponentNotFoundError when the command is looked up.
 
-def register_all_commands() -> None:
-    """Register all CLI commands with the global registry."""
+    Args:
+        command_name: Name of the command to register
+    """
     registry = get_global_registry()
+    if command_name not in COMMAND_SPECS:
+        return
+    if command_name in registry.commands.list_components():
+        return
+    registry.commands.register(command_name, _load_command_class(command_name))
 
-    # Define all commands to register
-    commands_to_register = [
-        # Core commands
-        ("setup", SetupCommand),
-        ("assess", AssessCommand),
-        ("generate-contract", GenerateContractCommand),
-        ("guide", GuideCommand),
-        # Information commands
-        ("list-assessments", ListAssessmentsCommand),
-        ("list-contracts", ListContractsCommand),
-        ("view-logs", ViewLogsCommand),
-        # Configuration commands
-        ("show-config", ShowConfigCommand),
-        ("validate-contract", ValidateContractCommand),
-        ("show-contract", ShowContractCommand),
-        # Scoring commands
-        ("scoring-explain", ScoringExplainCommand),
-        ("scoring-preset-apply", ScoringPresetApplyCommand),
-    ]
-
-    # Register commands only if they're not already registered
-    existing_commands = set(registry.commands.list_components())
-    for command_name, command_class in commands_to_register:
-        if command_name not in existing_commands:
-            registry.commands.register(command_name, command_class)
+
+def register_all_commands() -> None:
+    """Register all CLI commands with the global registry."""
+    for command_name in COMMAND_SPECS:
+        register_command(command_name)
 
 
 def create_command_registry() -> dict[str, Command]:
@@ -84,8 +101,8 @@ def get_command(command_name: str) -> Command:
     Raises:
         ComponentNotFoundError: If command is not found
     """
-    # Ensure all commands are registered
-    register_all_commands()
+    # Only import the requested command
+    register_command(command_name)
 
     registry = get_global_registry()
     return registry.commands.get_command(command_name)
@@ -73,7 +73,11 @@ class StandardSchema:
 
     # Dimension requirement fields
     DIMENSION_REQUIRED_FIELDS = ["weight"]
-    DIMENSION_OPTIONAL_FIELDS = ["minimum_score", "field_requirements"]
+    DIMENSION_OPTIONAL_FIELDS = [
+        "minimum_score",
+        "field_requirements",
+        "cross_field_rules",
+    ]
 
     # Weight constraints (0-5 scale)
     WEIGHT_MIN = 0
@@ -223,6 +227,12 @@ class StandardSchema:
                 field_type=dict,
                 description="Field-specific validation requirements",
             ),
+            "cross_field_rules": FieldSchema(
+                name="cross_field_rules",
+                required=False,
+                field_type=list,
+                description="Expressions relating fields of a record (consistency)",
+            ),
         }
 
     @classmethod
@@ -9,6 +9,7 @@ import os
 import threading
 from typing import Any
 
+from ..core.metrics import record_cache_lookup
 from .artifact import validate_artifact_declaration_section
 from .exceptions import ValidationResult
 from .schema import StandardSchema
@@ -396,6 +397,46 @@ class ContractValidator:
                         value, f"{dimension_path}.field_requirements", result
                     )
 
+                if field_name == "cross_field_rules":
+                    self._validate_cross_field_rules(value, field_path, result)
+
+    def _validate_cross_field_rules(
+        self, rules: list[Any], base_path: str, result: ValidationResult
+    ) -> None:
+        """
+        Validate declared cross-field rules by compiling their expressions.
+
+        Args:
+            rules: List of expression strings or {expression, name, remediation}
+            base_path: Path prefix for error reporting
+            result: ValidationResult to populate with errors
+        """
+        from ..validator.expressions import compile_expression, ExpressionError
+
+        for i, rule in enumerate(rules):
+            rule_path = f"{base_path}[{i}]"
+            expression = rule.get("expression") if isinstance(rule, dict) else rule
+            if not isinstance(expression, str):
+                result.add_error(
+                    message="Cross-field rule must be an expression string or a "
+                    "mapping with an 'expression'",
+                    path=rule_path,
+                    expected="str or {expression: str}",
+                    actual=type(rule).__name__,
+                )
+                continue
+            try:
+                compile_expression(expression)
+            except ExpressionError as e:
+                result.add_error(
+                    message=str(e),
+                    path=rule_path,
+                    actual=expression,
+                    suggestion="Use column names, literals, arithmetic, "
+                    "comparisons, and/or/not and abs/round/len/lower/upper/"
+                    "isnull/notnull",
+                )
+
     def _validate_field_requirements(
         self,
         field_requirements: dict[str, Any],
@@ -491,16 +532,19 @@ class ContractValidator:
         """
         with self._cache_lock:
             if file_path not in self._cache:
+                record_cache_lookup("contract_validation", hit=False)
                 return None
 
             cached_result, cached_mtime = self._cache[file_path]
 
             # Check if cache is still valid
             if self._is_cache_valid(file_path, cached_mtime):
+                record_cache_lookup("contract_validation", hit=True)
                 return cached_result
             else:
                 # Remove stale cache entry
                 del self._cache[file_path]
+                record_cache_lookup("contract_validation", hit=False)
                 return None
 
     def _cache_result(self, file_path: str, result: ValidationResult) -> None:
@@ -0,0 +1,624 @@
+"""In-process metrics registry for ADRI.
+
+Counters, gauges and HDR-style latency histograms updated by the guard, the
+validator, the contract validation cache and the audit logger. The registry
+renders the Prometheus text exposition format, which can be:
+
+- written to a file (``ADRI_METRICS_FILE=/path/metrics.prom``; refreshed at
+  most once per second and at interpreter exit)
+- served on a local port (``ADRI_METRICS_PORT=9464`` or
+  :func:`start_metrics_server`)
+- summarised with ``adri metrics``
+
+Histograms use log-linear buckets (32 sub-buckets per power of two over
+integer microseconds), giving quantiles within ~3% relative error at any
+latency without configuring bucket bounds up front. Only non-empty buckets are
+stored and exported.
+"""
+
+import atexit
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_SUB_BUCKET_BITS = 5
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+
+# Standard ADRI metric names
+ASSESSMENTS_TOTAL = "adri_assessments_total"
+ASSESSMENT_DURATION = "adri_assessment_duration_seconds"
+ROWS_ASSESSED_TOTAL = "adri_rows_assessed_total"
+GUARD_CALLS_TOTAL = "adri_guard_calls_total"
+CACHE_REQUESTS_TOTAL = "adri_cache_requests_total"
+AUDIT_WRITE_DURATION = "adri_audit_write_duration_seconds"
+AUDIT_WRITES_IN_FLIGHT = "adri_audit_writes_in_flight"
+AUDIT_WRITES_IN_FLIGHT_MAX = "adri_audit_writes_in_flight_max"
+PROCESS_START_TIME = "adri_process_start_time_seconds"
+SNAPSHOT_TIME = "adri_metrics_snapshot_time_seconds"
+
+
+def _bucket_index(micros: int) -> int:
+    """Map a non-negative integer number of microseconds to a bucket index."""
+    if micros < _SUB_BUCKETS:
+        return micros
+    shift = micros.bit_length() - _SUB_BUCKET_BITS - 1
+    return (shift + 1) * _SUB_BUCKETS + ((micros >> shift) - _SUB_BUCKETS)
+
+
+def _bucket_upper_bound(index: int) -> float:
+    """Return the inclusive upper bound (seconds) of a bucket index."""
+    if index < _SUB_BUCKETS:
+        return index / 1e6
+    shift = index // _SUB_BUCKETS - 1
+    mantissa = index % _SUB_BUCKETS + _SUB_BUCKETS
+    return (((mantissa + 1) << shift) - 1) / 1e6
+
+
+class Counter:
+    """Monotonically increasing counter."""
+
+    def __init__(self):
+        """Initialize the counter at zero."""
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter by ``amount``."""
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        """Current counter value."""
+        return self._value
+
+    def samples(self, name: str) -> list[tuple[str, dict[str, str], float]]:
+        """Return exposition samples as (name, extra labels, value)."""
+        return [(name, {}, self._value)]
+
+
+class Gauge:
+    """Value that can go up and down."""
+
+    def __init__(self):
+        """Initialize the gauge at zero."""
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        """Set the gauge to ``value``."""
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount: float = 1.0) -> float:
+        """Increase the gauge and return the new value."""
+        with self._lock:
+            self._value += amount
+            return self._value
+
+    def dec(self, amount: float = 1.0) -> float:
+        """Decrease the gauge and return the new value."""
+        with self._lock:
+            self._value -= amount
+            return self._value
+
+    def set_max(self, value: float) -> None:
+        """Raise the gauge to ``value`` if it is currently lower."""
+        with self._lock:
+            if value > self._value:
+                self._value = value
+
+    @property
+    def value(self) -> float:
+        """Current gauge value."""
+        return self._value
+
+    def samples(self, name: str) -> list[tuple[str, dict[str, str], float]]:
+        """Return exposition samples as (name, extra labels, value)."""
+        return [(name, {}, self._value)]
+
+
+class Histogram:
+    """HDR-style latency histogram over seconds.
+
+    Observations are rounded to whole microseconds and counted in sparse
+    log-linear buckets.
+    """
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self._buckets: dict[int, int] = {}
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Record a duration in seconds."""
+        index = _bucket_index(max(0, int(round(seconds * 1e6))))
+        with self._lock:
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+            self._count += 1
+            self._sum += seconds
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the wall-clock duration of the enclosed block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        """Sum of observed durations in seconds."""
+        return self._sum
+
+    def quantile(self, q: float) -> float:
+        """Return the ``q`` quantile (0..1) in seconds, or NaN when empty."""
+        with self._lock:
+            buckets = sorted(self._buckets.items())
+            count = self._count
+        return _quantile_from_buckets(
+            [(_bucket_upper_bound(i), n) for i, n in buckets], count, q
+        )
+
+    def samples(self, name: str) -> list[tuple[str, dict[str, str], float]]:
+        """Return cumulative ``_bucket`` samples plus ``_sum`` and ``_count``."""
+        with self._lock:
+            buckets = sorted(self._buckets.items())
+            count = self._count
+            total = self._sum
+        samples = []
+        cumulative = 0
+        for index, n in buckets:
+            cumulative += n
+            le = _format_value(_bucket_upper_bound(index))
+            samples.append((f"{name}_bucket", {"le": le}, cumulative))
+        samples.append((f"{name}_bucket", {"le": "+Inf"}, count))
+        samples.append((f"{name}_sum", {}, total))
+        samples.append((f"{name}_count", {}, count))
+        return samples
+
+
+def _quantile_from_buckets(
+    buckets: list[tuple[float, int]], count: int, q: float
+) -> float:
+    """Return the upper bound of the bucket holding the ``q`` quantile.
+
+    Args:
+        buckets: (upper bound, non-cumulative count) pairs in ascending order
+        count: Total number of observations
+        q: Quantile in [0, 1]
+    """
+    if count <= 0:
+        return math.nan
+    rank = max(1, math.ceil(q * count))
+    seen = 0
+    for upper, n in buckets:
+        seen += n
+        if seen >= rank:
+            return upper
+    return buckets[-1][0] if buckets else math.nan
+
+
+_METRIC_TYPES = {"counter": Counter, "gauge": Gauge, "histogram": Histogram}
+
+
+class MetricFamily:
+    """A named metric with optional labels."""
+
+    def __init__(self, name: str, help_text: str, metric_type: str, labelnames: tuple):
+        """Initialize the family.
+
+        Args:
+            name: Prometheus metric name
+            help_text: HELP text
+            metric_type: One of counter, gauge, histogram
+            labelnames: Label names, in exposition order
+        """
+        self.name = name
+        self.help = help_text
+        self.type = metric_type
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, **labels: Any):
+        """Return the child metric for the given label values."""
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = _METRIC_TYPES[self.type]()
+                    self._children[key] = child
+        return child
+
+    def children(self) -> list[tuple[dict[str, str], Any]]:
+        """Return (labels, metric) pairs for every child."""
+        with self._lock:
+            items = list(self._children.items())
+        return [(dict(zip(self.labelnames, key)), child) for key, child in items]
+
+
+class MetricsRegistry:
+    """Container for metric families with Prometheus text exposition."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._families: dict[str, MetricFamily] = {}
+        self._lock = threading.Lock()
+        self.gauge(
+            PROCESS_START_TIME, "Unix time the metrics registry was created"
+        ).labels().set(time.time())
+
+    def _family(
+        self, name: str, help_text: str, metric_type: str, labelnames: tuple
+    ) -> MetricFamily:
+        family = self._families.get(name)
+        if family is None:
+            with self._lock:
+                family = self._families.get(name)
+                if family is None:
+                    family = MetricFamily(name, help_text, metric_type, labelnames)
+                    self._families[name] = family
+        if family.type != metric_type:
+            raise ValueError(f"Metric '{name}' already registered as {family.type}")
+        return family
+
+    def counter(
+        self, name: str, help_text: str, labelnames: tuple = ()
+    ) -> MetricFamily:
+        """Get or create a counter family."""
+        return self._family(name, help_text, "counter", labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: tuple = ()) -> MetricFamily:
+        """Get or create a gauge family."""
+        return self._family(name, help_text, "gauge", labelnames)
+
+    def histogram(
+        self, name: str, help_text: str, labelnames: tuple = ()
+    ) -> MetricFamily:
+        """Get or create a histogram family."""
+        return self._family(name, help_text, "histogram", labelnames)
+
+    def get(self, name: str) -> MetricFamily | None:
+        """Return a registered family by name."""
+        return self._families.get(name)
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {SNAPSHOT_TIME} Unix time this snapshot was rendered",
+            f"# TYPE {SNAPSHOT_TIME} gauge",
+            f"{SNAPSHOT_TIME} {_format_value(time.time())}",
+        ]
+        with self._lock:
+            families = sorted(self._families.values(), key=lambda f: f.name)
+        for family in families:
+            lines.append(f"# HELP {family.name} {family.help}")
+            lines.append(f"# TYPE {family.name} {family.type}")
+            for labels, child in family.children():
+                for sample_name, extra, value in child.samples(family.name):
+                    lines.append(
+                        f"{sample_name}{_format_labels({**labels, **extra})} "
+                        f"{_format_value(value)}"
+                    )
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str | Path) -> None:
+        """Atomically write the exposition text to ``path``."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(self.to_prometheus(), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way Prometheus clients do."""
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer() and abs(value) < 1e15:
+            return str(int(value))
+        return repr(value)
+    return str(value)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{k}="{_escape_label_value(str(v))}"' for k, v in labels.items())
+    return "{" + pairs + "}"
+
+
+# ---------------- Process-wide registry -----------------
+
+_registry: MetricsRegistry | None = None
+_registry_lock = threading.Lock()
+_last_file_write = 0.0
+_FILE_WRITE_INTERVAL_SECONDS = 1.0
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Return the process-wide registry, creating it on first use.
+
+    On creation, ``ADRI_METRICS_PORT`` starts the local HTTP endpoint and
+    ``ADRI_METRICS_FILE`` registers a final file write at interpreter exit.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = MetricsRegistry()
+                _configure_exporters_from_env()
+    return _registry
+
+
+def reset_metrics_registry() -> None:
+    """Drop all recorded metrics (mainly for tests)."""
+    global _registry
+    with _registry_lock:
+        _registry = None
+
+
+def _configure_exporters_from_env() -> None:
+    port = os.environ.get("ADRI_METRICS_PORT")
+    if port:
+        try:
+            start_metrics_server(int(port))
+        except Exception as e:  # noqa: E722
+            logger.warning(f"Could not start metrics server on port {port}: {e}")
+    if os.environ.get("ADRI_METRICS_FILE"):
+        atexit.register(lambda: maybe_write_metrics_file(force=True))
+
+
+def maybe_write_metrics_file(force: bool = False) -> None:
+    """Refresh ``ADRI_METRICS_FILE`` if set, at most once per second."""
+    global _last_file_write
+    path = os.environ.get("ADRI_METRICS_FILE")
+    if not path or _registry is None:
+        return
+    now = time.monotonic()
+    if not force and now - _last_file_write < _FILE_WRITE_INTERVAL_SECONDS:
+        return
+    _last_file_write = now
+    try:
+        _registry.write(path)
+    except Exception as e:  # noqa: E722
+        logger.warning(f"Could not write metrics file {path}: {e}")
+
+
+def start_metrics_server(
+    port: int, host: str = "127.0.0.1", registry: MetricsRegistry | None = None
+):
+    """Serve ``/metrics`` from a daemon thread.
+
+    Args:
+        port: TCP port (0 picks a free port)
+        host: Interface to bind; defaults to loopback only
+        registry: Registry to expose (defaults to the process-wide registry)
+
+    Returns:
+        The running ThreadingHTTPServer; call ``shutdown()`` to stop it
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    def _registry_to_serve() -> MetricsRegistry:
+        return registry if registry is not None else get_metrics_registry()
+
+    class _MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = _registry_to_serve().to_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    thread = threading.Thread(
+        target=server.serve_forever, name="adri-metrics", daemon=True
+    )
+    thread.start()
+    return server
+
+
+# ---------------- Instrumentation helpers -----------------
+
+
+def record_assessment(contract: str, rows: int, seconds: float, passed: bool) -> None:
+    """Record one completed assessment."""
+    registry = get_metrics_registry()
+    registry.counter(
+        ASSESSMENTS_TOTAL, "Completed assessments", ("contract", "passed")
+    ).labels(contract=contract, passed=str(bool(passed)).lower()).inc()
+    registry.histogram(ASSESSMENT_DURATION, "Assessment latency", ("contract",)).labels(
+        contract=contract
+    ).observe(seconds)
+    registry.counter(ROWS_ASSESSED_TOTAL, "Rows assessed", ("contract",)).labels(
+        contract=contract
+    ).inc(rows)
+    maybe_write_metrics_file()
+
+
+def record_guard_call(contract: str, outcome: str) -> None:
+    """Record a guarded function call (passed, failed, error or provisional)."""
+    get_metrics_registry().counter(
+        GUARD_CALLS_TOTAL, "Guarded function calls", ("contract", "outcome")
+    ).labels(contract=contract, outcome=outcome).inc()
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Record a cache lookup for the cache hit ratio."""
+    get_metrics_registry().counter(
+        CACHE_REQUESTS_TOTAL, "Cache lookups", ("cache", "result")
+    ).labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+@contextmanager
+def track_audit_write() -> Iterator[None]:
+    """Time an audit write and track writers queued on the audit log."""
+    registry = get_metrics_registry()
+    in_flight = registry.gauge(
+        AUDIT_WRITES_IN_FLIGHT, "Audit writes waiting for or holding the log lock"
+    ).labels()
+    depth = in_flight.inc()
+    registry.gauge(
+        AUDIT_WRITES_IN_FLIGHT_MAX, "Highest observed audit write queue depth"
+    ).labels().set_max(depth)
+    try:
+        with (
+            registry.histogram(AUDIT_WRITE_DURATION, "Audit log write latency")
+            .labels()
+            .time()
+        ):
+            yield
+    finally:
+        in_flight.dec()
+
+
+# ---------------- Exposition parsing (adri metrics) -----------------
+
+_SAMPLE_RE = re.compile(
+    r"^(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(?P<labels>.*)\})?\s+(?P<value>\S+)"
+)
+_LABEL_RE = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+
+
+def parse_prometheus_text(text: str) -> list[tuple[str, dict[str, str], float]]:
+    """Parse Prometheus text exposition into (name, labels, value) samples."""
+    samples = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        match = _SAMPLE_RE.match(line)
+        if not match:
+            continue
+        labels = {
+            k: v.replace('\\"', '"').replace("\\n", "\n").replace("\\\\", "\\")
+            for k, v in _LABEL_RE.findall(match.group("labels") or "")
+        }
+        try:
+            value = float(match.group("value"))
+        except ValueError:
+            continue
+        samples.append((match.group("name"), labels, value))
+    return samples
+
+
+def summarize_samples(
+    samples: list[tuple[str, dict[str, str], float]],
+) -> dict[str, Any]:
+    """Derive fleet-level figures from parsed exposition samples.
+
+    Returns:
+        Dictionary with uptime, assessment rate, per-contract latency
+        quantiles and rows/s, cache hit ratios and audit write statistics
+    """
+    scalars: dict[str, float] = {}
+    counters: dict[tuple[str, tuple], float] = {}
+    buckets: dict[tuple[str, tuple], list[tuple[float, float]]] = {}
+
+    for name, labels, value in samples:
+        if name.endswith("_bucket") and "le" in labels:
+            rest = tuple(sorted((k, v) for k, v in labels.items() if k != "le"))
+            le = math.inf if labels["le"] == "+Inf" else float(labels["le"])
+            buckets.setdefault((name[: -len("_bucket")], rest), []).append((le, value))
+        elif labels:
+            counters[(name, tuple(sorted(labels.items())))] = value
+        else:
+            scalars[name] = value
+
+    def _quantiles(key) -> dict[str, float]:
+        cumulative = sorted(buckets.get(key, []))
+        total = cumulative[-1][1] if cumulative else 0
+        plain, previous = [], 0.0
+        for upper, seen in cumulative:
+            if not math.isinf(upper):
+                plain.append((upper, int(seen - previous)))
+            previous = seen
+        return {
+            f"p{int(q * 100)}": _quantile_from_buckets(plain, int(total), q)
+            for q in (0.5, 0.95, 0.99)
+        }
+
+    start = scalars.get(PROCESS_START_TIME)
+    snapshot = scalars.get(SNAPSHOT_TIME, time.time())
+    uptime = max(snapshot - start, 1e-9) if start else None
+
+    contracts: dict[str, dict[str, Any]] = {}
+    total_assessments = 0.0
+    for (name, labels), value in counters.items():
+        label_map = dict(labels)
+        if name == ASSESSMENTS_TOTAL:
+            entry = contracts.setdefault(label_map.get("contract", ""), {})
+            entry["assessments"] = entry.get("assessments", 0) + value
+            if label_map.get("passed") == "false":
+                entry["failed"] = entry.get("failed", 0) + value
+            total_assessments += value
+        elif name == ROWS_ASSESSED_TOTAL:
+            contracts.setdefault(label_map.get("contract", ""), {})["rows"] = value
+        elif name == f"{ASSESSMENT_DURATION}_sum":
+            contracts.setdefault(label_map.get("contract", ""), {})[
+                "duration_seconds"
+            ] = value
+
+    for contract, entry in contracts.items():
+        entry.update(_quantiles((ASSESSMENT_DURATION, (("contract", contract),))))
+        entry.setdefault("assessments", 0)
+        entry.setdefault("failed", 0)
+        seconds = entry.get("duration_seconds") or 0
+        entry["rows_per_second"] = entry.get("rows", 0) / seconds if seconds else None
+
+    caches: dict[str, dict[str, float]] = {}
+    for (name, labels), value in counters.items():
+        if name == CACHE_REQUESTS_TOTAL:
+            label_map = dict(labels)
+            entry = caches.setdefault(label_map.get("cache", ""), {"hit": 0, "miss": 0})
+            entry[label_map.get("result", "miss")] = value
+    for entry in caches.values():
+        lookups = entry["hit"] + entry["miss"]
+        entry["hit_ratio"] = entry["hit"] / lookups if lookups else None
+
+    audit = _quantiles((AUDIT_WRITE_DURATION, ()))
+    audit["writes"] = scalars.get(f"{AUDIT_WRITE_DURATION}_count", 0)
+    audit["queue_depth"] = scalars.get(AUDIT_WRITES_IN_FLIGHT, 0)
+    audit["max_queue_depth"] = scalars.get(AUDIT_WRITES_IN_FLIGHT_MAX, 0)
+
+    return {
+        "uptime_seconds": uptime,
+        "assessments": total_assessments,
+        "assessments_per_second": total_assessments / uptime if uptime else None,
+        "contracts": contracts,
+        "caches": caches,
+        "audit": audit,
+    }
@@ -0,0 +1,413 @@
+"""Hot-spot profiling for ADRI assessments.
+
+Runs one assessment in three passes so each tool measures undisturbed code:
+
+1. cProfile (deterministic) with timing spans enabled: top-N functions,
+   self time per component (dimension assessor, rules, engine, ...) and the
+   per-dimension / per-field / per-rule-type breakdown from
+   :mod:`adri.core.timing`
+2. A stack sampler: collapsed stacks (``frame;frame;frame count``) for
+   flamegraph tools such as flamegraph.pl, speedscope or inferno
+3. tracemalloc: peak memory overall and per span (assessment, pipeline,
+   each dimension assessor, audit write) plus the top allocation sites
+
+Use :func:`profile_assessment` from Python, or ``adri profile`` /
+``adri assess --profile`` from the command line.
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from .tracing import ATTR_DIMENSION, Span, Tracer, get_tracer, set_tracer
+
+DEFAULT_TOP_N = 25
+DEFAULT_SAMPLE_INTERVAL = 0.001
+
+# Path fragments (normalised to "/") mapped to report components, first match wins
+_COMPONENTS = (
+    ("adri/validator/dimensions/validity", "dimension:validity"),
+    ("adri/validator/dimensions/completeness", "dimension:completeness"),
+    ("adri/validator/dimensions/consistency", "dimension:consistency"),
+    ("adri/validator/dimensions/freshness", "dimension:freshness"),
+    ("adri/validator/dimensions/plausibility", "dimension:plausibility"),
+    ("adri/validator/rules", "rules"),
+    ("adri/validator/loaders", "contract_load"),
+    ("adri/contracts/", "contract_load"),
+    ("adri/logging/", "audit"),
+    ("adri/", "adri"),
+    ("/pandas/", "pandas"),
+    ("/numpy/", "numpy"),
+    ("/yaml/", "yaml"),
+)
+
+
+def _component(filename: str) -> str:
+    """Map a source file to a report component."""
+    normalised = filename.replace(os.sep, "/")
+    for fragment, component in _COMPONENTS:
+        if fragment in normalised:
+            return component
+    if normalised.startswith("~") or normalised.startswith("<"):
+        return "builtins"
+    return "other"
+
+
+def _frame_label(filename: str, name: str) -> str:
+    """Short ``module:function`` label for a source file and function name."""
+    filename = filename.replace(os.sep, "/")
+    if "/site-packages/" in filename:
+        filename = filename.split("/site-packages/", 1)[1]
+    elif "/adri/" in filename:
+        filename = "adri/" + filename.rsplit("/adri/", 1)[1]
+    module = filename[:-3] if filename.endswith(".py") else filename
+    return f"{module.replace('/', '.')}:{name}"
+
+
+class StackSampler:
+    """Samples the Python stack of one thread at a fixed interval.
+
+    Samples are aggregated into collapsed stacks, root first, which is the
+    input format of flamegraph.pl, speedscope and inferno.
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL):
+        """Initialize the sampler.
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._target_id: int | None = None
+
+    def start(self) -> None:
+        """Start sampling the calling thread."""
+        self._target_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="adri-stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(_frame_label(code.co_filename, code.co_name))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """Return the samples in collapsed-stack format."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+
+class _MemoryTracer(Tracer):
+    """Tracer that records the tracemalloc peak reached inside each span.
+
+    Peaks are measured relative to the memory in use when the span starts, so
+    ``dimension:validity`` reports what the validity assessor allocated on
+    top of the data already loaded.
+    """
+
+    def __init__(self):
+        self.peaks_kb: dict[str, float] = {}
+        self.peak = 0
+        self._stack: list[list[Any]] = []
+
+    @contextmanager
+    def start_span(self, name: str, attributes: dict[str, Any] | None = None):
+        if name == "adri.dimension" and attributes:
+            name = f"dimension:{attributes.get(ATTR_DIMENSION)}"
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak)
+        for frame in self._stack:
+            frame[2] = max(frame[2], peak)
+        tracemalloc.reset_peak()
+        self._stack.append([name, current, current])
+        try:
+            yield Span()
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            name, started, highest = self._stack.pop()
+            highest = max(highest, peak)
+            self.peak = max(self.peak, peak)
+            for frame in self._stack:
+                frame[2] = max(frame[2], highest)
+            used_kb = (highest - started) / 1024.0
+            self.peaks_kb[name] = max(self.peaks_kb.get(name, 0.0), round(used_kb, 1))
+
+
+class ProfileReport:
+    """Result of :func:`profile_assessment`.
+
+    Attributes:
+        result: AssessmentResult from the cProfile pass
+        timings: Timing spans (phases, dimensions, rules) in milliseconds
+        functions: Top-N functions by cumulative time
+        components: Self time (ms) per component
+        collapsed_stacks: Collapsed-stack text from the sampling pass
+        memory: tracemalloc peak and top allocation sites (or None)
+    """
+
+    def __init__(self):
+        """Initialize an empty report."""
+        self.result = None
+        self.timings: dict[str, Any] = {}
+        self.functions: list[dict[str, Any]] = []
+        self.components: dict[str, float] = {}
+        self.collapsed_stacks = ""
+        self.memory: dict[str, Any] | None = None
+        self.stats: pstats.Stats | None = None
+
+    def rule_type_totals(self) -> dict[str, float]:
+        """Sum rule timings across fields, keyed by ``dimension.rule_type``."""
+        totals: dict[str, float] = {}
+        for dimension, fields in (self.timings.get("rules") or {}).items():
+            for rules in fields.values():
+                for rule_type, ms in rules.items():
+                    key = f"{dimension}.{rule_type}"
+                    totals[key] = totals.get(key, 0.0) + ms
+        return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+    def field_rules(self, top_n: int = DEFAULT_TOP_N) -> list[tuple[str, float]]:
+        """Return the slowest ``dimension.field.rule_type`` spans."""
+        entries = []
+        for dimension, fields in (self.timings.get("rules") or {}).items():
+            for field_name, rules in fields.items():
+                for rule_type, ms in rules.items():
+                    entries.append((f"{dimension}.{field_name}.{rule_type}", ms))
+        entries.sort(key=lambda item: -item[1])
+        return entries[:top_n]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable summary."""
+        return {
+            "overall_score": getattr(self.result, "overall_score", None),
+            "timings": self.timings,
+            "rule_types_ms": self.rule_type_totals(),
+            "field_rules_ms": dict(self.field_rules()),
+            "components_ms": self.components,
+            "functions": self.functions,
+            "memory": self.memory,
+        }
+
+    def to_text(self, top_n: int = DEFAULT_TOP_N) -> str:
+        """Render the human-readable hot-spot report."""
+        lines = ["ADRI assessment profile", "=" * 72]
+        total = self.timings.get("total_ms")
+        if total is not None:
+            lines.append(f"Total (timed pass): {total:.1f}ms")
+
+        def section(title: str, rows: list[tuple[str, float]], unit: str = "ms"):
+            if not rows:
+                return
+            lines.append("")
+            lines.append(title)
+            for name, value in rows:
+                lines.append(f"  {value:>10.2f}{unit}  {name}")
+
+        section("Phases", sorted((self.timings.get("phases") or {}).items()))
+        section(
+            "Dimension assessors",
+            sorted((self.timings.get("dimensions") or {}).items(), key=lambda i: -i[1]),
+        )
+        section(
+            "Rule types (summed over fields)", list(self.rule_type_totals().items())
+        )
+        section("Slowest fields and rules", self.field_rules(top_n))
+        section(
+            "Self time by component (cProfile)",
+            sorted(self.components.items(), key=lambda i: -i[1]),
+        )
+
+        if self.functions:
+            lines.append("")
+            lines.append(f"Top {len(self.functions)} functions by cumulative time")
+            lines.append(f"  {'calls':>9} {'self ms':>10} {'cum ms':>10}  function")
+            for entry in self.functions:
+                lines.append(
+                    f"  {entry['calls']:>9} {entry['self_ms']:>10.2f} "
+                    f"{entry['cumulative_ms']:>10.2f}  {entry['function']}"
+                )
+
+        if self.memory:
+            lines.append("")
+            lines.append(f"Memory: peak {self.memory['peak_mb']:.2f} MiB (tracemalloc)")
+            lines.append("  Peak allocation per span")
+            for name, kb in sorted(
+                self.memory.get("spans_kb", {}).items(), key=lambda i: -i[1]
+            ):
+                lines.append(f"  {kb:>10.1f}KiB  {name}")
+            lines.append("  Live allocation sites after the assessment")
+            for site in self.memory["top_sites"]:
+                lines.append(
+                    f"  {site['size_kb']:>10.1f}KiB {site['count']:>8}  {site['site']}"
+                )
+        return "\n".join(lines) + "\n"
+
+    def write(self, output_dir: str | Path) -> dict[str, Path]:
+        """Write report.txt, report.json, stacks.collapsed and profile.pstats.
+
+        Returns:
+            Mapping of artifact name to written path
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        paths = {
+            "report": output_dir / "report.txt",
+            "json": output_dir / "report.json",
+            "collapsed": output_dir / "stacks.collapsed",
+        }
+        paths["report"].write_text(self.to_text(), encoding="utf-8")
+        paths["json"].write_text(
+            json.dumps(self.to_dict(), indent=2, default=str), encoding="utf-8"
+        )
+        paths["collapsed"].write_text(self.collapsed_stacks, encoding="utf-8")
+        if self.stats is not None:
+            paths["pstats"] = output_dir / "profile.pstats"
+            self.stats.dump_stats(str(paths["pstats"]))
+        return paths
+
+
+def _function_rows(stats: pstats.Stats, top_n: int) -> list[dict[str, Any]]:
+    rows = []
+    for (filename, line, name), (cc, nc, tt, ct, _callers) in stats.stats.items():
+        rows.append(
+            {
+                "function": f"{_frame_label(filename, name)} ({line})",
+                "component": _component(filename),
+                "calls": nc,
+                "self_ms": round(tt * 1000.0, 3),
+                "cumulative_ms": round(ct * 1000.0, 3),
+            }
+        )
+    rows.sort(key=lambda row: -row["cumulative_ms"])
+    return rows[:top_n]
+
+
+def _component_totals(stats: pstats.Stats) -> dict[str, float]:
+    totals: dict[str, float] = {}
+    for (filename, _line, _name), (_cc, _nc, tt, _ct, _callers) in stats.stats.items():
+        component = _component(filename)
+        totals[component] = totals.get(component, 0.0) + tt * 1000.0
+    return {k: round(v, 3) for k, v in totals.items()}
+
+
+def _memory_summary(snapshot: tracemalloc.Snapshot, peak: int, top_n: int):
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        )
+    )
+    sites = []
+    for stat in snapshot.statistics("lineno")[:top_n]:
+        frame = stat.traceback[0]
+        filename = frame.filename.replace(os.sep, "/")
+        sites.append(
+            {
+                "site": f"{'/'.join(filename.rsplit('/', 2)[-2:])}:{frame.lineno} "
+                f"[{_component(filename)}]",
+                "size_kb": round(stat.size / 1024.0, 1),
+                "count": stat.count,
+            }
+        )
+    return {"peak_mb": round(peak / (1024 * 1024), 3), "top_sites": sites}
+
+
+def profile_assessment(
+    data,
+    contract_path: str,
+    top_n: int = DEFAULT_TOP_N,
+    memory: bool = True,
+    sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+    config: dict[str, Any] | None = None,
+) -> ProfileReport:
+    """Profile one assessment of ``data`` against ``contract_path``.
+
+    Args:
+        data: DataFrame to assess
+        contract_path: Path to the YAML contract
+        top_n: Number of functions and allocation sites to report
+        memory: Run the tracemalloc pass
+        sample_interval: Seconds between stack samples
+        config: Assessor configuration (audit logging is disabled for the
+            extra passes)
+
+    Returns:
+        ProfileReport with all results
+    """
+    from ..validator.engine import DataQualityAssessor
+
+    assessor_config = dict(config or {})
+    assessor_config["timings"] = True
+    quiet_config = {**assessor_config, "audit": {"enabled": False}}
+    report = ProfileReport()
+
+    # Warm caches (contract parsing, imports) so passes compare like for like
+    DataQualityAssessor(quiet_config).assess(data, contract_path)
+
+    profiler = cProfile.Profile()
+    assessor = DataQualityAssessor(assessor_config)
+    profiler.enable()
+    try:
+        report.result = assessor.assess(data, contract_path)
+    finally:
+        profiler.disable()
+    report.timings = report.result.metadata.get("timings", {})
+    report.stats = pstats.Stats(profiler, stream=io.StringIO())
+    report.functions = _function_rows(report.stats, top_n)
+    report.components = _component_totals(report.stats)
+
+    sampler = StackSampler(sample_interval)
+    sampler.start()
+    try:
+        DataQualityAssessor(quiet_config).assess(data, contract_path)
+    finally:
+        sampler.stop()
+    report.collapsed_stacks = sampler.collapsed()
+
+    if memory:
+        previous_tracer = get_tracer()
+        memory_tracer = _MemoryTracer()
+        set_tracer(memory_tracer)
+        tracemalloc.start(1)
+        try:
+            DataQualityAssessor(quiet_config).assess(data, contract_path)
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            set_tracer(previous_tracer)
+        report.memory = _memory_summary(snapshot, max(peak, memory_tracer.peak), top_n)
+        report.memory["spans_kb"] = memory_tracer.peaks_kb
+
+    return report
+
+
+def default_profile_dir(base: str | Path = "ADRI/profiles") -> Path:
+    """Return a timestamped output directory under ``base``."""
+    return Path(base) / time.strftime("%Y%m%d_%H%M%S")
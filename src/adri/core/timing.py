@@ -0,0 +1,135 @@
+"""Opt-in timing spans for ADRI assessments.
+
+This module provides a small, low-overhead span recorder used to attribute
+assessment time to phases (schema validation, contract load, failure
+collection, audit write), dimensions and individual rule types per field.
+
+Recording is scoped with a context variable so dimension assessors and rule
+loops can add spans without threading a recorder through every signature.
+When no recorder is active every helper is a no-op.
+"""
+
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any
+
+_NULL_SPAN = nullcontext()
+
+_current_recorder: ContextVar["TimingRecorder | None"] = ContextVar(
+    "adri_timing_recorder", default=None
+)
+
+
+def timings_enabled(config: dict[str, Any] | None = None) -> bool:
+    """Check whether timing spans are requested.
+
+    Timings are enabled by a truthy ``timings`` key in the assessor config or by
+    the ADRI_TIMINGS environment variable (1, true, yes, on).
+
+    Args:
+        config: Optional assessor configuration dictionary
+
+    Returns:
+        True if timing spans should be recorded, False otherwise
+    """
+    if config and config.get("timings"):
+        return True
+    return os.environ.get("ADRI_TIMINGS", "").lower() in ("1", "true", "yes", "on")
+
+
+class TimingRecorder:
+    """Accumulates wall-clock spans keyed by a path of names.
+
+    Spans with the same path are summed, so a rule executed in several passes
+    reports its combined cost. Paths are rendered as nested dictionaries, e.g.
+    ``("rules", "validity", "email", "pattern")`` becomes
+    ``{"rules": {"validity": {"email": {"pattern": 1.234}}}}``.
+    """
+
+    def __init__(self):
+        """Initialize an empty recorder and start the total clock."""
+        self._spans: dict[tuple[str, ...], float] = {}
+        self._started = time.perf_counter()
+
+    def add(self, path: tuple[str, ...], seconds: float) -> None:
+        """Add a duration (in seconds) to the span at ``path``."""
+        self._spans[path] = self._spans.get(path, 0.0) + seconds
+
+    @contextmanager
+    def span(self, *path: str) -> Iterator[None]:
+        """Time the enclosed block and add it to the span at ``path``."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(path, time.perf_counter() - started)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Render recorded spans as nested dictionaries of milliseconds.
+
+        Returns:
+            Dictionary with ``total_ms`` plus one nested entry per span path
+        """
+        result: dict[str, Any] = {
+            "total_ms": round((time.perf_counter() - self._started) * 1000.0, 3)
+        }
+        for path, seconds in self._spans.items():
+            node = result
+            for key in path[:-1]:
+                child = node.get(key)
+                if not isinstance(child, dict):
+                    child = {}
+                    node[key] = child
+                node = child
+            node[path[-1]] = round(seconds * 1000.0, 3)
+        return result
+
+
+def get_timing_recorder() -> TimingRecorder | None:
+    """Return the recorder active in the current context, if any."""
+    return _current_recorder.get()
+
+
+@contextmanager
+def record_timings() -> Iterator[TimingRecorder]:
+    """Activate a fresh recorder for the duration of the block.
+
+    Yields:
+        The active TimingRecorder
+    """
+    recorder = TimingRecorder()
+    token = _current_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current_recorder.reset(token)
+
+
+def timing_span(*path: str):
+    """Return a context manager timing ``path`` on the active recorder.
+
+    Returns a shared no-op context manager when timings are not being recorded.
+    """
+    recorder = _current_recorder.get()
+    if recorder is None:
+        return _NULL_SPAN
+    return recorder.span(*path)
+
+
+def start_span() -> float | None:
+    """Start a manual span; returns None when timings are not being recorded."""
+    if _current_recorder.get() is None:
+        return None
+    return time.perf_counter()
+
+
+def end_span(started: float | None, *path: str) -> None:
+    """Finish a span started with :func:`start_span`."""
+    if started is None:
+        return
+    recorder = _current_recorder.get()
+    if recorder is not None:
+        recorder.add(path, time.perf_counter() - started)
@@ -0,0 +1,289 @@
+"""Pluggable tracing hooks for ADRI.
+
+ADRI emits spans around the guard, the assessor, the validation pipeline and
+audit logging through a small tracer interface. The default tracer is a no-op
+so instrumentation costs a single function call per span when tracing is not
+configured.
+
+Two implementations are provided besides the no-op default:
+
+- InMemoryTracer: records finished spans in a list, for tests and debugging
+- OpenTelemetryTracer: forwards spans to the OpenTelemetry API (optional
+  dependency, install with ``pip install opentelemetry-api``)
+
+Select a tracer with :func:`set_tracer`, or set ``ADRI_TRACER=opentelemetry``
+to enable the OpenTelemetry adapter without code changes.
+
+Span attributes use the ``adri.`` prefix, e.g. ``adri.contract``,
+``adri.row_count`` and ``adri.score``.
+"""
+
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Common span attribute names
+ATTR_CONTRACT = "adri.contract"
+ATTR_ROW_COUNT = "adri.row_count"
+ATTR_SCORE = "adri.score"
+ATTR_PASSED = "adri.passed"
+ATTR_DIMENSION = "adri.dimension"
+ATTR_FUNCTION = "adri.function"
+
+
+class Span:
+    """Span handle yielded by :meth:`Tracer.start_span`.
+
+    The base class ignores everything; tracer implementations subclass it.
+    """
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set a single attribute on the span."""
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        """Set several attributes on the span."""
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Record an exception raised inside the span."""
+
+
+class _NoOpSpanContext:
+    """Reusable context manager yielding the shared no-op span."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> Span:
+        return _NOOP_SPAN
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NOOP_SPAN = Span()
+_NOOP_SPAN_CONTEXT = _NoOpSpanContext()
+
+
+class Tracer(ABC):
+    """Abstract tracer interface used by ADRI instrumentation."""
+
+    @abstractmethod
+    def start_span(self, name: str, attributes: dict[str, Any] | None = None):
+        """Start a span for the duration of a ``with`` block.
+
+        Args:
+            name: Span name (e.g. ``adri.assess``)
+            attributes: Optional initial span attributes
+
+        Returns:
+            Context manager yielding a :class:`Span`
+        """
+
+
+class NoOpTracer(Tracer):
+    """Tracer that records nothing (the default)."""
+
+    def start_span(self, name: str, attributes: dict[str, Any] | None = None):
+        """Return a shared no-op span context."""
+        return _NOOP_SPAN_CONTEXT
+
+
+class RecordedSpan(Span):
+    """Span recorded by :class:`InMemoryTracer`."""
+
+    def __init__(self, name: str, parent: "RecordedSpan | None" = None):
+        """Initialize a recorded span.
+
+        Args:
+            name: Span name
+            parent: Enclosing recorded span, if any
+        """
+        self.name = name
+        self.parent = parent
+        self.attributes: dict[str, Any] = {}
+        self.exception: BaseException | None = None
+        self.duration_ms: float | None = None
+
+    @property
+    def parent_name(self) -> str | None:
+        """Name of the enclosing span, or None for root spans."""
+        return self.parent.name if self.parent is not None else None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set a single attribute on the span."""
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Record an exception raised inside the span."""
+        self.exception = exception
+
+
+class InMemoryTracer(Tracer):
+    """Tracer that keeps finished spans in memory.
+
+    Example:
+        >>> tracer = InMemoryTracer()
+        >>> set_tracer(tracer)
+        >>> ...  # run an assessment
+        >>> [span.name for span in tracer.spans]
+    """
+
+    def __init__(self):
+        """Initialize an empty tracer."""
+        self.spans: list[RecordedSpan] = []
+        self._current: ContextVar[RecordedSpan | None] = ContextVar(
+            "adri_in_memory_span", default=None
+        )
+
+    @contextmanager
+    def start_span(
+        self, name: str, attributes: dict[str, Any] | None = None
+    ) -> Iterator[RecordedSpan]:
+        """Record a span for the duration of the block."""
+        span = RecordedSpan(name, parent=self._current.get())
+        if attributes:
+            span.set_attributes(attributes)
+        token = self._current.set(span)
+        started = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            span.duration_ms = (time.perf_counter() - started) * 1000.0
+            self._current.reset(token)
+            self.spans.append(span)
+
+    def find(self, name: str) -> list[RecordedSpan]:
+        """Return finished spans with the given name, in completion order."""
+        return [span for span in self.spans if span.name == name]
+
+    def clear(self) -> None:
+        """Drop all recorded spans."""
+        self.spans.clear()
+
+
+def _otel_value(value: Any) -> Any:
+    """Coerce an attribute value to a type accepted by OpenTelemetry."""
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+class _OpenTelemetrySpan(Span):
+    """Adapter exposing an OpenTelemetry span through :class:`Span`."""
+
+    __slots__ = ("_span",)
+
+    def __init__(self, span: Any):
+        self._span = span
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set a single attribute on the span."""
+        if value is not None:
+            self._span.set_attribute(key, _otel_value(value))
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Record an exception raised inside the span."""
+        self._span.record_exception(exception)
+
+
+class OpenTelemetryTracer(Tracer):
+    """Tracer forwarding ADRI spans to the OpenTelemetry API.
+
+    Spans are created with ``start_as_current_span`` so they nest under any
+    span active in the caller (e.g. a web request or agent step). Exporters
+    are configured by the application through the OpenTelemetry SDK.
+    """
+
+    def __init__(self, tracer: Any = None):
+        """Initialize the adapter.
+
+        Args:
+            tracer: Optional OpenTelemetry tracer; defaults to the global
+                tracer provider's ``adri`` tracer
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed
+        """
+        if tracer is None:
+            try:
+                from opentelemetry import trace
+            except ImportError:
+                raise ImportError(
+                    "opentelemetry-api package required for OpenTelemetryTracer. "
+                    "Install with: pip install opentelemetry-api"
+                )
+            from ..version import __version__
+
+            tracer = trace.get_tracer("adri", __version__)
+        self._tracer = tracer
+
+    @contextmanager
+    def start_span(
+        self, name: str, attributes: dict[str, Any] | None = None
+    ) -> Iterator[Span]:
+        """Start an OpenTelemetry span for the duration of the block."""
+        otel_attributes = (
+            {k: _otel_value(v) for k, v in attributes.items() if v is not None}
+            if attributes
+            else None
+        )
+        with self._tracer.start_as_current_span(
+            name, attributes=otel_attributes
+        ) as span:
+            yield _OpenTelemetrySpan(span)
+
+
+_tracer: Tracer | None = None
+
+
+def _tracer_from_env() -> Tracer:
+    """Build the default tracer from the ADRI_TRACER environment variable."""
+    choice = os.environ.get("ADRI_TRACER", "").lower()
+    if choice in ("opentelemetry", "otel"):
+        try:
+            return OpenTelemetryTracer()
+        except ImportError as e:
+            logger.warning(f"ADRI_TRACER={choice} ignored: {e}")
+    return NoOpTracer()
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer (no-op unless configured)."""
+    global _tracer
+    if _tracer is None:
+        _tracer = _tracer_from_env()
+    return _tracer
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    """Install the process-wide tracer.
+
+    Args:
+        tracer: Tracer to use, or None to fall back to the environment default
+    """
+    global _tracer
+    _tracer = tracer
+
+
+def start_span(name: str, attributes: dict[str, Any] | None = None):
+    """Start a span on the process-wide tracer.
+
+    Args:
+        name: Span name
+        attributes: Optional initial span attributes
+
+    Returns:
+        Context manager yielding a :class:`Span`
+    """
+    return get_tracer().start_span(name, attributes)
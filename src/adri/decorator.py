@@ -12,6 +12,7 @@ import logging
 from collections.abc import Callable
 
 # Clean imports for modular architecture
+from .core.tracing import ATTR_CONTRACT, ATTR_FUNCTION, get_tracer
 from .guard.modes import DataProtectionEngine, ProtectionError
 
 logger = logging.getLogger(__name__)
@@ -182,25 +183,29 @@ def adri_protected(
 
                 # Protect the function call with name-only contract resolution
                 # Package context enables resolution from package-local directories
-                return engine.protect_function_call(
-                    func=func,
-                    args=args,
-                    kwargs=kwargs,
-                    data_param=data_param,
-                    function_name=func.__name__,
-                    contract_name=contract,
-                    min_score=min_score,
-                    dimensions=dimensions,
-                    on_failure=on_failure,
-                    on_assessment=on_assessment,
-                    auto_generate=auto_generate,
-                    cache_assessments=cache_assessments,
-                    verbose=verbose,
-                    reasoning_mode=reasoning_mode,
-                    workflow_context=workflow_context,
-                    package_context=package_context,
-                    audit_log_dir=audit_log_dir,
-                )
+                with get_tracer().start_span(
+                    "adri.protected_call",
+                    {ATTR_FUNCTION: func.__name__, ATTR_CONTRACT: contract},
+                ):
+                    return engine.protect_function_call(
+                        func=func,
+                        args=args,
+                        kwargs=kwargs,
+                        data_param=data_param,
+                        function_name=func.__name__,
+                        contract_name=contract,
+                        min_score=min_score,
+                        dimensions=dimensions,
+                        on_failure=on_failure,
+                        on_assessment=on_assessment,
+                        auto_generate=auto_generate,
+                        cache_assessments=cache_assessments,
+                        verbose=verbose,
+                        reasoning_mode=reasoning_mode,
+                        workflow_context=workflow_context,
+                        package_context=package_context,
+                        audit_log_dir=audit_log_dir,
+                    )
 
             except ProtectionError:
                 # Re-raise protection errors as-is (they have detailed messages)
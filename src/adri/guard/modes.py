@@ -17,11 +17,22 @@ from pathlib import Path
 from typing import Any
 
 import pandas as pd
-import yaml
 
 # Clean imports for modular architecture
-from ..analysis.contract_generator import ContractGenerator
+# ContractGenerator is imported on demand in _generate_contract so that
+# protected functions with an existing contract never load the analysis package.
 from ..config.loader import ConfigurationLoader
+from ..core.metrics import record_guard_call
+from ..core.tracing import (
+    ATTR_CONTRACT,
+    ATTR_FUNCTION,
+    ATTR_PASSED,
+    ATTR_ROW_COUNT,
+    ATTR_SCORE,
+    get_tracer,
+)
+from ..utils.locking import FileLock
+from ..utils.serialization import write_yaml_atomic
 from ..validator.engine import DataQualityAssessor
 
 logger = logging.getLogger(__name__)
@@ -305,6 +316,11 @@ class DataProtectionEngine:
             "default_min_score": 80,
             "default_failure_mode": "raise",
             "auto_generate_contracts": True,
+            # Concurrent first calls: "wait" for the generating worker, or
+            # "provisional" to run the function unassessed until it finishes
+            "auto_generate_wait": "wait",
+            "auto_generate_timeout": 300,
+            "auto_generate_sample_rows": 10000,
             "cache_duration_hours": 1,
             "verbose_protection": False,
         }
@@ -405,6 +421,8 @@ class DataProtectionEngine:
                 f"Protecting function '{function_name}' with {effective_mode.mode_name} mode, min_score={min_score}"
             )
 
+        # Outcome recorded in the guard call metrics, counted once per call
+        outcome = None
         try:
             # Extract data from function parameters
             data = self._extract_data_parameter(func, args, kwargs, data_param)
@@ -428,19 +446,41 @@ class DataProtectionEngine:
                 else self.protection_config.get("auto_generate_contracts", True)
             )
 
+            tracer = get_tracer()
+            span_attributes = {
+                ATTR_FUNCTION: function_name,
+                ATTR_CONTRACT: Path(str(resolved_contract_path)).stem,
+                ATTR_ROW_COUNT: len(data) if hasattr(data, "__len__") else None,
+            }
+
             # Ensure contract exists at the resolved path
-            self._ensure_contract_exists(
-                resolved_contract_path, data, auto_generate=should_auto_generate
-            )
+            with tracer.start_span("adri.guard.ensure_contract", span_attributes):
+                contract_ready = self._ensure_contract_exists(
+                    resolved_contract_path, data, auto_generate=should_auto_generate
+                )
+
+            if not contract_ready:
+                # Another worker is generating the contract (provisional mode)
+                outcome = "provisional"
+                record_guard_call(span_attributes[ATTR_CONTRACT], outcome)
+                with tracer.start_span(
+                    "adri.guard.function", {ATTR_FUNCTION: function_name}
+                ):
+                    return func(*args, **kwargs)
 
             # Assess data quality using the resolved path
             start_time = time.time()
-            assessment_result = self._assess_data_quality(
-                data,
-                resolved_contract_path,
-                reasoning_mode=reasoning_mode,
-                audit_log_dir=audit_log_dir,
-            )
+            with tracer.start_span("adri.guard.assess", span_attributes) as span:
+                assessment_result = self._assess_data_quality(
+                    data,
+                    resolved_contract_path,
+                    reasoning_mode=reasoning_mode,
+                    audit_log_dir=audit_log_dir,
+                )
+                span.set_attribute(ATTR_SCORE, assessment_result.overall_score)
+                span.set_attribute(
+                    ATTR_PASSED, assessment_result.overall_score >= min_score
+                )
             assessment_duration = time.time() - start_time
 
             if verbose:
@@ -459,6 +499,8 @@ class DataProtectionEngine:
                 assessment_passed = self._check_dimension_requirements(
                     assessment_result, dimensions
                 )
+            outcome = "passed" if assessment_passed else "failed"
+            record_guard_call(span_attributes[ATTR_CONTRACT], outcome)
 
             # Handle result based on protection mode
             if assessment_passed:
@@ -479,12 +521,26 @@ class DataProtectionEngine:
                 effective_mode.handle_failure(assessment_result, error_message)
 
             # Execute the protected function
-            return func(*args, **kwargs)
+            with tracer.start_span(
+                "adri.guard.function", {ATTR_FUNCTION: function_name}
+            ):
+                return func(*args, **kwargs)
 
         except ProtectionError:
             # Re-raise protection errors (from fail-fast mode)
             raise
         except Exception as e:
+            # Errors raised by the protected function itself were already
+            # counted under the assessment outcome
+            if outcome is None:
+                record_guard_call(
+                    (
+                        Path(str(resolved_contract_path)).stem
+                        if resolved_contract_path
+                        else "unknown"
+                    ),
+                    "error",
+                )
             self.logger.error(f"Protection engine error: {e}")
             raise ProtectionError(f"Data protection failed: {e}")
 
@@ -534,19 +590,28 @@ class DataProtectionEngine:
 
     def _ensure_contract_exists(
         self, contract_path: str, sample_data: Any, auto_generate: bool = True
-    ) -> None:
-        """Ensure a contract exists, using full ContractGenerator for rich rules.
+    ) -> bool:
+        """Ensure a contract exists, generating it once across concurrent workers.
 
-        This uses the SAME ContractGenerator as the CLI to ensure consistent,
-        high-quality contracts with full profiling and rule inference.
+        Generation is single-flight: the first worker to take the contract's
+        lock file generates it while concurrent workers (threads or
+        processes) either wait for the result or, with
+        ``auto_generate_wait: provisional``, proceed without an assessment.
+        The lock file is left in place: deleting it while workers wait on it
+        would let a newcomer lock a fresh file alongside them.
 
         Args:
             contract_path: Full path to the contract file
             sample_data: Sample data to generate contract from
             auto_generate: Whether to auto-generate the contract if missing
 
+        Returns:
+            True if the contract exists, False if another worker is still
+            generating it and the provisional policy applies
+
         Raises:
-            ProtectionError: If contract doesn't exist and auto_generate is False
+            ProtectionError: If contract doesn't exist and auto_generate is False,
+                or waiting for another worker timed out
         """
         # Resolve path to handle macOS symlinks (/var -> /private/var)
         contract_path = str(Path(contract_path).resolve())
@@ -554,7 +619,7 @@ class DataProtectionEngine:
         self.logger.info("Checking if contract exists at: %s", contract_path)
         if os.path.exists(contract_path):
             self.logger.info("Contract already exists, skipping auto-generation")
-            return
+            return True
 
         # Check if auto-generation is enabled
         if not auto_generate:
@@ -563,6 +628,42 @@ class DataProtectionEngine:
                 f"Auto-generation is disabled (auto_generate=False)"
             )
 
+        lock = FileLock(f"{contract_path}.lock")
+        if not lock.acquire(timeout=0):
+            if self.protection_config.get("auto_generate_wait") == "provisional":
+                self.logger.warning(
+                    "Contract is being generated by another worker, "
+                    "proceeding without assessment: %s",
+                    contract_path,
+                )
+                return False
+
+            timeout = float(self.protection_config.get("auto_generate_timeout", 300))
+            self.logger.info(
+                "Waiting for another worker to generate contract: %s", contract_path
+            )
+            if not lock.acquire(timeout=timeout):
+                raise ProtectionError(
+                    f"Timed out after {timeout:.0f}s waiting for contract "
+                    f"generation: {contract_path}"
+                )
+
+        try:
+            # The worker we waited for may have generated it already
+            if not os.path.exists(contract_path):
+                self._generate_contract(contract_path, sample_data)
+        finally:
+            lock.release()
+        return True
+
+    def _generate_contract(self, contract_path: str, sample_data: Any) -> None:
+        """Generate a contract with the full ContractGenerator and write it.
+
+        This uses the SAME ContractGenerator as the CLI to ensure consistent,
+        high-quality contracts with full profiling and rule inference. Rules
+        are inferred from a bounded sample of the payload, then verified
+        against all of it; the file is written atomically.
+        """
         self.logger.info(
             "Auto-generating contract with full profiling: %s", contract_path
         )
@@ -591,20 +692,25 @@ class DataProtectionEngine:
             data_name = Path(contract_path).stem.replace("_contract", "")
 
             # Use SAME generator as CLI for consistency and rich rule generation
+            from ..analysis.contract_generator import ContractGenerator
+
             generator = ContractGenerator()
 
             # Generate rich contract with full profiling and rule inference
             # This includes: allowed_values, min/max_value, patterns, length_bounds,
             # date_bounds, etc.
+            generation_config: dict[str, Any] = {"overall_minimum": 75.0}
+            sample_rows = self.protection_config.get("auto_generate_sample_rows")
+            if sample_rows:
+                generation_config["sampling"] = {"size": int(sample_rows)}
             contract_dict = generator.generate(
                 data=df,
                 data_name=data_name,
-                generation_config={"overall_minimum": 75.0},  # Match CLI defaults
+                generation_config=generation_config,  # Match CLI defaults
             )
 
             # Save to YAML
-            with open(contract_path, "w", encoding="utf-8") as f:
-                yaml.dump(contract_dict, f, default_flow_style=False, sort_keys=False)
+            write_yaml_atomic(Path(contract_path), contract_dict)
 
             self.logger.info(
                 "Successfully generated rich contract at: %s", contract_path
@@ -18,6 +18,8 @@ from pathlib import Path
 from typing import Any
 
 # Clean import for version info
+from ..core.metrics import track_audit_write
+from ..core.tracing import ATTR_CONTRACT, ATTR_ROW_COUNT, get_tracer
 from ..version import __version__
 
 # Enterprise logging functionality is available in the enterprise package
@@ -86,6 +88,9 @@ class AuditRecord:
             "remediation_suggested": [],
         }
 
+        # Optional timing spans (milliseconds) from result.metadata["timings"]
+        self.timings: dict[str, Any] = {}
+
     def to_dict(self) -> dict[str, Any]:
         """Convert audit record to dictionary format."""
         return {
@@ -164,7 +169,18 @@ class AuditRecord:
         dimension_records = []
         dimension_scores_dict = self.assessment_results.get("dimension_scores", {})
         if isinstance(dimension_scores_dict, dict):
+            dimension_timings = self.timings.get("dimensions", {})
+            rule_timings = self.timings.get("rules", {})
             for dim_name, dim_score in dimension_scores_dict.items():
+                details = {
+                    "score": dim_score,
+                    "max_score": 20,
+                    "percentage": (dim_score / 20) * 100,
+                }
+                if dim_name in dimension_timings:
+                    details["duration_ms"] = dimension_timings[dim_name]
+                if rule_timings.get(dim_name):
+                    details["rule_timings_ms"] = rule_timings[dim_name]
                 dimension_records.append(
                     {
                         "assessment_id": self.assessment_id,
@@ -172,13 +188,7 @@ class AuditRecord:
                         "dimension_score": dim_score,
                         "dimension_passed": "TRUE" if dim_score > 15 else "FALSE",
                         "issues_found": self._count_dimension_issues(dim_name),
-                        "details": json.dumps(
-                            {
-                                "score": dim_score,
-                                "max_score": 20,
-                                "percentage": (dim_score / 20) * 100,
-                            }
-                        ),
+                        "details": json.dumps(details),
                     }
                 )
 
@@ -533,6 +543,11 @@ class LocalLogger:
         if failed_checks:
             record.assessment_results["failed_checks"] = failed_checks
 
+        # Attach timing spans when the assessment recorded them
+        metadata = getattr(assessment_result, "metadata", None)
+        if isinstance(metadata, dict) and isinstance(metadata.get("timings"), dict):
+            record.timings = metadata["timings"]
+
         # Update performance metrics
         if performance_metrics:
             for key, value in performance_metrics.items():
@@ -563,7 +578,18 @@ class LocalLogger:
         record.response_id = response_id or ""
 
         # Write to JSONL files
-        self._write_to_jsonl_files(record)
+        with (
+            get_tracer().start_span(
+                "adri.audit.write",
+                {
+                    "adri.assessment_id": record.assessment_id,
+                    ATTR_CONTRACT: record.standard_applied.get("standard_id"),
+                    ATTR_ROW_COUNT: record.data_fingerprint.get("row_count"),
+                },
+            ),
+            track_audit_write(),
+        ):
+            self._write_to_jsonl_files(record)
 
         return record
 
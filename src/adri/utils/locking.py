@@ -0,0 +1,100 @@
+"""Inter-process file locking for the ADRI framework.
+
+Locks are advisory and held on an open file handle (``flock`` on POSIX,
+``msvcrt.locking`` on Windows), so the operating system releases them when
+the holding process exits, even if it crashes.
+"""
+
+import os
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+class FileLock:
+    """Exclusive lock on ``path`` shared between threads and processes.
+
+    Every FileLock instance opens its own handle, so two instances guarding
+    the same path exclude each other within a process as well as across
+    processes.
+
+    Args:
+        path: Lock file to create (its content is irrelevant)
+        poll_interval: Seconds between attempts while waiting
+
+    Example:
+        >>> with FileLock("contracts/orders.yaml.lock"):
+        ...     generate_contract()
+    """
+
+    def __init__(self, path: str | Path, poll_interval: float = 0.05):
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self._fd: int | None = None
+
+    @property
+    def is_locked(self) -> bool:
+        """Whether this instance currently holds the lock."""
+        return self._fd is not None
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Acquire the lock.
+
+        Args:
+            timeout: Seconds to wait; 0 tries once, None waits indefinitely
+
+        Returns:
+            True if the lock was acquired, False on timeout
+        """
+        if self._fd is not None:
+            return True
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self._try_lock(fd):
+                self._fd = fd
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                os.close(fd)
+                return False
+            time.sleep(self.poll_interval)
+
+    def release(self) -> None:
+        """Release the lock if held."""
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _try_lock(fd: int) -> bool:
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
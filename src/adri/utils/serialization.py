@@ -6,6 +6,8 @@ standards, and other data structures to various formats like JSON, YAML, and CSV
 
 import csv
 import json
+import os
+import tempfile
 from datetime import date, datetime
 from io import StringIO
 from pathlib import Path
@@ -523,6 +525,25 @@ def save_to_file(
         raise SerializationError(f"Failed to save file {file_path}: {e}")
 
 
+def write_yaml_atomic(path: str | Path, content: dict[str, Any]) -> None:
+    """Write YAML to a temporary file in the target directory, then rename it.
+
+    Readers never observe a partially written contract, and an interrupted
+    run leaves any previous contract in place.
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            yaml.dump(content, f, default_flow_style=False, sort_keys=False)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
 def load_from_file(file_path: str | Path, format: str | None = None) -> Any:
     """Load data from a file in the specified format.
 
@@ -0,0 +1,284 @@
+"""Content-addressed storage for training data snapshots.
+
+Snapshots are stored once per distinct file content under
+``<training-data>/objects/<aa>/<sha256><suffix>``, so contracts generated
+from identical data share one object. Objects are materialized with a
+reflink (copy-on-write clone) where the filesystem supports it, falling back
+to a plain copy; hardlinks and gzip compression are available on request.
+Objects no longer referenced by any contract's ``training_data_lineage`` can
+be removed with :meth:`SnapshotStore.collect_garbage`.
+"""
+
+import gzip
+import hashlib
+import mmap
+import os
+import shutil
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+# Read size for hashing/copying files that are not memory-mapped
+HASH_CHUNK_SIZE = 1 << 20
+
+# Linux FICLONE ioctl: clone file extents (btrfs, XFS, bcachefs, ...)
+_FICLONE = 0x40049409
+
+LINK_MODES = ("reflink", "hardlink", "copy")
+
+# Suffixes that are already compressed; gzip would only cost CPU
+_COMPRESSED_SUFFIXES = (".parquet", ".gz", ".zip", ".bz2", ".xz", ".zst")
+
+_digest_cache: dict[tuple[str, int, int], str] = {}
+
+
+def hash_file(path: str | Path) -> str:
+    """Return the full SHA-256 hex digest of a file.
+
+    Files larger than one read chunk are memory-mapped and hashed in a single
+    call, which avoids copying the content through Python buffers. Digests
+    are cached by path, size and modification time so lineage metadata and
+    snapshotting hash each source only once per process.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        64-character hex digest
+    """
+    path = Path(path)
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+    cached = _digest_cache.get(key)
+    if cached is not None:
+        return cached
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        if stat.st_size >= HASH_CHUNK_SIZE:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    digest.update(mm)
+            except (OSError, ValueError):
+                f.seek(0)
+                digest = hashlib.sha256()
+                _update_buffered(digest, f)
+        else:
+            _update_buffered(digest, f)
+
+    result = digest.hexdigest()
+    _digest_cache[key] = result
+    return result
+
+
+def object_digest(path: str | Path) -> str | None:
+    """Return the content digest encoded in a stored object's file name."""
+    path = Path(path)
+    if path.parent.parent.name != "objects":
+        return None
+    digest = path.name.split(".", 1)[0]
+    if len(digest) != 64 or path.parent.name != digest[:2]:
+        return None
+    return digest
+
+
+def _update_buffered(digest, f) -> None:
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    while True:
+        n = f.readinto(buffer)
+        if not n:
+            break
+        digest.update(view[:n])
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    """Clone ``source`` into ``target`` without copying data, if supported."""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+
+    try:
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return True
+    except OSError:
+        target.unlink(missing_ok=True)
+        return False
+
+
+@dataclass(frozen=True)
+class SnapshotRecord:
+    """A stored snapshot.
+
+    Attributes:
+        digest: SHA-256 of the original (uncompressed) content
+        path: Location of the stored object
+        method: How the object was produced: "existing" (deduplicated),
+            "reflink", "hardlink", "copy" or "gzip"
+    """
+
+    digest: str
+    path: Path
+    method: str
+
+    @property
+    def compressed(self) -> bool:
+        return self.path.suffix == ".gz"
+
+
+class SnapshotStore:
+    """Deduplicating, content-addressed store for training data snapshots.
+
+    Args:
+        root: Training data directory; objects live under ``root/objects``
+        link_mode: "reflink" (clone, falling back to copy), "hardlink"
+            (share the source inode, falling back to reflink/copy) or "copy".
+            Hardlinked snapshots change if the source file is modified in
+            place, so only use them for sources that are replaced atomically.
+        compress: Store objects gzip-compressed (skipped for formats that are
+            already compressed, such as parquet)
+    """
+
+    def __init__(
+        self, root: str | Path, link_mode: str = "reflink", compress: bool = False
+    ):
+        if link_mode not in LINK_MODES:
+            raise ValueError(
+                f"Unknown link mode '{link_mode}'; expected one of {LINK_MODES}"
+            )
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.link_mode = link_mode
+        self.compress = compress
+
+    def object_path(self, digest: str, suffix: str, compressed: bool = False) -> Path:
+        """Return where the object for ``digest`` is (or would be) stored."""
+        name = f"{digest}{suffix.lower()}" + (".gz" if compressed else "")
+        return self.objects_dir / digest[:2] / name
+
+    def find(self, digest: str) -> Path | None:
+        """Return the stored object for ``digest``, compressed or not."""
+        directory = self.objects_dir / digest[:2]
+        if not directory.is_dir():
+            return None
+        for candidate in directory.glob(f"{digest}*"):
+            if not candidate.name.endswith(".tmp"):
+                return candidate
+        return None
+
+    def put(self, source: str | Path) -> SnapshotRecord:
+        """Store ``source`` unless identical content is already present.
+
+        Args:
+            source: File to snapshot
+
+        Returns:
+            SnapshotRecord describing the stored object
+        """
+        source = Path(source)
+        digest = hash_file(source)
+        existing = self.find(digest)
+        if existing is not None:
+            return SnapshotRecord(digest, existing, "existing")
+
+        suffix = source.suffix
+        compress = self.compress and suffix.lower() not in _COMPRESSED_SUFFIXES
+        target = self.object_path(digest, suffix, compressed=compress)
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        if compress:
+            method = "gzip"
+        elif self.link_mode == "hardlink" and self._try_hardlink(source, target):
+            return SnapshotRecord(digest, target, "hardlink")
+        else:
+            method = "copy"
+
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        try:
+            if compress:
+                with open(source, "rb") as src, gzip.open(tmp, "wb", 6) as dst:
+                    shutil.copyfileobj(src, dst, HASH_CHUNK_SIZE)
+            elif self.link_mode != "copy" and _reflink(source, tmp):
+                method = "reflink"
+            else:
+                shutil.copy2(source, tmp)
+            os.replace(tmp, target)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+        return SnapshotRecord(digest, target, method)
+
+    def _try_hardlink(self, source: Path, target: Path) -> bool:
+        try:
+            os.link(source, target)
+            return True
+        except FileExistsError:
+            return True
+        except OSError:
+            return False
+
+    def iter_objects(self) -> Iterable[Path]:
+        """Yield every stored object (including leftover temporary files)."""
+        if not self.objects_dir.is_dir():
+            return
+        for directory in sorted(self.objects_dir.iterdir()):
+            if directory.is_dir():
+                yield from sorted(directory.iterdir())
+
+    def collect_garbage(
+        self, referenced: Iterable[str], dry_run: bool = False
+    ) -> list[Path]:
+        """Remove objects whose digest is not in ``referenced``.
+
+        Args:
+            referenced: Digests still in use, e.g. from
+                :func:`referenced_digests`
+            dry_run: Only report what would be removed
+
+        Returns:
+            Paths of removed (or removable) objects
+        """
+        keep = set(referenced)
+        removed = []
+        for path in self.iter_objects():
+            if object_digest(path) in keep:
+                continue
+            removed.append(path)
+            if not dry_run:
+                path.unlink(missing_ok=True)
+
+        if not dry_run and self.objects_dir.is_dir():
+            for directory in self.objects_dir.iterdir():
+                if directory.is_dir() and not any(directory.iterdir()):
+                    directory.rmdir()
+        return removed
+
+
+def referenced_digests(contracts_dir: str | Path) -> set[str]:
+    """Collect snapshot digests referenced by contracts in ``contracts_dir``.
+
+    Args:
+        contracts_dir: Directory searched recursively for YAML contracts
+
+    Returns:
+        Set of ``training_data_lineage.snapshot_hash`` values
+    """
+    import yaml
+
+    digests: set[str] = set()
+    for pattern in ("*.yaml", "*.yml"):
+        for path in Path(contracts_dir).rglob(pattern):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    contract = yaml.safe_load(f)
+            except (OSError, yaml.YAMLError):
+                continue
+            if not isinstance(contract, dict):
+                continue
+            lineage = contract.get("training_data_lineage") or {}
+            if isinstance(lineage, dict) and lineage.get("snapshot_hash"):
+                digests.add(str(lineage["snapshot_hash"]))
+    return digests
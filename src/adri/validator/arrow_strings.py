@@ -0,0 +1,158 @@
+"""Optional Arrow backend for string rule kernels.
+
+When enabled (``ADRI_STRING_BACKEND=arrow``), pattern, length and case checks
+on string columns run as ``pyarrow.compute`` kernels (RE2 regular expressions,
+``utf8_length``, ``ascii_is_lower``/``ascii_is_upper``/``ascii_is_title``)
+instead of calling Python per value.
+
+Arrow and Python agree exactly on printable ASCII text, so only those values
+take the Arrow path. Values with non-ASCII or control characters (where RE2's
+``\\d``/``\\w``/``\\s``/``$`` and Unicode case tables differ from Python's),
+non-string values, and patterns RE2 cannot compile or may read differently
+fall back to the Python checks.
+"""
+
+import os
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype
+
+STRING_BACKEND_ENV = "ADRI_STRING_BACKEND"
+
+# Control characters and DEL; with non-ASCII text these route values to Python
+_UNSAFE_CHARS = r"[\x00-\x1f\x7f]"
+
+# Syntax Python and RE2 both accept but read differently: "{,n}" is a
+# quantifier in Python 3.11 and a literal in RE2, and "[:alpha:]" is a POSIX
+# class only in RE2
+_AMBIGUOUS_REGEX_SYNTAX = ("{,", "[:")
+
+ArrowCompute = Callable[[Any], np.ndarray | None]
+
+
+def arrow_strings_enabled() -> bool:
+    """Check whether the Arrow string backend is requested.
+
+    Returns:
+        True if ADRI_STRING_BACKEND is set to "arrow"
+    """
+    return os.environ.get(STRING_BACKEND_ENV, "").lower() == "arrow"
+
+
+def _to_arrow(series: pd.Series):
+    """Return (pyarrow string array, printable-ASCII mask) or None."""
+    if not isinstance(series.dtype, pd.StringDtype) and not (
+        series.dtype == object and infer_dtype(series, skipna=True) == "string"
+    ):
+        return None
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return None
+
+    try:
+        array = pa.array(series.astype(pd.ArrowDtype(pa.string())))
+        simple = pc.and_(
+            pc.string_is_ascii(array),
+            pc.invert(pc.match_substring_regex(array, _UNSAFE_CHARS)),
+        )
+        simple = pc.fill_null(simple, False).to_numpy(zero_copy_only=False)
+    except (pa.ArrowException, UnicodeError, TypeError, ValueError):
+        return None
+    return array, simple
+
+
+def string_kernel(
+    fallback: Callable[[pd.Series], np.ndarray], compute: ArrowCompute
+) -> Callable[[pd.Series], np.ndarray]:
+    """Wrap a rule kernel so string columns are evaluated with Arrow.
+
+    Args:
+        fallback: Kernel giving the reference result for any Series
+        compute: Maps a pyarrow string array to a boolean numpy mask, or
+            returns None if it cannot evaluate the rule
+
+    Returns:
+        Kernel using ``compute`` for printable ASCII values and ``fallback``
+        for the rest (or for everything when the backend is disabled)
+    """
+
+    def kernel(series: pd.Series) -> np.ndarray:
+        if not arrow_strings_enabled():
+            return fallback(series)
+        prepared = _to_arrow(series)
+        if prepared is None:
+            return fallback(series)
+        array, simple = prepared
+        result = compute(array)
+        if result is None:
+            return fallback(series)
+
+        mask = np.where(simple, result, False)
+        rest = np.flatnonzero(~simple)
+        if len(rest):
+            mask[rest] = fallback(series.iloc[rest])
+        return mask
+
+    return kernel
+
+
+def _to_mask(result) -> np.ndarray:
+    import pyarrow.compute as pc
+
+    return pc.fill_null(result, False).to_numpy(zero_copy_only=False)
+
+
+def regex_match(pattern: str) -> ArrowCompute:
+    """``re.match(pattern, value)`` (anchored at the start) with RE2."""
+
+    def compute(array):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if any(token in pattern for token in _AMBIGUOUS_REGEX_SYNTAX):
+            return None
+        try:
+            return _to_mask(pc.match_substring_regex(array, f"^(?:{pattern})"))
+        except pa.ArrowException:
+            return None  # Not valid RE2 syntax (e.g. lookarounds, backrefs)
+
+    return compute
+
+
+def length_between(min_len: int | None, max_len: int | None) -> ArrowCompute:
+    """``min_len <= len(value) <= max_len`` with ``utf8_length``."""
+
+    def compute(array):
+        import pyarrow.compute as pc
+
+        lengths = pc.utf8_length(array).to_numpy(zero_copy_only=False)
+        mask = np.ones(len(lengths), dtype=bool)
+        if min_len is not None:
+            mask &= lengths >= min_len
+        if max_len is not None:
+            mask &= lengths <= max_len
+        return mask
+
+    return compute
+
+
+def case_check(mode: str) -> ArrowCompute:
+    """``str.islower``/``isupper``/``istitle`` where empty strings pass.
+
+    Args:
+        mode: "lower", "upper" or "title"
+    """
+
+    def compute(array):
+        import pyarrow.compute as pc
+
+        cased = _to_mask(getattr(pc, f"ascii_is_{mode}")(array))
+        empty = pc.utf8_length(array).to_numpy(zero_copy_only=False) == 0
+        return cased | empty
+
+    return compute
@@ -0,0 +1,137 @@
+"""Shared per-assessment column preparation for dimension assessors.
+
+Dimension assessors repeatedly derive the same representations of a column
+(non-null values, null masks, parsed datetimes, ...). A ColumnContext memoizes
+them for one DataFrame so a five-dimension run, its explain payloads and its
+failure collection pay for each conversion once.
+
+Contexts are scoped with a context variable, like timing spans, so assessors
+keep their ``assess(data, requirements)`` signature: they call
+:func:`get_column_context` and receive the context shared by the enclosing
+assessment, or a private one when none is active. Cached values are shared
+between callers and must not be modified in place.
+"""
+
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import pandas as pd
+
+_active_contexts: ContextVar["dict[int, ColumnContext] | None"] = ContextVar(
+    "adri_column_contexts", default=None
+)
+
+
+class ColumnContext:
+    """Lazily memoized column representations of one DataFrame.
+
+    Args:
+        data: DataFrame being assessed; it must not change while the context
+            is in use
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self._memo: dict[Hashable, Any] = {}
+
+    def memo(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the value cached under ``key``, computing it on first use.
+
+        Args:
+            key: Cache key; namespace it with a leading name, e.g.
+                ``("date_pair", end_col, start_col)``
+            factory: Computes the value; exceptions propagate and nothing is
+                cached
+
+        Returns:
+            The cached value
+        """
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = factory()
+            return value
+
+    def null_mask(self, column: Any) -> pd.Series:
+        """Boolean Series marking missing values of ``column``."""
+        return self.memo(("null_mask", column), lambda: self.data[column].isna())
+
+    def null_count(self, column: Any) -> int:
+        """Number of missing values in ``column``."""
+        return self.memo(
+            ("null_count", column), lambda: int(self.null_mask(column).sum())
+        )
+
+    def null_counts(self) -> pd.Series:
+        """Missing values per column (``data.isnull().sum()``)."""
+        return self.memo(("null_counts",), lambda: self.data.isnull().sum())
+
+    def non_null(self, column: Any) -> pd.Series:
+        """Non-null values of ``column`` with their original index."""
+        return self.memo(("non_null", column), lambda: self.data[column].dropna())
+
+    def numeric(self, column: Any) -> pd.Series:
+        """Non-null values of ``column`` coerced to numbers (NaN if not numeric)."""
+        return self.memo(
+            ("numeric", column),
+            lambda: pd.to_numeric(self.non_null(column), errors="coerce"),
+        )
+
+    def strings(self, column: Any) -> pd.Series:
+        """Non-null values of ``column`` converted with ``str``."""
+        return self.memo(("strings", column), lambda: self.non_null(column).astype(str))
+
+    def datetimes(self, column: Any) -> pd.Series:
+        """All values of ``column`` parsed as naive UTC datetimes (NaT if invalid)."""
+        return self.memo(
+            ("datetimes", column), lambda: _parse_utc_naive(self.data[column])
+        )
+
+
+def _parse_utc_naive(series: pd.Series) -> pd.Series:
+    parsed = pd.to_datetime(series, utc=True, errors="coerce")
+    try:
+        return parsed.dt.tz_convert(None)
+    except Exception:
+        return parsed  # Already naive or conversion failed
+
+
+@contextmanager
+def column_context_scope() -> Iterator[None]:
+    """Share column contexts between assessors for the duration of the block.
+
+    Nested scopes reuse the outermost one, so an assessment and the failure
+    collection that follows it see the same cached columns.
+    """
+    if _active_contexts.get() is not None:
+        yield
+        return
+
+    token = _active_contexts.set({})
+    try:
+        yield
+    finally:
+        _active_contexts.reset(token)
+
+
+def get_column_context(data: pd.DataFrame) -> ColumnContext:
+    """Return the column context for ``data``.
+
+    Args:
+        data: DataFrame being assessed
+
+    Returns:
+        The context shared within the active scope, or a new private context
+        when no scope is active
+    """
+    contexts = _active_contexts.get()
+    if contexts is None:
+        return ColumnContext(data)
+
+    # The context holds a reference to data, so its id stays unique
+    context = contexts.get(id(data))
+    if context is None or context.data is not data:
+        context = contexts[id(data)] = ColumnContext(data)
+    return context
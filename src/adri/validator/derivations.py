@@ -0,0 +1,303 @@
+"""
+ADRI Derived Field Evaluation.
+
+Evaluates the derivation rules declared in enhanced ``allowed_values`` (see
+:mod:`adri.contracts.derivation`) against data, so a derived categorical
+field can be checked against its inputs on every row::
+
+    risk_level:
+      allowed_values:
+        Critical:
+          definition: At-risk top priority projects
+          precedence: 1
+          derivation_rule:
+            type: ordered_conditions
+            inputs: [project_status, priority_order]
+            logic: IF project_status = 'At Risk' AND priority_order = 1 THEN 'Critical'
+        High:
+          definition: Any other at-risk project
+          precedence: 2
+          derivation_rule:
+            type: ordered_conditions
+            inputs: [project_status]
+            logic: IF project_status IN ('At Risk', 'Blocked')
+
+Rule logic is SQL-like (``=``, ``<>``, ``AND``/``OR``/``NOT``, ``IN``,
+``IS [NOT] NULL``, an optional ``IF ... THEN 'value'``) and is translated
+onto the restricted syntax of :mod:`adri.validator.expressions`, so it is
+compiled once and evaluated column-wise. Conditions are combined with
+``np.select`` in precedence order: the first condition that holds gives the
+expected category. As in SQL, a condition over a missing input does not hold.
+"""
+
+import ast
+import re
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .column_context import get_column_context
+from .expressions import compile_expression, CompiledExpression, ExpressionError
+
+ORDERED_CONDITIONS = "ordered_conditions"
+
+# String literals ('' escapes a quote) and backtick-quoted column names
+_QUOTED_RE = re.compile(r"'((?:[^']|'')*)'|(`[^`]+`)")
+_PLACEHOLDER_RE = re.compile(r"__adri_quoted_(\d+)__")
+_NULL_TEST_RE = re.compile(r"(\w+)\s+IS\s+(NOT\s+)?NULL\b", re.IGNORECASE)
+_KEYWORD_RE = re.compile(r"\b(IF|THEN|AND|OR|NOT|IN|TRUE|FALSE)\b", re.IGNORECASE)
+_EQUALS_RE = re.compile(r"(?<![<>!=])=(?!=)")
+_THEN_MARKER = "\x00"
+
+_KEYWORDS = {
+    "if": "",
+    "then": _THEN_MARKER,
+    "and": "and",
+    "or": "or",
+    "not": "not",
+    "in": "in",
+    "true": "True",
+    "false": "False",
+}
+
+
+def _translate_code(text: str) -> str:
+    """Translate SQL operators and keywords (quoted spans already hidden)."""
+
+    def null_test(match: re.Match) -> str:
+        function = "notnull" if match.group(2) else "isnull"
+        return f"{function}({match.group(1)})"
+
+    text = _NULL_TEST_RE.sub(null_test, text)
+    text = _KEYWORD_RE.sub(lambda m: _KEYWORDS[m.group(1).lower()], text)
+    return _EQUALS_RE.sub("==", text.replace("<>", "!="))
+
+
+def translate_derivation_logic(logic: str) -> tuple[str, str | None]:
+    """Translate SQL-like derivation logic into an expression.
+
+    Args:
+        logic: Rule logic, e.g.
+            ``"IF project_status = 'At Risk' AND priority_order = 1 THEN 'Critical'"``
+
+    Returns:
+        (condition expression, THEN value or None), e.g.
+        ``("project_status == 'At Risk' and priority_order == 1", "Critical")``
+
+    Raises:
+        ExpressionError: If the logic is empty or the THEN clause is not a
+            single literal
+    """
+    if not isinstance(logic, str) or not logic.strip():
+        raise ExpressionError("Derivation logic must be a non-empty string")
+
+    # Hide string literals and quoted names so keywords inside them are kept
+    quoted: list[str] = []
+
+    def hide(match: re.Match) -> str:
+        if match.group(2) is not None:
+            quoted.append(match.group(2))
+        else:
+            quoted.append(repr(match.group(1).replace("''", "'")))
+        return f"__adri_quoted_{len(quoted) - 1}__"
+
+    code = _translate_code(_QUOTED_RE.sub(hide, logic))
+    text = _PLACEHOLDER_RE.sub(lambda m: quoted[int(m.group(1))], code)
+
+    condition, _, then = text.partition(_THEN_MARKER)
+    if _THEN_MARKER in then:
+        raise ExpressionError(f"Derivation logic has more than one THEN: '{logic}'")
+    if not then.strip():
+        return condition.strip(), None
+    try:
+        value = ast.literal_eval(then.strip())
+    except (SyntaxError, ValueError) as e:
+        raise ExpressionError(f"THEN must give a single value: '{logic}'") from e
+    if not isinstance(value, (str, int, float)):
+        raise ExpressionError(f"THEN must give a single value: '{logic}'")
+    return condition.strip(), str(value)
+
+
+def _evaluable_rules(allowed_values: Any) -> list[tuple[str, dict[str, Any]]] | None:
+    """Return (category, rule) pairs if every declared rule can be evaluated.
+
+    Only ``ordered_conditions`` rules are evaluated, and placeholder rules
+    from contract generation (``metadata.auto_generated``) are left for
+    review: since precedence makes the rules of a field depend on each other,
+    a field is evaluated only when all of its rules are.
+    """
+    if not isinstance(allowed_values, dict):
+        return None
+
+    rules = []
+    for category, definition in allowed_values.items():
+        if not isinstance(definition, dict) or not definition.get("derivation_rule"):
+            continue
+        rule = definition["derivation_rule"]
+        if not isinstance(rule, dict) or rule.get("type") != ORDERED_CONDITIONS:
+            return None
+        if (rule.get("metadata") or {}).get("auto_generated"):
+            return None
+        rules.append((str(category), rule))
+    return rules or None
+
+
+def derived_field_specs(field_requirements: dict[str, Any]) -> dict[str, Any]:
+    """Select the fields whose derivation rules can be evaluated.
+
+    Args:
+        field_requirements: Field requirements from a contract
+
+    Returns:
+        Mapping of field name to its enhanced ``allowed_values``
+    """
+    if not isinstance(field_requirements, dict):
+        return {}
+    return {
+        name: spec["allowed_values"]
+        for name, spec in field_requirements.items()
+        if isinstance(spec, dict) and _evaluable_rules(spec.get("allowed_values"))
+    }
+
+
+class CompiledDerivation:
+    """Derivation rules of one field, compiled for column-wise evaluation.
+
+    Attributes:
+        field: Derived field name
+        categories: Category names in precedence order
+        conditions: Compiled condition per category with an evaluable rule
+        columns: Input columns read by the conditions
+    """
+
+    def __init__(
+        self,
+        field: str,
+        categories: list[str],
+        conditions: dict[str, CompiledExpression],
+    ):
+        self.field = field
+        self.categories = tuple(categories)
+        self.conditions = conditions
+        self.columns = tuple(
+            dict.fromkeys(
+                column
+                for condition in conditions.values()
+                for column in condition.columns
+                if column != field
+            )
+        )
+        self.key = (
+            field,
+            tuple((name, conditions[name].expression) for name in conditions),
+        )
+
+    def derive(self, data: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+        """Derive the expected category of every row.
+
+        Args:
+            data: DataFrame containing every input column
+
+        Returns:
+            (codes, checked) where ``codes`` indexes :attr:`categories` (-1 if
+            no condition holds) and ``checked`` has one row per condition in
+            :attr:`conditions` order, marking rows whose inputs are present
+
+        Raises:
+            ExpressionError: If an input column is missing or its values
+                cannot be compared
+        """
+        results = [condition.evaluate(data) for condition in self.conditions.values()]
+        codes = np.select(
+            [passed for _, passed in results],
+            [self.categories.index(name) for name in self.conditions],
+            default=-1,
+        )
+        checked = np.array([checked for checked, _ in results]).reshape(
+            len(results), len(data)
+        )
+        return codes, checked
+
+    def evaluate(self, data: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Check the derived field against the category its inputs give.
+
+        A row is checked when its derived value is one of the categories and
+        either some condition holds, or the value's own condition could be
+        evaluated (it then fails, as none held). Null or unknown values are
+        left to completeness and validity.
+
+        Args:
+            data: DataFrame containing the derived field and its inputs
+
+        Returns:
+            (checked, passed, expected) where ``expected`` holds the expected
+            category per row (None if no condition holds)
+
+        Raises:
+            ExpressionError: If a column is missing or values cannot be
+                compared
+        """
+        if self.field not in data.columns:
+            raise ExpressionError(f"Missing columns: {self.field}")
+
+        expected_codes, condition_checked = self.derive(data)
+
+        context = get_column_context(data)
+        present = ~context.null_mask(self.field).to_numpy(dtype=bool)
+        actual_codes = np.full(len(data), -1)
+        actual_codes[present] = pd.Index(self.categories).get_indexer(
+            context.strings(self.field)
+        )
+
+        # Whether each row's own category condition could be evaluated
+        own_checked = np.zeros(len(data), dtype=bool)
+        for row, name in enumerate(self.conditions):
+            own_checked |= (actual_codes == self.categories.index(name)) & (
+                condition_checked[row]
+            )
+
+        checked = (actual_codes >= 0) & ((expected_codes >= 0) | own_checked)
+        passed = checked & (actual_codes == expected_codes)
+        labels = np.array([*self.categories, None], dtype=object)
+        return checked, passed, labels[expected_codes]
+
+
+def compile_derivation(
+    field: str, allowed_values: dict[str, Any]
+) -> CompiledDerivation:
+    """Compile the derivation rules of a field.
+
+    Args:
+        field: Derived field name
+        allowed_values: Enhanced allowed_values with category definitions
+
+    Returns:
+        CompiledDerivation with conditions in precedence order
+
+    Raises:
+        ExpressionError: If the field has no evaluable rules or a rule's logic
+            does not compile
+    """
+    rules = _evaluable_rules(allowed_values)
+    if not rules:
+        raise ExpressionError(f"Field '{field}' has no evaluable derivation rules")
+
+    from ..contracts.derivation import get_categories_by_precedence
+
+    categories = [str(name) for name, _ in get_categories_by_precedence(allowed_values)]
+    rules_by_category = dict(rules)
+    conditions = {}
+    for category in categories:
+        rule = rules_by_category.get(category)
+        if rule is None:
+            continue
+        condition, then = translate_derivation_logic(rule.get("logic"))
+        if then is not None and then != category:
+            raise ExpressionError(
+                f"Rule for '{category}' derives '{then}' instead: '{rule['logic']}'"
+            )
+        conditions[category] = compile_expression(condition)
+    if not conditions:
+        raise ExpressionError(f"Field '{field}' has no valid category definitions")
+    return CompiledDerivation(field, categories, conditions)
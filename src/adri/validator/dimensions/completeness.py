@@ -10,6 +10,7 @@ from typing import Any
 import pandas as pd
 
 from ...core.protocols import DimensionAssessor
+from ..column_context import get_column_context
 
 
 class CompletenessAssessor(DimensionAssessor):
@@ -57,7 +58,7 @@ class CompletenessAssessor(DimensionAssessor):
     def _assess_completeness_basic(self, data: pd.DataFrame) -> float:
         """Perform basic completeness assessment without field requirements."""
         total_cells = int(data.size)
-        missing_cells = int(data.isnull().sum().sum())
+        missing_cells = int(get_column_context(data).null_counts().sum())
         completeness_rate = (total_cells - missing_cells) / total_cells
         return float(completeness_rate * 20.0)
 
@@ -79,11 +80,12 @@ class CompletenessAssessor(DimensionAssessor):
         # Calculate completeness for required fields only
         required_total = len(data) * len(required_fields) if len(data) > 0 else 0
         missing_required = 0
+        context = get_column_context(data)
 
         for col in required_fields:
             if col in data.columns:
                 try:
-                    missing_required += int(data[col].isnull().sum())
+                    missing_required += context.null_count(col)
                 except Exception:
                     # If there's an error counting nulls, assume all are missing
                     missing_required += len(data)
@@ -114,11 +116,12 @@ class CompletenessAssessor(DimensionAssessor):
 
         required_total = len(data) * len(required_fields) if len(data) > 0 else 0
         per_field_missing: dict[str, int] = {}
+        context = get_column_context(data)
 
         for col in required_fields:
             if col in data.columns:
                 try:
-                    per_field_missing[col] = int(data[col].isnull().sum())
+                    per_field_missing[col] = context.null_count(col)
                 except Exception:
                     per_field_missing[col] = len(data)
             else:
@@ -233,7 +236,7 @@ class CompletenessAssessor(DimensionAssessor):
                 )
             else:
                 # Count null values in this field
-                null_mask = data[field_name].isnull()
+                null_mask = get_column_context(data).null_mask(field_name)
                 null_count = int(null_mask.sum())
 
                 if null_count > 0:
@@ -273,82 +276,13 @@ class CompletenessAssessor(DimensionAssessor):
         Returns:
             List of failure records with details
         """
-        from collections import defaultdict
+        from ..rule_kernels import collect_rule_failures
 
-        from ...core.validation_rule import ValidationRule
-        from ..rules import execute_validation_rule
-
-        failures = []
-        total_rows = len(data)
-
-        # Track failures by field and rule
-        failure_tracking = defaultdict(
-            lambda: defaultdict(lambda: {"count": 0, "samples": [], "row_indices": []})
+        # Nulls are included: completeness rules are what catch them
+        return collect_rule_failures(
+            data, field_requirements, "completeness", skip_nulls=False
         )
 
-        for column in data.columns:
-            if column not in field_requirements:
-                continue
-
-            field_config = field_requirements[column]
-            if not isinstance(field_config, dict):
-                continue
-
-            validation_rules = field_config.get("validation_rules", [])
-            if not validation_rules:
-                continue
-
-            # Get completeness rules for this field (all severities for logging)
-            completeness_rules = [
-                r
-                for r in validation_rules
-                if isinstance(r, ValidationRule) and r.dimension == "completeness"
-            ]
-
-            if not completeness_rules:
-                continue
-
-            # Execute each rule and track failures
-            series = data[column]
-            for idx, value in series.items():
-                for rule in completeness_rules:
-                    if not execute_validation_rule(value, rule, field_config):
-                        # Track failure
-                        rule_key = f"{rule.rule_type}_{rule.severity.value}"
-                        failure_tracking[column][rule_key]["count"] += 1
-
-                        if len(failure_tracking[column][rule_key]["samples"]) < 3:
-                            sample_val = "<null>" if pd.isna(value) else str(value)[:50]
-                            failure_tracking[column][rule_key]["samples"].append(
-                                sample_val
-                            )
-                        failure_tracking[column][rule_key]["row_indices"].append(idx)
-
-        # Convert tracking to failure records
-        for field_name, rule_failures in failure_tracking.items():
-            for rule_key, failure_info in rule_failures.items():
-                if failure_info["count"] > 0:
-                    # Extract rule type and severity from key
-                    parts = rule_key.rsplit("_", 1)
-                    rule_type = parts[0] if len(parts) > 1 else rule_key
-                    severity = parts[1] if len(parts) > 1 else "CRITICAL"
-
-                    failures.append(
-                        {
-                            "dimension": "completeness",
-                            "field": field_name,
-                            "issue": f"{rule_type}_failed",
-                            "severity": severity,
-                            "affected_rows": failure_info["count"],
-                            "affected_percentage": (failure_info["count"] / total_rows)
-                            * 100.0,
-                            "samples": failure_info["samples"],
-                            "remediation": f"Fix {field_name} to pass {rule_type} validation ({severity} severity)",
-                        }
-                    )
-
-        return failures
-
     def _has_validation_rules_format(self, field_requirements: dict[str, Any]) -> bool:
         """Check if field_requirements use new validation_rules format.
 
@@ -379,51 +313,8 @@ class CompletenessAssessor(DimensionAssessor):
         Returns:
             Completeness score (0.0 to 20.0)
         """
-        from ...core.severity import Severity
-        from ...core.validation_rule import ValidationRule
-        from ..rules import execute_validation_rule
-
-        total_critical_checks = 0
-        failed_critical_checks = 0
-
-        # Process each field
-        for column in data.columns:
-            if column not in field_requirements:
-                continue
-
-            field_config = field_requirements[column]
-            if not isinstance(field_config, dict):
-                continue
-
-            validation_rules = field_config.get("validation_rules", [])
-            if not validation_rules:
-                continue
-
-            # Filter to only CRITICAL rules for completeness dimension
-            critical_rules = [
-                r
-                for r in validation_rules
-                if isinstance(r, ValidationRule)
-                and r.dimension == "completeness"
-                and r.severity == Severity.CRITICAL
-            ]
-
-            if not critical_rules:
-                continue
-
-            # Execute CRITICAL completeness rules against data
-            series = data[column]  # Include nulls for completeness checking
-            for value in series:
-                for rule in critical_rules:
-                    total_critical_checks += 1
-                    if not execute_validation_rule(value, rule, field_config):
-                        failed_critical_checks += 1
-
-        # Calculate score based on CRITICAL rules only
-        if total_critical_checks == 0:
-            return 20.0  # No CRITICAL rules = perfect score
-
-        success_rate = (
-            total_critical_checks - failed_critical_checks
-        ) / total_critical_checks
-        return success_rate * 20.0
+        from ..rule_kernels import score_critical_rules
+
+        return score_critical_rules(
+            data, field_requirements, "completeness", skip_nulls=False
+        )
@@ -5,11 +5,16 @@ This module contains the ConsistencyAssessor class that evaluates data consisten
 ADRI standards.
 """
 
+import logging
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from ...core.protocols import DimensionAssessor
+from ..column_context import get_column_context
+
+logger = logging.getLogger(__name__)
 
 
 class ConsistencyAssessor(DimensionAssessor):
@@ -56,11 +61,18 @@ class ConsistencyAssessor(DimensionAssessor):
         # Get primary key fields for uniqueness checking
         pk_fields = self._get_primary_key_fields(requirements)
 
-        # Get format rules if defined
+        # Get format rules, declared cross-field rules and derived fields if defined
         format_rules = requirements.get("format_rules", {})
+        cross_field_rules = requirements.get("cross_field_rules", [])
+        derived_fields = requirements.get("derived_fields", {})
 
         return self._assess_consistency_with_rules(
-            data, rule_weights_cfg, pk_fields, format_rules
+            data,
+            rule_weights_cfg,
+            pk_fields,
+            format_rules,
+            cross_field_rules,
+            derived_fields,
         )
 
     def _get_primary_key_fields(self, requirements: dict[str, Any]) -> list[str]:
@@ -81,6 +93,8 @@ class ConsistencyAssessor(DimensionAssessor):
         rule_weights_cfg: dict[str, float],
         pk_fields: list[str],
         format_rules: dict[str, Any] | None = None,
+        cross_field_rules: list[Any] | None = None,
+        derived_fields: dict[str, Any] | None = None,
     ) -> float:
         """Assess consistency using configured rules with weighted scoring."""
         # Extract and validate rule weights
@@ -113,7 +127,9 @@ class ConsistencyAssessor(DimensionAssessor):
 
         # 3. Cross-field logic
         if logic_weight > 0.0:
-            logic_pass_rate = self._get_cross_field_logic_pass_rate(data)
+            logic_pass_rate = self._get_cross_field_logic_pass_rate(
+                data, cross_field_rules, derived_fields
+            )
             weighted_sum += logic_pass_rate * logic_weight
 
         # 4. Format consistency
@@ -152,10 +168,19 @@ class ConsistencyAssessor(DimensionAssessor):
         # standards
         return 1.0
 
-    def _get_cross_field_logic_pass_rate(self, data: pd.DataFrame) -> float:
+    def _get_cross_field_logic_pass_rate(
+        self,
+        data: pd.DataFrame,
+        cross_field_rules: list[Any] | None = None,
+        derived_fields: dict[str, Any] | None = None,
+    ) -> float:
         """Get pass rate for cross-field logic rule.
 
-        Checks common logical relationships between fields such as:
+        Contracts can declare their own rules under ``cross_field_rules`` (see
+        :meth:`_evaluate_cross_field_rules`) and derivation rules for derived
+        fields (see :meth:`_evaluate_derived_fields`); these replace the
+        built-in checks. Otherwise common logical relationships between fields
+        are checked:
         - Date ranges (end_date >= start_date)
         - Numeric totals (total = subtotal + tax)
         - Status consistency
@@ -166,6 +191,14 @@ class ConsistencyAssessor(DimensionAssessor):
         total_checks = 0
         passed_checks = 0
 
+        if cross_field_rules or derived_fields:
+            for _, checked, passed in self._evaluate_declared_rules(
+                data, cross_field_rules, derived_fields
+            ):
+                total_checks += int(checked.sum())
+                passed_checks += int(passed.sum())
+            return float(passed_checks / total_checks) if total_checks else 1.0
+
         # Check for common date range patterns
         date_pairs = [
             ("end_date", "start_date"),
@@ -177,13 +210,13 @@ class ConsistencyAssessor(DimensionAssessor):
         for end_col, start_col in date_pairs:
             if end_col in data.columns and start_col in data.columns:
                 # Only check rows where both dates are present
-                mask = data[end_col].notna() & data[start_col].notna()
-                subset = data[mask]
+                subset = self._date_pair_rows(data, end_col, start_col)
                 if len(subset) > 0:
                     try:
                         # Convert to datetime for comparison
-                        end_dates = pd.to_datetime(subset[end_col], errors="coerce")
-                        start_dates = pd.to_datetime(subset[start_col], errors="coerce")
+                        end_dates, start_dates = self._parse_date_pair(
+                            data, end_col, start_col
+                        )
                         valid_mask = end_dates.notna() & start_dates.notna()
                         valid_subset = subset[valid_mask]
 
@@ -227,6 +260,137 @@ class ConsistencyAssessor(DimensionAssessor):
 
         return float(passed_checks / total_checks)
 
+    def _evaluate_declared_rules(
+        self,
+        data: pd.DataFrame,
+        cross_field_rules: list[Any] | None,
+        derived_fields: dict[str, Any] | None,
+    ) -> list[tuple[dict[str, Any], np.ndarray, np.ndarray]]:
+        """Evaluate declared cross-field rules followed by derived fields."""
+        return self._evaluate_cross_field_rules(
+            data, cross_field_rules or []
+        ) + self._evaluate_derived_fields(data, derived_fields or {})
+
+    def _evaluate_derived_fields(
+        self, data: pd.DataFrame, derived_fields: dict[str, Any]
+    ) -> list[tuple[dict[str, Any], np.ndarray, np.ndarray]]:
+        """Check derived categorical fields against their derivation rules.
+
+        ``derived_fields`` maps each field to its enhanced ``allowed_values``
+        (see :func:`adri.validator.derivations.derived_field_specs`). The
+        category conditions are evaluated column-wise in precedence order and
+        each row's value must be the first category whose condition holds.
+        Fields whose rules do not compile or reference missing columns check
+        no rows; they are logged and carry the reason under ``error``.
+
+        Returns:
+            (rule, checked mask, passed mask) for each derived field; the rule
+            records the expected category of every row
+        """
+        from ..derivations import compile_derivation
+        from ..expressions import ExpressionError
+
+        context = get_column_context(data)
+        results = []
+        for field, allowed_values in derived_fields.items():
+            rule: dict[str, Any] = {"name": f"{field} derivation", "field": field}
+            try:
+                derivation = compile_derivation(field, allowed_values)
+                checked, passed, expected = context.memo(
+                    ("derived_field", derivation.key), lambda: derivation.evaluate(data)
+                )
+            except (ExpressionError, TypeError) as e:
+                logger.warning("Derivation rules of '%s' not evaluated: %s", field, e)
+                unchecked = np.zeros(len(data), dtype=bool)
+                rule.update({"columns": (field,), "error": str(e)})
+                results.append((rule, unchecked, unchecked))
+                continue
+            rule.update({"columns": (*derivation.columns, field), "expected": expected})
+            results.append((rule, checked, passed))
+        return results
+
+    def _evaluate_cross_field_rules(
+        self, data: pd.DataFrame, cross_field_rules: list[Any]
+    ) -> list[tuple[dict[str, Any], np.ndarray, np.ndarray]]:
+        """Evaluate declared cross-field rules (memoized per expression).
+
+        Each rule is an expression string or a mapping with ``expression`` and
+        optional ``name`` and ``remediation``, for example::
+
+            cross_field_rules:
+              - end_date >= start_date
+              - name: total_matches_parts
+                expression: abs(total - (subtotal + tax)) < 0.01
+
+        Expressions are compiled once (see :mod:`adri.validator.expressions`).
+        Rules that do not compile, reference missing columns or compare
+        incompatible values check no rows; they are logged and carry the
+        reason under ``error``.
+
+        Returns:
+            (rule, checked mask, passed mask) for each declared rule
+        """
+        context = get_column_context(data)
+        results = []
+        for rule in cross_field_rules:
+            if isinstance(rule, str):
+                rule = {"expression": rule}
+            if not isinstance(rule, dict):
+                continue
+            expression = rule.get("expression")
+            columns, checked, passed, error = context.memo(
+                ("cross_field_rule", expression),
+                lambda: self._run_cross_field_rule(data, expression),
+            )
+            rule = {**rule, "columns": columns}
+            if error:
+                rule["error"] = error
+            results.append((rule, checked, passed))
+        return results
+
+    def _run_cross_field_rule(
+        self, data: pd.DataFrame, expression: Any
+    ) -> tuple[tuple[str, ...], np.ndarray, np.ndarray, str | None]:
+        """Compile and evaluate one rule, logging why it cannot be evaluated."""
+        from ..expressions import compile_expression, ExpressionError
+
+        columns: tuple[str, ...] = ()
+        try:
+            compiled = compile_expression(expression)
+            columns = compiled.columns
+            checked, passed = compiled.evaluate(data)
+        except (ExpressionError, TypeError) as e:
+            logger.warning("Cross-field rule '%s' not evaluated: %s", expression, e)
+            unchecked = np.zeros(len(data), dtype=bool)
+            return columns, unchecked, unchecked, str(e)
+        return columns, checked, passed, None
+
+    def _date_pair_rows(
+        self, data: pd.DataFrame, end_col: str, start_col: str
+    ) -> pd.DataFrame:
+        """Return the rows where both dates of a pair are present (memoized)."""
+        return get_column_context(data).memo(
+            ("date_pair_rows", end_col, start_col),
+            lambda: data[data[end_col].notna() & data[start_col].notna()],
+        )
+
+    def _parse_date_pair(
+        self, data: pd.DataFrame, end_col: str, start_col: str
+    ) -> tuple[pd.Series, pd.Series]:
+        """Parse a date pair on the rows from :meth:`_date_pair_rows` (memoized).
+
+        The score and the failure collection share the parsed dates through
+        the column context.
+        """
+        subset = self._date_pair_rows(data, end_col, start_col)
+        return get_column_context(data).memo(
+            ("date_pair", end_col, start_col),
+            lambda: (
+                pd.to_datetime(subset[end_col], errors="coerce"),
+                pd.to_datetime(subset[start_col], errors="coerce"),
+            ),
+        )
+
     def _get_format_consistency_pass_rate(
         self, data: pd.DataFrame, format_rules: dict[str, Any] | None = None
     ) -> float:
@@ -254,7 +418,7 @@ class ConsistencyAssessor(DimensionAssessor):
 
         for col in data.columns:
             if data[col].dtype == "object":  # Only check string columns
-                non_null = data[col].dropna()
+                non_null = get_column_context(data).non_null(col)
                 if len(non_null) < 2:  # Need at least 2 values to check consistency
                     continue
 
@@ -500,6 +664,8 @@ class ConsistencyAssessor(DimensionAssessor):
         Returns:
             Consistency score between 0.0 and 20.0
         """
+        from ..rule_kernels import distinct_values
+
         # Handle legacy format rules
         total_checks = 0
         failed_checks = 0
@@ -507,13 +673,17 @@ class ConsistencyAssessor(DimensionAssessor):
         format_rules = consistency_rules.get("format_rules", {})
         for field, rule in format_rules.items():
             if field in data.columns:
-                for value in data[field].dropna():
-                    total_checks += 1
-                    # Simple format checking
-                    if rule == "title_case" and not str(value).istitle():
-                        failed_checks += 1
-                    elif rule == "lowercase" and str(value) != str(value).lower():
-                        failed_checks += 1
+                values = get_column_context(data).non_null(field)
+                total_checks += len(values)
+                # Simple format checking, once per distinct value
+                distinct, codes = distinct_values(values)
+                failed = [
+                    (rule == "title_case" and not str(value).istitle())
+                    or (rule == "lowercase" and str(value) != str(value).lower())
+                    for value in distinct
+                ]
+                if failed:
+                    failed_checks += int(np.asarray(failed)[codes].sum())
 
         if total_checks > 0:
             success_rate = (total_checks - failed_checks) / total_checks
@@ -551,8 +721,13 @@ class ConsistencyAssessor(DimensionAssessor):
             pk_failures = self._check_primary_key_uniqueness(data, pk_fields)
             failures.extend(pk_failures)
 
-        # Check cross-field logic issues (date ranges, numeric totals)
-        logic_failures = self._get_cross_field_logic_failures(data)
+        # Check cross-field logic issues (declared rules and derived fields,
+        # or date ranges and numeric totals)
+        logic_failures = self._get_cross_field_logic_failures(
+            data,
+            requirements.get("cross_field_rules"),
+            requirements.get("derived_fields"),
+        )
         failures.extend(logic_failures)
 
         # Check format consistency issues
@@ -562,7 +737,10 @@ class ConsistencyAssessor(DimensionAssessor):
         return failures
 
     def _get_cross_field_logic_failures(
-        self, data: pd.DataFrame
+        self,
+        data: pd.DataFrame,
+        cross_field_rules: list[Any] | None = None,
+        derived_fields: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         """Get failures from cross-field logic validation."""
         failures = []
@@ -572,6 +750,68 @@ class ConsistencyAssessor(DimensionAssessor):
 
         total_rows = len(data)
 
+        if cross_field_rules or derived_fields:
+            for rule, checked, passed in self._evaluate_declared_rules(
+                data, cross_field_rules, derived_fields
+            ):
+                if rule.get("error"):
+                    failures.append(
+                        {
+                            "dimension": "consistency",
+                            "field": ",".join(map(str, rule["columns"])),
+                            "issue": "cross_field_rule_not_evaluated",
+                            "rule": rule.get("name") or rule.get("expression"),
+                            "affected_rows": 0,
+                            "affected_percentage": 0.0,
+                            "samples": [],
+                            "remediation": f"Fix the rule: {rule['error']}",
+                        }
+                    )
+                    continue
+                failed_positions = np.flatnonzero(checked & ~passed)
+                if not len(failed_positions):
+                    continue
+                columns = list(rule["columns"])
+                sample_rows = data.iloc[failed_positions[:3]][columns]
+                samples = [
+                    f"Row {idx}: "
+                    + ", ".join(
+                        f"{col}={str(value)[:50]}"
+                        for col, value in zip(columns, values)
+                    )
+                    for idx, values in zip(
+                        sample_rows.index, sample_rows.itertuples(index=False)
+                    )
+                ]
+                failure = {
+                    "dimension": "consistency",
+                    "field": ",".join(map(str, columns)),
+                    "issue": "cross_field_rule_violation",
+                    "rule": rule.get("name") or rule["expression"],
+                    "affected_rows": len(failed_positions),
+                    "affected_percentage": (len(failed_positions) / total_rows) * 100.0,
+                    "samples": samples,
+                    "remediation": rule.get("remediation")
+                    or f"Ensure {rule.get('expression')}",
+                }
+                if "expected" in rule:
+                    expected = rule["expected"][failed_positions[:3]]
+                    failure.update(
+                        {
+                            "field": rule["field"],
+                            "issue": "derived_value_mismatch",
+                            "samples": [
+                                f"{sample} (expected {value or 'no category'})"
+                                for sample, value in zip(samples, expected)
+                            ],
+                            "remediation": f"Re-derive {rule['field']} from "
+                            f"{', '.join(map(str, columns[:-1]))} following the "
+                            "category precedence in allowed_values",
+                        }
+                    )
+                failures.append(failure)
+            return failures
+
         # Check date range violations
         date_pairs = [
             ("end_date", "start_date"),
@@ -582,12 +822,12 @@ class ConsistencyAssessor(DimensionAssessor):
 
         for end_col, start_col in date_pairs:
             if end_col in data.columns and start_col in data.columns:
-                mask = data[end_col].notna() & data[start_col].notna()
-                subset = data[mask]
+                subset = self._date_pair_rows(data, end_col, start_col)
                 if len(subset) > 0:
                     try:
-                        end_dates = pd.to_datetime(subset[end_col], errors="coerce")
-                        start_dates = pd.to_datetime(subset[start_col], errors="coerce")
+                        end_dates, start_dates = self._parse_date_pair(
+                            data, end_col, start_col
+                        )
                         valid_mask = end_dates.notna() & start_dates.notna()
 
                         if valid_mask.any():
@@ -678,7 +918,7 @@ class ConsistencyAssessor(DimensionAssessor):
 
         for col in data.columns:
             if data[col].dtype == "object":
-                non_null = data[col].dropna()
+                non_null = get_column_context(data).non_null(col)
                 if len(non_null) < 2:
                     continue
 
@@ -722,81 +962,10 @@ class ConsistencyAssessor(DimensionAssessor):
         Returns:
             List of failure records with details
         """
-        from collections import defaultdict
+        from ..rule_kernels import collect_rule_failures
 
-        from ...core.validation_rule import ValidationRule
-        from ..rules import execute_validation_rule
-
-        failures = []
         field_requirements = requirements.get("field_requirements", {})
-        total_rows = len(data)
-
-        # Track failures by field and rule
-        failure_tracking = defaultdict(
-            lambda: defaultdict(lambda: {"count": 0, "samples": [], "row_indices": []})
-        )
-
-        for column in data.columns:
-            if column not in field_requirements:
-                continue
-
-            field_config = field_requirements[column]
-            if not isinstance(field_config, dict):
-                continue
-
-            validation_rules = field_config.get("validation_rules", [])
-            if not validation_rules:
-                continue
-
-            # Get consistency rules for this field (all severities for logging)
-            consistency_rules = [
-                r
-                for r in validation_rules
-                if isinstance(r, ValidationRule) and r.dimension == "consistency"
-            ]
-
-            if not consistency_rules:
-                continue
-
-            # Execute each rule and track failures
-            series = data[column].dropna()
-            for idx, value in series.items():
-                for rule in consistency_rules:
-                    if not execute_validation_rule(value, rule, field_config):
-                        # Track failure
-                        rule_key = f"{rule.rule_type}_{rule.severity.value}"
-                        failure_tracking[column][rule_key]["count"] += 1
-
-                        if len(failure_tracking[column][rule_key]["samples"]) < 3:
-                            failure_tracking[column][rule_key]["samples"].append(
-                                str(value)[:50]
-                            )
-                        failure_tracking[column][rule_key]["row_indices"].append(idx)
-
-        # Convert tracking to failure records
-        for field_name, rule_failures in failure_tracking.items():
-            for rule_key, failure_info in rule_failures.items():
-                if failure_info["count"] > 0:
-                    # Extract rule type and severity from key
-                    parts = rule_key.rsplit("_", 1)
-                    rule_type = parts[0] if len(parts) > 1 else rule_key
-                    severity = parts[1] if len(parts) > 1 else "CRITICAL"
-
-                    failures.append(
-                        {
-                            "dimension": "consistency",
-                            "field": field_name,
-                            "issue": f"{rule_type}_failed",
-                            "severity": severity,
-                            "affected_rows": failure_info["count"],
-                            "affected_percentage": (failure_info["count"] / total_rows)
-                            * 100.0,
-                            "samples": failure_info["samples"],
-                            "remediation": f"Fix {field_name} to pass {rule_type} validation ({severity} severity)",
-                        }
-                    )
-
-        return failures
+        return collect_rule_failures(data, field_requirements, "consistency")
 
     def _has_validation_rules_format(self, field_requirements: dict[str, Any]) -> bool:
         """Check if field_requirements use new validation_rules format.
@@ -828,51 +997,6 @@ class ConsistencyAssessor(DimensionAssessor):
         Returns:
             Consistency score (0.0 to 20.0)
         """
-        from ...core.severity import Severity
-        from ...core.validation_rule import ValidationRule
-        from ..rules import execute_validation_rule
-
-        total_critical_checks = 0
-        failed_critical_checks = 0
-
-        # Process each field
-        for column in data.columns:
-            if column not in field_requirements:
-                continue
-
-            field_config = field_requirements[column]
-            if not isinstance(field_config, dict):
-                continue
-
-            validation_rules = field_config.get("validation_rules", [])
-            if not validation_rules:
-                continue
-
-            # Filter to only CRITICAL rules for consistency dimension
-            critical_rules = [
-                r
-                for r in validation_rules
-                if isinstance(r, ValidationRule)
-                and r.dimension == "consistency"
-                and r.severity == Severity.CRITICAL
-            ]
-
-            if not critical_rules:
-                continue
+        from ..rule_kernels import score_critical_rules
 
-            # Execute CRITICAL consistency rules against data
-            series = data[column].dropna()
-            for value in series:
-                for rule in critical_rules:
-                    total_critical_checks += 1
-                    if not execute_validation_rule(value, rule, field_config):
-                        failed_critical_checks += 1
-
-        # Calculate score based on CRITICAL rules only
-        if total_critical_checks == 0:
-            return 20.0  # No CRITICAL rules = perfect score
-
-        success_rate = (
-            total_critical_checks - failed_critical_checks
-        ) / total_critical_checks
-        return success_rate * 20.0
+        return score_critical_rules(data, field_requirements, "consistency")
@@ -10,6 +10,7 @@ from typing import Any
 import pandas as pd
 
 from ...core.protocols import DimensionAssessor
+from ..column_context import get_column_context
 
 
 class FreshnessAssessor(DimensionAssessor):
@@ -115,15 +116,9 @@ class FreshnessAssessor(DimensionAssessor):
         if date_field not in data.columns:
             return 20.0  # Perfect score when field not found
 
-        # Parse date values in the specified field
-        series = data[date_field]
-        parsed_dates = pd.to_datetime(series, utc=True, errors="coerce")
-
-        # Convert to naive datetime to match as_of
-        try:
-            parsed_dates = parsed_dates.dt.tz_convert(None)
-        except Exception:
-            pass  # Already naive or conversion failed
+        # Parse date values in the specified field as naive datetimes to
+        # match as_of
+        parsed_dates = get_column_context(data).datetimes(date_field)
 
         # Count valid (parseable) dates
         total_valid_dates = int(parsed_dates.notna().sum())
@@ -223,13 +218,7 @@ class FreshnessAssessor(DimensionAssessor):
             }
 
         # Parse and analyze dates
-        series = data[date_field]
-        parsed_dates = pd.to_datetime(series, utc=True, errors="coerce")
-
-        try:
-            parsed_dates = parsed_dates.dt.tz_convert(None)
-        except Exception:
-            pass
+        parsed_dates = get_column_context(data).datetimes(date_field)
 
         total_valid = int(parsed_dates.notna().sum())
 
@@ -3,13 +3,240 @@
 This module contains the PlausibilityAssessor class that evaluates data plausibility
 (statistical outliers and business logic coherence) according to requirements
 defined in ADRI standards.
+
+Outlier and rare-category checks compare whole columns against IQR fences and
+category shares. By default these are estimated from the batch under test; a
+contract can instead carry baselines recorded at generation time (see
+:func:`build_plausibility_baselines`) under
+``dimension_requirements.plausibility.baselines``::
+
+    baselines:
+      min_category_share: 0.05
+      numeric:
+        amount: {q1: 120.0, q3: 480.0}
+      categorical:
+        status: {frequencies: {paid: 0.62, pending: 0.31}}
+
+Columns with a baseline are scored against it, so small or skewed batches no
+longer shift their own reference; other columns keep the batch estimate.
 """
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from ...core.protocols import DimensionAssessor
+from ..column_context import get_column_context
+
+# Values further than this many IQRs outside the quartiles are outliers
+IQR_FENCE_MULTIPLIER = 1.5
+
+# Fewest values from which a batch's own quartiles are estimated
+MIN_IQR_VALUES = 4
+
+# Categories holding less than this share of a column's values are "rare"
+RARE_CATEGORY_SHARE = 0.05
+
+
+def _rule_result(passed: int, total: int) -> dict[str, Any]:
+    return {
+        "passed": passed,
+        "total": total,
+        "pass_rate": (passed / total) if total > 0 else 1.0,
+    }
+
+
+def _count_within_fences(values: pd.Series, q1: float, q3: float) -> int | None:
+    """Count values inside the IQR fences, or None if the IQR is not positive."""
+    iqr = q3 - q1
+    if not iqr > 0:
+        return None
+    lower = q1 - IQR_FENCE_MULTIPLIER * iqr
+    upper = q3 + IQR_FENCE_MULTIPLIER * iqr
+    array = values.to_numpy()
+    return int(np.count_nonzero((array >= lower) & (array <= upper)))
+
+
+def score_statistical_outliers(
+    data: pd.DataFrame, columns: list[Any], baselines: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Count values of numeric columns inside their IQR fences.
+
+    Args:
+        data: DataFrame being assessed
+        columns: Numeric columns to check
+        baselines: Optional contract baselines; columns listed under
+            ``numeric`` use the recorded quartiles
+
+    Returns:
+        Rule result with passed, total and pass_rate
+    """
+    numeric_baselines = (baselines or {}).get("numeric") or {}
+    context = get_column_context(data)
+    passed = 0
+    total = 0
+
+    for col in columns:
+        non_null = context.non_null(col)
+        baseline = numeric_baselines.get(col)
+        if baseline:
+            q1, q3 = float(baseline["q1"]), float(baseline["q3"])
+        elif len(non_null) >= MIN_IQR_VALUES:
+            q1, q3 = non_null.quantile([0.25, 0.75]).tolist()
+        else:
+            continue
+
+        within = _count_within_fences(non_null, q1, q3)
+        if within is not None:
+            passed += within
+            total += len(non_null)
+
+    return _rule_result(passed, total)
+
+
+def score_categorical_frequency(
+    data: pd.DataFrame, columns: list[Any], baselines: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Count values of categorical columns that are not rare categories.
+
+    Args:
+        data: DataFrame being assessed
+        columns: Categorical columns to check
+        baselines: Optional contract baselines; columns listed under
+            ``categorical`` compare their values (as strings) with the recorded
+            category shares, and unseen categories count as rare
+
+    Returns:
+        Rule result with passed, total and pass_rate
+    """
+    baselines = baselines or {}
+    categorical_baselines = baselines.get("categorical") or {}
+    min_share = float(baselines.get("min_category_share", RARE_CATEGORY_SHARE))
+    context = get_column_context(data)
+    passed = 0
+    total = 0
+
+    for col in columns:
+        non_null = context.non_null(col)
+        if len(non_null) == 0:
+            continue
+
+        total += len(non_null)
+        baseline = categorical_baselines.get(col)
+        if baseline:
+            frequencies = baseline.get("frequencies") or {}
+            common = [str(k) for k, share in frequencies.items() if share >= min_share]
+            passed += int(np.count_nonzero(context.strings(col).isin(common)))
+        else:
+            counts = non_null.value_counts()
+            passed += int(counts[counts >= len(non_null) * min_share].sum())
+
+    return _rule_result(passed, total)
+
+
+def count_range_failures(values: pd.Series, min_val: Any, max_val: Any) -> int:
+    """Count values that are not numbers or fall outside [min_val, max_val].
+
+    Matches converting each value with ``float`` and comparing it with the
+    bounds: conversion errors fail, NaN passes.
+
+    Args:
+        values: Column without missing values
+        min_val: Lower bound or None
+        max_val: Upper bound or None
+
+    Returns:
+        Number of failing values
+    """
+
+    def fails(value: Any) -> bool:
+        try:
+            number = float(value)
+            return (min_val is not None and number < min_val) or (
+                max_val is not None and number > max_val
+            )
+        except Exception:
+            return True
+
+    numeric_bounds = all(
+        b is None or (isinstance(b, (int, float)) and not isinstance(b, bool))
+        for b in (min_val, max_val)
+    )
+    if (
+        numeric_bounds
+        and isinstance(values.dtype, np.dtype)
+        and values.dtype.kind in "iufb"
+    ):
+        numbers = values.to_numpy().astype(np.float64)
+        failed = np.zeros(len(numbers), dtype=bool)
+        if min_val is not None:
+            failed |= numbers < min_val
+        if max_val is not None:
+            failed |= numbers > max_val
+        return int(np.count_nonzero(failed))
+
+    from ..rule_kernels import distinct_values
+
+    distinct, codes = distinct_values(values)
+    failed = np.fromiter((fails(v) for v in distinct), dtype=bool, count=len(distinct))
+    return int(np.count_nonzero(failed[codes]))
+
+
+def build_plausibility_baselines(
+    data: pd.DataFrame, exclude_columns: list[str] | None = None
+) -> dict[str, Any]:
+    """Record reference quartiles and category shares for plausibility scoring.
+
+    Numeric columns store their quartiles when the IQR is positive; string
+    columns store the share of every category that is not rare. Key columns
+    and strictly monotonic integer columns (sequences such as ids) are
+    skipped, since new batches move past their training range by design.
+
+    Args:
+        data: Training data
+        exclude_columns: Columns to leave out, e.g. the primary key fields
+
+    Returns:
+        Baselines for ``dimension_requirements.plausibility.baselines``
+    """
+    numeric: dict[str, Any] = {}
+    categorical: dict[str, Any] = {}
+    excluded = set(exclude_columns or [])
+
+    for col in data.columns:
+        if col in excluded:
+            continue
+        series = data[col]
+        non_null = series.dropna()
+        if series.dtype in ["int64", "float64"]:
+            if len(non_null) < MIN_IQR_VALUES:
+                continue
+            if (
+                series.dtype == "int64"
+                and non_null.is_unique
+                and (
+                    non_null.is_monotonic_increasing or non_null.is_monotonic_decreasing
+                )
+            ):
+                continue
+            q1, q3 = non_null.quantile([0.25, 0.75]).tolist()
+            if q3 - q1 > 0:
+                numeric[str(col)] = {"q1": float(q1), "q3": float(q3)}
+        elif pd.api.types.is_string_dtype(series) or series.dtype == "object":
+            if len(non_null) == 0:
+                continue
+            shares = non_null.astype(str).value_counts(normalize=True)
+            common = shares[shares >= RARE_CATEGORY_SHARE]
+            categorical[str(col)] = {
+                "frequencies": {str(k): float(v) for k, v in common.items()}
+            }
+
+    return {
+        "min_category_share": RARE_CATEGORY_SHARE,
+        "numeric": numeric,
+        "categorical": categorical,
+    }
 
 
 class PlausibilityAssessor(DimensionAssessor):
@@ -64,13 +291,18 @@ class PlausibilityAssessor(DimensionAssessor):
             return 20.0  # Perfect score when no rules active
 
         # Execute plausibility rules
-        return self._assess_plausibility_with_rules(data, active_weights)
+        return self._assess_plausibility_with_rules(
+            data, active_weights, requirements.get("baselines")
+        )
 
     def _assess_plausibility_with_rules(
-        self, data: pd.DataFrame, active_weights: dict[str, float]
+        self,
+        data: pd.DataFrame,
+        active_weights: dict[str, float],
+        baselines: dict[str, Any] | None = None,
     ) -> float:
         """Assess plausibility using active rule weights."""
-        rule_results = self._execute_plausibility_rules(data, active_weights)
+        rule_results = self._execute_plausibility_rules(data, active_weights, baselines)
 
         # Calculate weighted score
         total_weight = sum(active_weights.values())
@@ -86,18 +318,25 @@ class PlausibilityAssessor(DimensionAssessor):
         return float(score)
 
     def _execute_plausibility_rules(
-        self, data: pd.DataFrame, active_weights: dict[str, float]
+        self,
+        data: pd.DataFrame,
+        active_weights: dict[str, float],
+        baselines: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Execute plausibility rules that are distinct from validity rules."""
         results = {}
 
         # Statistical outliers - IQR-based outlier detection
         if "statistical_outliers" in active_weights:
-            results["statistical_outliers"] = self._assess_statistical_outliers(data)
+            results["statistical_outliers"] = self._assess_statistical_outliers(
+                data, baselines
+            )
 
         # Categorical frequency - flag rare categories
         if "categorical_frequency" in active_weights:
-            results["categorical_frequency"] = self._assess_categorical_frequency(data)
+            results["categorical_frequency"] = self._assess_categorical_frequency(
+                data, baselines
+            )
 
         # Business logic - domain-specific rules
         if "business_logic" in active_weights:
@@ -111,65 +350,25 @@ class PlausibilityAssessor(DimensionAssessor):
 
         return results
 
-    def _assess_statistical_outliers(self, data: pd.DataFrame) -> dict[str, Any]:
+    def _assess_statistical_outliers(
+        self, data: pd.DataFrame, baselines: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         """Assess statistical outliers using IQR method (distinct from validity bounds)."""
-        passed = 0
-        total = 0
-
-        for col in data.columns:
-            series = data[col]
-            if series.dtype in ["int64", "float64"]:
-                non_null = series.dropna()
-                if len(non_null) < 4:  # Need at least 4 values for IQR
-                    continue
-
-                q1 = non_null.quantile(0.25)
-                q3 = non_null.quantile(0.75)
-                iqr = q3 - q1
-
-                if iqr > 0:  # Avoid division by zero
-                    lower_bound = q1 - 1.5 * iqr
-                    upper_bound = q3 + 1.5 * iqr
+        columns = [
+            col for col in data.columns if data[col].dtype in ["int64", "float64"]
+        ]
+        return score_statistical_outliers(data, columns, baselines)
 
-                    for value in non_null:
-                        total += 1
-                        if lower_bound <= value <= upper_bound:
-                            passed += 1
-
-        return {
-            "passed": passed,
-            "total": total,
-            "pass_rate": (passed / total) if total > 0 else 1.0,
-        }
-
-    def _assess_categorical_frequency(self, data: pd.DataFrame) -> dict[str, Any]:
+    def _assess_categorical_frequency(
+        self, data: pd.DataFrame, baselines: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         """Assess categorical frequency - flag rare categories."""
-        passed = 0
-        total = 0
-
-        for col in data.columns:
-            series = data[col]
-            if (
-                pd.api.types.is_string_dtype(series) or series.dtype == "object"
-            ):  # String/categorical columns
-                non_null = series.dropna()
-                if len(non_null) == 0:
-                    continue
-
-                # Categories appearing in <5% of data are considered "rare"
-                value_counts = non_null.value_counts()
-                threshold = len(non_null) * 0.05
-
-                for value in non_null:
-                    total += 1
-                    if value_counts[value] >= threshold:
-                        passed += 1
-
-        return {
-            "passed": passed,
-            "total": total,
-            "pass_rate": (passed / total) if total > 0 else 1.0,
-        }
+        columns = [
+            col
+            for col in data.columns
+            if pd.api.types.is_string_dtype(data[col]) or data[col].dtype == "object"
+        ]
+        return score_categorical_frequency(data, columns, baselines)
 
     def _assess_business_logic(self, data: pd.DataFrame) -> dict[str, Any]:
         """Assess business logic rules (placeholder - can be extended with domain rules)."""
@@ -222,7 +421,9 @@ class PlausibilityAssessor(DimensionAssessor):
             }
 
         # Execute rules and build breakdown
-        rule_results = self._execute_plausibility_rules(data, active_weights)
+        rule_results = self._execute_plausibility_rules(
+            data, active_weights, requirements.get("baselines")
+        )
 
         # Build rule counts for breakdown
         rule_counts = {
@@ -279,43 +480,25 @@ class PlausibilityAssessor(DimensionAssessor):
         """
         total_checks = 0
         failed_checks = 0
+        context = get_column_context(data)
 
         outlier_detection = plausibility_config.get("outlier_detection", {})
         business_rules = plausibility_config.get("business_rules", {})
 
-        # Check business rules
-        for field, rules in business_rules.items():
-            if field in data.columns:
-                min_val = rules.get("min")
-                max_val = rules.get("max")
-                for value in data[field].dropna():
-                    total_checks += 1
-                    try:
-                        numeric_value = float(value)
-                        if min_val is not None and numeric_value < min_val:
-                            failed_checks += 1
-                        elif max_val is not None and numeric_value > max_val:
-                            failed_checks += 1
-                    except Exception:
-                        failed_checks += 1
-
-        # Check outlier detection rules
-        for field, rules in outlier_detection.items():
-            if field in data.columns:
-                method = rules.get("method")
-                if method == "range":
-                    min_val = rules.get("min")
-                    max_val = rules.get("max")
-                    for value in data[field].dropna():
-                        total_checks += 1
-                        try:
-                            numeric_value = float(value)
-                            if min_val is not None and numeric_value < min_val:
-                                failed_checks += 1
-                            elif max_val is not None and numeric_value > max_val:
-                                failed_checks += 1
-                        except Exception:
-                            failed_checks += 1
+        # Business rules and range-method outlier rules both bound values
+        range_rules = list(business_rules.items()) + [
+            (field, rules)
+            for field, rules in outlier_detection.items()
+            if field in data.columns and rules.get("method") == "range"
+        ]
+        for field, rules in range_rules:
+            if field not in data.columns:
+                continue
+            values = context.non_null(field)
+            total_checks += len(values)
+            failed_checks += count_range_failures(
+                values, rules.get("min"), rules.get("max")
+            )
 
         if total_checks > 0:
             success_rate = (total_checks - failed_checks) / total_checks
@@ -6,11 +6,15 @@ defined in ADRI standards.
 """
 
 from collections import defaultdict
+from contextlib import nullcontext
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from ...core.protocols import DimensionAssessor
+from ..column_context import get_column_context
+from ...core.timing import timing_span
 from ..rules import (
     check_allowed_values,
     check_date_bounds,
@@ -20,6 +24,25 @@ from ..rules import (
     check_length_bounds,
 )
 
+# Validity rule types in evaluation order: (rule key, triggering field_req keys,
+# check). A value only reaches a rule if it passed every earlier applicable rule.
+# A trigger of None means the rule always applies.
+_VALIDITY_RULE_CHECKS = [
+    ("type", None, check_field_type),
+    ("allowed_values", ("allowed_values",), check_allowed_values),
+    ("length_bounds", ("min_length", "max_length"), check_length_bounds),
+    ("pattern", ("pattern",), check_field_pattern),
+    ("numeric_bounds", ("min_value", "max_value"), check_field_range),
+    (
+        "date_bounds",
+        ("after_date", "before_date", "after_datetime", "before_datetime"),
+        check_date_bounds,
+    ),
+]
+
+# Rule types evaluated with a column-level kernel (see rule_kernels)
+_COLUMN_RULE_CHECKS = ("length_bounds", "pattern", "date_bounds")
+
 
 class ValidityAssessor(DimensionAssessor):
     """Assesses data validity (format correctness and type compliance).
@@ -78,18 +101,19 @@ class ValidityAssessor(DimensionAssessor):
         """Perform basic validity assessment without field requirements."""
         total_checks = 0
         failed_checks = 0
+        context = get_column_context(data)
 
         for column in data.columns:
             column_str = str(column).lower()
 
             if "email" in column_str:
-                for value in data[column].dropna():
+                for value in context.non_null(column):
                     total_checks += 1
                     if not self._is_valid_email(str(value)):
                         failed_checks += 1
 
             elif "age" in column_str:
-                for value in data[column].dropna():
+                for value in context.non_null(column):
                     total_checks += 1
                     try:
                         age = float(value)
@@ -110,30 +134,19 @@ class ValidityAssessor(DimensionAssessor):
         """Perform simple validity assessment using field requirements."""
         total_checks = 0
         failed_checks = 0
+        context = get_column_context(data)
 
         for column in data.columns:
             if column in field_requirements:
                 field_req = field_requirements[column]
-                for value in data[column].dropna():
-                    total_checks += 1
-                    if not check_field_type(value, field_req):
-                        failed_checks += 1
-                        continue
-                    if not check_allowed_values(value, field_req):
-                        failed_checks += 1
-                        continue
-                    if not check_length_bounds(value, field_req):
-                        failed_checks += 1
-                        continue
-                    if not check_field_pattern(value, field_req):
-                        failed_checks += 1
-                        continue
-                    if not check_field_range(value, field_req):
-                        failed_checks += 1
-                        continue
-                    if not check_date_bounds(value, field_req):
-                        failed_checks += 1
-                        continue
+                values = context.non_null(column)
+                total_checks += len(values)
+                rule_counts = self._run_rule_cascade(
+                    column, values, field_req, present_only=False
+                )
+                failed_checks += sum(
+                    total - passed for total, passed in rule_counts.values()
+                )
 
         if total_checks == 0:
             return 20.0
@@ -199,74 +212,124 @@ class ValidityAssessor(DimensionAssessor):
             lambda: {rk: {"passed": 0, "total": 0} for rk in RULE_KEYS}
         )
 
+        context = get_column_context(data)
         for column in data.columns:
             if column not in field_requirements:
                 continue
             field_req = field_requirements[column]
-            series = data[column].dropna()
+            values = context.non_null(column)
 
-            for value in series:
-                # Type check (always performed)
-                counts["type"]["total"] += 1
-                per_field_counts[column]["type"]["total"] += 1
-                if not check_field_type(value, field_req):
-                    continue
-                counts["type"]["passed"] += 1
-                per_field_counts[column]["type"]["passed"] += 1
-
-                # Allowed values (only if rule present)
-                if "allowed_values" in field_req:
-                    counts["allowed_values"]["total"] += 1
-                    per_field_counts[column]["allowed_values"]["total"] += 1
-                    if not check_allowed_values(value, field_req):
-                        continue
-                    counts["allowed_values"]["passed"] += 1
-                    per_field_counts[column]["allowed_values"]["passed"] += 1
-
-                # Length bounds (only if present)
-                if ("min_length" in field_req) or ("max_length" in field_req):
-                    counts["length_bounds"]["total"] += 1
-                    per_field_counts[column]["length_bounds"]["total"] += 1
-                    if not check_length_bounds(value, field_req):
-                        continue
-                    counts["length_bounds"]["passed"] += 1
-                    per_field_counts[column]["length_bounds"]["passed"] += 1
-
-                # Pattern (only if present)
-                if "pattern" in field_req:
-                    counts["pattern"]["total"] += 1
-                    per_field_counts[column]["pattern"]["total"] += 1
-                    if not check_field_pattern(value, field_req):
-                        continue
-                    counts["pattern"]["passed"] += 1
-                    per_field_counts[column]["pattern"]["passed"] += 1
-
-                # Numeric bounds (only if present)
-                if ("min_value" in field_req) or ("max_value" in field_req):
-                    counts["numeric_bounds"]["total"] += 1
-                    per_field_counts[column]["numeric_bounds"]["total"] += 1
-                    if not check_field_range(value, field_req):
-                        continue
-                    counts["numeric_bounds"]["passed"] += 1
-                    per_field_counts[column]["numeric_bounds"]["passed"] += 1
-
-                # Date bounds (only if present)
-                date_keys = [
-                    "after_date",
-                    "before_date",
-                    "after_datetime",
-                    "before_datetime",
-                ]
-                if any(k in field_req for k in date_keys):
-                    counts["date_bounds"]["total"] += 1
-                    per_field_counts[column]["date_bounds"]["total"] += 1
-                    if not check_date_bounds(value, field_req):
-                        continue
-                    counts["date_bounds"]["passed"] += 1
-                    per_field_counts[column]["date_bounds"]["passed"] += 1
+            rule_counts = self._run_rule_cascade(
+                column, values, field_req, present_only=True
+            )
+            for rule_key, (total, passed) in rule_counts.items():
+                counts[rule_key]["total"] += total
+                counts[rule_key]["passed"] += passed
+                per_field_counts[column][rule_key]["total"] += total
+                per_field_counts[column][rule_key]["passed"] += passed
 
         return counts, per_field_counts
 
+    def _run_rule_cascade(
+        self,
+        column: Any,
+        values: pd.Series,
+        field_req: dict[str, Any],
+        present_only: bool,
+    ) -> dict[str, tuple[int, int]]:
+        """Run validity rule types over a column's non-null values in order.
+
+        Each rule type only sees the values that passed the previous ones, which
+        matches the per-value short-circuit of the original checks while letting
+        every rule type be timed separately per field.
+
+        Args:
+            column: Column name (used for timing spans)
+            values: Non-null values of the column
+            field_req: Field requirements for the column
+            present_only: Only run rule types whose keys are present in field_req
+
+        Returns:
+            Mapping of rule type to (total, passed) counts
+        """
+        rule_keys, first_failed = self._first_failed_rules(
+            column, values, field_req, present_only
+        )
+        # reached[i]: rows that passed every rule before rule i
+        reached = np.bincount(first_failed, minlength=len(rule_keys) + 1)[
+            ::-1
+        ].cumsum()[::-1]
+
+        rule_counts: dict[str, tuple[int, int]] = {}
+        for i, rule_key in enumerate(rule_keys):
+            if not reached[i]:
+                break
+            rule_counts[rule_key] = (int(reached[i]), int(reached[i + 1]))
+        return rule_counts
+
+    def _first_failed_rules(
+        self,
+        column: Any,
+        values: pd.Series,
+        field_req: dict[str, Any],
+        present_only: bool,
+        timed: bool = True,
+    ) -> tuple[list[str], np.ndarray]:
+        """Find the first failing validity rule type of every value.
+
+        Low-cardinality columns are evaluated once per distinct value and the
+        outcome is broadcast back to the rows, so counts and row positions are
+        identical to a per-row evaluation.
+
+        Args:
+            column: Column name (used for timing spans)
+            values: Non-null values of the column
+            field_req: Field requirements for the column
+            present_only: Only run rule types whose keys are present in field_req
+            timed: Record a timing span per rule type
+
+        Returns:
+            (applied rule types in order, per-row index into them of the first
+            failed rule, or their count if the value passed all of them)
+        """
+        from ..rule_kernels import compile_field_check, distinct_values
+
+        rules = [
+            (rule_key, check)
+            for rule_key, trigger_keys, check in _VALIDITY_RULE_CHECKS
+            if not present_only
+            or trigger_keys is None
+            or any(k in field_req for k in trigger_keys)
+        ]
+        distinct, codes = distinct_values(values)
+        first_failed = np.full(len(distinct), len(rules), dtype=np.intp)
+        remaining = np.arange(len(distinct))
+
+        for i, (rule_key, check) in enumerate(rules):
+            if not len(remaining):
+                break
+            span = (
+                timing_span("rules", "validity", str(column), rule_key)
+                if timed
+                else nullcontext()
+            )
+            with span:
+                if rule_key in _COLUMN_RULE_CHECKS:
+                    kernel = compile_field_check(rule_key, field_req)
+                    passed = kernel(
+                        pd.Series([distinct[j] for j in remaining], dtype=object)
+                    )
+                else:
+                    passed = np.fromiter(
+                        (bool(check(distinct[j], field_req)) for j in remaining),
+                        dtype=bool,
+                        count=len(remaining),
+                    )
+            first_failed[remaining[~passed]] = i
+            remaining = remaining[passed]
+
+        return [rule_key for rule_key, _ in rules], first_failed[codes]
+
     def _apply_global_rule_weights(
         self,
         counts: dict[str, dict[str, int]],
@@ -394,100 +457,36 @@ class ValidityAssessor(DimensionAssessor):
             # Extract failures from validation_rules format
             return self._get_validation_rules_failures(data, field_requirements)
 
-        # Track failures by field and rule type (old format)
-        failure_tracking = defaultdict(
-            lambda: defaultdict(lambda: {"count": 0, "samples": [], "row_indices": []})
-        )
+        # Track failures by field and rule type (old format); nulls are left
+        # to the completeness dimension
+        failure_tracking: dict[Any, dict[str, dict[str, Any]]] = {}
+        context = get_column_context(data)
 
         for column in data.columns:
             if column not in field_requirements:
                 continue
 
-            field_req = field_requirements[column]
-            series = data[column]
-
-            for idx, value in series.items():
-                # Skip null values (handled by completeness dimension)
-                if pd.isna(value):
-                    continue
-
-                # Check each validation rule
-                # 1. Type check
-                if not check_field_type(value, field_req):
-                    failure_tracking[column]["type"]["count"] += 1
-                    if len(failure_tracking[column]["type"]["samples"]) < 3:
-                        failure_tracking[column]["type"]["samples"].append(
-                            str(value)[:50]
-                        )
-                    failure_tracking[column]["type"]["row_indices"].append(idx)
-                    continue
-
-                # 2. Allowed values
-                if "allowed_values" in field_req and not check_allowed_values(
-                    value, field_req
-                ):
-                    failure_tracking[column]["allowed_values"]["count"] += 1
-                    if len(failure_tracking[column]["allowed_values"]["samples"]) < 3:
-                        failure_tracking[column]["allowed_values"]["samples"].append(
-                            str(value)[:50]
-                        )
-                    failure_tracking[column]["allowed_values"]["row_indices"].append(
-                        idx
-                    )
-                    continue
-
-                # 3. Length bounds
-                if (
-                    ("min_length" in field_req) or ("max_length" in field_req)
-                ) and not check_length_bounds(value, field_req):
-                    failure_tracking[column]["length_bounds"]["count"] += 1
-                    if len(failure_tracking[column]["length_bounds"]["samples"]) < 3:
-                        failure_tracking[column]["length_bounds"]["samples"].append(
-                            str(value)[:50]
-                        )
-                    failure_tracking[column]["length_bounds"]["row_indices"].append(idx)
-                    continue
-
-                # 4. Pattern
-                if "pattern" in field_req and not check_field_pattern(value, field_req):
-                    failure_tracking[column]["pattern"]["count"] += 1
-                    if len(failure_tracking[column]["pattern"]["samples"]) < 3:
-                        failure_tracking[column]["pattern"]["samples"].append(
-                            str(value)[:50]
-                        )
-                    failure_tracking[column]["pattern"]["row_indices"].append(idx)
-                    continue
-
-                # 5. Numeric bounds
-                if (
-                    ("min_value" in field_req) or ("max_value" in field_req)
-                ) and not check_field_range(value, field_req):
-                    failure_tracking[column]["numeric_bounds"]["count"] += 1
-                    if len(failure_tracking[column]["numeric_bounds"]["samples"]) < 3:
-                        failure_tracking[column]["numeric_bounds"]["samples"].append(
-                            str(value)[:50]
-                        )
-                    failure_tracking[column]["numeric_bounds"]["row_indices"].append(
-                        idx
-                    )
-                    continue
+            values = context.non_null(column)
+            rule_keys, first_failed = self._first_failed_rules(
+                column, values, field_requirements[column], True, timed=False
+            )
+            failed_rows = np.flatnonzero(first_failed < len(rule_keys))
+            if not len(failed_rows):
+                continue
 
-                # 6. Date bounds
-                date_keys = [
-                    "after_date",
-                    "before_date",
-                    "after_datetime",
-                    "before_datetime",
-                ]
-                if any(k in field_req for k in date_keys) and not check_date_bounds(
-                    value, field_req
-                ):
-                    failure_tracking[column]["date_bounds"]["count"] += 1
-                    if len(failure_tracking[column]["date_bounds"]["samples"]) < 3:
-                        failure_tracking[column]["date_bounds"]["samples"].append(
-                            str(value)[:50]
-                        )
-                    failure_tracking[column]["date_bounds"]["row_indices"].append(idx)
+            # Rule types in order of their first failing row
+            failed_rules = first_failed[failed_rows]
+            _, first_rows = np.unique(failed_rules, return_index=True)
+            column_tracking = failure_tracking.setdefault(column, {})
+            for rule_index in failed_rules[np.sort(first_rows)]:
+                rows = failed_rows[failed_rules == rule_index]
+                column_tracking[rule_keys[rule_index]] = {
+                    "count": len(rows),
+                    "samples": [
+                        str(value)[:50] for value in values.iloc[rows[:3]].tolist()
+                    ],
+                    "row_indices": values.index[rows].tolist(),
+                }
 
         # Convert tracking to failure records
         total_rows = len(data)
@@ -526,82 +525,9 @@ class ValidityAssessor(DimensionAssessor):
         Returns:
             List of failure records with details
         """
-        from ...core.validation_rule import ValidationRule
-        from ..rules import execute_validation_rule
-
-        failures = []
-        total_rows = len(data)
-
-        # Track failures by field and rule
-        failure_tracking = defaultdict(
-            lambda: defaultdict(lambda: {"count": 0, "samples": [], "row_indices": []})
-        )
-
-        for column in data.columns:
-            if column not in field_requirements:
-                continue
-
-            field_config = field_requirements[column]
-            if not isinstance(field_config, dict):
-                continue
-
-            validation_rules = field_config.get("validation_rules", [])
-            if not validation_rules:
-                continue
-
-            # Get validity rules for this field (all severities for logging)
-            validity_rules = [
-                r
-                for r in validation_rules
-                if isinstance(r, ValidationRule) and r.dimension == "validity"
-            ]
-
-            if not validity_rules:
-                continue
-
-            # Execute each rule and track failures
-            series = data[column]
-            for idx, value in series.items():
-                # Skip null values (completeness dimension)
-                if pd.isna(value):
-                    continue
-
-                for rule in validity_rules:
-                    if not execute_validation_rule(value, rule, field_config):
-                        # Track failure
-                        rule_key = f"{rule.rule_type}_{rule.severity.value}"
-                        failure_tracking[column][rule_key]["count"] += 1
-
-                        if len(failure_tracking[column][rule_key]["samples"]) < 3:
-                            failure_tracking[column][rule_key]["samples"].append(
-                                str(value)[:50]
-                            )
-                        failure_tracking[column][rule_key]["row_indices"].append(idx)
-
-        # Convert tracking to failure records
-        for field_name, rule_failures in failure_tracking.items():
-            for rule_key, failure_info in rule_failures.items():
-                if failure_info["count"] > 0:
-                    # Extract rule type and severity from key
-                    parts = rule_key.rsplit("_", 1)
-                    rule_type = parts[0] if len(parts) > 1 else rule_key
-                    severity = parts[1] if len(parts) > 1 else "CRITICAL"
-
-                    failures.append(
-                        {
-                            "dimension": "validity",
-                            "field": field_name,
-                            "issue": f"{rule_type}_failed",
-                            "severity": severity,
-                            "affected_rows": failure_info["count"],
-                            "affected_percentage": (failure_info["count"] / total_rows)
-                            * 100.0,
-                            "samples": failure_info["samples"],
-                            "remediation": f"Fix {field_name} to pass {rule_type} validation ({severity} severity)",
-                        }
-                    )
+        from ..rule_kernels import collect_rule_failures
 
-        return failures
+        return collect_rule_failures(data, field_requirements, "validity")
 
     def _get_remediation_text(
         self, rule_type: str, field_name: str, field_req: dict[str, Any]
@@ -676,51 +602,6 @@ class ValidityAssessor(DimensionAssessor):
         Returns:
             Validity score (0.0 to 20.0)
         """
-        from ...core.severity import Severity
-        from ...core.validation_rule import ValidationRule
-        from ..rules import execute_validation_rule
+        from ..rule_kernels import score_critical_rules
 
-        total_critical_checks = 0
-        failed_critical_checks = 0
-
-        # Process each field
-        for column in data.columns:
-            if column not in field_requirements:
-                continue
-
-            field_config = field_requirements[column]
-            if not isinstance(field_config, dict):
-                continue
-
-            validation_rules = field_config.get("validation_rules", [])
-            if not validation_rules:
-                continue
-
-            # Filter to only CRITICAL rules for this dimension
-            critical_rules = [
-                r
-                for r in validation_rules
-                if isinstance(r, ValidationRule)
-                and r.dimension == "validity"
-                and r.severity == Severity.CRITICAL
-            ]
-
-            if not critical_rules:
-                continue
-
-            # Execute CRITICAL rules against data
-            series = data[column].dropna()
-            for value in series:
-                for rule in critical_rules:
-                    total_critical_checks += 1
-                    if not execute_validation_rule(value, rule, field_config):
-                        failed_critical_checks += 1
-
-        # Calculate score based on CRITICAL rules only
-        if total_critical_checks == 0:
-            return 20.0  # No CRITICAL rules = perfect score
-
-        success_rate = (
-            total_critical_checks - failed_critical_checks
-        ) / total_critical_checks
-        return success_rate * 20.0
+        return score_critical_rules(data, field_requirements, "validity")
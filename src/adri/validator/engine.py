@@ -18,7 +18,24 @@ from typing import Any
 import pandas as pd
 
 # Clean imports for new modular architecture
+from ..core.timing import (
+    end_span,
+    get_timing_recorder,
+    record_timings,
+    start_span,
+    timing_span,
+    timings_enabled,
+)
+from ..core.metrics import record_assessment
+from ..core.tracing import (
+    ATTR_CONTRACT,
+    ATTR_PASSED,
+    ATTR_ROW_COUNT,
+    ATTR_SCORE,
+    get_tracer,
+)
 from ..logging.local import CSVAuditLogger
+from .column_context import column_context_scope, get_column_context
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
@@ -819,6 +836,9 @@ class DataQualityAssessor:
             config is not None
         )  # Track if config was explicitly provided
 
+        # Opt-in timing spans (config "timings: true" or ADRI_TIMINGS=1)
+        self.collect_timings = timings_enabled(self.config)
+
         # Skip audit config synthesis if explicit empty config was provided
         if self._explicit_config and not self.config:
             # Explicit empty config - disable audit logging entirely
@@ -889,7 +909,40 @@ class DataQualityAssessor:
             return False
 
     def assess(self, data, standard_path=None):
-        """Assess data quality using pipeline architecture with audit logging."""
+        """Assess data quality using pipeline architecture with audit logging.
+
+        When timings are enabled, per-phase, per-dimension and per-rule spans
+        are stored in ``result.metadata["timings"]`` (milliseconds).
+
+        The call is wrapped in an ``adri.assess`` span on the configured tracer
+        (see :mod:`adri.core.tracing`) and counted in the process metrics
+        registry (see :mod:`adri.core.metrics`).
+        """
+        contract = Path(standard_path).stem if standard_path else None
+        row_count = len(data) if hasattr(data, "__len__") else None
+        attributes = {ATTR_CONTRACT: contract, ATTR_ROW_COUNT: row_count}
+        started = time.perf_counter()
+        with (
+            get_tracer().start_span("adri.assess", attributes) as span,
+            column_context_scope(),
+        ):
+            if not self.collect_timings or get_timing_recorder() is not None:
+                result = self._assess(data, standard_path)
+            else:
+                with record_timings():
+                    result = self._assess(data, standard_path)
+            span.set_attribute(ATTR_SCORE, result.overall_score)
+            span.set_attribute(ATTR_PASSED, result.passed)
+        record_assessment(
+            contract or "none",
+            row_count or 0,
+            time.perf_counter() - started,
+            result.passed,
+        )
+        return result
+
+    def _assess(self, data, standard_path=None):
+        """Run the assessment; see :meth:`assess`."""
         # Start timing
         start_time = time.time()
 
@@ -941,6 +994,7 @@ class DataQualityAssessor:
 
         # Run assessment using pipeline
         schema_result = None  # Initialize schema result
+        schema_span = start_span()
 
         if standard_path:
             # Load standard for schema validation - use lenient YAML loading for schema check
@@ -1135,6 +1189,8 @@ class DataQualityAssessor:
                     diagnostic_log.append(f"Traceback: {traceback.format_exc()}")
                 schema_result = None
 
+        end_span(schema_span, "phases", "schema_validation")
+
         # Continue with standard assessment flow
         if standard_path:
             # Load standard and use pipeline
@@ -1147,7 +1203,8 @@ class DataQualityAssessor:
                         f"Standard file exists: {os.path.exists(standard_path)}"
                     )
 
-                standard_dict = load_contract(standard_path)
+                with timing_span("phases", "contract_load"):
+                    standard_dict = load_contract(standard_path)
 
                 if _should_enable_debug():
                     diagnostic_log.append("Standard loaded successfully")
@@ -1219,6 +1276,10 @@ class DataQualityAssessor:
         if schema_result is not None:
             result.metadata["schema_validation"] = schema_result.to_dict()
 
+        timings = get_timing_recorder()
+        if timings is not None:
+            result.metadata["timings"] = timings.to_dict()
+
         # Log dimension scores (debug mode only)
         if _should_enable_debug():
             diagnostic_log.append("=== DIMENSION SCORES ===")
@@ -1285,16 +1346,27 @@ class DataQualityAssessor:
             }
 
             # Prepare failed checks (extract from dimension assessors)
-            failed_checks = self._collect_validation_failures(data, result)
+            with timing_span("phases", "failure_collection"):
+                failed_checks = self._collect_validation_failures(data, result)
+
+            # Refresh timings so the audit record includes failure collection;
+            # the audit write itself can only be reported on the result.
+            timings = get_timing_recorder()
+            if timings is not None:
+                result.metadata["timings"] = timings.to_dict()
 
             # Log the assessment (using pre-generated assessment_id from result)
-            audit_record = self.audit_logger.log_assessment(
-                assessment_result=result,
-                execution_context=execution_context,
-                data_info=data_info,
-                performance_metrics=performance_metrics,
-                failed_checks=failed_checks if failed_checks else None,
-            )
+            with timing_span("phases", "audit_write"):
+                audit_record = self.audit_logger.log_assessment(
+                    assessment_result=result,
+                    execution_context=execution_context,
+                    data_info=data_info,
+                    performance_metrics=performance_metrics,
+                    failed_checks=failed_checks if failed_checks else None,
+                )
+
+            if timings is not None:
+                result.metadata["timings"] = timings.to_dict()
 
             # Note: assessment_id is now generated at AssessmentResult creation time
             # and passed to the logger, ensuring it's available for workflow logging
@@ -1478,11 +1550,13 @@ class DataQualityAssessor:
 
             # Collect failures from Consistency dimension
             try:
+                from .derivations import derived_field_specs
                 from .dimensions.consistency import ConsistencyAssessor
 
                 consistency_assessor = ConsistencyAssessor()
                 consistency_requirements = {
                     "record_identification": standard_wrapper.get_record_identification(),
+                    "derived_fields": derived_field_specs(field_reqs),
                     **dim_reqs.get("consistency", {}),
                 }
                 consistency_failures = consistency_assessor.get_validation_failures(
@@ -2433,11 +2507,7 @@ class ValidationEngine:
             }
             return 20.0
 
-        parsed = pd.to_datetime(series, utc=True, errors="coerce")
-        try:
-            parsed = parsed.dt.tz_convert(None)
-        except Exception:  # noqa: E722
-            pass
+        parsed = get_column_context(data).datetimes(date_field)
         total = int(parsed.notna().sum())
         if total <= 0:
             self._explain["freshness"] = {
@@ -2544,6 +2614,9 @@ class ValidationEngine:
                 if isinstance(scoring_cfg, dict)
                 else {}
             )
+            baselines = (
+                plaus_cfg.get("baselines") if isinstance(plaus_cfg, dict) else None
+            )
         except Exception:  # noqa: E722
             return self._assess_plausibility(data)
 
@@ -2570,7 +2643,7 @@ class ValidationEngine:
             return 20.0
 
         # Execute plausibility rules with distinct logic from validity
-        rule_results = self._execute_plausibility_rules(data, active_weights)
+        rule_results = self._execute_plausibility_rules(data, active_weights, baselines)
 
         # Calculate weighted score
         total_weight = sum(active_weights.values())
@@ -2613,7 +2686,10 @@ class ValidationEngine:
         return float(score)
 
     def _execute_plausibility_rules(
-        self, data: pd.DataFrame, active_weights: dict[str, float]
+        self,
+        data: pd.DataFrame,
+        active_weights: dict[str, float],
+        baselines: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Execute plausibility rules that are distinct from validity rules."""
         results = {}
@@ -2621,12 +2697,16 @@ class ValidationEngine:
         # Statistical outliers - IQR-based outlier detection (different from
         # validity bounds)
         if "statistical_outliers" in active_weights:
-            results["statistical_outliers"] = self._assess_statistical_outliers(data)
+            results["statistical_outliers"] = self._assess_statistical_outliers(
+                data, baselines
+            )
 
         # Categorical frequency - flag rare categories (different from validity
         # allowed_values)
         if "categorical_frequency" in active_weights:
-            results["categorical_frequency"] = self._assess_categorical_frequency(data)
+            results["categorical_frequency"] = self._assess_categorical_frequency(
+                data, baselines
+            )
 
         # Business logic - domain-specific rules (placeholder for future)
         if "business_logic" in active_weights:
@@ -2641,64 +2721,25 @@ class ValidationEngine:
 
         return results
 
-    def _assess_statistical_outliers(self, data: pd.DataFrame) -> dict[str, Any]:
+    def _assess_statistical_outliers(
+        self, data: pd.DataFrame, baselines: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         """Assess statistical outliers using IQR method (distinct from validity bounds)."""
-        passed = 0
-        total = 0
-
-        for col in data.columns:
-            series = data[col]
-            if series.dtype in ["int64", "float64"]:
-                non_null = series.dropna()
-                if len(non_null) < 4:  # Need at least 4 values for IQR
-                    continue
-
-                q1 = non_null.quantile(0.25)
-                q3 = non_null.quantile(0.75)
-                iqr = q3 - q1
-
-                if iqr > 0:  # Avoid division by zero
-                    lower_bound = q1 - 1.5 * iqr
-                    upper_bound = q3 + 1.5 * iqr
+        from .dimensions.plausibility import score_statistical_outliers
 
-                    for value in non_null:
-                        total += 1
-                        if lower_bound <= value <= upper_bound:
-                            passed += 1
-
-        return {
-            "passed": passed,
-            "total": total,
-            "pass_rate": (passed / total) if total > 0 else 1.0,
-        }
+        columns = [
+            col for col in data.columns if data[col].dtype in ["int64", "float64"]
+        ]
+        return score_statistical_outliers(data, columns, baselines)
 
-    def _assess_categorical_frequency(self, data: pd.DataFrame) -> dict[str, Any]:
+    def _assess_categorical_frequency(
+        self, data: pd.DataFrame, baselines: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         """Assess categorical frequency - flag rare categories (distinct from validity allowed_values)."""
-        passed = 0
-        total = 0
-
-        for col in data.columns:
-            series = data[col]
-            if series.dtype == "object":  # String/categorical columns
-                non_null = series.dropna()
-                if len(non_null) == 0:
-                    continue
-
-                # Calculate frequency threshold (categories appearing in <5% of data are
-                # "rare")
-                value_counts = non_null.value_counts()
-                threshold = len(non_null) * 0.05
-
-                for value in non_null:
-                    total += 1
-                    if value_counts[value] >= threshold:
-                        passed += 1
+        from .dimensions.plausibility import score_categorical_frequency
 
-        return {
-            "passed": passed,
-            "total": total,
-            "pass_rate": (passed / total) if total > 0 else 1.0,
-        }
+        columns = [col for col in data.columns if data[col].dtype == "object"]
+        return score_categorical_frequency(data, columns, baselines)
 
     def _assess_business_logic(self, data: pd.DataFrame) -> dict[str, Any]:
         """Assess business logic rules (placeholder - could be extended with domain rules)."""
@@ -2810,45 +2851,28 @@ class ValidationEngine:
         """Public method for plausibility assessment."""
         if plausibility_config:
             # Basic plausibility assessment
+            from .dimensions.plausibility import count_range_failures
+
             total_checks = 0
             failed_checks = 0
 
             outlier_detection = plausibility_config.get("outlier_detection", {})
             business_rules = plausibility_config.get("business_rules", {})
 
-            # Check business rules
-            for field, rules in business_rules.items():
-                if field in data.columns:
-                    min_val = rules.get("min")
-                    max_val = rules.get("max")
-                    for value in data[field].dropna():
-                        total_checks += 1
-                        try:
-                            numeric_value = float(value)
-                            if min_val is not None and numeric_value < min_val:
-                                failed_checks += 1
-                            elif max_val is not None and numeric_value > max_val:
-                                failed_checks += 1
-                        except Exception:  # noqa: E722
-                            failed_checks += 1
-
-            # Check outlier detection rules
-            for field, rules in outlier_detection.items():
-                if field in data.columns:
-                    method = rules.get("method")
-                    if method == "range":
-                        min_val = rules.get("min")
-                        max_val = rules.get("max")
-                        for value in data[field].dropna():
-                            total_checks += 1
-                            try:
-                                numeric_value = float(value)
-                                if min_val is not None and numeric_value < min_val:
-                                    failed_checks += 1
-                                elif max_val is not None and numeric_value > max_val:
-                                    failed_checks += 1
-                            except Exception:  # noqa: E722
-                                failed_checks += 1
+            # Business rules and range-method outlier rules both bound values
+            range_rules = list(business_rules.items()) + [
+                (field, rules)
+                for field, rules in outlier_detection.items()
+                if field in data.columns and rules.get("method") == "range"
+            ]
+            for field, rules in range_rules:
+                if field not in data.columns:
+                    continue
+                values = data[field].dropna()
+                total_checks += len(values)
+                failed_checks += count_range_failures(
+                    values, rules.get("min"), rules.get("max")
+                )
 
             if total_checks > 0:
                 success_rate = (total_checks - failed_checks) / total_checks
@@ -0,0 +1,475 @@
+"""
+ADRI Restricted Column Expressions.
+
+Compiles declarative rules such as ``end_date >= start_date`` or
+``abs(total - (subtotal + tax)) < 0.01`` into vectorized evaluators over the
+columns of a DataFrame. Expressions are parsed with :mod:`ast` and only a
+whitelist of nodes is accepted (no attribute access, subscripts, lambdas or
+arbitrary calls), so contract authors cannot execute code.
+
+Supported syntax:
+    - Column names as identifiers, or quoted with backticks for names that
+      are not identifiers (```order total` > 0``)
+    - Number, string and boolean literals
+    - Arithmetic: ``+ - * / %`` and unary minus
+    - Comparisons, including chains: ``== != < <= > >=``, and ``in`` /
+      ``not in`` against a literal list or tuple
+    - Boolean logic: ``and``, ``or``, ``not``
+    - Functions: ``abs``, ``round``, ``len``, ``lower``, ``upper``,
+      ``isnull`` and ``notnull``
+
+Columns are read once per DataFrame (see :mod:`adri.validator.column_context`).
+String columns whose values all parse as numbers, or all as dates in one
+format, are read as numbers or datetimes, so CSV text compares the way it
+reads. Comparing with a number coerces text to numbers, comparing with a
+datetime coerces text to dates, and date differences compare as days. Rows
+where a referenced column is missing are not checked, except for columns
+referenced only through ``isnull``/``notnull``.
+"""
+
+import ast
+import operator
+import re
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype
+
+from .column_context import get_column_context
+
+_BACKTICK_RE = re.compile(r"`([^`]+)`")
+_QUOTED_PREFIX = "__adri_col_"
+
+_ARITHMETIC = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+}
+
+_COMPARISONS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+_NULL_CHECKS = {"isnull", "notnull"}
+
+_ONE_DAY = np.timedelta64(1, "D")
+
+# Values checked before a text column is converted to numbers or dates
+_PROBE_SIZE = 64
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression is invalid, unsupported or cannot be evaluated."""
+
+
+class _Rows:
+    """Column access for the rows an expression is evaluated on."""
+
+    def __init__(self, data: pd.DataFrame, rows: np.ndarray | None, size: int):
+        self.data = data
+        self.rows = rows
+        self.size = size
+
+    def _take(self, values: np.ndarray) -> np.ndarray:
+        return values if self.rows is None else values[self.rows]
+
+    def column(self, name: str) -> np.ndarray:
+        return self._take(_column_values(self.data, name))
+
+    def null_mask(self, name: str) -> np.ndarray:
+        return self._take(
+            get_column_context(self.data).null_mask(name).to_numpy(dtype=bool)
+        )
+
+
+Evaluator = Callable[[_Rows], Any]
+
+
+def _column_values(data: pd.DataFrame, name: str) -> np.ndarray:
+    """Read a column as numbers, datetimes or objects (memoized)."""
+
+    def load() -> np.ndarray:
+        context = get_column_context(data)
+        series = data[name]
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in "iufbmM":
+            return series.to_numpy()
+        if isinstance(dtype, pd.DatetimeTZDtype):
+            return context.datetimes(name).to_numpy()
+
+        values = series.to_numpy(dtype=object, na_value=None)
+        non_null = context.non_null(name)
+        if len(non_null) == 0 or infer_dtype(non_null, skipna=True) != "string":
+            return values
+
+        # Probe a sample before converting the whole column
+        present = ~context.null_mask(name).to_numpy(dtype=bool)
+        sample = non_null.iloc[:_PROBE_SIZE]
+        if pd.to_numeric(sample, errors="coerce").notna().all():
+            numbers = pd.to_numeric(non_null, errors="coerce").to_numpy(dtype=float)
+            if not np.isnan(numbers).any():
+                result = np.full(len(series), np.nan)
+                result[present] = numbers
+                return result
+
+        from .rule_kernels import parse_date_column
+
+        if parse_date_column(sample)[1].all():
+            parsed, done = parse_date_column(series)
+            if done[present].all():
+                return parsed
+        return values
+
+    return get_column_context(data).memo(("expression_column", name), load)
+
+
+def _kind(value: Any) -> str:
+    if isinstance(value, np.ndarray):
+        kind = value.dtype.kind
+        if kind in "iuf":
+            return "number"
+        return {"b": "bool", "M": "datetime", "m": "timedelta"}.get(kind, "text")
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "number"
+    return "text"
+
+
+def _as_numbers(value: Any) -> Any:
+    kind = _kind(value)
+    if kind == "timedelta":
+        return value / _ONE_DAY
+    if kind == "datetime":
+        raise ExpressionError("Dates cannot be used as numbers")
+    if not isinstance(value, np.ndarray):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return np.nan
+    if kind in ("number", "bool"):
+        return value.astype(float)
+    return pd.to_numeric(pd.Series(value, dtype=object), errors="coerce").to_numpy(
+        dtype=float
+    )
+
+
+def _as_datetimes(value: Any) -> Any:
+    if _kind(value) == "datetime":
+        return value
+    if not isinstance(value, np.ndarray):
+        try:
+            timestamp = pd.Timestamp(value)
+        except (TypeError, ValueError):
+            return np.datetime64("NaT")
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.tz_convert(None)
+        return timestamp.to_datetime64()
+    parsed = pd.to_datetime(
+        pd.Series(value, dtype=object), utc=True, errors="coerce", format="mixed"
+    )
+    return parsed.dt.tz_convert(None).to_numpy()
+
+
+def _align(left: Any, right: Any) -> tuple[Any, Any]:
+    """Coerce two operands to a common type before comparing them."""
+    kinds = {_kind(left), _kind(right)}
+    if kinds & {"number", "timedelta"}:
+        return _as_numbers(left), _as_numbers(right)
+    if "datetime" in kinds:
+        return _as_datetimes(left), _as_datetimes(right)
+    return left, right
+
+
+def _as_mask(value: Any, size: int) -> np.ndarray:
+    if isinstance(value, np.ndarray) and value.dtype == bool:
+        return value
+    if isinstance(value, (bool, np.bool_)):
+        return np.full(size, bool(value))
+    raise ExpressionError("Expression must evaluate to true or false")
+
+
+def _text(value: Any) -> pd.Series:
+    if not isinstance(value, np.ndarray):
+        value = np.array([value], dtype=object)
+    return pd.Series(value, dtype=object).astype(str)
+
+
+def _literal(node: ast.AST) -> Any:
+    try:
+        value = ast.literal_eval(node)
+    except ValueError as e:
+        raise ExpressionError("'in' needs a list of literal values") from e
+    if value is None or not isinstance(value, (bool, int, float, str)):
+        raise ExpressionError(f"Unsupported literal: {value!r}")
+    return value
+
+
+class _Compiler:
+    """Translate a whitelisted AST into nested evaluator closures."""
+
+    def __init__(self, names: dict[str, str]):
+        self.names = names
+        self.columns: list[str] = []
+        self.null_checked: list[str] = []
+
+    def _column(self, node: ast.Name) -> str:
+        name = self.names.get(node.id, node.id)
+        if name not in self.columns:
+            self.columns.append(name)
+        return name
+
+    def compile(self, node: ast.AST) -> Evaluator:
+        handler = getattr(self, f"_compile_{type(node).__name__}", None)
+        if handler is None:
+            raise ExpressionError(f"Unsupported syntax: {type(node).__name__}")
+        return handler(node)
+
+    def _compile_Name(self, node: ast.Name) -> Evaluator:
+        name = self._column(node)
+        return lambda rows: rows.column(name)
+
+    def _compile_Constant(self, node: ast.Constant) -> Evaluator:
+        value = node.value
+        if value is None or not isinstance(value, (bool, int, float, str)):
+            raise ExpressionError(f"Unsupported literal: {value!r}")
+        return lambda rows: value
+
+    def _compile_BoolOp(self, node: ast.BoolOp) -> Evaluator:
+        parts = [self.compile(v) for v in node.values]
+        combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+
+        def evaluate(rows: _Rows) -> np.ndarray:
+            return combine.reduce([_as_mask(p(rows), rows.size) for p in parts])
+
+        return evaluate
+
+    def _compile_UnaryOp(self, node: ast.UnaryOp) -> Evaluator:
+        operand = self.compile(node.operand)
+        if isinstance(node.op, ast.Not):
+            return lambda rows: ~_as_mask(operand(rows), rows.size)
+        if isinstance(node.op, ast.USub):
+            return lambda rows: -_as_numbers(operand(rows))
+        if isinstance(node.op, ast.UAdd):
+            return lambda rows: _as_numbers(operand(rows))
+        raise ExpressionError(f"Unsupported operator: {type(node.op).__name__}")
+
+    def _compile_BinOp(self, node: ast.BinOp) -> Evaluator:
+        op = _ARITHMETIC.get(type(node.op))
+        if op is None:
+            raise ExpressionError(f"Unsupported operator: {type(node.op).__name__}")
+        left, right = self.compile(node.left), self.compile(node.right)
+
+        def evaluate(rows: _Rows) -> Any:
+            a, b = left(rows), right(rows)
+            if isinstance(node.op, (ast.Add, ast.Sub)) and {_kind(a), _kind(b)} & {
+                "datetime",
+                "timedelta",
+            }:
+                return op(a, b)  # Date arithmetic stays in datetime64/timedelta64
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return op(_as_numbers(a), _as_numbers(b))
+
+        return evaluate
+
+    def _compile_Compare(self, node: ast.Compare) -> Evaluator:
+        operands = [self.compile(node.left)]
+        checks: list[Callable[[Any, Any], np.ndarray]] = []
+        for op, comparator in zip(node.ops, node.comparators):
+            if isinstance(op, (ast.In, ast.NotIn)):
+                if not isinstance(comparator, (ast.List, ast.Tuple, ast.Set)):
+                    raise ExpressionError("'in' needs a literal list of values")
+                choices = [_literal(e) for e in comparator.elts]
+                operands.append(lambda rows, c=choices: c)
+                checks.append(self._membership(choices, isinstance(op, ast.NotIn)))
+                continue
+            compare = _COMPARISONS.get(type(op))
+            if compare is None:
+                raise ExpressionError(f"Unsupported comparison: {type(op).__name__}")
+            operands.append(self.compile(comparator))
+            checks.append(lambda a, b, f=compare: f(*_align(a, b)))
+
+        def evaluate(rows: _Rows) -> np.ndarray:
+            values = [operand(rows) for operand in operands]
+            result = np.ones(rows.size, dtype=bool)
+            for i, check in enumerate(checks):
+                try:
+                    outcome = check(values[i], values[i + 1])
+                except TypeError as e:
+                    raise ExpressionError(f"Cannot compare values: {e}") from e
+                result &= _as_mask(np.asarray(outcome, dtype=bool), rows.size)
+            return result
+
+        return evaluate
+
+    @staticmethod
+    def _membership(
+        choices: list[Any], negate: bool
+    ) -> Callable[[Any, Any], np.ndarray]:
+        def check(value: Any, _: Any) -> np.ndarray:
+            if not isinstance(value, np.ndarray):
+                value = np.array([value], dtype=object)
+            if _kind(value) in ("number", "bool"):
+                targets = [_as_numbers(c) for c in choices]
+                found = pd.Series(value.astype(float)).isin(targets).to_numpy()
+            else:
+                found = pd.Series(value, dtype=object).isin(choices).to_numpy()
+            return ~found if negate else found
+
+        return check
+
+    def _compile_Call(self, node: ast.Call) -> Evaluator:
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            raise ExpressionError("Only plain function calls are supported")
+        name = node.func.id
+        args = node.args
+
+        if name in _NULL_CHECKS:
+            if len(args) != 1 or not isinstance(args[0], ast.Name):
+                raise ExpressionError(f"{name}() takes one column name")
+            column = self.names.get(args[0].id, args[0].id)
+            if column not in self.null_checked:
+                self.null_checked.append(column)
+            if name == "isnull":
+                return lambda rows: rows.null_mask(column)
+            return lambda rows: ~rows.null_mask(column)
+
+        if name == "round":
+            if len(args) not in (1, 2) or (
+                len(args) == 2
+                and not (
+                    isinstance(args[1], ast.Constant) and type(args[1].value) is int
+                )
+            ):
+                raise ExpressionError("round() takes a value and integer digits")
+            value = self.compile(args[0])
+            digits = args[1].value if len(args) == 2 else 0
+            return lambda rows: np.round(_as_numbers(value(rows)), digits)
+
+        unary = {
+            "abs": lambda v: np.abs(_as_numbers(v)),
+            "len": lambda v: _text(v).str.len().to_numpy(),
+            "lower": lambda v: _text(v).str.lower().to_numpy(dtype=object),
+            "upper": lambda v: _text(v).str.upper().to_numpy(dtype=object),
+        }
+        if name not in unary:
+            raise ExpressionError(f"Unsupported function: {name}()")
+        if len(args) != 1:
+            raise ExpressionError(f"{name}() takes one argument")
+        value, apply = self.compile(args[0]), unary[name]
+        return lambda rows: apply(value(rows))
+
+
+class CompiledExpression:
+    """A compiled expression, evaluated column-wise over a DataFrame.
+
+    Attributes:
+        expression: Source text
+        columns: Columns the expression reads, in order of appearance
+    """
+
+    def __init__(
+        self,
+        expression: str,
+        evaluator: Evaluator,
+        columns: list[str],
+        null_checked: list[str],
+    ):
+        self.expression = expression
+        self.columns = tuple(columns + [c for c in null_checked if c not in columns])
+        self._evaluator = evaluator
+        self._required = tuple(columns)
+
+    def evaluate(self, data: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+        """Evaluate the expression on every row with its columns present.
+
+        Args:
+            data: DataFrame containing every column in :attr:`columns`
+
+        Returns:
+            (checked, passed) boolean masks over all rows; ``passed`` is False
+            for rows that were not checked
+
+        Raises:
+            ExpressionError: If a column is missing or values cannot be
+                compared
+        """
+        missing = [c for c in self.columns if c not in data.columns]
+        if missing:
+            raise ExpressionError(f"Missing columns: {', '.join(map(str, missing))}")
+
+        context = get_column_context(data)
+        checked = np.ones(len(data), dtype=bool)
+        for column in self._required:
+            checked &= ~context.null_mask(column).to_numpy(dtype=bool)
+
+        rows = None if checked.all() else np.flatnonzero(checked)
+        size = len(data) if rows is None else len(rows)
+        passed = np.zeros(len(data), dtype=bool)
+        if size:
+            result = _as_mask(self._evaluator(_Rows(data, rows, size)), size)
+            if rows is None:
+                passed = result
+            else:
+                passed[rows] = result
+        return checked, passed
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(expression: str) -> CompiledExpression:
+    """Compile a restricted boolean expression over DataFrame columns.
+
+    Args:
+        expression: Expression text, e.g. ``"end_date >= start_date"``
+
+    Returns:
+        CompiledExpression (cached per expression text)
+
+    Raises:
+        ExpressionError: If the expression is not valid or uses syntax
+            outside the supported subset
+    """
+    if not isinstance(expression, str) or not expression.strip():
+        raise ExpressionError("Expression must be a non-empty string")
+
+    names: dict[str, str] = {}
+
+    def quote(match: re.Match) -> str:
+        placeholder = f"{_QUOTED_PREFIX}{len(names)}"
+        names[placeholder] = match.group(1)
+        return placeholder
+
+    try:
+        tree = ast.parse(_BACKTICK_RE.sub(quote, expression.strip()), mode="eval")
+    except SyntaxError as e:
+        raise ExpressionError(f"Invalid expression '{expression}': {e.msg}") from e
+
+    body = tree.body
+    if not (
+        isinstance(body, (ast.Compare, ast.BoolOp))
+        or (isinstance(body, ast.UnaryOp) and isinstance(body.op, ast.Not))
+        or (
+            isinstance(body, ast.Call)
+            and isinstance(body.func, ast.Name)
+            and body.func.id in _NULL_CHECKS
+        )
+    ):
+        raise ExpressionError(
+            f"Expression '{expression}' must be a comparison or boolean condition"
+        )
+
+    compiler = _Compiler(names)
+    evaluator = compiler.compile(body)
+    return CompiledExpression(
+        expression, evaluator, compiler.columns, compiler.null_checked
+    )
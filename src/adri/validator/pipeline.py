@@ -13,6 +13,10 @@ import pandas as pd
 
 from ..core.protocols import DimensionAssessor
 from ..core.registry import get_global_registry
+from ..core.timing import timing_span
+from ..core.tracing import ATTR_DIMENSION, ATTR_ROW_COUNT, ATTR_SCORE, get_tracer
+from .column_context import column_context_scope
+from .derivations import derived_field_specs
 from .engine import AssessmentResult, BundledStandardWrapper, DimensionScore
 
 
@@ -78,6 +82,10 @@ class ValidationPipeline:
     ) -> AssessmentResult:
         """Execute a complete validation assessment using dimension assessors.
 
+        Dimension assessors share one column context for ``data`` (see
+        :mod:`adri.validator.column_context`), so null masks, non-null values
+        and parsed dates are derived once per assessment.
+
         Args:
             data: DataFrame containing the data to assess
             standard: Standard configuration (BundledStandardWrapper or dict)
@@ -86,6 +94,20 @@ class ValidationPipeline:
         Returns:
             AssessmentResult with dimension scores and metadata
         """
+        with (
+            get_tracer().start_span(
+                "adri.pipeline", {ATTR_ROW_COUNT: len(data)}
+            ) as span,
+            column_context_scope(),
+        ):
+            result = self._execute_assessment(data, standard, collect_explain)
+            span.set_attribute(ATTR_SCORE, result.overall_score)
+            return result
+
+    def _execute_assessment(
+        self, data: pd.DataFrame, standard: Any, collect_explain: bool
+    ) -> AssessmentResult:
+        """Run the assessment; see :meth:`execute_assessment`."""
         start_time = time.time()
 
         # DIAGNOSTIC LOGGING - Issue #35 Parity Investigation
@@ -142,6 +164,7 @@ class ValidationPipeline:
         # Execute dimension assessments
         dimension_scores = {}
         explain_data = {}
+        tracer = get_tracer()
 
         if _should_enable_debug():
             diagnostic_log.append("=== DIMENSION ASSESSMENT ===")
@@ -156,13 +179,20 @@ class ValidationPipeline:
             try:
                 if _should_enable_debug():
                     diagnostic_log.append(f"Assessing {dimension_name}...")
-                score, explanation = self._assess_single_dimension(
-                    data,
-                    dimension_name,
-                    dimension_requirements,
-                    field_requirements,
-                    collect_explain,
-                )
+                with (
+                    timing_span("dimensions", dimension_name),
+                    tracer.start_span(
+                        "adri.dimension", {ATTR_DIMENSION: dimension_name}
+                    ) as dimension_span,
+                ):
+                    score, explanation = self._assess_single_dimension(
+                        data,
+                        dimension_name,
+                        dimension_requirements,
+                        field_requirements,
+                        collect_explain,
+                    )
+                    dimension_span.set_attribute(ATTR_SCORE, score)
                 dimension_scores[dimension_name] = DimensionScore(score)
                 if _should_enable_debug():
                     diagnostic_log.append(f"  {dimension_name}: {score:.2f}/20")
@@ -269,6 +299,10 @@ class ValidationPipeline:
                             ] = pk_fields
                 except Exception:  # noqa: E722
                     pass
+                # Derived fields are checked against their derivation rules
+                derived_fields = derived_field_specs(field_requirements)
+                if derived_fields:
+                    dim_requirements["derived_fields"] = derived_fields
             elif dimension_name == "freshness":
                 # Freshness needs metadata for date field configuration
                 try:
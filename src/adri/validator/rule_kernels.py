@@ -0,0 +1,640 @@
+"""
+ADRI Validation Rule Kernels.
+
+Compiles ValidationRule objects from the validation_rules contract format into
+column-level kernels. A kernel takes a column (pandas Series) and returns a
+boolean mask of passing values, matching ``rules.execute_validation_rule``
+applied to every value.
+
+Each rule is dispatched once per column instead of once per value. Numeric
+type and range checks and string length checks run as numpy/pandas
+operations; every other rule evaluates its scalar check once per distinct
+value and broadcasts the result whenever the column is low-cardinality
+(see distinct_codes). Pattern, length and case checks can run on Arrow
+compute kernels instead (see :mod:`adri.validator.arrow_strings`).
+"""
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype
+
+from ..core.severity import Severity
+from ..core.timing import timing_span
+from ..core.validation_rule import ValidationRule
+from .arrow_strings import case_check, length_between, regex_match, string_kernel
+from .column_context import get_column_context
+from .rules import (
+    _VALIDATION_HANDLERS,
+    _validate_not_null,
+    check_date_bounds,
+    check_field_type,
+    parse_date_bounds,
+)
+
+RuleKernel = Callable[[pd.Series], np.ndarray]
+
+# Object columns whose equal values always have equal ``str()`` (so rules can
+# be evaluated once per distinct value). Mixed or float object columns are
+# evaluated per value: 1 == 1.0 == True and 0.0 == -0.0 but their strings differ.
+_DISTINCT_SAFE_KINDS = {"string", "integer", "boolean", "empty"}
+
+# Evaluate rules per distinct value when distinct values / rows is at most this
+DISTINCT_RATIO_THRESHOLD = 0.5
+
+# Column date formats parsed with pd.to_datetime, as (shape, format). Only
+# values whose stripped text has the exact shape take the vectorized path, and
+# for those _parse_date_like yields the same datetime (ISO 8601 first, then the
+# same strptime format). Anything else is parsed per value.
+_TIME_SHAPE = r"(?:[01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9]"
+_DATE_COLUMN_FORMATS = (
+    (r"[0-9]{4}-[0-9]{2}-[0-9]{2}", "%Y-%m-%d"),
+    (rf"[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}} {_TIME_SHAPE}", "%Y-%m-%d %H:%M:%S"),
+    (rf"[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}T{_TIME_SHAPE}", "%Y-%m-%dT%H:%M:%S"),
+    (r"[0-9]{2}/[0-9]{2}/[0-9]{4}", "%m/%d/%Y"),
+    (r"[0-9]{4}/[0-9]{2}/[0-9]{2}", "%Y/%m/%d"),
+    (r"[0-9]{2}-[0-9]{2}-[0-9]{4}", "%d-%m-%Y"),
+)
+
+# Values inspected to pick a column's date format
+DATE_FORMAT_SAMPLE_SIZE = 64
+
+
+def _evaluate(check: Callable[[Any], bool], values: list[Any]) -> np.ndarray:
+    return np.fromiter((bool(check(v)) for v in values), dtype=bool, count=len(values))
+
+
+def _factorize(series: pd.Series) -> tuple[np.ndarray, np.ndarray] | None:
+    """Return (codes, first position of each code), or None if unsafe.
+
+    Missing values get code -1. Floats are factorized on their bit patterns
+    so that 0.0 and -0.0 stay distinct.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind == "f":
+        values = np.ascontiguousarray(series.to_numpy())
+        key: Any = values.view(f"i{values.itemsize}")
+    elif dtype == object:
+        if infer_dtype(series, skipna=True) not in _DISTINCT_SAFE_KINDS:
+            return None
+        key = series.to_numpy()
+    else:
+        key = series
+
+    try:
+        codes, _ = pd.factorize(key)
+    except TypeError:
+        return None
+
+    valid = np.flatnonzero(codes >= 0)
+    _, first = np.unique(codes[valid], return_index=True)
+    return codes, valid[first]
+
+
+def distinct_codes(
+    series: pd.Series, max_ratio: float = DISTINCT_RATIO_THRESHOLD
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """Factorize a column for per-distinct-value rule evaluation.
+
+    Args:
+        series: Column to factorize
+        max_ratio: Highest distinct/rows ratio worth evaluating per distinct
+            value; above it per-row evaluation is cheaper
+
+    Returns:
+        (codes, first row position of each distinct value) with -1 codes for
+        missing values, or None when rules should be evaluated per row
+    """
+    factorized = _factorize(series)
+    if factorized is None or len(factorized[1]) > max_ratio * len(series):
+        return None
+    return factorized
+
+
+def distinct_values(
+    series: pd.Series, max_ratio: float = DISTINCT_RATIO_THRESHOLD
+) -> tuple[list[Any], np.ndarray]:
+    """Return the values a per-value rule chain has to see, and each row's value.
+
+    Low-cardinality columns yield their distinct values; otherwise (or when the
+    column cannot be factorized safely) every row is its own value.
+
+    Args:
+        series: Column without missing values
+        max_ratio: See :func:`distinct_codes`
+
+    Returns:
+        (values, codes) where row ``i`` holds ``values[codes[i]]``
+    """
+    factorized = distinct_codes(series, max_ratio)
+    if factorized is None or (factorized[0] < 0).any():
+        return series.tolist(), np.arange(len(series))
+    codes, positions = factorized
+    return series.iloc[positions].tolist(), codes
+
+
+def _distinct_kernel(
+    check: Callable[[Any], bool], batch: Callable[[pd.Series], np.ndarray] | None = None
+) -> RuleKernel:
+    """Kernel evaluating ``check`` once per distinct value of the column.
+
+    ``batch`` optionally evaluates a whole Series at once with the same
+    result as ``check`` per value.
+    """
+    if batch is None:
+
+        def batch(values: pd.Series) -> np.ndarray:
+            return _evaluate(check, values.tolist())
+
+    def kernel(series: pd.Series) -> np.ndarray:
+        factorized = distinct_codes(series)
+        if factorized is None:
+            return batch(series)
+
+        codes, positions = factorized
+        mask = np.ones(len(codes), dtype=bool)
+        if len(positions):
+            results = batch(series.iloc[positions])
+            mask = results[np.maximum(codes, 0)]
+        missing = np.flatnonzero(codes < 0)
+        if len(missing):
+            mask[missing] = batch(series.iloc[missing])
+        return mask
+
+    return kernel
+
+
+def _is_numpy_numeric(series: pd.Series) -> bool:
+    return isinstance(series.dtype, np.dtype) and series.dtype.kind in "iufb"
+
+
+def _type_check(rule: ValidationRule, field_req: dict[str, Any] | None):
+    """Return (declared type, scalar check) with the rule expression parsed once."""
+    if field_req and "type" in field_req:
+        return field_req.get("type", "string"), lambda v: check_field_type(v, field_req)
+
+    expr = rule.rule_expression.upper()
+    if "STRING" in expr:
+        return "string", lambda v: isinstance(v, str)
+    if "INTEGER" in expr or "INT" in expr:
+        return "integer", lambda v: check_field_type(v, {"type": "integer"})
+    if "FLOAT" in expr or "NUMBER" in expr:
+        return "float", lambda v: check_field_type(v, {"type": "float"})
+    return None, lambda v: True
+
+
+def _numeric_type_mask(declared: str | None, values: np.ndarray) -> np.ndarray:
+    """check_field_type over a numpy numeric/bool column."""
+    kind = values.dtype.kind
+    if declared == "integer":
+        if kind == "f":
+            return np.isfinite(values)
+        return np.ones(len(values), dtype=bool)
+    if declared == "boolean":
+        if kind == "b":
+            return np.ones(len(values), dtype=bool)
+        if kind in "iu":
+            return (values == 0) | (values == 1)
+        return np.zeros(len(values), dtype=bool)
+    if declared in ("string", "date"):
+        return np.zeros(len(values), dtype=bool)
+    # number, float and unknown types always pass
+    return np.ones(len(values), dtype=bool)
+
+
+def _compile_type(rule: ValidationRule, field_req: dict[str, Any] | None) -> RuleKernel:
+    declared, check = _type_check(rule, field_req)
+    distinct = _distinct_kernel(check)
+
+    def kernel(series: pd.Series) -> np.ndarray:
+        if _is_numpy_numeric(series):
+            return _numeric_type_mask(declared, series.to_numpy())
+        return distinct(series)
+
+    return kernel
+
+
+def _compile_numeric_bounds(field_req: dict[str, Any] | None) -> RuleKernel:
+    check = _scalar_check("numeric_bounds", None, field_req)
+    distinct = _distinct_kernel(check)
+    if not field_req:
+        return distinct
+    min_val, max_val = field_req.get("min_value"), field_req.get("max_value")
+    if not all(
+        b is None or (isinstance(b, (int, float)) and not isinstance(b, bool))
+        for b in (min_val, max_val)
+    ):
+        return distinct
+
+    def kernel(series: pd.Series) -> np.ndarray:
+        if not _is_numpy_numeric(series):
+            return distinct(series)
+        values = series.to_numpy().astype(np.float64)
+        failed = np.zeros(len(values), dtype=bool)
+        with np.errstate(invalid="ignore"):
+            if min_val is not None:
+                failed |= values < min_val
+            if max_val is not None:
+                failed |= values > max_val
+        return ~failed
+
+    return kernel
+
+
+def _compile_length_bounds(field_req: dict[str, Any] | None) -> RuleKernel:
+    check = _scalar_check("length_bounds", None, field_req)
+    distinct = _distinct_kernel(check)
+    if not field_req:
+        return distinct
+    try:
+        min_len, max_len = (
+            None if field_req.get(key) is None else int(field_req[key])
+            for key in ("min_length", "max_length")
+        )
+    except (TypeError, ValueError):
+        return distinct
+    if min_len is None and max_len is None:
+        return distinct
+    other = string_kernel(distinct, length_between(min_len, max_len))
+
+    def kernel(series: pd.Series) -> np.ndarray:
+        if not isinstance(series.dtype, pd.StringDtype):
+            return other(series)
+        present = series.notna().to_numpy()
+        lengths = series.str.len().to_numpy(dtype=np.float64, na_value=np.nan)
+        mask = np.ones(len(series), dtype=bool)
+        with np.errstate(invalid="ignore"):
+            if min_len is not None:
+                mask &= ~(lengths < min_len)
+            if max_len is not None:
+                mask &= ~(lengths > max_len)
+        missing = np.flatnonzero(~present)
+        if len(missing):
+            mask[missing] = _evaluate(check, series.iloc[missing].tolist())
+        return mask
+
+    return kernel
+
+
+def _compile_pattern(field_req: dict[str, Any] | None) -> RuleKernel:
+    distinct = _distinct_kernel(_scalar_check("pattern", None, field_req))
+    pattern = field_req.get("pattern") if field_req else None
+    if not pattern or not isinstance(pattern, str):
+        return distinct
+    try:
+        re.compile(pattern)
+    except re.error:
+        return distinct  # Every value fails, as in check_field_pattern
+    return string_kernel(distinct, regex_match(pattern))
+
+
+def _compile_format(rule: ValidationRule) -> RuleKernel:
+    distinct = _distinct_kernel(_scalar_check(rule.rule_type, rule, None))
+    expr = rule.rule_expression.upper()
+    for token, mode in (
+        ("LOWERCASE", "lower"),
+        ("UPPERCASE", "upper"),
+        ("TITLE", "title"),
+    ):
+        if token in expr:
+            return string_kernel(distinct, case_check(mode))
+    return distinct
+
+
+def _compile_not_null(
+    rule: ValidationRule, field_req: dict[str, Any] | None
+) -> RuleKernel:
+    distinct = _distinct_kernel(lambda v: _validate_not_null(v, rule, field_req))
+
+    def kernel(series: pd.Series) -> np.ndarray:
+        # Numbers and timestamps never stringify to whitespace
+        dtype = series.dtype
+        if (isinstance(dtype, np.dtype) and dtype.kind in "iufbmM") or isinstance(
+            dtype, pd.DatetimeTZDtype
+        ):
+            return series.notna().to_numpy()
+        return distinct(series)
+
+    return kernel
+
+
+def parse_date_column(series: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Parse the string dates of a column with one detected format.
+
+    The format is detected from a sample of the column and every value with
+    that exact shape is parsed in one ``pd.to_datetime`` call. Other values
+    (stragglers, non-strings, out-of-range or invalid dates) are left to the
+    caller's per-value path.
+
+    Args:
+        series: Column to parse
+
+    Returns:
+        (datetime64[us] array, mask of the rows that were parsed); rows
+        outside the mask hold NaT
+    """
+    n = len(series)
+    parsed = np.full(n, np.datetime64("NaT"), dtype="datetime64[us]")
+    done = np.zeros(n, dtype=bool)
+
+    values = series.to_numpy(dtype=object, na_value=None)
+    if isinstance(series.dtype, pd.StringDtype):
+        is_str = series.notna().to_numpy()
+    else:
+        is_str = np.fromiter((isinstance(v, str) for v in values), bool, count=n)
+    rows = np.flatnonzero(is_str)
+    if not len(rows):
+        return parsed, done
+
+    text = pd.Series(values[rows], dtype=object).str.strip()
+    sample = text.iloc[:DATE_FORMAT_SAMPLE_SIZE]
+    shape, fmt = max(
+        _DATE_COLUMN_FORMATS, key=lambda f: int(sample.str.fullmatch(f[0]).sum())
+    )
+    matches = text.str.fullmatch(shape).to_numpy(dtype=bool)
+    if not matches.any():
+        return parsed, done
+
+    dates = pd.to_datetime(text[matches], format=fmt, errors="coerce").to_numpy(
+        dtype="datetime64[us]"
+    )
+    valid = ~np.isnat(dates)
+    target = rows[matches][valid]
+    parsed[target] = dates[valid]
+    done[target] = True
+    return parsed, done
+
+
+def date_bounds_mask(series: pd.Series, field_req: dict[str, Any]) -> np.ndarray:
+    """check_date_bounds over a whole column.
+
+    Bounds are parsed once and string dates are parsed column-wise (see
+    :func:`parse_date_column`); remaining values use the scalar check.
+
+    Args:
+        series: Column to check
+        field_req: Field requirements with after/before date(time) bounds
+
+    Returns:
+        Boolean numpy mask of passing values
+    """
+    n = len(series)
+    try:
+        bounds = parse_date_bounds(field_req)
+    except Exception:
+        return np.zeros(n, dtype=bool)
+    if bounds is None:
+        return np.ones(n, dtype=bool)
+
+    lower, upper = bounds
+    if any(b.tzinfo is not None for b in lower + upper):
+        # Timezone-aware bounds: only aware values compare; keep scalar rules
+        return _evaluate(lambda v: check_date_bounds(v, field_req), series.tolist())
+
+    parsed, done = parse_date_column(series)
+    mask = np.zeros(n, dtype=bool)
+    if done.any():
+        dates = parsed[done]
+        passed = np.ones(len(dates), dtype=bool)
+        for lb in lower:
+            passed &= dates >= np.datetime64(lb, "us")
+        for ub in upper:
+            passed &= dates <= np.datetime64(ub, "us")
+        mask[done] = passed
+    rest = np.flatnonzero(~done)
+    if len(rest):
+        mask[rest] = _evaluate(
+            lambda v: check_date_bounds(v, field_req), series.iloc[rest].tolist()
+        )
+    return mask
+
+
+def _scalar_check(
+    rule_type: str, rule: ValidationRule | None, field_req: dict[str, Any] | None
+) -> Callable[[Any], bool]:
+    """Scalar check for ``rule_type`` with per-rule work done up front."""
+    if rule_type == "pattern" and field_req and field_req.get("pattern"):
+        try:
+            regex = re.compile(field_req["pattern"])
+        except (re.error, TypeError):
+            return lambda v: False
+
+        def check_pattern(value: Any) -> bool:
+            try:
+                return regex.match(str(value)) is not None
+            except Exception:
+                return False
+
+        return check_pattern
+
+    if rule_type in ("format", "case"):
+        expr = rule.rule_expression.upper()
+        if "LOWERCASE" in expr:
+            return lambda v: str(v).islower() if v else True
+        if "UPPERCASE" in expr:
+            return lambda v: str(v).isupper() if v else True
+        if "TITLE" in expr:
+            return lambda v: str(v).istitle() if v else True
+        return lambda v: True
+
+    handler = _VALIDATION_HANDLERS.get(rule_type)
+    if handler is None:
+        return lambda v: True
+    return lambda v: handler(v, rule, field_req)
+
+
+def _always_pass(series: pd.Series) -> np.ndarray:
+    return np.ones(len(series), dtype=bool)
+
+
+def compile_validation_rule(
+    rule: Any, field_req: dict[str, Any] | None = None
+) -> RuleKernel:
+    """Compile a ValidationRule into a column-level kernel.
+
+    Args:
+        rule: ValidationRule to compile (anything else always passes, as in
+            execute_validation_rule)
+        field_req: Field requirements the rule reads its parameters from
+
+    Returns:
+        Function mapping a Series to a boolean numpy mask (True = passes)
+    """
+    if not isinstance(rule, ValidationRule):
+        return _always_pass
+
+    rule_type = rule.rule_type
+    if rule_type not in _VALIDATION_HANDLERS:
+        return _always_pass
+    if rule_type in ("not_null", "not_empty"):
+        return _compile_not_null(rule, field_req)
+    if rule_type == "type":
+        return _compile_type(rule, field_req)
+    if rule_type == "numeric_bounds":
+        return _compile_numeric_bounds(field_req)
+    if rule_type == "length_bounds":
+        return _compile_length_bounds(field_req)
+    if rule_type == "pattern":
+        return _compile_pattern(field_req)
+    if rule_type in ("format", "case"):
+        return _compile_format(rule)
+    if rule_type == "date_bounds" and field_req:
+        return _distinct_kernel(
+            lambda v: check_date_bounds(v, field_req),
+            lambda values: date_bounds_mask(values, field_req),
+        )
+    return _distinct_kernel(_scalar_check(rule_type, rule, field_req))
+
+
+def compile_field_check(rule_type: str, field_req: dict[str, Any]) -> RuleKernel:
+    """Compile a field_requirements rule type into a column-level kernel.
+
+    Only for rule types whose ``rules.check_*`` function reads nothing but
+    field_req (length_bounds, pattern, date_bounds), so the kernel gives the
+    same results as the legacy per-value check.
+
+    Args:
+        rule_type: Rule type key
+        field_req: Field requirements for the column
+
+    Returns:
+        Function mapping a Series to a boolean numpy mask (True = passes)
+    """
+    rule = ValidationRule(
+        name=rule_type,
+        dimension="validity",
+        severity=Severity.CRITICAL,
+        rule_type=rule_type,
+        rule_expression="",
+    )
+    return compile_validation_rule(rule, field_req)
+
+
+def iter_rule_masks(
+    data: pd.DataFrame,
+    field_requirements: dict[str, Any],
+    dimension: str,
+    skip_nulls: bool = True,
+    critical_only: bool = False,
+):
+    """Evaluate a dimension's validation_rules column by column.
+
+    Args:
+        data: DataFrame to evaluate
+        field_requirements: Field requirements with validation_rules lists
+        dimension: Only rules for this dimension are evaluated
+        skip_nulls: Drop missing values before evaluating (completeness keeps them)
+        critical_only: Only evaluate CRITICAL rules (those that affect scores)
+
+    Yields:
+        (column, evaluated series, rule, pass mask) for each applicable rule
+    """
+    context = get_column_context(data)
+    for column in data.columns:
+        field_config = field_requirements.get(column)
+        if not isinstance(field_config, dict):
+            continue
+
+        rules = [
+            r
+            for r in field_config.get("validation_rules", None) or []
+            if isinstance(r, ValidationRule)
+            and r.dimension == dimension
+            and (not critical_only or r.severity == Severity.CRITICAL)
+        ]
+        if not rules:
+            continue
+
+        series = context.non_null(column) if skip_nulls else data[column]
+        for rule in rules:
+            with timing_span("rules", dimension, str(column), rule.rule_type):
+                mask = compile_validation_rule(rule, field_config)(series)
+            yield column, series, rule, mask
+
+
+def score_critical_rules(
+    data: pd.DataFrame,
+    field_requirements: dict[str, Any],
+    dimension: str,
+    skip_nulls: bool = True,
+) -> float:
+    """Score a dimension from its CRITICAL validation_rules.
+
+    WARNING and INFO rules are not evaluated here: they are logged through
+    collect_rule_failures but never penalize the score.
+
+    Returns:
+        Score from 0.0 to 20.0 (20.0 when no CRITICAL rule applies)
+    """
+    total = 0
+    failed = 0
+    for _, _, _, mask in iter_rule_masks(
+        data, field_requirements, dimension, skip_nulls, critical_only=True
+    ):
+        total += len(mask)
+        failed += len(mask) - int(np.count_nonzero(mask))
+
+    if total == 0:
+        return 20.0
+    return (total - failed) / total * 20.0
+
+
+def collect_rule_failures(
+    data: pd.DataFrame,
+    field_requirements: dict[str, Any],
+    dimension: str,
+    skip_nulls: bool = True,
+) -> list[dict[str, Any]]:
+    """Build failure records for a dimension's validation_rules (all severities).
+
+    Failures are grouped per field, rule type and severity. Samples are the
+    first three failing values in row order.
+
+    Returns:
+        List of failure records with details
+    """
+    total_rows = len(data)
+    columns = {column: i for i, column in enumerate(data.columns)}
+    # (field, rule_type, severity) -> [count, [(position, rule order, sample)]]
+    tracking: dict[tuple[Any, str, str], list[Any]] = {}
+
+    for order, (column, series, rule, mask) in enumerate(
+        iter_rule_masks(data, field_requirements, dimension, skip_nulls)
+    ):
+        failing = np.flatnonzero(~mask)
+        if not len(failing):
+            continue
+        key = (column, rule.rule_type, rule.severity.value)
+        entry = tracking.setdefault(key, [0, []])
+        entry[0] += len(failing)
+        head = failing[:3]
+        missing = series.isna().to_numpy()[head]
+        samples = [
+            "<null>" if is_missing else str(value)[:50]
+            for value, is_missing in zip(series.iloc[head].tolist(), missing)
+        ]
+        entry[1].extend(zip(head.tolist(), [order] * len(head), samples))
+
+    # Records appear per field, ordered by each group's first failing row
+    ordered = sorted(
+        tracking.items(), key=lambda item: (columns[item[0][0]], min(item[1][1]))
+    )
+
+    failures = []
+    for (field_name, rule_type, severity), (count, samples) in ordered:
+        failures.append(
+            {
+                "dimension": dimension,
+                "field": field_name,
+                "issue": f"{rule_type}_failed",
+                "severity": severity,
+                "affected_rows": count,
+                "affected_percentage": (count / total_rows) * 100.0,
+                "samples": [sample for _, _, sample in sorted(samples)[:3]],
+                "remediation": f"Fix {field_name} to pass {rule_type} validation ({severity} severity)",
+            }
+        )
+    return failures
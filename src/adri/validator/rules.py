@@ -5,8 +5,26 @@ Field-level validation logic extracted from the original AssessmentEngine.
 Contains functions for type checking, pattern matching, and range validation.
 """
 
+import re
+from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
+# check_field_type "date": YYYY-MM-DD or MM/DD/YYYY
+_DATE_TYPE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$|^\d{2}/\d{2}/\d{4}$")
+
+# Formats tried by _parse_date_like after ISO 8601, in order
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%Y/%m/%d",
+    "%d-%m-%Y",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y/%m/%d %H:%M:%S",
+)
+
+DATE_BOUND_KEYS = ("after_date", "before_date", "after_datetime", "before_datetime")
+
 
 def check_field_type(value: Any, field_req: dict[str, Any]) -> bool:
     """Check if value matches the required type."""
@@ -34,13 +52,7 @@ def check_field_type(value: Any, field_req: dict[str, Any]) -> bool:
             ]
         elif required_type == "date":
             # Basic date validation
-            import re
-
-            date_patterns = [
-                r"^\d{4}-\d{2}-\d{2}$",  # YYYY-MM-DD
-                r"^\d{2}/\d{2}/\d{4}$",  # MM/DD/YYYY
-            ]
-            return any(re.match(pattern, str(value)) for pattern in date_patterns)
+            return _DATE_TYPE_RE.match(str(value)) is not None
     except Exception:
         return False
 
@@ -54,8 +66,6 @@ def check_field_pattern(value: Any, field_req: dict[str, Any]) -> bool:
         return True
 
     try:
-        import re
-
         return bool(re.match(pattern, str(value)))
     except Exception:
         return False
@@ -126,14 +136,11 @@ def _parse_date_like(value: Any):
     if value is None:
         return None
     try:
-        # Fast path ISO
-        from datetime import datetime
-
         s = str(value).strip()
         if not s:
             return None
 
-        # Accept 'Z'
+        # Fast path ISO, accepting 'Z'
         if s.endswith("Z"):
             s = s.replace("Z", "+00:00")
         try:
@@ -142,27 +149,59 @@ def _parse_date_like(value: Any):
             pass
 
         # Common alternatives
-        fmts = [
-            "%Y-%m-%d",
-            "%m/%d/%Y",
-            "%Y/%m/%d",
-            "%d-%m-%Y",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y/%m/%d %H:%M:%S",
-        ]
-        for fmt in fmts:
-            parsed_dt = None
+        for fmt in DATE_FORMATS:
             try:
-                parsed_dt = datetime.strptime(s, fmt)
+                return datetime.strptime(s, fmt)
             except Exception:
-                parsed_dt = None
-            if parsed_dt is not None:
-                return parsed_dt
+                pass
     except Exception:
         return None
     return None
 
 
+def _parse_date_bounds_uncached(after_d, before_d, after_dt, before_dt):
+    lower, upper = [], []
+    if after_d:
+        # Interpret as date-only lower bound (inclusive)
+        lower.append(datetime.fromisoformat(str(after_d)))
+    if before_d:
+        upper.append(datetime.fromisoformat(str(before_d)))
+    if after_dt:
+        lb = _parse_date_like(after_dt)
+        if lb:
+            lower.append(lb)
+    if before_dt:
+        ub = _parse_date_like(before_dt)
+        if ub:
+            upper.append(ub)
+    return tuple(lower), tuple(upper)
+
+
+_parse_date_bounds_cached = lru_cache(maxsize=256)(_parse_date_bounds_uncached)
+
+
+def parse_date_bounds(field_req: dict[str, Any]):
+    """Parse the date bounds of a field requirement once.
+
+    Args:
+        field_req: Field requirements with after/before date(time) keys
+
+    Returns:
+        (lower bounds, upper bounds) as tuples of datetimes, or None if no
+        bound is set
+
+    Raises:
+        ValueError: If after_date/before_date is not an ISO date
+    """
+    bounds = tuple(field_req.get(key) for key in DATE_BOUND_KEYS)
+    if not any(bounds):
+        return None
+    try:
+        return _parse_date_bounds_cached(*bounds)
+    except TypeError:  # unhashable bound values
+        return _parse_date_bounds_uncached(*bounds)
+
+
 def check_date_bounds(value: Any, field_req: dict[str, Any]) -> bool:
     """Check after/before bounds for date or datetime fields.
 
@@ -170,155 +209,23 @@ def check_date_bounds(value: Any, field_req: dict[str, Any]) -> bool:
       - after_date / before_date (YYYY-MM-DD)
       - after_datetime / before_datetime (ISO-like)
     """
-    after_d = field_req.get("after_date")
-    before_d = field_req.get("before_date")
-    after_dt = field_req.get("after_datetime")
-    before_dt = field_req.get("before_datetime")
-
-    # Nothing to enforce
-    if not any([after_d, before_d, after_dt, before_dt]):
-        return True
-
     try:
-        from datetime import datetime
+        bounds = parse_date_bounds(field_req)
+        # Nothing to enforce
+        if bounds is None:
+            return True
 
         v = _parse_date_like(value)
         if v is None:
             return False
 
-        if after_d:
-            # Interpret as date-only lower bound (inclusive)
-            lb = datetime.fromisoformat(str(after_d))
-            if v < lb:
-                return False
-
-        if before_d:
-            ub = datetime.fromisoformat(str(before_d))
-            if v > ub:
-                return False
-
-        if after_dt:
-            lb = _parse_date_like(after_dt)
-            if lb and v < lb:
-                return False
-
-        if before_dt:
-            ub = _parse_date_like(before_dt)
-            if ub and v > ub:
-                return False
-
-        return True
+        lower, upper = bounds
+        return all(v >= lb for lb in lower) and all(v <= ub for ub in upper)
     except Exception:
         # If parsing fails, treat as failure for strictness
         return False
 
 
-def check_primary_key_uniqueness(data, standard_config):
-    """
-    Check for duplicate primary key values in the dataset.
-
-    Args:
-        data: DataFrame containing the data to validate
-        standard_config: Standard configuration dictionary
-
-    Returns:
-        List of validation failures for duplicate primary keys
-    """
-    import pandas as pd
-
-    failures = []
-
-    # Get primary key configuration from standard
-    record_id_config = standard_config.get("record_identification", {})
-    primary_key_fields = record_id_config.get("primary_key_fields", [])
-
-    if not primary_key_fields:
-        return failures  # No primary key defined, skip check
-
-    # Check if all primary key fields exist in data
-    missing_pk_fields = [
-        field for field in primary_key_fields if field not in data.columns
-    ]
-    if missing_pk_fields:
-        return failures  # Can't validate if primary key fields don't exist
-
-    # Create composite key for uniqueness checking
-    if len(primary_key_fields) == 1:
-        # Single primary key
-        pk_field = primary_key_fields[0]
-        duplicates = data[data.duplicated(subset=[pk_field], keep=False)]
-
-        if not duplicates.empty:
-            # Group duplicates by value
-            duplicate_groups = duplicates.groupby(pk_field)
-
-            for pk_value, group in duplicate_groups:
-                if pd.isna(pk_value):
-                    continue  # Skip null primary keys
-
-                duplicate_record_ids = []
-                for idx in group.index:
-                    record_id = f"{pk_value} (Row {idx + 1})"
-                    duplicate_record_ids.append(record_id)
-
-                if len(duplicate_record_ids) > 1:
-                    failures.append(
-                        {
-                            "validation_id": f"pk_dup_{pk_value}".replace(" ", "_"),
-                            "dimension": "consistency",
-                            "field": pk_field,
-                            "issue": "duplicate_primary_key",
-                            "affected_rows": len(duplicate_record_ids),
-                            "affected_percentage": (
-                                len(duplicate_record_ids) / len(data)
-                            )
-                            * 100,
-                            "samples": duplicate_record_ids,
-                            "remediation": f"Remove duplicate {pk_field} values: {pk_value}",
-                        }
-                    )
-    else:
-        # Compound primary key
-        duplicates = data[data.duplicated(subset=primary_key_fields, keep=False)]
-
-        if not duplicates.empty:
-            # Group duplicates by compound key
-            duplicate_groups = duplicates.groupby(primary_key_fields)
-
-            for pk_values, group in duplicate_groups:
-                # Create compound key string
-                if isinstance(pk_values, tuple):
-                    pk_str = ":".join(str(v) for v in pk_values if pd.notna(v))
-                else:
-                    pk_str = str(pk_values)
-
-                duplicate_record_ids = []
-                for idx in group.index:
-                    record_id = f"{pk_str} (Row {idx + 1})"
-                    duplicate_record_ids.append(record_id)
-
-                if len(duplicate_record_ids) > 1:
-                    failures.append(
-                        {
-                            "validation_id": f"pk_dup_{pk_str}".replace(
-                                " ", "_"
-                            ).replace(":", "_"),
-                            "dimension": "consistency",
-                            "field": ",".join(primary_key_fields),
-                            "issue": "duplicate_compound_key",
-                            "affected_rows": len(duplicate_record_ids),
-                            "affected_percentage": (
-                                len(duplicate_record_ids) / len(data)
-                            )
-                            * 100,
-                            "samples": duplicate_record_ids,
-                            "remediation": f"Remove duplicate compound key values: {pk_str}",
-                        }
-                    )
-
-    return failures
-
-
 # Validation handler functions (extracted to reduce complexity)
 def _validate_not_null(value, rule, field_req):
     """Validate not_null rule."""
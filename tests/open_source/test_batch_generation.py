@@ -0,0 +1,141 @@
+"""
+Tests for batch contract generation and the training snapshot store.
+"""
+
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+import yaml
+
+from src.adri.cli.commands.generate_contract import (
+    discover_data_files,
+    GenerateContractCommand,
+    is_batch_target,
+)
+from src.adri.utils.snapshot_store import (
+    hash_file,
+    object_digest,
+    referenced_digests,
+    SnapshotStore,
+)
+
+
+class TestBatchGeneration(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        (self.root / "data" / "nested").mkdir(parents=True)
+        (self.root / "contracts").mkdir()
+        (self.root / "training").mkdir()
+        self.data_file = self.root / "data" / "nested" / "orders.csv"
+        pd.DataFrame(
+            {"id": range(50), "status": ["open", "closed"] * 25}
+        ).to_csv(self.data_file, index=False)
+        (self.root / "data" / "notes.txt").write_text("ignored")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _generate(self, force=False):
+        return GenerateContractCommand()._generate_file(
+            str(self.data_file),
+            str(self.root / "contracts"),
+            str(self.root / "training"),
+            force=force,
+        )
+
+    def test_discovers_directories_and_globs(self):
+        data_dir = str(self.root / "data")
+        self.assertTrue(is_batch_target(data_dir))
+        self.assertTrue(is_batch_target(f"{data_dir}/*.csv"))
+        self.assertFalse(is_batch_target(str(self.data_file)))
+
+        expected = [self.data_file.resolve()]
+        self.assertEqual(discover_data_files([data_dir]), expected)
+        self.assertEqual(discover_data_files([f"{data_dir}/**/*.csv"]), expected)
+
+    def test_unchanged_files_are_skipped(self):
+        result = self._generate()
+        self.assertEqual(result["status"], "generated")
+        self.assertEqual(result["rows"], 50)
+
+        contract = yaml.safe_load(Path(result["output"]).read_text())
+        lineage = contract["training_data_lineage"]
+        self.assertEqual(lineage["file_hash"], hash_file(self.data_file))
+        self.assertEqual(lineage["snapshot_hash"], lineage["file_hash"])
+        self.assertEqual(
+            list((self.root / "contracts").iterdir()), [Path(result["output"])]
+        )
+
+        self.assertEqual(self._generate()["status"], "skipped")
+        # --force regenerates unchanged files, e.g. after changing options
+        self.assertEqual(self._generate(force=True)["status"], "generated")
+
+        # Changed content needs --force to replace the existing contract
+        self.data_file.write_text("id,status\n1,open\n")
+        self.assertEqual(self._generate()["status"], "failed")
+        self.assertEqual(self._generate(force=True)["status"], "generated")
+
+
+class TestSnapshotStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.first = self.root / "a.csv"
+        self.first.write_text("id,value\n1,x\n2,y\n")
+        self.copy = self.root / "b.csv"
+        self.copy.write_bytes(self.first.read_bytes())
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_identical_content_is_stored_once(self):
+        store = SnapshotStore(self.root / "training")
+        record = store.put(self.first)
+        self.assertIn(record.method, ("reflink", "copy"))
+        self.assertEqual(record.digest, hash_file(self.first))
+        self.assertEqual(object_digest(record.path), record.digest)
+
+        duplicate = store.put(self.copy)
+        self.assertEqual(duplicate.method, "existing")
+        self.assertEqual(duplicate.path, record.path)
+        self.assertEqual(len(list(store.iter_objects())), 1)
+
+    def test_compressed_objects_keep_content_digest(self):
+        store = SnapshotStore(self.root / "training", compress=True)
+        record = store.put(self.first)
+        self.assertTrue(record.compressed)
+        self.assertEqual(record.digest, hash_file(self.first))
+        with gzip.open(record.path, "rb") as f:
+            self.assertEqual(f.read(), self.first.read_bytes())
+
+    def test_garbage_collection_keeps_referenced_objects(self):
+        store = SnapshotStore(self.root / "training")
+        kept = store.put(self.first)
+        self.copy.write_text("id,value\n3,z\n")
+        dropped = store.put(self.copy)
+
+        contracts = self.root / "contracts"
+        contracts.mkdir()
+        (contracts / "a.yaml").write_text(
+            yaml.dump({"training_data_lineage": {"snapshot_hash": kept.digest}})
+        )
+        referenced = referenced_digests(contracts)
+
+        self.assertEqual(
+            store.collect_garbage(referenced, dry_run=True), [dropped.path]
+        )
+        self.assertTrue(dropped.path.exists())
+        store.collect_garbage(referenced)
+        self.assertEqual(list(store.iter_objects()), [kept.path])
+
+    def test_unknown_link_mode(self):
+        with self.assertRaises(ValueError):
+            SnapshotStore(self.root, link_mode="symlink")
+
+
+if __name__ == "__main__":
+    unittest.main()
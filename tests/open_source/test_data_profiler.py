@@ -20,6 +20,8 @@ import pandas as pd
 
 # Modern imports only - no legacy patterns
 from src.adri.analysis.data_profiler import DataProfiler, ProfileResult, FieldProfile, profile_dataframe
+from src.adri.analysis.sketches import HyperLogLog, QuantileSketch, hash_values
+from src.adri.analysis.streaming_profiler import StreamingProfiler
 from src.adri.core.exceptions import DataValidationError, ConfigurationError
 
 
@@ -655,3 +657,94 @@ class TestDataProfilerFunctionality:
         assert result is not None
         assert 'is_active' in result.field_profiles
         assert 'has_subscription' in result.field_profiles
+
+
+class TestStreamingProfiler:
+    """Tests for the sketch-based single-pass profiler."""
+
+    def _data(self, rows: int = 5000) -> pd.DataFrame:
+        rng = np.random.default_rng(7)
+        amount = rng.uniform(1, 1000, size=rows).round(2)
+        amount[::50] = np.nan
+        return pd.DataFrame({
+            "id": np.arange(rows),
+            "amount": amount,
+            "status": rng.choice(["active", "inactive", "pending"], size=rows),
+            "email": [f"user{i}@example.com" for i in range(rows)],
+        })
+
+    def test_matches_exact_profile(self):
+        """Counts, bounds, lengths and patterns match DataProfiler exactly."""
+        data = self._data()
+        exact = DataProfiler({"streaming": False}).profile_data(data)
+        streamed = StreamingProfiler({"chunk_rows": 777}).profile_data(data)
+
+        for column in data.columns:
+            a, b = exact.fields[column], streamed.fields[column]
+            assert (a.dtype, a.null_count, a.unique_count) == (b.dtype, b.null_count, b.unique_count)
+            for key in ("min_value", "max_value", "min_length", "max_length", "common_patterns"):
+                assert a.get(key) == b.get(key)
+            if a.get("mean_value") is not None:
+                assert b.mean_value == pytest.approx(a.mean_value)
+                assert b.std_dev == pytest.approx(a.std_dev)
+                assert b.median_value == pytest.approx(a.median_value, rel=0.02)
+        assert streamed.fields["status"].top_values[0][1] == data["status"].value_counts().iloc[0]
+        assert streamed.summary_statistics["total_rows"] == len(data)
+        assert streamed.metadata["streaming"] is True
+
+    def test_merge_and_file_input(self, tmp_path):
+        """Merged partial profiles and chunked CSV input equal a single pass."""
+        data = self._data()
+        whole = StreamingProfiler().profile_data(data)
+
+        left, right = StreamingProfiler(), StreamingProfiler()
+        left.update(data.iloc[:2000])
+        right.update(data.iloc[2000:])
+        merged = left.merge(right).result()
+
+        csv_path = tmp_path / "data.csv"
+        data.to_csv(csv_path, index=False)
+        from_file = StreamingProfiler({"chunk_rows": 1000}).profile_file(csv_path)
+
+        for result in (merged, from_file):
+            for column in data.columns:
+                assert result.fields[column].unique_count == whole.fields[column].unique_count
+                assert result.fields[column].null_count == whole.fields[column].null_count
+
+    def test_streaming_is_opt_in(self):
+        """Large data keeps exact statistics unless streaming is requested."""
+        data = self._data(3000)
+        exact = DataProfiler({"sample_size": 1000}).profile_data(data)
+        assert "streaming" not in exact.metadata
+        assert exact.fields["id"].median_value == data["id"].head(1000).median()
+
+        result = DataProfiler({"sample_size": 1000, "streaming": True}).profile_data(
+            data
+        )
+        assert result.summary_statistics["total_rows"] == 3000
+        assert result.fields["id"].unique_count == 3000
+
+    def test_distinct_estimate_capped_at_non_null_count(self):
+        """An overshooting distinct estimate never exceeds the values counted."""
+        values = np.random.default_rng(3).random(2000)
+        values[:10] = np.nan
+        result = StreamingProfiler({"exact_distinct_limit": 0}).profile_data(
+            pd.DataFrame({"amount": values})
+        )
+        assert result.fields["amount"].unique_count == 1990
+        assert result.fields["amount"].unique_percentage == pytest.approx(99.5)
+
+    def test_sketch_accuracy(self):
+        """HyperLogLog and quantile estimates stay within their error bounds."""
+        values = np.random.default_rng(1).lognormal(3, 1, size=200_000)
+        distinct = HyperLogLog(exact_limit=0)
+        distinct.update(hash_values(values))
+        assert abs(distinct.count() - len(values)) / len(values) < 0.04
+
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        sketch.update(values[:100_000])
+        other = QuantileSketch(relative_accuracy=0.01)
+        other.update(values[100_000:])
+        sketch.merge(other)
+        for q, estimate in zip((0.1, 0.5, 0.99), sketch.quantiles((0.1, 0.5, 0.99))):
+            assert estimate == pytest.approx(np.quantile(values, q), rel=0.02)
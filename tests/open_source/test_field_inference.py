@@ -0,0 +1,187 @@
+"""
+Tests for contract inference helpers.
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from src.adri.analysis.generation.field_inference import (
+    FieldInferenceEngine,
+    map_columns,
+)
+from src.adri.analysis.rule_inference import (
+    detect_primary_key,
+    infer_date_bounds,
+    infer_regex_pattern,
+    InferenceConfig,
+    pattern_coverage,
+)
+
+
+class TestDerivedFieldDetection(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        n = 400
+        region = rng.choice(["north", "south", "east", "west"], n)
+        self.data = pd.DataFrame(
+            {
+                "region": region,
+                "zone": np.where(np.isin(region, ["north", "east"]), "A", "B"),
+                "noise": rng.choice(["x", "y", "z"], n),
+                "amount": rng.normal(100, 10, n),
+                "constant": "k",
+            }
+        )
+        self.field_reqs = {
+            "region": {"allowed_values": ["east", "north", "south", "west"]},
+            "zone": {"allowed_values": ["A", "B"]},
+            "noise": {"allowed_values": ["x", "y", "z"]},
+        }
+
+    def test_cramers_v_matches_reference(self):
+        engine = FieldInferenceEngine()
+        x = pd.Series(["a", "a", "b", "b", "a", "b"])
+        y = pd.Series(["u", "u", "v", "v", "v", "u"])
+        # 2x2 table [[2, 1], [1, 2]]: chi-square 2/3, V = sqrt(2/3 / 6)
+        self.assertAlmostEqual(engine._cramers_v(x, y), (2 / 3 / 6) ** 0.5)
+        self.assertEqual(engine._cramers_v(x, pd.Series(["u"] * 6)), 0.0)
+
+    def test_correlation_ratio_matches_reference(self):
+        engine = FieldInferenceEngine()
+        categories = pd.Series(["a", "a", "b", "b"])
+        self.assertAlmostEqual(
+            engine._correlation_ratio(categories, pd.Series([1.0, 1.0, 3.0, 3.0])), 1.0
+        )
+        self.assertEqual(
+            engine._correlation_ratio(categories, pd.Series([2.0] * 4)), 0.0
+        )
+
+    def test_detects_functional_dependency(self):
+        engine = FieldInferenceEngine()
+        derived = engine.detect_derived_fields(self.data, self.field_reqs)
+
+        self.assertEqual(derived["zone"]["input_fields"], ["region"])
+        self.assertAlmostEqual(derived["zone"]["confidence"], 1.0)
+        self.assertNotIn("noise", derived)
+
+    def test_parallel_and_sequential_agree(self):
+        engine = FieldInferenceEngine()
+        self.assertEqual(
+            engine.detect_derived_fields(self.data, self.field_reqs, max_workers=1),
+            engine.detect_derived_fields(self.data, self.field_reqs, max_workers=4),
+        )
+
+
+class TestParallelColumnInference(unittest.TestCase):
+    def test_backends_produce_identical_requirements(self):
+        rng = np.random.default_rng(1)
+        n = 200
+        data = pd.DataFrame(
+            {
+                "code": [f"AB-{int(i):04d}" for i in rng.integers(0, 9999, n)],
+                "status": rng.choice(["open", "closed"], n),
+                "amount": rng.normal(50, 5, n),
+                "created": pd.date_range("2024-01-01", periods=n).strftime("%Y-%m-%d"),
+            }
+        )
+        engine = FieldInferenceEngine()
+        results = [
+            engine.infer_field_requirements(
+                data, {}, InferenceConfig(parallel_backend=backend, max_workers=2)
+            )
+            for backend in (None, "thread", "process")
+        ]
+        self.assertEqual(list(results[2]), list(data.columns))
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], results[2])
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            map_columns(len, [("a",), ("b",)], InferenceConfig(parallel_backend="gpu"))
+
+
+class TestSampledPatternAndDateInference(unittest.TestCase):
+    def test_pattern_confirmed_beyond_sample(self):
+        values = [f"INV-{i:05d}" for i in range(2000)]
+        self.assertEqual(
+            infer_regex_pattern(pd.Series(values), sample_size=16),
+            r"^[A-Za-z]+-\d{3,}$",
+        )
+        # One value outside the sample breaks the id-like shape
+        values[1234] = "INV_01234"
+        self.assertEqual(
+            infer_regex_pattern(pd.Series(values), sample_size=16), r"^[A-Za-z0-9\-_]+$"
+        )
+
+    def test_mixed_types_are_matched_as_rendered(self):
+        # 1, 1.0 and True compare equal but render as "1", "1.0" and "True"
+        self.assertIsNone(infer_regex_pattern(pd.Series(["1", "2", 1, 1.0])))
+        self.assertIsNone(infer_regex_pattern(pd.Series([True, 1.0, -5, "US"])))
+        self.assertEqual(
+            infer_regex_pattern(pd.Series(["1", "2", 1, True])), r"^[A-Za-z0-9\-_]+$"
+        )
+
+    def test_date_bounds_cover_rare_formats(self):
+        dates = pd.date_range("2024-01-01", periods=500).strftime("%Y-%m-%d").tolist()
+        dates += ["12/31/2023", "2024/06/01 10:00:00", "not a date", "2024-13-01"]
+        self.assertEqual(
+            infer_date_bounds(pd.Series(dates), margin_days=0, sample_size=8),
+            ("2023-12-31", "2025-05-14"),
+        )
+
+    def test_pattern_coverage_weights_by_count(self):
+        series = pd.Series(["a1", "a1", "a1", "b-2", None])
+        self.assertAlmostEqual(pattern_coverage(series, r"^[a-z]\d$"), 0.75)
+
+
+class TestPrimaryKeyDetection(unittest.TestCase):
+    def test_composite_key_after_pruning(self):
+        # status x region has 4 combinations for 6 rows and is pruned without
+        # a uniqueness check; the unique pair includes the id-like column
+        data = pd.DataFrame(
+            {
+                "status": ["open", "paid", "open", "paid", "open", "paid"],
+                "region": ["n", "n", "s", "s", "n", "s"],
+                "order_id": [1, 1, 2, 2, 3, 3],
+                "line": [1, 2, 1, 2, 1, 2],
+            }
+        )
+        self.assertEqual(detect_primary_key(data), ["order_id", "line"])
+
+    def test_hash_collisions_are_confirmed_on_rows(self):
+        data = pd.DataFrame(
+            {"batch": ["a", "a", "b", "b"], "seq": [1, 2, 1, 2], "flag": [0, 1, 0, 1]}
+        )
+
+        def colliding(series, index=False):
+            return pd.Series(np.zeros(len(series), dtype=np.uint64))
+
+        with mock.patch(
+            "src.adri.analysis.rule_inference.pd.util.hash_pandas_object",
+            side_effect=colliding,
+        ):
+            # Every row hashes alike, but only (seq, flag) has real duplicates
+            self.assertEqual(detect_primary_key(data), ["batch", "seq"])
+            duplicated = data.assign(seq=[1, 1, 2, 2], flag=[0, 0, 0, 0])
+            self.assertEqual(detect_primary_key(duplicated), [])
+
+    def test_ties_in_score_order(self):
+        data = pd.DataFrame(
+            {
+                "first": ["aa", "aa", "bb", "bb"],
+                "second": ["c", "d", "c", "d"],
+                "third": ["e", "e", "f", "f"],
+            }
+        )
+        # Equal id-like scores: shortest combined length wins
+        self.assertEqual(detect_primary_key(data), ["second", "third"])
+        # Equal lengths too: first combo in column order wins
+        data["third"] = ["ee", "ee", "ff", "ff"]
+        self.assertEqual(detect_primary_key(data), ["first", "second"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Tests for single-flight contract auto-generation in the guard.
+"""
+
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import yaml
+
+from src.adri.guard.modes import DataProtectionEngine, ProtectionError
+from src.adri.utils.locking import FileLock
+
+
+class TestSingleFlightGeneration(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.contract_path = str(Path(self._tmp.name) / "orders_contract.yaml")
+        self.data = pd.DataFrame({"id": range(20), "status": ["open", "closed"] * 10})
+        self.generated = []
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _engine(self, **protection):
+        engine = DataProtectionEngine()
+        engine._protection_config = {
+            **engine._get_default_protection_config(),
+            **protection,
+        }
+        return engine
+
+    def _slow_generate(self, contract_path, sample_data):
+        self.generated.append(contract_path)
+        time.sleep(0.3)
+        Path(contract_path).write_text(yaml.dump({"contracts": {"id": "orders"}}))
+
+    def test_concurrent_workers_generate_once(self):
+        results = []
+
+        def worker():
+            engine = self._engine()
+            results.append(
+                engine._ensure_contract_exists(self.contract_path, self.data)
+            )
+
+        with patch.object(
+            DataProtectionEngine, "_generate_contract", self._slow_generate
+        ):
+            threads = [threading.Thread(target=worker) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(self.generated), 1)
+        self.assertEqual(results, [True] * 6)
+        self.assertTrue(Path(self.contract_path).exists())
+        # The lock file stays but is released
+        lock = FileLock(f"{Path(self.contract_path).resolve()}.lock")
+        self.assertTrue(lock.acquire(timeout=0))
+        lock.release()
+
+    def test_provisional_and_timeout_while_locked(self):
+        lock = FileLock(f"{Path(self.contract_path).resolve()}.lock")
+        self.assertTrue(lock.acquire(timeout=0))
+        try:
+            provisional = self._engine(auto_generate_wait="provisional")
+            self.assertFalse(
+                provisional._ensure_contract_exists(self.contract_path, self.data)
+            )
+            waiting = self._engine(auto_generate_timeout=0.1)
+            with self.assertRaises(ProtectionError):
+                waiting._ensure_contract_exists(self.contract_path, self.data)
+        finally:
+            lock.release()
+
+    def test_generation_samples_large_payloads(self):
+        engine = self._engine(auto_generate_sample_rows=50)
+        data = pd.DataFrame({"id": range(500), "amount": [1.5, 2.5] * 250})
+        self.assertTrue(engine._ensure_contract_exists(self.contract_path, data))
+
+        contract = yaml.safe_load(Path(self.contract_path).read_text())
+        self.assertEqual(contract["metadata"]["sampling"]["sample_rows"], 50)
+        self.assertEqual(contract["metadata"]["sampling"]["total_rows"], 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+"""
+Tests for sampled contract generation and training-pass relaxation.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.adri.analysis.contract_generator import ContractGenerator
+from src.adri.analysis.generation.contract_builder import ContractBuilder
+from src.adri.analysis.generation.field_inference import FieldInferenceEngine
+from src.adri.analysis.sampling import sample_rows, SamplingConfig
+
+
+def _make_data(n=5000):
+    rng = np.random.default_rng(3)
+    data = pd.DataFrame(
+        {
+            "id": np.arange(n),
+            "segment": rng.choice(
+                ["retail", "sme", "corp", "gov"], n, p=[0.8, 0.15, 0.045, 0.005]
+            ),
+            "amount": rng.normal(100, 25, n).round(2),
+            "code": [f"C{int(i):05d}" for i in rng.integers(0, 99999, n)],
+            "created": pd.date_range("2023-01-01", periods=n, freq="h").strftime(
+                "%Y-%m-%d"
+            ),
+        }
+    )
+    # Outliers a small sample will almost certainly miss
+    data.loc[n - 1, "amount"] = 1_000_000.0
+    data.loc[n - 2, "segment"] = "unknown"
+    data.loc[n - 3, "code"] = "not-a-code"
+    return data
+
+
+class TestSampleRows(unittest.TestCase):
+    def test_reservoir_is_sized_and_ordered(self):
+        data = _make_data()
+        sample = sample_rows(data, SamplingConfig(size=300, seed=1))
+        self.assertEqual(len(sample), 300)
+        self.assertTrue(sample["id"].is_monotonic_increasing)
+        again = sample_rows(data, SamplingConfig(size=300, seed=1))
+        self.assertTrue(sample.equals(again))
+
+    def test_small_data_is_returned_unchanged(self):
+        data = _make_data(100)
+        self.assertIs(sample_rows(data, SamplingConfig(size=500)), data)
+
+    def test_stratified_keeps_rare_values(self):
+        data = _make_data()
+        sample = sample_rows(
+            data, SamplingConfig(size=200, strategy="stratified", column="segment")
+        )
+        self.assertLessEqual(len(sample), 200)
+        self.assertEqual(set(sample["segment"]), set(data["segment"]))
+
+    def test_stratified_keeps_every_stratum_up_to_size(self):
+        # 62 strata in 100 rows: rounding rare strata up to one row overshoots
+        data = _make_data()
+        data.loc[: len(data) - 62, "segment"] = "bulk"
+        data.loc[len(data) - 61 :, "segment"] = [f"rare{i}" for i in range(61)]
+        for size in (62, 100):
+            with self.subTest(size=size):
+                sample = sample_rows(
+                    data,
+                    SamplingConfig(size=size, strategy="stratified", column="segment"),
+                )
+                self.assertEqual(len(sample), size)
+                self.assertEqual(sample["segment"].nunique(), 62)
+
+    def test_time_covers_whole_range(self):
+        data = _make_data()
+        sample = sample_rows(
+            data, SamplingConfig(size=200, strategy="time", column="created")
+        )
+        dates = pd.to_datetime(sample["created"])
+        self.assertLess(dates.min(), pd.Timestamp("2023-01-10"))
+        self.assertGreater(dates.max(), pd.Timestamp("2023-07-01"))
+
+    def test_invalid_config(self):
+        with self.assertRaises(ValueError):
+            SamplingConfig(size=10, strategy="systematic")
+        with self.assertRaises(ValueError):
+            SamplingConfig(size=10, strategy="stratified")
+
+
+class TestSampledGeneration(unittest.TestCase):
+    def test_full_data_passes_contract_generated_from_sample(self):
+        data = _make_data()
+        contract = ContractGenerator().generate(
+            data, "sampled", {"sampling": {"size": 400, "seed": 7}}
+        )
+
+        sampling = contract["metadata"]["sampling"]
+        self.assertEqual(sampling["sample_rows"], 400)
+        self.assertEqual(sampling["total_rows"], len(data))
+
+        engine = FieldInferenceEngine()
+        field_reqs = contract["requirements"]["field_requirements"]
+        for col in data.columns:
+            for value in data[col].dropna().unique():
+                self.assertIsNone(
+                    engine.validate_field_against_rules(value, field_reqs[col]),
+                    f"{col}={value!r}",
+                )
+
+    def test_find_failing_rules_matches_scalar_check(self):
+        engine = FieldInferenceEngine()
+        series = pd.Series(["a", "bb", None, "a"])
+        field_req = {"type": "string", "allowed_values": ["a"], "max_length": 1}
+        self.assertEqual(
+            engine.find_failing_rules(series, field_req)[0],
+            engine.validate_field_against_rules("bb", field_req),
+        )
+        integer = {"type": "integer"}
+        self.assertEqual(engine.find_failing_rules(pd.Series(["1", " 2"]), integer), [])
+        self.assertEqual(
+            engine.find_failing_rules(pd.Series(["1", "x"]), integer), ["type"]
+        )
+
+    def test_date_bounds_candidates_are_vectorized(self):
+        engine = FieldInferenceEngine()
+        values = pd.Series(["2024-01-05", "2023-12-31", "01/02/2024", "2024-02-30"])
+        field_req = {"type": "date", "after_date": "2024-01-01"}
+        mask = engine._candidate_failures(
+            "date_bounds", values, lambda: values.astype(str), field_req
+        )
+        # Only the out-of-range and non-ISO values need the scalar check
+        self.assertEqual(np.asarray(mask).tolist(), [False, True, True, True])
+        self.assertEqual(engine.find_failing_rules(values, field_req), ["date_bounds"])
+
+
+class TestTrainingPassRelaxation(unittest.TestCase):
+    def test_relaxes_from_column_aggregates(self):
+        data = _make_data(500)
+        standard = {
+            "requirements": {
+                "field_requirements": {
+                    "segment": {
+                        "type": "string",
+                        "nullable": False,
+                        "allowed_values": ["retail"],
+                    },
+                    "amount": {"type": "float", "min_value": 90.0, "max_value": 110.0},
+                    "code": {"type": "string", "max_length": 3, "pattern": "^Z"},
+                }
+            }
+        }
+        ContractBuilder().enforce_training_pass_guarantee(data, standard)
+
+        field_reqs = standard["requirements"]["field_requirements"]
+        self.assertEqual(
+            set(field_reqs["segment"]["allowed_values"]), set(data["segment"])
+        )
+        self.assertEqual(field_reqs["amount"]["min_value"], data["amount"].min())
+        self.assertEqual(field_reqs["amount"]["max_value"], data["amount"].max())
+        self.assertEqual(field_reqs["code"]["max_length"], 10)
+        self.assertNotIn("pattern", field_reqs["code"])
+
+        adjustments = standard["metadata"]["explanations"]["segment"]["adjustments"]
+        self.assertEqual(adjustments[0]["action"], "widened")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Tests for the contract-driven synthetic data generator.
+"""
+
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from src.adri.analysis.synthetic import SyntheticDataGenerator
+from src.adri.validator.rules import (
+    check_allowed_values,
+    check_date_bounds,
+    check_field_pattern,
+    check_field_range,
+    check_field_type,
+    check_length_bounds,
+)
+
+CONTRACT = {
+    "record_identification": {"primary_key_fields": ["order_id"]},
+    "requirements": {
+        "field_requirements": {
+            "order_id": {"type": "integer", "nullable": False, "min_value": 1},
+            "email": {
+                "type": "string",
+                "nullable": False,
+                "pattern": r"^[^@]+@[^@]+\.[^@]+$",
+                "min_length": 14,
+                "max_length": 24,
+            },
+            "status": {
+                "type": "string",
+                "nullable": False,
+                "allowed_values": ["open", "paid", "void"],
+            },
+            "amount": {
+                "type": "float",
+                "nullable": True,
+                "min_value": 0.0,
+                "max_value": 500.0,
+            },
+            "order_date": {
+                "type": "date",
+                "nullable": False,
+                "after_date": "2024-01-01",
+                "before_date": "2024-12-31",
+            },
+        }
+    },
+}
+
+CHECKS = (
+    check_field_type,
+    check_allowed_values,
+    check_field_range,
+    check_length_bounds,
+    check_field_pattern,
+    check_date_bounds,
+)
+
+
+def _row_valid(value, field_req):
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return field_req.get("nullable", True)
+    return all(check(value, field_req) for check in CHECKS)
+
+
+class TestSyntheticDataGenerator(unittest.TestCase):
+    """Test conforming and violating data generation."""
+
+    def setUp(self):
+        self.fields = CONTRACT["requirements"]["field_requirements"]
+
+    def test_clean_data_conforms_to_contract(self):
+        df = SyntheticDataGenerator(CONTRACT, seed=3).generate(2000)
+        self.assertEqual(list(df.columns), list(self.fields))
+        self.assertTrue(df["order_id"].is_unique)
+        for name, field_req in self.fields.items():
+            invalid = [v for v in df[name].tolist() if not _row_valid(v, field_req)]
+            self.assertEqual(invalid, [], name)
+
+    def test_violations_break_their_rule(self):
+        generator = SyntheticDataGenerator(CONTRACT, seed=3)
+        df = generator.generate(5000, violation_rate=0.02, duplicate_pk_rate=0.01)
+        counts = generator.last_violations
+
+        self.assertEqual(
+            set(counts["email"]), {"not_null", "type", "length_bounds", "pattern"}
+        )
+        self.assertIn("allowed_values", counts["status"])
+        self.assertIn("date_bounds", counts["order_date"])
+        for name, field_req in self.fields.items():
+            invalid = sum(not _row_valid(v, field_req) for v in df[name].tolist())
+            if name == "order_id":
+                continue
+            self.assertEqual(invalid, sum(counts[name].values()), name)
+        self.assertGreater(counts["_primary_key"]["duplicate"], 0)
+        self.assertFalse(df["order_id"].dropna().is_unique)
+
+    def test_string_primary_keys_are_unique(self):
+        # (key requirement, whether generated keys can also match its pattern)
+        cases = [
+            ({"type": "string", "pattern": r"^[A-Za-z]+-\d{3,}$"}, True),
+            ({"type": "string", "pattern": r"^[a-z]+$", "max_length": 3}, False),
+        ]
+        for key_req, matches in cases:
+            contract = {
+                "record_identification": {"primary_key_fields": ["key"]},
+                "requirements": {"field_requirements": {"key": key_req}},
+            }
+            with self.subTest(key_req=key_req):
+                keys = SyntheticDataGenerator(contract, seed=2).generate(3000)["key"]
+                self.assertTrue(keys.is_unique)
+                self.assertEqual(keys.str.match(key_req["pattern"]).all(), matches)
+
+    def test_deterministic_for_seed(self):
+        first = SyntheticDataGenerator(CONTRACT, seed=9).generate(300, violation_rate=0.05)
+        second = SyntheticDataGenerator(CONTRACT, seed=9).generate(300, violation_rate=0.05)
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_parquet_output_in_chunks(self):
+        generator = SyntheticDataGenerator(CONTRACT, seed=1)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "orders.parquet")
+            generator.to_parquet(path, 2500, chunk_rows=1000, violation_rate=0.01)
+            df = pd.read_parquet(path)
+        self.assertEqual(len(df), 2500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Tests for the benchmark suite in adri.benchmarks.
+"""
+
+import unittest
+
+from src.adri.benchmarks import compare_results, make_dataset, run_benchmarks
+
+
+class TestBenchmarkDatasets(unittest.TestCase):
+    """Test synthetic benchmark datasets."""
+
+    def test_dataset_is_deterministic(self):
+        first = make_dataset(500, failure_rate=0.1, seed=7)
+        second = make_dataset(500, failure_rate=0.1, seed=7)
+        self.assertTrue(first.equals(second))
+        self.assertEqual(len(first), 500)
+
+    def test_failure_rate_controls_violations(self):
+        clean = make_dataset(2000, failure_rate=0.0)
+        dirty = make_dataset(2000, failure_rate=0.1)
+        self.assertFalse(clean["customer_id"].duplicated().any())
+        self.assertEqual((clean["age"] > 90).sum(), 0)
+        self.assertTrue(140 < (dirty["age"] == 150).sum() < 260)
+        self.assertTrue(dirty["customer_id"].duplicated().any())
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    """Test running cases and comparing against a baseline."""
+
+    def test_run_selected_cases(self):
+        results = run_benchmarks(
+            rows=[200], cases=["assess", "dimension", "load_csv"], repeat=1
+        )
+        cases = [entry["case"] for entry in results["results"]]
+        self.assertEqual(cases[0], "assess")
+        self.assertIn("dimension.validity", cases)
+        self.assertIn("load_csv", cases)
+        self.assertNotIn("generate_contract", cases)
+        assess = results["results"][0]
+        self.assertGreater(assess["median_ms"], 0)
+        self.assertIn("peak_memory_mb", assess)
+
+    def test_unknown_case_rejected(self):
+        with self.assertRaises(ValueError):
+            run_benchmarks(rows=[10], cases=["nope"])
+
+    def test_compare_flags_regressions(self):
+        baseline = {"results": [
+            {"case": "assess", "rows": 1000, "median_ms": 10.0},
+            {"case": "load_csv", "rows": 1000, "median_ms": 10.0},
+        ]}
+        current = {"results": [
+            {"case": "assess", "rows": 1000, "median_ms": 11.0},
+            {"case": "load_csv", "rows": 1000, "median_ms": 13.0},
+            {"case": "audit_log", "rows": 1000, "median_ms": 1.0},
+        ]}
+        comparison = compare_results(current, baseline, tolerance=0.15)
+        self.assertEqual(
+            [(c["case"], c["regression"]) for c in comparison],
+            [("assess", False), ("load_csv", True)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
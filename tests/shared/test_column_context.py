@@ -0,0 +1,71 @@
+"""
+Tests for the shared per-assessment column context.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from src.adri.validator import column_context
+from src.adri.validator.column_context import (
+    ColumnContext,
+    column_context_scope,
+    get_column_context,
+)
+from src.adri.validator.dimensions.freshness import FreshnessAssessor
+
+
+class TestColumnContext(unittest.TestCase):
+    def setUp(self):
+        self.data = pd.DataFrame(
+            {
+                "amount": [1.5, None, 3.0],
+                "updated": ["2024-01-02T00:00:00Z", "bad", None],
+            }
+        )
+
+    def test_representations_are_memoized(self):
+        context = ColumnContext(self.data)
+        self.assertEqual(context.non_null("amount").tolist(), [1.5, 3.0])
+        self.assertIs(context.non_null("amount"), context.non_null("amount"))
+        self.assertEqual(context.null_count("amount"), 1)
+        self.assertEqual(context.null_counts().to_dict(), {"amount": 1, "updated": 1})
+        self.assertEqual(context.strings("amount").tolist(), ["1.5", "3.0"])
+
+        parsed = context.datetimes("updated")
+        self.assertEqual(parsed.iloc[0], pd.Timestamp("2024-01-02"))
+        self.assertTrue(parsed.iloc[1:].isna().all())
+
+    def test_scope_shares_contexts_per_dataframe(self):
+        self.assertIsNot(get_column_context(self.data), get_column_context(self.data))
+        with column_context_scope():
+            shared = get_column_context(self.data)
+            with column_context_scope():
+                self.assertIs(get_column_context(self.data), shared)
+            self.assertIsNot(get_column_context(self.data.copy()), shared)
+
+    def test_assessment_and_breakdown_parse_dates_once(self):
+        requirements = {
+            "scoring": {"rule_weights": {"recency_window": 1.0}},
+            "metadata": {
+                "freshness": {
+                    "as_of": "2024-01-10T00:00:00Z",
+                    "window_days": 30,
+                    "date_field": "updated",
+                }
+            }
+        }
+        assessor = FreshnessAssessor()
+        with patch.object(
+            column_context, "_parse_utc_naive", wraps=column_context._parse_utc_naive
+        ) as parse, column_context_scope():
+            score = assessor.assess(self.data, requirements)
+            breakdown = assessor.get_freshness_breakdown(self.data, requirements)
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(breakdown["counts"], {"passed": 1, "total": 1})
+        self.assertEqual(score, 20.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
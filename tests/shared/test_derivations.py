@@ -0,0 +1,169 @@
+"""
+Tests for evaluating derivation rules of derived categorical fields.
+"""
+
+import unittest
+
+import pandas as pd
+
+from src.adri.validator.derivations import (
+    compile_derivation,
+    derived_field_specs,
+    translate_derivation_logic,
+)
+from src.adri.validator.dimensions.consistency import ConsistencyAssessor
+from src.adri.validator.expressions import ExpressionError
+
+RISK_LEVELS = {
+    "High": {
+        "definition": "Any other at-risk or blocked project",
+        "precedence": 2,
+        "derivation_rule": {
+            "type": "ordered_conditions",
+            "inputs": ["project_status"],
+            "logic": "IF project_status IN ('At Risk', 'Blocked')",
+        },
+    },
+    "Critical": {
+        "definition": "At-risk top priority projects",
+        "precedence": 1,
+        "derivation_rule": {
+            "type": "ordered_conditions",
+            "inputs": ["project_status", "priority_order"],
+            "logic": "IF project_status = 'At Risk' AND priority_order = 1 "
+            "THEN 'Critical'",
+        },
+    },
+    "Low": {"definition": "Everything else", "precedence": 3},
+}
+
+
+class TestDerivationLogic(unittest.TestCase):
+    def test_sql_logic_is_translated(self):
+        cases = {
+            "IF project_status = 'At Risk' AND priority_order = 1 THEN 'Critical'": (
+                "project_status == 'At Risk' and priority_order == 1",
+                "Critical",
+            ),
+            "owner IS NOT NULL OR NOT status <> 'O''Neil'": (
+                "notnull(owner) or not status != \"O'Neil\"",
+                None,
+            ),
+            "IF `due in` >= 3 then 2": ("`due in` >= 3", "2"),
+            "`In Progress` = TRUE AND `Is Done` IS NULL": (
+                "`In Progress` == True and isnull(`Is Done`)",
+                None,
+            ),
+        }
+        for logic, expected in cases.items():
+            with self.subTest(logic=logic):
+                self.assertEqual(translate_derivation_logic(logic), expected)
+
+    def test_rules_are_checked_in_precedence_order(self):
+        data = pd.DataFrame(
+            {
+                "project_status": [
+                    "At Risk",
+                    "At Risk",
+                    "Blocked",
+                    "On Track",
+                    None,
+                    "On Track",
+                    "At Risk",
+                ],
+                "priority_order": ["1", "2", "1", "1", "1", "3", None],
+                "risk": ["Critical", "Critical", "High", "Low", "High", "High", "High"],
+            }
+        )
+        checked, passed, expected = compile_derivation("risk", RISK_LEVELS).evaluate(
+            data
+        )
+        self.assertEqual(
+            expected.tolist(),
+            ["Critical", "High", "High", None, None, None, "High"],
+        )
+        # Low has no rule and row 4's own condition has a missing input
+        self.assertEqual(checked.tolist(), [1, 1, 1, 0, 0, 1, 1])
+        self.assertEqual(passed.tolist(), [1, 0, 1, 0, 0, 0, 1])
+
+    def test_only_reviewed_ordered_conditions_are_evaluated(self):
+        placeholder = {
+            "A": {
+                "definition": "d",
+                "precedence": 1,
+                "derivation_rule": {
+                    "type": "ordered_conditions",
+                    "inputs": ["x"],
+                    "logic": "IF x = 'a' THEN 'A'",
+                    "metadata": {"auto_generated": True},
+                },
+            }
+        }
+        specs = derived_field_specs(
+            {
+                "risk": {"type": "string", "allowed_values": RISK_LEVELS},
+                "generated": {"type": "string", "allowed_values": placeholder},
+                "plain": {"type": "string", "allowed_values": ["a", "b"]},
+            }
+        )
+        self.assertEqual(list(specs), ["risk"])
+
+        mislabeled = {**RISK_LEVELS, "Low": {**RISK_LEVELS["High"], "precedence": 3}}
+        mislabeled["Low"]["derivation_rule"] = {
+            **RISK_LEVELS["High"]["derivation_rule"],
+            "logic": "IF project_status = 'On Track' THEN 'High'",
+        }
+        with self.assertRaises(ExpressionError):
+            compile_derivation("risk", mislabeled)
+
+
+class TestDerivedFieldConsistency(unittest.TestCase):
+    def test_mismatches_are_scored_and_reported(self):
+        data = pd.DataFrame(
+            {
+                "project_status": ["At Risk", "At Risk", "Blocked", "On Track"],
+                "priority_order": [1, 2, 1, 1],
+                "risk": ["Critical", "Critical", "High", "Low"],
+            }
+        )
+        requirements = {
+            "scoring": {"rule_weights": {"cross_field_logic": 1.0}},
+            "derived_fields": {"risk": RISK_LEVELS},
+        }
+        assessor = ConsistencyAssessor()
+        self.assertAlmostEqual(assessor.assess(data, requirements), 20.0 * 2 / 3)
+
+        failures = assessor.get_validation_failures(data, requirements)
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(failures[0]["issue"], "derived_value_mismatch")
+        self.assertEqual(failures[0]["field"], "risk")
+        self.assertEqual(
+            failures[0]["samples"],
+            [
+                "Row 1: project_status=At Risk, priority_order=2, risk=Critical "
+                "(expected High)"
+            ],
+        )
+
+    def test_unevaluable_derivations_are_reported(self):
+        data = pd.DataFrame({"project_status": ["At Risk"], "risk": ["High"]})
+        requirements = {
+            "scoring": {"rule_weights": {"cross_field_logic": 1.0}},
+            "derived_fields": {"risk": RISK_LEVELS},
+        }
+        assessor = ConsistencyAssessor()
+        with self.assertLogs(
+            "src.adri.validator.dimensions.consistency", level="WARNING"
+        ):
+            self.assertEqual(assessor.assess(data, requirements), 20.0)
+
+        failures = assessor.get_validation_failures(data, requirements)
+        self.assertEqual(
+            [(f["field"], f["issue"]) for f in failures],
+            [("risk", "cross_field_rule_not_evaluated")],
+        )
+        self.assertIn("priority_order", failures[0]["remediation"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1094,5 +1094,71 @@ class TestValidatorEngineRefactor(unittest.TestCase):
         self.assertGreaterEqual(score, 15.0)
 
 
+class TestAssessmentTimings(unittest.TestCase):
+    """Test opt-in timing spans stored in result.metadata["timings"]."""
+
+    def setUp(self):
+        """Write a contract generated from clean sample data."""
+        import yaml
+
+        from src.adri.analysis.contract_generator import ContractGenerator
+
+        self.data = pd.DataFrame({
+            "customer_id": [1, 2, 3, 4, 5],
+            "email": ["a@x.com", "b@x.com", "c@x.com", "d@x.com", "e@x.com"],
+            "amount": [10.5, 20.0, 30.25, 40.0, 50.75],
+        })
+        contract = ContractGenerator().generate(data=self.data, data_name="timings")
+        # Use flat field constraints so validity runs per rule type
+        for field_req in contract["requirements"]["field_requirements"].values():
+            field_req.pop("validation_rules", None)
+
+        fd, self.contract_path = tempfile.mkstemp(suffix=".yaml")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            yaml.safe_dump(contract, f, sort_keys=False)
+
+    def tearDown(self):
+        os.unlink(self.contract_path)
+
+    def test_timings_disabled_by_default(self):
+        assessor = DataQualityAssessor({"audit": {"enabled": False}})
+        result = assessor.assess(self.data, self.contract_path)
+        self.assertNotIn("timings", result.metadata)
+
+    def test_timings_recorded_when_enabled(self):
+        assessor = DataQualityAssessor({"audit": {"enabled": False}, "timings": True})
+        result = assessor.assess(self.data, self.contract_path)
+
+        timings = result.metadata["timings"]
+        self.assertGreater(timings["total_ms"], 0)
+        self.assertIn("schema_validation", timings["phases"])
+        self.assertIn("contract_load", timings["phases"])
+        self.assertEqual(
+            set(timings["dimensions"]),
+            {"validity", "completeness", "consistency", "freshness", "plausibility"},
+        )
+        self.assertIn("type", timings["rules"]["validity"]["email"])
+
+    def test_timings_written_to_dimension_log(self):
+        import json
+
+        with tempfile.TemporaryDirectory() as log_dir:
+            assessor = DataQualityAssessor(
+                {"audit": {"enabled": True, "log_dir": log_dir}, "timings": True}
+            )
+            result = assessor.assess(self.data, self.contract_path)
+
+            self.assertIn("failure_collection", result.metadata["timings"]["phases"])
+            self.assertIn("audit_write", result.metadata["timings"]["phases"])
+
+            with open(
+                os.path.join(log_dir, "adri_dimension_scores.jsonl"), encoding="utf-8"
+            ) as f:
+                records = [json.loads(line) for line in f if line.strip()]
+            validity = next(r for r in records if r["dimension_name"] == "validity")
+            self.assertIn("duration_ms", validity["details"])
+            self.assertIn("email", validity["details"]["rule_timings_ms"])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,157 @@
+"""
+Tests for restricted column expressions and declared cross-field rules.
+"""
+
+import unittest
+
+import pandas as pd
+
+from src.adri.contracts.validator import ContractValidator
+from src.adri.validator.dimensions.consistency import ConsistencyAssessor
+from src.adri.validator.expressions import compile_expression, ExpressionError
+
+
+class TestCompileExpression(unittest.TestCase):
+    def setUp(self):
+        # CSV-style text columns, as load_data returns them
+        self.data = pd.DataFrame(
+            {
+                "start_date": ["2024-01-01", "2024-02-01", None, "2024-03-01"],
+                "end_date": ["2024-01-05", "2024-01-15", "2024-01-01", "2024-03-31"],
+                "total": ["10.00", "11", "5", None],
+                "subtotal": [9.0, 10.0, 4.0, 1.0],
+                "tax": [1.0, 1.0, 0.5, 0.0],
+                "status": ["paid", "void", "paid", "new"],
+                "shipped on": [None, "2024-01-20", None, None],
+            }
+        )
+
+    def evaluate(self, expression):
+        checked, passed = compile_expression(expression).evaluate(self.data)
+        return checked.tolist(), passed.tolist()
+
+    def test_rows_with_missing_operands_are_not_checked(self):
+        checked, passed = self.evaluate("end_date >= start_date")
+        self.assertEqual(checked, [True, True, False, True])
+        self.assertEqual(passed, [True, False, False, True])
+
+        checked, passed = self.evaluate("abs(total - (subtotal + tax)) < 0.01")
+        self.assertEqual(checked, [True, True, True, False])
+        self.assertEqual(passed, [True, True, False, False])
+
+    def test_operators_and_functions(self):
+        cases = {
+            "end_date - start_date <= 20": [True, True, False, False],
+            "status in ('paid', 'new') and 0 < subtotal <= 9": [
+                True,
+                False,
+                True,
+                True,
+            ],
+            "status != 'void' or notnull(`shipped on`)": [True, True, True, True],
+            "not (upper(status) == 'PAID') or len(status) == 4": [
+                True,
+                True,
+                True,
+                True,
+            ],
+        }
+        for expression, expected in cases.items():
+            with self.subTest(expression=expression):
+                self.assertEqual(self.evaluate(expression)[1], expected)
+
+    def test_unsafe_or_invalid_expressions_are_rejected(self):
+        for expression in [
+            "__import__('os').system('true')",
+            "status.upper() == 'PAID'",
+            "total",
+            "total[0] > 1",
+            "eval('1') == 1",
+            "end_date >= ",
+        ]:
+            with self.subTest(expression=expression):
+                with self.assertRaises(ExpressionError):
+                    compile_expression(expression)
+
+
+class TestDeclaredCrossFieldRules(unittest.TestCase):
+    def setUp(self):
+        self.data = pd.DataFrame(
+            {
+                "start_date": ["2024-01-01", "2024-02-01", "2024-03-01"],
+                "end_date": ["2024-01-05", "2024-01-15", "2024-03-31"],
+                "total": [10.0, 11.0, 5.0],
+                "subtotal": [9.0, 10.0, 4.0],
+                "tax": [1.0, 1.0, 0.5],
+            }
+        )
+        self.requirements = {
+            "scoring": {"rule_weights": {"cross_field_logic": 1.0}},
+            "cross_field_rules": [
+                "end_date >= start_date",
+                {
+                    "name": "total_matches_parts",
+                    "expression": "abs(total - (subtotal + tax)) < 0.01",
+                },
+            ],
+        }
+
+    def test_declared_rules_are_scored_and_reported(self):
+        assessor = ConsistencyAssessor()
+        score = assessor.assess(self.data, self.requirements)
+        self.assertAlmostEqual(score, 20.0 * 4 / 6)
+
+        failures = assessor.get_validation_failures(self.data, self.requirements)
+        by_rule = {f["rule"]: f for f in failures}
+        self.assertEqual(set(by_rule), {"end_date >= start_date", "total_matches_parts"})
+        self.assertEqual(
+            by_rule["end_date >= start_date"]["samples"],
+            ["Row 1: end_date=2024-01-15, start_date=2024-02-01"],
+        )
+
+    def test_rules_on_missing_columns_are_reported(self):
+        requirements = {
+            **self.requirements,
+            "cross_field_rules": ["end_date >= start_date", "tottal > 0"],
+        }
+        assessor = ConsistencyAssessor()
+        with self.assertLogs(
+            "src.adri.validator.dimensions.consistency", level="WARNING"
+        ) as logs:
+            score = assessor.assess(self.data, requirements)
+        self.assertAlmostEqual(score, 20.0 * 2 / 3)
+        self.assertIn("tottal > 0", logs.output[0])
+
+        failures = assessor.get_validation_failures(self.data, requirements)
+        skipped = [f for f in failures if f["rule"] == "tottal > 0"]
+        self.assertEqual(skipped[0]["issue"], "cross_field_rule_not_evaluated")
+        self.assertEqual(skipped[0]["field"], "tottal")
+        self.assertIn("Missing columns: tottal", skipped[0]["remediation"])
+
+    def test_contract_validation_compiles_rules(self):
+        contract = {
+            "contracts": {
+                "id": "orders",
+                "name": "Orders",
+                "version": "1.0.0",
+                "description": "Orders contract",
+            },
+            "requirements": {
+                "overall_minimum": 75.0,
+                "dimension_requirements": {
+                    "consistency": {
+                        "weight": 1.0,
+                        "cross_field_rules": ["end_date >= start_date", "open()"],
+                    }
+                },
+            },
+        }
+        result = ContractValidator().validate_contract(contract, use_cache=False)
+        self.assertEqual(
+            [e.path for e in result.errors],
+            ["requirements.dimension_requirements.consistency.cross_field_rules[1]"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Tests for the in-process metrics registry in adri.core.metrics.
+"""
+
+import os
+import tempfile
+import unittest
+import urllib.request
+from unittest import mock
+
+import pandas as pd
+import yaml
+
+from src.adri.analysis.contract_generator import ContractGenerator
+from src.adri.core.metrics import (
+    ASSESSMENT_DURATION,
+    ASSESSMENTS_TOTAL,
+    AUDIT_WRITE_DURATION,
+    GUARD_CALLS_TOTAL,
+    MetricsRegistry,
+    get_metrics_registry,
+    parse_prometheus_text,
+    reset_metrics_registry,
+    start_metrics_server,
+    summarize_samples,
+)
+from src.adri.guard.modes import DataProtectionEngine, ProtectionError
+from src.adri.validator.engine import DataQualityAssessor
+
+
+class TestHistogram(unittest.TestCase):
+    """Test HDR-style histogram buckets and quantiles."""
+
+    def test_quantiles_within_relative_error(self):
+        histogram = MetricsRegistry().histogram("latency", "test").labels()
+        for millis in range(1, 1001):
+            histogram.observe(millis / 1000.0)
+
+        for q, expected in ((0.5, 0.5), (0.95, 0.95), (0.99, 0.99)):
+            estimate = histogram.quantile(q)
+            self.assertGreaterEqual(estimate, expected)
+            self.assertLess(abs(estimate - expected) / expected, 0.04)
+        self.assertEqual(histogram.count, 1000)
+
+    def test_exposition_round_trip(self):
+        registry = MetricsRegistry()
+        family = registry.histogram("adri_test_seconds", "test", ("contract",))
+        for seconds in (0.001, 0.002, 0.004, 1.5):
+            family.labels(contract='orders "v2"').observe(seconds)
+        registry.counter("adri_test_total", "test", ("contract",)).labels(
+            contract="orders"
+        ).inc(3)
+
+        samples = parse_prometheus_text(registry.to_prometheus())
+        counts = [s for s in samples if s[0] == "adri_test_seconds_count"]
+        self.assertEqual(counts, [("adri_test_seconds_count", {"contract": 'orders "v2"'}, 4.0)])
+        self.assertIn(("adri_test_total", {"contract": "orders"}, 3.0), samples)
+        inf_bucket = [s for s in samples if s[1].get("le") == "+Inf"]
+        self.assertEqual(inf_bucket[0][2], 4.0)
+
+
+class TestAssessmentMetrics(unittest.TestCase):
+    """Test that assessments update the process-wide registry."""
+
+    def setUp(self):
+        reset_metrics_registry()
+        self.data = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+        contract = ContractGenerator().generate(data=self.data, data_name="metrics")
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.contract_path = os.path.join(self.temp_dir.name, "orders.yaml")
+        with open(self.contract_path, "w", encoding="utf-8") as f:
+            yaml.safe_dump(contract, f, sort_keys=False)
+
+    def tearDown(self):
+        reset_metrics_registry()
+        self.temp_dir.cleanup()
+
+    def test_assessments_recorded(self):
+        assessor = DataQualityAssessor(
+            {"audit": {"enabled": True, "log_dir": self.temp_dir.name}}
+        )
+        for _ in range(3):
+            assessor.assess(self.data, self.contract_path)
+
+        registry = get_metrics_registry()
+        self.assertEqual(
+            registry.get(ASSESSMENTS_TOTAL).labels(contract="orders", passed="true").value,
+            3,
+        )
+        self.assertEqual(
+            registry.get(ASSESSMENT_DURATION).labels(contract="orders").count, 3
+        )
+        self.assertEqual(registry.get(AUDIT_WRITE_DURATION).labels().count, 3)
+
+        summary = summarize_samples(parse_prometheus_text(registry.to_prometheus()))
+        orders = summary["contracts"]["orders"]
+        self.assertEqual(orders["assessments"], 3)
+        self.assertEqual(orders["rows"], 9)
+        self.assertGreater(orders["p99"], 0)
+        self.assertEqual(summary["audit"]["writes"], 3)
+        self.assertEqual(summary["audit"]["queue_depth"], 0)
+
+    def test_guard_call_counted_once_when_function_raises(self):
+        def process(data):
+            raise RuntimeError("boom")
+
+        engine = DataProtectionEngine()
+        with mock.patch.object(
+            engine, "_resolve_contract_file_path", return_value=self.contract_path
+        ):
+            with self.assertRaises(ProtectionError):
+                engine.protect_function_call(
+                    process,
+                    (self.data,),
+                    {},
+                    data_param="data",
+                    function_name="process",
+                    contract_name="orders",
+                    min_score=0,
+                    audit_log_dir=self.temp_dir.name,
+                )
+
+        calls = get_metrics_registry().get(GUARD_CALLS_TOTAL)
+        self.assertEqual(calls.labels(contract="orders", outcome="passed").value, 1)
+        self.assertEqual(calls.labels(contract="orders", outcome="error").value, 0)
+
+    def test_metrics_server(self):
+        get_metrics_registry().counter("adri_test_total", "test").labels().inc()
+        server = start_metrics_server(0)
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                body = response.read().decode("utf-8")
+        finally:
+            server.shutdown()
+        self.assertIn("adri_test_total 1", body)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Tests for vectorized plausibility scoring and persisted baselines.
+"""
+
+import unittest
+
+import pandas as pd
+
+from src.adri.analysis.contract_generator import ContractGenerator
+from src.adri.validator.dimensions.plausibility import (
+    build_plausibility_baselines,
+    count_range_failures,
+    PlausibilityAssessor,
+)
+from src.adri.validator.engine import ValidationEngine
+
+
+class TestPlausibilityScoring(unittest.TestCase):
+    def setUp(self):
+        self.train = pd.DataFrame(
+            {
+                "amount": [float(v) for v in range(10, 31)],
+                "status": ["paid"] * 13 + ["pending"] * 7 + ["void"],
+            }
+        )
+        self.batch = pd.DataFrame(
+            {
+                "amount": [100.0, 101.0, 102.0, 103.0, 20.0],
+                "status": ["void", "void", "void", "paid", "new"],
+            }
+        )
+
+    def test_batch_statistics_match_per_value_counts(self):
+        assessor = PlausibilityAssessor()
+        outliers = assessor._assess_statistical_outliers(self.batch)
+        self.assertEqual((outliers["passed"], outliers["total"]), (4, 5))
+
+        rare = assessor._assess_categorical_frequency(self.batch)
+        self.assertEqual((rare["passed"], rare["total"]), (5, 5))
+        self.assertEqual(
+            ValidationEngine()._assess_categorical_frequency(
+                self.batch.astype({"status": object})
+            ),
+            rare,
+        )
+
+    def test_baselines_replace_batch_statistics(self):
+        baselines = build_plausibility_baselines(self.train)
+        self.assertEqual(set(baselines["numeric"]), {"amount"})
+        self.assertEqual(
+            set(baselines["categorical"]["status"]["frequencies"]), {"paid", "pending"}
+        )
+
+        assessor = PlausibilityAssessor()
+        outliers = assessor._assess_statistical_outliers(self.batch, baselines)
+        self.assertEqual((outliers["passed"], outliers["total"]), (1, 5))
+        rare = assessor._assess_categorical_frequency(self.batch, baselines)
+        self.assertEqual((rare["passed"], rare["total"]), (1, 5))
+
+    def test_generation_persists_baselines(self):
+        train = self.train.assign(id=range(len(self.train)))
+        contract = ContractGenerator().generate(
+            train, "payments", {"plausibility_baselines": True}
+        )
+        plausibility = contract["requirements"]["dimension_requirements"][
+            "plausibility"
+        ]
+        self.assertEqual(set(plausibility["baselines"]["numeric"]), {"amount"})
+        self.assertGreater(
+            plausibility["scoring"]["rule_weights"]["statistical_outliers"], 0
+        )
+
+        assessor = PlausibilityAssessor()
+        self.assertLess(assessor.assess(self.batch, plausibility), 20.0)
+        # The key column has no baseline, so new ids are not outliers
+        self.assertEqual(
+            assessor.assess(train.assign(id=train["id"] + 5000), plausibility),
+            assessor.assess(train, plausibility),
+        )
+
+    def test_baselines_skip_keys_and_sequences(self):
+        data = self.train.assign(seq=range(len(self.train)), code=[5, 3] * 10 + [4])
+        baselines = build_plausibility_baselines(data, exclude_columns=["code"])
+        self.assertEqual(set(baselines["numeric"]), {"amount"})
+
+    def test_range_failures_follow_float_conversion(self):
+        values = pd.Series([1, "2", "x", 9.5, True, "nan"], dtype=object)
+        self.assertEqual(count_range_failures(values, 0, 5), 2)
+        self.assertEqual(count_range_failures(pd.Series([1, 6, 3]), None, 5), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Tests for assessment hot-spot profiling in adri.core.profiling.
+"""
+
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+import yaml
+
+from src.adri.analysis.contract_generator import ContractGenerator
+from src.adri.core.profiling import profile_assessment
+from src.adri.core.tracing import NoOpTracer, get_tracer
+
+
+class TestProfileAssessment(unittest.TestCase):
+    """Test the cProfile, stack sampling and tracemalloc passes."""
+
+    def setUp(self):
+        self.data = pd.DataFrame(
+            {"id": range(200), "email": [f"u{i}@example.com" for i in range(200)]}
+        )
+        contract = ContractGenerator().generate(data=self.data, data_name="profiled")
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.contract_path = os.path.join(self.temp_dir.name, "profiled.yaml")
+        with open(self.contract_path, "w", encoding="utf-8") as f:
+            yaml.safe_dump(contract, f, sort_keys=False)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_report_and_artifacts(self):
+        report = profile_assessment(
+            self.data,
+            self.contract_path,
+            top_n=5,
+            sample_interval=0.0005,
+            config={"audit": {"enabled": False}},
+        )
+
+        self.assertIsNotNone(report.result)
+        self.assertEqual(len(report.functions), 5)
+        self.assertIn("validity", report.timings["dimensions"])
+        self.assertTrue(any(k.startswith("dimension:") for k in report.components))
+        self.assertIn("dimension:validity", report.memory["spans_kb"])
+        self.assertGreater(report.memory["peak_mb"], 0)
+        self.assertIsInstance(get_tracer(), NoOpTracer)
+
+        paths = report.write(os.path.join(self.temp_dir.name, "out"))
+        for key in ("report", "json", "collapsed", "pstats"):
+            self.assertTrue(paths[key].exists())
+        self.assertIn("Dimension assessors", paths["report"].read_text())
+        for line in paths["collapsed"].read_text().splitlines():
+            stack, count = line.rsplit(" ", 1)
+            self.assertTrue(int(count) > 0 and stack)
+
+
+if __name__ == "__main__":
+    unittest.main()
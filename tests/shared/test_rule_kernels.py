@@ -0,0 +1,217 @@
+"""
+Tests for column-level validation_rules kernels.
+"""
+
+import os
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from src.adri.core.validation_rule import ValidationRule
+from src.adri.validator.dimensions.completeness import CompletenessAssessor
+from src.adri.validator.dimensions.validity import ValidityAssessor
+from src.adri.validator.rule_kernels import (
+    compile_field_check,
+    compile_validation_rule,
+    date_bounds_mask,
+    distinct_values,
+    parse_date_column,
+)
+from src.adri.validator.rules import check_date_bounds, execute_validation_rule
+
+
+def _rule(rule_type, dimension="validity", severity="CRITICAL", expression=""):
+    return ValidationRule(
+        name=rule_type,
+        dimension=dimension,
+        severity=severity,
+        rule_type=rule_type,
+        rule_expression=expression,
+    )
+
+
+class TestCompiledKernels(unittest.TestCase):
+    def assertMatchesScalar(self, series, rule, field_req):
+        expected = [
+            execute_validation_rule(value, rule, field_req) for value in series.tolist()
+        ]
+        mask = compile_validation_rule(rule, field_req)(series)
+        self.assertEqual(mask.tolist(), expected, f"{rule.rule_type} {field_req}")
+
+    def test_kernels_match_scalar_rules(self):
+        columns = [
+            pd.Series([1.5, np.nan, -0.0, 0.0, np.inf, 200.0]),
+            pd.Series([0, 1, 2, 150]),
+            pd.Series(["abc", "ABC", " ", "", None, "2024-01-05", " 7 "], dtype="str"),
+            pd.Series([1, 1.0, True, "1", None, -0.0, 0.0], dtype=object),
+            pd.Series([[1], None, [1]], dtype=object),
+        ]
+        cases = [
+            (_rule("not_null", "completeness"), {}),
+            (_rule("type"), {"type": "integer"}),
+            (_rule("type"), {"type": "boolean"}),
+            (_rule("type", expression="is_string"), {}),
+            (_rule("allowed_values"), {"allowed_values": ["abc", 1]}),
+            (_rule("pattern"), {"pattern": r"^[a-z0-9]+$"}),
+            (_rule("numeric_bounds"), {"min_value": 0, "max_value": 100}),
+            (_rule("length_bounds"), {"min_length": 1, "max_length": 3}),
+            (_rule("date_bounds"), {"after_date": "2024-01-01"}),
+            (_rule("format", expression="IS_LOWERCASE"), {}),
+        ]
+        for series in columns:
+            for rule, field_req in cases:
+                self.assertMatchesScalar(series, rule, field_req)
+
+    def test_non_rules_always_pass(self):
+        mask = compile_validation_rule({"rule_type": "not_null"})(pd.Series([None]))
+        self.assertEqual(mask.tolist(), [True])
+
+
+class TestColumnarDates(unittest.TestCase):
+    def setUp(self):
+        self.series = pd.Series(
+            [
+                "2024-01-05",
+                " 2024-03-01 ",
+                "2024-02-30",  # invalid date
+                "01/20/2024",  # straggler in another format
+                "2024-06-01T10:00:00Z",
+                None,
+                "2300-01-01",
+            ],
+            dtype=object,
+        )
+
+    def test_detected_format_parses_matching_rows(self):
+        parsed, done = parse_date_column(self.series)
+        self.assertEqual(done.tolist(), [True, True, False, False, False, False, True])
+        self.assertEqual(parsed[1], np.datetime64("2024-03-01"))
+        self.assertEqual(parsed[6], np.datetime64("2300-01-01"))
+
+    def test_bounds_match_scalar_check(self):
+        for field_req in (
+            {"after_date": "2024-01-10", "before_date": "2400-01-01"},
+            {"after_datetime": "2024-01-01T00:00:00+00:00"},
+            {"before_date": "not a date"},
+        ):
+            expected = [check_date_bounds(v, field_req) for v in self.series]
+            self.assertEqual(
+                date_bounds_mask(self.series, field_req).tolist(), expected
+            )
+
+
+@patch.dict(os.environ, {"ADRI_STRING_BACKEND": "arrow"})
+class TestArrowStringBackend(TestCompiledKernels):
+    """Reruns the scalar comparisons with the Arrow string backend enabled."""
+
+    def test_matches_python_including_fallbacks(self):
+        values = ["abc", "ABC", "ab1", "", "a\n", "é", "Title Case", "x" * 9, None]
+        for series in (pd.Series(values, dtype=object), pd.Series(values, dtype="str")):
+            for pattern in (r"^[a-z]+$", r"\w+", r"(a)\1", r"(?<=a)b", "[:a"):
+                self.assertMatchesScalar(series, _rule("pattern"), {"pattern": pattern})
+            for expression in ("IS_LOWERCASE", "IS_UPPERCASE", "TITLECASE"):
+                self.assertMatchesScalar(
+                    series, _rule("format", expression=expression), {}
+                )
+            self.assertEqual(
+                compile_field_check("length_bounds", {"max_length": 3})(
+                    series.dropna()
+                ).tolist(),
+                [True, True, True, True, True, True, False, False],
+            )
+
+
+class TestSeverityAwareScoring(unittest.TestCase):
+    def setUp(self):
+        self.data = pd.DataFrame(
+            {"status": ["open", "closed", "bogus", None], "amount": [5, 50, 500, 7]}
+        )
+        self.requirements = {
+            "field_requirements": {
+                "status": {
+                    "allowed_values": ["open", "closed"],
+                    "validation_rules": [
+                        _rule("allowed_values"),
+                        _rule("not_null", "completeness", "WARNING"),
+                    ],
+                },
+                "amount": {
+                    "max_value": 100,
+                    "validation_rules": [_rule("numeric_bounds", severity="WARNING")],
+                },
+            }
+        }
+
+    def test_only_critical_rules_affect_score(self):
+        # 1 of 3 non-null statuses fails; the amount rule is only a warning
+        self.assertAlmostEqual(
+            ValidityAssessor().assess(self.data, self.requirements), 20.0 * 2 / 3
+        )
+        self.assertEqual(
+            CompletenessAssessor().assess(self.data, self.requirements), 20.0
+        )
+
+    def test_failures_include_all_severities(self):
+        failures = ValidityAssessor().get_validation_failures(
+            self.data, self.requirements
+        )
+        self.assertEqual(
+            [(f["field"], f["issue"], f["severity"], f["samples"]) for f in failures],
+            [
+                ("status", "allowed_values_failed", "CRITICAL", ["bogus"]),
+                ("amount", "numeric_bounds_failed", "WARNING", ["500"]),
+            ],
+        )
+        completeness = CompletenessAssessor().get_validation_failures(
+            self.data, self.requirements
+        )
+        self.assertEqual(completeness[0]["samples"], ["<null>"])
+
+
+class TestDistinctEvaluation(unittest.TestCase):
+    def test_distinct_values_switch_on_cardinality(self):
+        low = pd.Series(["a", "b", "a", "a"])
+        values, codes = distinct_values(low)
+        self.assertEqual(values, ["a", "b"])
+        self.assertEqual(codes.tolist(), [0, 1, 0, 0])
+
+        high = pd.Series(["a", "b", "c", "a"])
+        values, codes = distinct_values(high)
+        self.assertEqual(values, high.tolist())
+        self.assertEqual(codes.tolist(), [0, 1, 2, 3])
+
+    def test_legacy_failures_broadcast_to_rows(self):
+        data = pd.DataFrame(
+            {"status": ["open", "x", "bad", "open", "x", "open"] * 2},
+            index=[f"r{i}" for i in range(12)],
+        )
+        field_requirements = {
+            "status": {
+                "type": "string",
+                "allowed_values": ["open", "x"],
+                "min_length": 2,
+            }
+        }
+        assessor = ValidityAssessor()
+        self.assertEqual(
+            assessor._run_rule_cascade(
+                "status", data["status"], field_requirements["status"], True
+            ),
+            {"type": (12, 12), "allowed_values": (12, 10), "length_bounds": (10, 6)},
+        )
+        failures = assessor.get_validation_failures(
+            data, {"field_requirements": field_requirements}
+        )
+        self.assertEqual(
+            [(f["issue"], f["affected_rows"], f["samples"]) for f in failures],
+            [
+                ("length_bounds_failed", 4, ["x", "x", "x"]),
+                ("allowed_values_failed", 2, ["bad", "bad"]),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Tests for the pluggable tracer interface in adri.core.tracing.
+
+Spans are captured with InMemoryTracer; the OpenTelemetry adapter is
+exercised against a stand-in tracer so no SDK or exporter is required.
+"""
+
+import os
+import tempfile
+import unittest
+from contextlib import contextmanager
+
+import pandas as pd
+import yaml
+
+from src.adri.analysis.contract_generator import ContractGenerator
+from src.adri.core.tracing import (
+    ATTR_CONTRACT,
+    ATTR_DIMENSION,
+    ATTR_ROW_COUNT,
+    ATTR_SCORE,
+    InMemoryTracer,
+    NoOpTracer,
+    OpenTelemetryTracer,
+    get_tracer,
+    set_tracer,
+)
+from src.adri.validator.engine import DataQualityAssessor
+
+
+class _FakeOtelSpan:
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes or {})
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, exception):
+        self.attributes["exception"] = repr(exception)
+
+
+class _FakeOtelTracer:
+    def __init__(self):
+        self.spans = []
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        span = _FakeOtelSpan(name, attributes)
+        self.spans.append(span)
+        yield span
+
+
+class TestTracing(unittest.TestCase):
+    """Test tracer selection and span emission around assessments."""
+
+    def setUp(self):
+        self.data = pd.DataFrame({
+            "customer_id": [1, 2, 3, 4],
+            "email": ["a@x.com", "b@x.com", "c@x.com", "d@x.com"],
+        })
+        contract = ContractGenerator().generate(data=self.data, data_name="traced")
+        fd, self.contract_path = tempfile.mkstemp(suffix=".yaml")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            yaml.safe_dump(contract, f, sort_keys=False)
+
+        self.tracer = InMemoryTracer()
+        set_tracer(self.tracer)
+
+    def tearDown(self):
+        set_tracer(None)
+        os.unlink(self.contract_path)
+
+    def test_default_tracer_is_noop(self):
+        set_tracer(None)
+        self.assertIsInstance(get_tracer(), NoOpTracer)
+        with get_tracer().start_span("adri.test", {"a": 1}) as span:
+            span.set_attribute("b", 2)
+
+    def test_assessment_spans_nest_with_attributes(self):
+        assessor = DataQualityAssessor({"audit": {"enabled": False}})
+        result = assessor.assess(self.data, self.contract_path)
+
+        (assess_span,) = self.tracer.find("adri.assess")
+        self.assertIsNone(assess_span.parent_name)
+        self.assertEqual(
+            assess_span.attributes[ATTR_CONTRACT], os.path.basename(self.contract_path)[:-5]
+        )
+        self.assertEqual(assess_span.attributes[ATTR_ROW_COUNT], 4)
+        self.assertEqual(assess_span.attributes[ATTR_SCORE], result.overall_score)
+
+        (pipeline_span,) = self.tracer.find("adri.pipeline")
+        self.assertEqual(pipeline_span.parent_name, "adri.assess")
+
+        dimension_spans = self.tracer.find("adri.dimension")
+        self.assertEqual(
+            [span.attributes[ATTR_DIMENSION] for span in dimension_spans],
+            ["validity", "completeness", "consistency", "freshness", "plausibility"],
+        )
+        self.assertTrue(all(s.parent_name == "adri.pipeline" for s in dimension_spans))
+
+    def test_audit_write_span(self):
+        with tempfile.TemporaryDirectory() as log_dir:
+            assessor = DataQualityAssessor(
+                {"audit": {"enabled": True, "log_dir": log_dir}}
+            )
+            assessor.assess(self.data, self.contract_path)
+
+        (write_span,) = self.tracer.find("adri.audit.write")
+        self.assertEqual(write_span.parent_name, "adri.assess")
+        self.assertEqual(write_span.attributes[ATTR_ROW_COUNT], 4)
+
+    def test_exception_recorded_on_span(self):
+        with self.assertRaises(RuntimeError):
+            with self.tracer.start_span("adri.failing"):
+                raise RuntimeError("boom")
+        (span,) = self.tracer.find("adri.failing")
+        self.assertIsInstance(span.exception, RuntimeError)
+
+    def test_opentelemetry_adapter_forwards_spans(self):
+        fake = _FakeOtelTracer()
+        tracer = OpenTelemetryTracer(tracer=fake)
+        with tracer.start_span("adri.assess", {ATTR_ROW_COUNT: 3, "skip": None}) as span:
+            span.set_attribute(ATTR_SCORE, 91.5)
+            span.set_attribute("adri.fields", ["a", "b"])
+
+        (otel_span,) = fake.spans
+        self.assertEqual(otel_span.name, "adri.assess")
+        self.assertEqual(
+            otel_span.attributes,
+            {ATTR_ROW_COUNT: 3, ATTR_SCORE: 91.5, "adri.fields": "['a', 'b']"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
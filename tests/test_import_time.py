@@ -0,0 +1,93 @@
+"""
+Import-time budget tests for lazy top-level imports.
+
+`import adri`, `adri --version` and cold starts that only need
+`adri_protected` must not load the contract generator, and the bare
+package import must not pull in pandas at all.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SRC_PATH = PROJECT_ROOT / "src"
+
+# Generous budget (microseconds) for the cumulative cost of `import adri`,
+# reported by `python -X importtime`. Eager imports cost well over 300ms.
+IMPORT_ADRI_BUDGET_US = 150_000
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    """Run a snippet in a fresh interpreter with the src/ layout on the path."""
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=str(SRC_PATH),
+        timeout=60,
+    )
+
+
+def _loaded_modules(code: str, modules: list[str]) -> list[str]:
+    """Return which of ``modules`` are in sys.modules after running ``code``."""
+    probe = f"{code}\nimport sys\nprint(','.join(m for m in {modules!r} if m in sys.modules))"
+    result = _run(probe)
+    assert result.returncode == 0, result.stderr
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+def test_import_adri_is_lightweight():
+    loaded = _loaded_modules(
+        "import adri",
+        ["pandas", "adri.analysis", "adri.validator.engine", "adri.guard.modes"],
+    )
+    assert loaded == []
+
+
+def test_adri_protected_does_not_load_contract_generator():
+    loaded = _loaded_modules(
+        "from adri import adri_protected",
+        ["adri.analysis", "adri.analysis.contract_generator"],
+    )
+    assert loaded == []
+
+
+def test_cli_startup_does_not_load_commands():
+    loaded = _loaded_modules(
+        "import adri.cli",
+        ["pandas", "adri.analysis", "adri.cli.commands.generate_contract"],
+    )
+    assert loaded == []
+
+
+def test_public_api_still_resolves():
+    result = _run(
+        "import adri\n"
+        "missing = [n for n in adri.__all__ if getattr(adri, n, None) is None]\n"
+        "print(','.join(missing))"
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
+
+
+def test_unknown_attribute_raises():
+    result = _run("import adri\nadri.does_not_exist")
+    assert result.returncode != 0
+    assert "AttributeError" in result.stderr
+
+
+@pytest.mark.performance
+def test_import_adri_within_budget():
+    result = _run("import adri", "-X", "importtime")
+    assert result.returncode == 0, result.stderr
+
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == "adri":
+            cumulative_us = int(parts[1])
+    assert cumulative_us is not None, result.stderr
+    assert cumulative_us < IMPORT_ADRI_BUDGET_US